@@ -18,6 +18,7 @@ cwd = os.path.dirname(os.path.realpath(__file__))
 site.addsitedir(os.path.join(cwd, "lib"))
 
 import sys
+import time
 import importlib
 import nodeitems_utils
 import sverchok
@@ -171,22 +172,29 @@ def make_node_list():
             modules.append(module)
     return modules
 
-imported_modules = make_node_list()
+# Node modules are only imported when the add-on is registered. The node index
+# above is enough to build the menus, and the ladybug libraries are only
+# imported by the nodes the first time that they process.
+imported_modules = []
 
 reload_event = False
 
 import bpy
 
 def register_nodes():
-    node_modules = make_node_list()
-    for module in node_modules:
+    global imported_modules
+    start = time.perf_counter()
+    imported_modules = make_node_list()
+    for module in imported_modules:
         module.register()
-    logger.info("Registered %s nodes", len(node_modules))
+    logger.info("Registered %s nodes in %.3f seconds",
+                len(imported_modules), time.perf_counter() - start)
 
 def unregister_nodes():
     global imported_modules
     for module in reversed(imported_modules):
         module.unregister()
+    imported_modules = []
 
 
 add_node_menu.append_from_config(node_categories)
@@ -5,64 +5,66 @@ ladybug_geometry or there are much more efficient versions of them in Rhino.
 """
 import bpy
 import math
-import types
-import mathutils.geometry
-import array as specializedarray
 from .config import tolerance
-from mathutils import Vector, Matrix
+from .sverchok import tasks, parallel_map, chunk_ranges, process_context, \
+    local_processor_count
+from .visibility import IntersectionMatrix
 
+try:
+    from ladybug_geometry.geometry3d.pointvector import Point3D
+    from ladybug_geometry.geometry3d.mesh import Mesh3D
+    from ladybug_geometry.bvh import MeshBVH
+except ImportError as e:
+    raise ImportError(
+        "Failed to import ladybug_geometry.\n{}".format(e))
 
-# Stub for .net tasks.
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # python < 3.8
+    shared_memory = None
 
-def for_each(iterable, fn):
-    for i in iterable:
-        fn(i)
-    return # Does this work in Sverchok?
-
-    pool = multiprocessing.Pool()
-    pool.map(fn, iterable)
-    pool.close()
-    pool.join()
-
-tasks = types.SimpleNamespace()
-Parallel = types.SimpleNamespace()
-Parallel.ForEach = for_each
-tasks.Parallel = Parallel
+# state of each worker process that is set once by _init_bvh_worker
+_worker_shm = None
+_worker_bvh = None
+_worker_args = None
 
 
 def join_geometry_to_mesh(geometry):
-    """Convert an array of Rhino Breps and/or Meshes into a single Rhino Mesh.
+    """Convert an array of Blender objects and/or Meshes into a single Ladybug Mesh3D.
 
     This is a typical pre-step before using the intersect_mesh_rays function.
+    The resulting mesh is triangulated and transformed into world coordinates
+    so that no temporary objects need to be added to the Blender scene.
 
     Args:
-        geometry: An array of Rhino Breps or Rhino Meshes.
+        geometry: An array of Blender mesh objects or Ladybug Mesh3D.
     """
-    copied_geometry = []
+    lb_meshes = []
     for geo in geometry:
-        new = geo.copy()
-        new.data = new.data.copy()
-        copied_geometry.append(new)
-    c = {}
-    c['object'] = c['active_object'] = copied_geometry[0]
-    c['selected_objects'] = c['selected_editable_objects'] = copied_geometry
-    bpy.ops.object.join(c)
-    bpy.context.scene.collection.objects.link(copied_geometry[0])
-    # Apply all transformations
-    copied_geometry[0].data.transform(copied_geometry[0].matrix_world)
-    copied_geometry[0].matrix_world = Matrix()
-    return copied_geometry[0]
-    for geo in geometry:
-        if isinstance(geo, rg.Brep):
-            meshes = rg.Mesh.CreateFromBrep(geo, rg.MeshingParameters.Default)
-            for mesh in meshes:
-                joined_mesh.Append(mesh)
-        elif isinstance(geo, rg.Mesh):
-            joined_mesh.Append(geo)
+        if isinstance(geo, Mesh3D):
+            lb_meshes.append(geo)
+        elif isinstance(geo, bpy.types.Object) and geo.type == 'MESH':
+            lb_meshes.append(_triangulated_mesh3d(geo))
         else:
-            raise TypeError('Geometry must be either a Brep or a Mesh. '
-                            'Not {}.'.format(type(geo)))
-    return joined_mesh
+            raise TypeError('Geometry must be either a Blender mesh object or a '
+                            'Mesh3D. Not {}.'.format(type(geo)))
+    if len(lb_meshes) == 1:
+        return lb_meshes[0]
+    return Mesh3D.join_meshes(lb_meshes)
+
+
+def mesh_bvh(mesh):
+    """Get a ladybug_geometry MeshBVH that can be used to intersect rays with a mesh.
+
+    Args:
+        mesh: A Ladybug Mesh3D, a Blender mesh object or an existing MeshBVH,
+            which will be returned as it is.
+    """
+    if isinstance(mesh, MeshBVH):
+        return mesh
+    if not isinstance(mesh, Mesh3D):
+        mesh = join_geometry_to_mesh([mesh])
+    return MeshBVH(mesh)
 
 
 def intersect_mesh_rays(
@@ -70,23 +72,26 @@ def intersect_mesh_rays(
     """Intersect a group of rays (represented by points and vectors) with a mesh.
 
     All combinations of rays that are possible between the input points and
-    vectors will be intersected. This method exists since most CAD plugins have
-    much more efficient mesh/ray intersection functions than ladybug_geometry.
-    However, the ladybug_geometry Face3D.intersect_line_ray() method provides
-    a workable (albeit very inefficient) alternative to this if it is needed.
+    vectors will be intersected. The rays are intersected with a bounding
+    volume hierarchy (ladybug_geometry MeshBVH) built over the faces of the
+    mesh such that no Blender scene is needed and such that the time of each
+    intersection grows only logarithmically with the number of mesh faces.
 
     Args:
-        mesh: A Rhino mesh that can block the rays.
-        points: An array of Rhino points that will be used to generate rays.
-        vectors: An array of Rhino vectors that will be used to generate rays.
-        normals: An optional array of Rhino vectors that align with the input
-            points and denote the direction each point is facing. These will
+        mesh: A Ladybug Mesh3D, a Blender mesh object or a MeshBVH that can
+            block the rays.
+        points: An array of Ladybug Point3D that will be used to generate rays.
+        vectors: An array of Ladybug Vector3D that will be used to generate rays.
+        normals: An optional array of Ladybug Vector3D that align with the points
+            and denote the direction each point is facing. These will
             be used to eliminate any cases where the vector and the normal differ
             by more than 90 degrees. If None, points are assumed to have no direction.
         cpu_count: An integer for the number of CPUs to be used in the intersection
-            calculation. The ladybug_rhino.grasshopper.recommended_processor_count
+            calculation. The ladybug_tools.sverchok.recommended_processor_count
             function can be used to get a recommendation. If set to None, all
-            available processors will be used. (Default: None).
+            available processors will be used. When more than one CPU is used,
+            the points are handed out in chunks to worker processes that all
+            share one copy of the BVH. (Default: None).
         parallel: Optional boolean to override the cpu_count and use a single CPU
             instead of multiple processors.
 
@@ -102,80 +107,72 @@ def intersect_mesh_rays(
             matrix represents one of the normals and has a length equal to the
             supplied vectors. Will be None if no normals are provided.
     """
-    intersection_matrix = [0] * len(points)  # matrix to be filled with results
-    angle_matrix = [0] * len(normals) if normals is not None else None
-    cutoff_angle = math.pi / 2  # constant used in all normal checks
+    bvh = mesh_bvh(mesh)
     if not parallel:
         cpu_count = 1
+    if bvh.node_count != 0 and _use_processes(len(points), cpu_count):
+        ranges = chunk_ranges(len(points), cpu_count)
+        results = _run_bvh_workers(
+            bvh, _intersect_rays_chunk, ranges, cpu_count, (points, vectors, normals))
+        intersection_matrix = [row for res in results for row in res[0]]
+        angle_matrix = [row for res in results for row in res[1]] \
+            if normals is not None else None
+        return intersection_matrix, angle_matrix
+    return bvh.intersect_rays(points, vectors, normals)
+
+
+def intersection_matrix(mesh, points, vectors, normals=None, cpu_count=None,
+                        parallel=True, store=None, cosine_type='d'):
+    """Get an IntersectionMatrix for the rays between points and vectors and a mesh.
+
+    This is the same intersection as intersect_mesh_rays but the result is packed
+    into a compact IntersectionMatrix with one bit per ray and, if normals are
+    provided, the cosines of the unblocked rays. The matrix has methods to
+    compute the sums of weights over each point (eg. radiation, sky view and
+    sun hours) without building any nested lists.
 
-    def intersect_point(i):
-        """Intersect all of the vectors of a given point without any normal check."""
-        pt = points[i]
-        int_list = []
-        for vec in vectors:
-            is_clear = 0 if mesh.ray_cast(
-                Vector((pt.x, pt.y, pt.z)),
-                Vector((vec.x, vec.y, vec.z)))[0] else 1
-            int_list.append(is_clear)
-        intersection_matrix[i] = int_list
-
-    def intersect_point_normal_check(i):
-        """Intersect all of the vectors of a given point with a normal check."""
-        pt, normal_vec = points[i], normals[i]
-        int_list = []
-        angle_list = []
-        for vec in vectors:
-            vec_angle = Vector((normal_vec.x, normal_vec.y, normal_vec.z)).angle(Vector((vec.x, vec.y, vec.z)))
-            angle_list.append(vec_angle)
-            if vec_angle <= cutoff_angle:
-                is_clear = 0 if mesh.ray_cast(
-                    Vector((pt.x, pt.y, pt.z)),
-                    Vector((vec.x, vec.y, vec.z)))[0] else 1
-                int_list.append(is_clear)
-            else:  # the vector is pointing behind the surface
-                int_list.append(0)
-        intersection_matrix[i] = specializedarray.array('B', int_list)
-        angle_matrix[i] = specializedarray.array('d', angle_list)
-
-    def intersect_each_point_group(worker_i):
-        """Intersect groups of points so that only the cpu_count is used."""
-        start_i, stop_i = pt_groups[worker_i]
-        for count in range(start_i, stop_i):
-            intersect_point(count)
-
-    def intersect_each_point_group_normal_check(worker_i):
-        """Intersect groups of points with distance check so only cpu_count is used."""
-        start_i, stop_i = pt_groups[worker_i]
-        for count in range(start_i, stop_i):
-            intersect_point_normal_check(count)
-
-    if cpu_count is not None and cpu_count > 1:
-        # group the points in order to meet the cpu_count
-        pt_count = len(points)
-        worker_count = min((cpu_count, pt_count))
-        i_per_group = int(math.ceil(pt_count / worker_count))
-        pt_groups = [[x, x + i_per_group] for x in range(0, pt_count, i_per_group)]
-        pt_groups[-1][-1] = pt_count  # ensure the last group ends with point count
+    Args:
+        mesh: A Ladybug Mesh3D, a Blender mesh object or a MeshBVH that can
+            block the rays.
+        points: An array of Ladybug Point3D that will be used to generate rays.
+        vectors: An array of Ladybug Vector3D that will be used to generate rays.
+        normals: An optional array of Ladybug Vector3D that align with the points.
+            If None, the matrix will have no cosines.
+        cpu_count: An integer for the number of CPUs to be used in the intersection
+            calculation. (Default: None).
+        parallel: Optional boolean to override the cpu_count and use a single CPU
+            instead of multiple processors.
+        store: An optional VisibilityMatrixStore (eg. the visibility_matrix_store
+            of ladybug_tools.visibility). If the same mesh, points, vectors and
+            normals were intersected before, the stored matrix is returned
+            without intersecting any rays. Otherwise, the resulting matrix
+            is added to the store. (Default: None).
+        cosine_type: Text for the struct format character used to store the
+            cosines. Choose from e (float16), f (float32) or d (float64). If None,
+            the normals are only used to block the rays behind the points and the
+            matrix has no cosines, which is all that sun hours need. (Default: d).
 
-    if normals is not None:
-        if cpu_count is None:  # use all availabe CPUs
-            tasks.Parallel.ForEach(range(len(points)), intersect_point_normal_check)
-        elif cpu_count <= 1:  # run everything on a single processor
-            for i in range(len(points)):
-                intersect_point_normal_check(i)
-        else:  # run the groups in a manner that meets the CPU count
-            tasks.Parallel.ForEach(
-                range(len(pt_groups)), intersect_each_point_group_normal_check)
+    Returns:
+        An IntersectionMatrix with one row for each point and one column for
+        each vector.
+    """
+    key = None
+    if store is not None:
+        if not isinstance(mesh, (Mesh3D, MeshBVH)):
+            mesh = join_geometry_to_mesh([mesh])
+        key = store.rays_key(mesh, points, vectors, normals, cosine_type)
+        matrix = store.get(key)
+        if matrix is not None:
+            return matrix
+    int_matrix, angles = intersect_mesh_rays(
+        mesh, points, vectors, normals, cpu_count, parallel)
+    if cosine_type is None:
+        matrix = IntersectionMatrix.from_matrices(int_matrix)
     else:
-        if cpu_count is None:  # use all availabe CPUs
-            tasks.Parallel.ForEach(range(len(points)), intersect_point)
-        elif cpu_count <= 1:  # run everything on a single processor
-            for i in range(len(points)):
-                intersect_point(i)
-        else:  # run the groups in a manner that meets the CPU count
-            tasks.Parallel.ForEach(range(len(pt_groups)), intersect_each_point_group)
-
-    return intersection_matrix, angle_matrix
+        matrix = IntersectionMatrix.from_matrices(int_matrix, angles, cosine_type)
+    if key is not None:
+        store.set(key, matrix)
+    return matrix
 
 
 def intersect_mesh_lines(
@@ -183,23 +180,24 @@ def intersect_mesh_lines(
     """Intersect a group of lines (represented by start + end points) with a mesh.
 
     All combinations of lines that are possible between the input start_points and
-    end_points will be intersected. This method exists since most CAD plugins have
-    much more efficient mesh/line intersection functions than ladybug_geometry.
-    However, the ladybug_geometry Face3D.intersect_line_ray() method provides
-    a workable (albeit very inefficient) alternative to this if it is needed.
+    end_points will be intersected. The lines are intersected with a bounding
+    volume hierarchy (ladybug_geometry MeshBVH) built over the faces of the mesh.
 
     Args:
-        mesh: A Rhino mesh that can block the lines.
-        start_points: An array of Rhino points that will be used to generate lines.
-        end_points: An array of Rhino points that will be used to generate lines.
+        mesh: A Ladybug Mesh3D, a Blender mesh object or a MeshBVH that can
+            block the lines.
+        start_points: An array of Ladybug Point3D that will be used to generate lines.
+        end_points: An array of Ladybug Point3D that will be used to generate lines.
         max_dist: An optional number to set the maximum distance beyond which the
             end_points are no longer considered visible by the start_points.
             If None, points with an unobstructed view to one another will be
             considered visible no matter how far they are from one another.
         cpu_count: An integer for the number of CPUs to be used in the intersection
-            calculation. The ladybug_rhino.grasshopper.recommended_processor_count
+            calculation. The ladybug_tools.sverchok.recommended_processor_count
             function can be used to get a recommendation. If set to None, all
-            available processors will be used. (Default: None).
+            available processors will be used. When more than one CPU is used,
+            the points are handed out in chunks to worker processes that all
+            share one copy of the BVH. (Default: None).
         parallel: Optional boolean to override the cpu_count and use a single CPU
             instead of multiple processors.
 
@@ -209,74 +207,93 @@ def intersect_mesh_lines(
         length equal to the end_points. 0 indicates a blocked ray and 1 indicates
         a ray that was not blocked.
     """
-    int_matrix = [0] * len(start_points)  # matrix to be filled with results
+    bvh = mesh_bvh(mesh)
     if not parallel:
         cpu_count = 1
+    if bvh.node_count != 0 and _use_processes(len(start_points), cpu_count):
+        ranges = chunk_ranges(len(start_points), cpu_count)
+        results = _run_bvh_workers(
+            bvh, _intersect_lines_chunk, ranges, cpu_count,
+            (start_points, end_points, max_dist))
+        return [row for res in results for row in res]
+    return bvh.intersect_lines(start_points, end_points, max_dist)
 
-    def intersect_line(i):
-        """Intersect a line defined by a start and an end with the mesh."""
-        pt = start_points[i]
-        int_list = []
-        for ept in end_points:
-            lin = rg.Line(pt, ept)
-            int_obj = rg.Intersect.Intersection.MeshLine(mesh, lin)
-            is_clear = 1 if None in int_obj or len(int_obj) == 0 else 0
-            int_list.append(is_clear)
-        int_matrix[i] = int_list
-
-    def intersect_line_dist_check(i):
-        """Intersect a line with the mesh with a distance check."""
-        pt = start_points[i]
-        int_list = []
-        for ept in end_points:
-            lin = rg.Line(pt, ept)
-            if lin.Length > max_dist:
-                int_list.append(0)
-            else:
-                int_obj = rg.Intersect.Intersection.MeshLine(mesh, lin)
-                is_clear = 1 if None in int_obj or len(int_obj) == 0 else 0
-                int_list.append(is_clear)
-        int_matrix[i] = int_list
-
-    def intersect_each_line_group(worker_i):
-        """Intersect groups of lines so that only the cpu_count is used."""
-        start_i, stop_i = l_groups[worker_i]
-        for count in range(start_i, stop_i):
-            intersect_line(count)
 
-    def intersect_each_line_group_dist_check(worker_i):
-        """Intersect groups of lines with distance check so only cpu_count is used."""
-        start_i, stop_i = l_groups[worker_i]
-        for count in range(start_i, stop_i):
-            intersect_line_dist_check(count)
-
-    if cpu_count is not None and cpu_count > 1:
-        # group the lines in order to meet the cpu_count
-        l_count = len(start_points)
-        worker_count = min((cpu_count, l_count))
-        i_per_group = int(math.ceil(l_count / worker_count))
-        l_groups = [[x, x + i_per_group] for x in range(0, l_count, i_per_group)]
-        l_groups[-1][-1] = l_count  # ensure the last group ends with line count
-
-    if max_dist is not None:
-        if cpu_count is None:  # use all availabe CPUs
-            tasks.Parallel.ForEach(range(len(start_points)), intersect_line_dist_check)
-        elif cpu_count <= 1:  # run everything on a single processor
-            for i in range(len(start_points)):
-                intersect_line_dist_check(i)
-        else:  # run the groups in a manner that meets the CPU count
-            tasks.Parallel.ForEach(
-                range(len(l_groups)), intersect_each_line_group_dist_check)
-    else:
-        if cpu_count is None:  # use all availabe CPUs
-            tasks.Parallel.ForEach(range(len(start_points)), intersect_line)
-        elif cpu_count <= 1:  # run everything on a single processor
-            for i in range(len(start_points)):
-                intersect_line(i)
-        else:  # run the groups in a manner that meets the CPU count
-            tasks.Parallel.ForEach(
-                range(len(l_groups)), intersect_each_line_group)
-    return int_matrix
+def _use_processes(object_count, cpu_count):
+    """Check whether an intersection should be split across worker processes."""
+    if cpu_count is None:
+        cpu_count = local_processor_count()
+    return cpu_count > 1 and object_count > 1 and shared_memory is not None \
+        and process_context() is not None
+
+
+def _run_bvh_workers(bvh, function, ranges, cpu_count, args):
+    """Run a chunk function in worker processes that share one copy of a MeshBVH.
+
+    The BVH arrays are written once to a block of shared memory, which every
+    worker attaches to when it starts. Only the (start, stop) ranges of each
+    chunk are sent to the workers and the results are returned in chunk order.
+    """
+    shm = shared_memory.SharedMemory(create=True, size=bvh.buffer_byte_size)
+    try:
+        bvh.write_to_buffer(shm.buf)
+        return parallel_map(function, ranges, cpu_count, _init_bvh_worker,
+                            (shm.name, bvh.buffer_sizes, args))
+    finally:
+        _release_bvh_worker()
+        shm.close()
+        shm.unlink()
+
+
+def _init_bvh_worker(shm_name, sizes, args):
+    """Attach a worker process to the shared MeshBVH and store the ray inputs."""
+    global _worker_shm, _worker_bvh, _worker_args
+    _worker_shm = shared_memory.SharedMemory(name=shm_name)
+    _worker_bvh = MeshBVH.from_buffer(_worker_shm.buf, sizes)
+    _worker_args = args
+
+
+def _release_bvh_worker():
+    """Detach this process from the shared MeshBVH if it ran the chunks itself.
+
+    This happens when parallel_map falls back to running the chunks in the
+    calling process, in which case the worker state must not outlive the
+    shared memory that is unlinked afterwards.
+    """
+    global _worker_shm, _worker_bvh, _worker_args
+    if _worker_shm is None:
+        return
+    for view in (_worker_bvh.bounds, _worker_bvh.nodes, _worker_bvh.triangles):
+        view.release()
+    _worker_shm.close()
+    _worker_shm, _worker_bvh, _worker_args = None, None, None
+
+
+def _intersect_rays_chunk(index_range):
+    """Intersect the rays of a range of points in a worker process."""
+    start_i, stop_i = index_range
+    points, vectors, normals = _worker_args
+    if normals is not None:
+        normals = normals[start_i:stop_i]
+    return _worker_bvh.intersect_rays(points[start_i:stop_i], vectors, normals)
+
+
+def _intersect_lines_chunk(index_range):
+    """Intersect the lines of a range of start points in a worker process."""
+    start_i, stop_i = index_range
+    start_points, end_points, max_dist = _worker_args
+    return _worker_bvh.intersect_lines(
+        start_points[start_i:stop_i], end_points, max_dist)
+
+
+def _triangulated_mesh3d(obj):
+    """Get a triangulated Ladybug Mesh3D in world coordinates from a Blender object."""
+    data = obj.data
+    data.calc_loop_triangles()
+    mtx = obj.matrix_world
+    verts = tuple(Point3D(*(mtx @ v.co)) for v in data.vertices)
+    faces = tuple(tuple(tri.vertices) for tri in data.loop_triangles)
+    return Mesh3D(verts, faces)
 
 
 def intersect_solids_parallel(solids, bound_boxes, cpu_count=None):
@@ -13,6 +13,8 @@ except ImportError:
     from collections import Iterable  # python >= 3.8
 from string import ascii_lowercase
 import math
+import operator
+import array as specializedarray
 
 try:
     from itertools import izip as zip  # python 2
@@ -149,8 +151,8 @@ class BaseCollection(object):
         consequences depending on how the data collection is used. Use to_unit to
         get a new instance of a collection without mutating this one.
         """
-        self._values = self._header.data_type.to_unit(
-            self._values, unit, self._header.unit)
+        self._values = self._typed_values(self._header.data_type.to_unit(
+            self._values, unit, self._header.unit))
         self._header._unit = unit
 
     def convert_to_ip(self):
@@ -160,8 +162,9 @@ class BaseCollection(object):
         consequences depending on how the data collection is used. Use to_ip to
         get a new instance of a collection without mutating this one.
         """
-        self._values, self._header._unit = self._header.data_type.to_ip(
+        values, self._header._unit = self._header.data_type.to_ip(
             self._values, self._header.unit)
+        self._values = self._typed_values(values)
 
     def convert_to_si(self):
         """Convert the Data Collection to SI units.
@@ -170,8 +173,9 @@ class BaseCollection(object):
         consequences depending on how the data collection is used. Use to_si to
         get a new instance of a collection without mutating this one.
         """
-        self._values, self._header._unit = self._header.data_type.to_si(
+        values, self._header._unit = self._header.data_type.to_si(
             self._values, self._header.unit)
+        self._values = self._typed_values(values)
 
     def to_unit(self, unit):
         """Get a Data Collection in the input unit.
@@ -584,24 +588,8 @@ class BaseCollection(object):
             and False does not.
         """
         BaseCollection.are_collections_aligned(data_collections)
-        correct_var = BaseCollection._check_conditional_statement(
-            statement, len(data_collections))
-
-        # replace the operators of the statement with non-alphanumeric characters
-        # necessary to avoid replacing the characters of the operators
-        num_statement_clean = BaseCollection._replace_operators(statement)
-
-        pattern = []
-        for i in xrange(len(data_collections[0])):
-            num_statement = num_statement_clean
-            # replace the variable names with their numerical values
-            for j, coll in enumerate(data_collections):
-                var = correct_var[j]
-                num_statement = num_statement.replace(var, str(coll[i]))
-            # put back the operators
-            num_statement = BaseCollection._restore_operators(num_statement)
-            pattern.append(eval(num_statement, {}))
-        return pattern
+        evaluate = BaseCollection._compile_statement(statement, len(data_collections))
+        return evaluate(*[coll.values for coll in data_collections])
 
     @staticmethod
     def are_collections_aligned(data_collections, raise_exception=True):
@@ -686,13 +674,16 @@ class BaseCollection(object):
         else:
             BaseCollection.are_collections_aligned(data_colls)
             val_len = len(data_colls[0].values)
-            for i, col in enumerate(data_collections):
-                data_collections[i] = [col] * val_len if isinstance(col, float) else col
+            columns = [[col] * val_len if isinstance(col, float) else col._values
+                       for col in data_collections]
             result = data_colls[0].get_aligned_collection(data_type=data_type, unit=unit)
             if not result._mutable:
                 result = result.to_mutable()
-            for i in xrange(val_len):
-                result[i] = funct(*[col[i] for col in data_collections])
+            values = [funct(*args) for args in zip(*columns)]
+            if all(isinstance(val, float) for val in values):
+                result._values = data_colls[0]._typed_values(values)
+            else:  # keep results that are not floats (eg. booleans) as they are
+                result._values = values
             return result
 
     @staticmethod
@@ -798,6 +789,39 @@ class BaseCollection(object):
                 )
         return correct_var
 
+    @staticmethod
+    def _compile_statement(statement, num_collections):
+        """Parse a conditional statement once into an evaluator for columns of values.
+
+        Args:
+            statement: A conditional statement as a string (e.g. a>25 and a%5==0).
+                The variable should always be named as 'a' (without quotations).
+            num_collections: An integer representing the number of data collections
+                that the statement will be evaluating.
+
+        Returns:
+            evaluate -- A function that takes one list of values for each variable
+                of the statement (in the order a, b, c...) and returns a list
+                with the result of the statement for each set of values.
+        """
+        correct_var = BaseCollection._check_conditional_statement(
+            statement, num_collections)
+        col_names = ['_{}'.format(var) for var in correct_var]
+        source = '[({}) for ({},) in _zip({})]'.format(
+            statement.lower(), ', '.join(correct_var), ', '.join(col_names))
+        try:
+            code = compile(source, '<statement>', 'eval')
+        except SyntaxError:
+            raise ValueError(
+                'Invalid conditional statement: {}\n '
+                'Statement should be a valid Python statement.'.format(statement))
+
+        def evaluate(*columns):
+            namespace = dict(zip(col_names, columns))
+            namespace['_zip'] = zip
+            return eval(code, namespace)
+        return evaluate
+
     @staticmethod
     def _remove_operators(statement):
         """Remove logical operators from a statement."""
@@ -1025,12 +1049,12 @@ class BaseCollection(object):
 
     def _filter_by_statement(self, statement):
         """Filter the data collection based on a conditional statement."""
-        self.__class__._check_conditional_statement(statement, 1)
+        pattern = self.__class__._compile_statement(statement, 1)(self._values)
         _filt_values, _filt_datetimes = [], []
-        for i, a in enumerate(self._values):
-            if eval(statement, {'a': a}):
+        for a, dt, match in zip(self._values, self.datetimes, pattern):
+            if match:
                 _filt_values.append(a)
-                _filt_datetimes.append(self.datetimes[i])
+                _filt_datetimes.append(dt)
         return _filt_values, _filt_datetimes
 
     def _filter_by_range(self, greater_than, less_than):
@@ -1177,7 +1201,7 @@ class BaseCollection(object):
         return new_obj
 
     def __neg__(self):
-        new_vals = [-v_1 for v_1 in self._values]
+        new_vals = self._typed_values(map(operator.neg, self._values))
         new_obj = self.__class__(self.header.duplicate(), new_vals, self.datetimes)
         new_obj._validated_a_period = self._validated_a_period
         return new_obj
@@ -1190,8 +1214,8 @@ class BaseCollection(object):
                 '{} cannot be added to {}'.format(self.__class__, other.__class__)
             assert len(self) == len(other), 'Length of DataCollections must match in ' \
                 'order to add them together. {} != {}'.format(len(self), len(other))
-            new_vals = [v_1 + v_2 for v_1, v_2 in zip(self._values, other._values)]
-        return new_vals
+            new_vals = map(operator.add, self._values, other._values)
+        return self._typed_values(new_vals)
 
     def _sub_values(self, other):
         if isinstance(other, (int, float)):
@@ -1201,8 +1225,8 @@ class BaseCollection(object):
                 '{} cannot be subtracted from {}'.format(other.__class__, self.__class__)
             assert len(self) == len(other), 'Length of DataCollections must match ' \
                 'to subtract one from the other. {} != {}'.format(len(self), len(other))
-            new_vals = [v_1 - v_2 for v_1, v_2 in zip(self._values, other._values)]
-        return new_vals
+            new_vals = map(operator.sub, self._values, other._values)
+        return self._typed_values(new_vals)
 
     def _mul_values(self, other):
         if isinstance(other, (int, float)):
@@ -1212,8 +1236,8 @@ class BaseCollection(object):
                 '{} cannot be multiplied by {}'.format(other.__class__, self.__class__)
             assert len(self) == len(other), 'Length of DataCollections must match ' \
                 'to multiply them together. {} != {}'.format(len(self), len(other))
-            new_vals = [v_1 * v_2 for v_1, v_2 in zip(self._values, other._values)]
-        return new_vals
+            new_vals = map(operator.mul, self._values, other._values)
+        return self._typed_values(new_vals)
 
     def _div_values(self, other):
         if isinstance(other, (int, float)):
@@ -1223,8 +1247,18 @@ class BaseCollection(object):
                 '{} cannot be divided by {}'.format(other.__class__, self.__class__)
             assert len(self) == len(other), 'Length of DataCollections must match ' \
                 'to divide them. {} != {}'.format(len(self), len(other))
-            new_vals = [v_1 / v_2 for v_1, v_2 in zip(self._values, other._values)]
-        return new_vals
+            new_vals = map(operator.truediv, self._values, other._values)
+        return self._typed_values(new_vals)
+
+    def _typed_values(self, values):
+        """Get new values in the same type of container as the values of this collection.
+
+        This keeps a collection that stores its values in a compact array of
+        doubles backed by such an array after operations that yield new values.
+        """
+        if isinstance(self._values, specializedarray.array):
+            return specializedarray.array(self._values.typecode, values)
+        return values if isinstance(values, list) else list(values)
 
     @property
     def is_continuous(self):
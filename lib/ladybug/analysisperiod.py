@@ -2,13 +2,18 @@
 """Ladybug analysis period class."""
 from __future__ import division
 
-from .dt import DateTime
+from .dt import DateTime, DateTimeIndex
 
-from datetime import datetime, timedelta
+from datetime import timedelta
+from collections import OrderedDict
 import sys
 if (sys.version_info >= (3, 0)):
     xrange = range
 
+# DateTimeIndexes shared between equivalent analysis periods
+_DATETIME_INDEXES = OrderedDict()
+_MAX_DATETIME_INDEXES = 32
+
 
 class AnalysisPeriod(object):
     """An analysis period between two dates of the year and between certain hours.
@@ -61,7 +66,7 @@ class AnalysisPeriod(object):
     __slots__ = (
         '_is_leap_year', '_st_time', '_num_of_days_each_month', '_is_overnight',
         '_is_reversed', '_timestep', '_minute_intervals', '_end_time',
-        '_timestamps_data', '_datetimes'
+        '_timestamps_data'
     )
 
     def __init__(self, st_month=1, st_day=1, st_hour=0, end_month=12,
@@ -111,10 +116,8 @@ class AnalysisPeriod(object):
         self._timestep = timestep
         self._minute_intervals = timedelta(1 / (24.0 * self.timestep))
 
-        # _timestamps_data is a dictionary for datetimes.
-        # key values will be minute of year
+        # _timestamps_data is a DateTimeIndex for the minutes of the year.
         self._timestamps_data = None  # set to None for now and calculate upon request
-        self._datetimes = None
 
     @classmethod
     def from_dict(cls, data):
@@ -239,33 +242,36 @@ class AnalysisPeriod(object):
         return self._end_time
 
     @property
-    def datetimes(self):
-        """A sorted list of hourly datetimes in this analysis period."""
+    def datetime_index(self):
+        """A DateTimeIndex with the minutes of the year in this analysis period.
+
+        The index is shared between all analysis periods with the same start time,
+        end time, timestep and leap year so DateTimes are only created once.
+        """
         if self._timestamps_data is None:
             self._calculate_timestamps()
-        return tuple(self._datetimes)
+        return self._timestamps_data
+
+    @property
+    def datetimes(self):
+        """A sorted list of hourly datetimes in this analysis period."""
+        return self.datetime_index.datetimes
 
     @property
     def moys(self):
         """A sorted list of hourly minutes of year in this analysis period as integers.
         """
-        if self._timestamps_data is None:
-            self._calculate_timestamps()
-        return tuple(self._timestamps_data)
+        return tuple(self.datetime_index.moys)
 
     @property
     def hoys(self):
         """A sorted list of hours of year in this analysis period."""
-        if self._timestamps_data is None:
-            self._calculate_timestamps()
-        return tuple(moy / 60.0 for moy in self._timestamps_data)
+        return tuple(moy / 60.0 for moy in self.datetime_index.moys)
 
     @property
     def hoys_int(self):
         """A sorted list of hours of year in this analysis period as integers."""
-        if self._timestamps_data is None:
-            self._calculate_timestamps()
-        return tuple(int(moy / 60.0) for moy in self._timestamps_data)
+        return tuple(int(moy / 60.0) for moy in self.datetime_index.moys)
 
     @property
     def doys_int(self):
@@ -354,9 +360,7 @@ class AnalysisPeriod(object):
         Returns:
             A boolean. True if time is included in analysis period
         """
-        if self._timestamps_data is None:
-            self._calculate_timestamps()
-        return time.moy in self._timestamps_data
+        return time.moy in self.datetime_index
 
     def duplicate(self):
         """Return a copy of the analysis period."""
@@ -381,50 +385,42 @@ class AnalysisPeriod(object):
             'type': 'AnalysisPeriod'
         }
 
-    def _calc_timestamps(self, st_time, end_time):
-        """Calculate timesteps between start time and end time.
+    def _calc_timestamps(self, st_time, end_time, moys):
+        """Calculate the minutes of the year between start time and end time.
 
         Use this method only when start time month is before end time month.
         """
-        # calculate based on minutes
-        # I have to convert the object to DateTime because of how Dynamo
-        # works: https://github.com/DynamoDS/Dynamo/issues/6683
-        # Do not modify this line to datetime
-        curr = datetime(st_time.year, st_time.month, st_time.day, st_time.hour,
-                        st_time.minute, self.is_leap_year)
-        end_time = datetime(end_time.year, end_time.month, end_time.day,
-                            end_time.hour, end_time.minute, self.is_leap_year)
-
-        while curr <= end_time:
-            if self.is_possible_hour(curr.hour + (curr.minute / 60.0)):
-                time = DateTime(curr.month, curr.day, curr.hour, curr.minute,
-                                self.is_leap_year)
-                self._timestamps_data.append(time.moy)
-                self._datetimes.append(time)
-            curr += self.minute_intervals
-
-        if self.timestep != 1 and curr.hour == 23 and self.is_possible_hour(0):
+        step = int(60 / self.timestep)
+        curr, end_moy = st_time.moy, end_time.moy
+        while curr <= end_moy:
+            if self.is_possible_hour((curr // 60) % 24 + (curr % 60) / 60.0):
+                moys.append(curr)
+            curr += step
+
+        if self.timestep != 1 and (curr // 60) % 24 == 23 and self.is_possible_hour(0):
             # This is for cases that timestep is more than one
             # and last hour of the day is part of the calculation
-            curr = end_time
-            for _ in list(xrange(self.timestep))[1:]:
-                curr += self.minute_intervals
-                time = DateTime(curr.month, curr.day, curr.hour, curr.minute,
-                                self.is_leap_year)
-                self._timestamps_data.append(time.moy)
-                self._datetimes.append(time)
+            for i in xrange(1, self.timestep):
+                moys.append(end_moy + i * step)
 
     def _calculate_timestamps(self):
-        """Return a list of Ladybug DateTimes in this analysis period."""
-        self._timestamps_data = []
-        self._datetimes = []
-        if not self._is_reversed:
-            self._calc_timestamps(self.st_time, self.end_time)
-        else:
-            self._calc_timestamps(
-                self.st_time, DateTime.from_last_hour(self.is_leap_year))
-            self._calc_timestamps(
-                DateTime.from_first_hour(self.is_leap_year), self.end_time)
+        """Get the shared DateTimeIndex of the timesteps in this analysis period."""
+        key = (self.st_time.moy, self.end_time.moy, self.timestep, self.is_leap_year)
+        try:
+            self._timestamps_data = _DATETIME_INDEXES.pop(key)
+        except KeyError:
+            moys = []
+            if not self._is_reversed:
+                self._calc_timestamps(self.st_time, self.end_time, moys)
+            else:
+                self._calc_timestamps(
+                    self.st_time, DateTime.from_last_hour(self.is_leap_year), moys)
+                self._calc_timestamps(
+                    DateTime.from_first_hour(self.is_leap_year), self.end_time, moys)
+            self._timestamps_data = DateTimeIndex(moys, self.is_leap_year)
+            while len(_DATETIME_INDEXES) >= _MAX_DATETIME_INDEXES:
+                _DATETIME_INDEXES.popitem(last=False)
+        _DATETIME_INDEXES[key] = self._timestamps_data
 
     def _calc_daystamps(self, st_time, end_time):
         """Calculate days of the year between start time and end time.
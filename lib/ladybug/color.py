@@ -2,11 +2,18 @@
 """Ladybug color, colorsets and colorrange."""
 from __future__ import division
 
+from bisect import bisect_left
+
 try:
     from collections.abc import Iterable  # python < 3.7
 except ImportError:
     from collections import Iterable  # python >= 3.8
 
+try:  # python 2
+    xrange
+except NameError:  # python 3
+    xrange = range
+
 
 class Color(object):
     """Ladybug RGBA color.
@@ -146,6 +153,113 @@ class Color(object):
         return "(R:%d, G:%d, B:%d, A:%d)" % (self._r, self._g, self._b, self._a)
 
 
+class ColorArray(object):
+    """A compact, immutable array of RGBA colors packed into bytes.
+
+    Each color occupies four consecutive bytes (R, G, B, A) of the array, which
+    makes it much lighter than a list of Color objects for large meshes. Individual
+    Color objects are only built when the array is indexed or iterated over.
+
+    Args:
+        rgba: A bytes or bytearray object with four bytes for each color in the
+            array. Default: An empty array.
+
+    Properties:
+        * rgba
+    """
+    __slots__ = ("_rgba",)
+
+    def __init__(self, rgba=None):
+        """Initialize ColorArray."""
+        rgba = bytes(bytearray(rgba)) if rgba is not None else b''
+        assert len(rgba) % 4 == 0, 'The length of a ColorArray rgba must be ' \
+            'a multiple of 4. Got {}.'.format(len(rgba))
+        self._rgba = rgba
+
+    @classmethod
+    def from_colors(cls, colors):
+        """Create a ColorArray from a list of Color objects.
+
+        Args:
+            colors: A list of ladybug Color objects.
+        """
+        rgba = bytearray()
+        for col in colors:
+            rgba.extend((col.r, col.g, col.b, col.a))
+        return cls(rgba)
+
+    @property
+    def rgba(self):
+        """Get the bytes of the array with four values (R, G, B, A) per color."""
+        return self._rgba
+
+    def to_colors(self):
+        """Get a tuple of Color objects for the colors of the array.
+
+        Identical colors in the array are represented by the same Color object.
+        """
+        rgba, _colors, colors = bytearray(self._rgba), {}, []
+        for i in xrange(0, len(rgba), 4):
+            key = self._rgba[i:i + 4]
+            try:
+                colors.append(_colors[key])
+            except KeyError:
+                col = _colors[key] = Color(rgba[i], rgba[i + 1], rgba[i + 2],
+                                           rgba[i + 3])
+                colors.append(col)
+        return tuple(colors)
+
+    def duplicate(self):
+        """Return a copy of the current color array."""
+        return self.__copy__()
+
+    def __copy__(self):
+        return self.__class__(self._rgba)
+
+    def __len__(self):
+        return len(self._rgba) // 4
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step == 1:
+                return self.__class__(self._rgba[4 * start:4 * max(start, stop)])
+            return self.__class__.from_colors(self.to_colors()[key])
+        count = len(self)
+        if key < 0:
+            key += count
+        if not 0 <= key < count:
+            raise IndexError('ColorArray index out of range.')
+        r, g, b, a = bytearray(self._rgba[4 * key:4 * key + 4])
+        return Color(r, g, b, a)
+
+    def __iter__(self):
+        return iter(self.to_colors())
+
+    def __eq__(self, other):
+        if isinstance(other, ColorArray):
+            return self._rgba == other._rgba
+        try:
+            return len(self) == len(other) and \
+                all(c1 == c2 for c1, c2 in zip(self, other))
+        except TypeError:
+            return False
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(self._rgba)
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __repr__(self):
+        """Color array representation."""
+        return "Color Array ({} colors)".format(len(self))
+
+
 # TODO: Add support for CMYK
 class Colorset(object):
     """Ladybug Color-range repository.
@@ -620,6 +734,92 @@ class ColorRange(object):
                 else:
                     return self._colors[count + 1]
 
+    def color_array(self, values, lut_size=None):
+        """Calculate the colors along the range for a list of values all at once.
+
+        This is much faster than calling the color method for each value since
+        the domain is searched with a bisection, the blending factors of each
+        segment of the domain are only computed once, the colors of repeated
+        values are only computed once and no Color objects are created.
+
+        Args:
+            values: A list of numbers for which colors will be computed.
+            lut_size: An optional integer for the number of bins of a lookup table
+                that will be pre-computed between the minimum and maximum of the
+                domain. When specified, each value of a continuous color range
+                gets the color of the nearest bin, which is an approximation
+                of the exact color (eg. 4096 bins is visually indistinguishable
+                from the exact colors). Segmented color ranges are always
+                computed exactly. If None, all colors are exact. (Default: None).
+
+        Returns:
+            A ColorArray with one color for each of the input values.
+        """
+        _colors, _domain = self._colors, self._domain
+        d_min, d_max = _domain[0], _domain[-1]
+        c_min = (_colors[0].r, _colors[0].g, _colors[0].b, _colors[0].a)
+        c_max = (_colors[-1].r, _colors[-1].g, _colors[-1].b, _colors[-1].a)
+        rgba = []
+        extend = rgba.extend
+
+        if lut_size and self._continuous_colors and d_max > d_min:
+            # pre-compute the colors of the bins of the lookup table
+            lut_size = int(lut_size)
+            assert lut_size >= 2, 'lut_size must be at least 2. Got {}.'.format(
+                lut_size)
+            step = (d_max - d_min) / (lut_size - 1)
+            lut = [tuple(bytearray(self._color_bytes(d_min + i * step)))
+                   for i in xrange(lut_size)]
+            for val in values:
+                if val < d_min:
+                    extend(c_min)
+                elif val > d_max:
+                    extend(c_max)
+                else:
+                    extend(lut[int((val - d_min) / step + 0.5)])
+            return ColorArray(bytearray(rgba))
+
+        memo = {}
+        if self._continuous_colors:
+            # the start, width and start/change of each color channel of each segment
+            segments = []
+            for i in xrange(len(_domain) - 1):
+                c_0, c_1 = _colors[i], _colors[i + 1]
+                segments.append((_domain[i], _domain[i + 1] - _domain[i],
+                                 c_0.r, c_1.r - c_0.r, c_0.g, c_1.g - c_0.g,
+                                 c_0.b, c_1.b - c_0.b))
+            for val in values:
+                if val < d_min:
+                    extend(c_min)
+                elif val > d_max:
+                    extend(c_max)
+                else:
+                    col = memo.get(val)
+                    if col is None:
+                        index = bisect_left(_domain, val)
+                        start, width, r_0, d_r, g_0, d_g, b_0, d_b = \
+                            segments[index - 1 if index > 0 else 0]
+                        try:
+                            factor = (val - start) / width
+                        except ZeroDivisionError:
+                            factor = 0
+                        # same expressions as _cal_color
+                        col = memo[val] = (int(round(factor * d_r + r_0)),
+                                           int(round(factor * d_g + g_0)),
+                                           int(round(factor * d_b + b_0)), 255)
+                    extend(col)
+        else:
+            seg_colors = [(col.r, col.g, col.b, col.a) for col in _colors]
+            seg_colors[0] = seg_colors[1]  # values equal to the minimum
+            for val in values:
+                if val < d_min:
+                    extend(c_min)
+                elif val > d_max:
+                    extend(c_max)
+                else:
+                    extend(seg_colors[bisect_left(_domain, val)])
+        return ColorArray(bytearray(rgba))
+
     def duplicate(self):
         """Return a copy of the current color range."""
         return self.__copy__()
@@ -650,6 +850,15 @@ class ColorRange(object):
 
         return Color(red, green, blue)
 
+    def _color_bytes(self, value):
+        """Get the packed RGBA bytes of a value within the domain of the range."""
+        index = bisect_left(self._domain, value)
+        if self._continuous_colors:
+            col = self._cal_color(value, index - 1 if index > 0 else 0)
+        else:
+            col = self._colors[index if index > 0 else 1]
+        return bytes(bytearray((col.r, col.g, col.b, col.a)))
+
     def __copy__(self):
         return self.__class__(self.colors, self.domain, self.continuous_colors)
 
@@ -33,6 +33,7 @@ from __future__ import division
 
 from collections import OrderedDict
 from copy import deepcopy
+import array as specializedarray
 try:
     from collections.abc import Iterable  # python < 3.7
 except ImportError:
@@ -176,7 +177,7 @@ class HourlyDiscontinuousCollection(BaseCollection):
         Return:
             A new Data Collection with filtered data
         """
-        _filt_values, _filt_datetimes = self._filter_by_moys_slow(moys)
+        _filt_values, _filt_datetimes = self._filter_by_moys(moys)
         collection = HourlyDiscontinuousCollection(
             self.header.duplicate(), _filt_values, _filt_datetimes)
         collection._validated_a_period = self._validated_a_period
@@ -469,15 +470,17 @@ class HourlyDiscontinuousCollection(BaseCollection):
         _step = (end - start) / float(step_count)
         return (start + (i * _step) for i in xrange(int(step_count)))
 
-    def _filter_by_moys_slow(self, moys):
-        """Filter the Data Collection with a slow method that always works."""
-        _filt_values = []
-        _filt_datetimes = []
-        for i, d in enumerate(self.datetimes):
-            if d.moy in moys:
-                _filt_datetimes.append(d)
-                _filt_values.append(self._values[i])
-        return _filt_values, _filt_datetimes
+    def _filter_by_moys(self, moys):
+        """Filter the Data Collection using a set of the input minutes of the year."""
+        moys = set(moys)
+        indices = [i for i, d in enumerate(self.datetimes) if d.moy in moys]
+        return self._gather(indices)
+
+    def _gather(self, indices):
+        """Get lists of values and datetimes at an array of indices of the collection.
+        """
+        _values, _datetimes = self._values, self.datetimes
+        return [_values[i] for i in indices], [_datetimes[i] for i in indices]
 
     def _timestep_cull(self, timestep):
         """Cull out values that do not fit a timestep."""
@@ -576,7 +579,11 @@ class HourlyContinuousCollection(HourlyDiscontinuousCollection):
             must have an AnalysisPeriod on it that aligns with the
             list of values.
         values: A list of values. Note that the length of this list
-            must align with the AnalysisPeriod on the header.
+            must align with the AnalysisPeriod on the header. This can also
+            be an array of doubles (array.array('d')), in which case the
+            collection stores its values in a compact typed array (8 bytes
+            per value) and keeps this type of storage through arithmetic,
+            unit conversion and filtering by analysis period.
 
     Properties:
         * average
@@ -586,6 +593,7 @@ class HourlyContinuousCollection(HourlyDiscontinuousCollection):
         * header
         * is_continuous
         * is_mutable
+        * is_typed_array
         * max
         * median
         * min
@@ -644,6 +652,34 @@ class HourlyContinuousCollection(HourlyDiscontinuousCollection):
             self._datetimes = self.header.analysis_period.datetimes
         return self._datetimes
 
+    @property
+    def values(self):
+        """Get a tuple of numerical values for this collection."""
+        return tuple(self._values)
+
+    @values.setter
+    def values(self, values):
+        self._check_values(values)
+        if isinstance(values, specializedarray.array) and values.typecode == 'd':
+            self._values = specializedarray.array('d', values)
+        else:
+            self._values = list(values)
+
+    @property
+    def is_typed_array(self):
+        """Boolean noting whether the values are stored in a compact array of doubles.
+        """
+        return isinstance(self._values, specializedarray.array)
+
+    def to_typed_array(self):
+        """Get a copy of this collection with values stored in a compact typed array.
+
+        The values of the resulting collection are stored as an array of doubles,
+        which uses 8 bytes per value instead of a list of Python floats.
+        """
+        return HourlyContinuousCollection(
+            self.header.duplicate(), specializedarray.array('d', self._values))
+
     def interpolate_holes(self):
         """All continuous collections do not have holes in the data set.
 
@@ -798,39 +834,26 @@ class HourlyContinuousCollection(HourlyDiscontinuousCollection):
         Return:
             A new Data Collection with filtered data
         """
-        existing_hoys = self.header.analysis_period.hoys
-        hoys = [h for h in hoys if h in existing_hoys]
-        _moys = tuple(int(round(hour * 60)) for hour in hoys)
+        dt_index = self.header.analysis_period.datetime_index
+        _moys = []
+        for hour in hoys:
+            moy = int(round(hour * 60))
+            if moy / 60.0 == hour and moy in dt_index:
+                _moys.append(moy)
         return self.filter_by_moys(_moys)
 
     def filter_by_moys(self, moys):
         """Filter the Data Collection based on a list of minutes of the year.
 
         Args:
-           moys: A List of minutes of the year [0..8759 * 60]
+           moys: A List of minutes of the year [0..8759 * 60]. Minutes of the
+                year that are not in the collection are ignored.
 
         Return:
             A new Data Collection with filtered data
         """
-        t_s = 60 / self.header.analysis_period.timestep
-        st_ind = self.header.analysis_period.st_time.moy / t_s
-        if not self.header.analysis_period.is_reversed:
-            _filt_indices = [int(moy / t_s - st_ind) for moy in moys]
-        else:
-            if not self.header.analysis_period.is_leap_year:
-                eoy_ind = 8759 * self.header.analysis_period.timestep - st_ind
-            else:
-                eoy_ind = 8783 * self.header.analysis_period.timestep - st_ind
-            _filt_indices = []
-            for moy in moys:
-                ind = moy / t_s
-                if ind > st_ind:
-                    _filt_indices.append(int(ind - st_ind))
-                else:
-                    _filt_indices.append(int(ind + eoy_ind))
-
-        _filt_values = [self._values[i] for i in _filt_indices]
-        _filt_datetimes = [self.datetimes[i] for i in _filt_indices]
+        _filt_indices = self.header.analysis_period.datetime_index.indices(moys)
+        _filt_values, _filt_datetimes = self._gather(_filt_indices)
         _filt_header = self.header.duplicate()
         coll = HourlyDiscontinuousCollection(_filt_header, _filt_values, _filt_datetimes)
         coll._validated_a_period = True
@@ -888,6 +911,35 @@ class HourlyContinuousCollection(HourlyDiscontinuousCollection):
                 indx += interval
         return hourly_data_by_month
 
+    def group_by_month_per_hour(self):
+        """Return a dictionary of this collection's values grouped by each month per hour.
+
+        Key values are tuples of 3 integers.
+
+        -   The first represents the month of the year between 1-12.
+
+        -   The second represents the hour of the day between 0-24.
+
+        -   The third represents the minute of the minute of the hour between 0-59.
+        """
+        a_per = self.header.analysis_period
+        if not a_per.is_annual:
+            return HourlyDiscontinuousCollection.group_by_month_per_hour(self)
+
+        # annual values can be sliced with a stride of one day for each hour
+        t_step = a_per.timestep
+        day_steps = 24 * t_step
+        data_by_month_per_hour = OrderedDict()
+        st_i = 0
+        for m in xrange(1, 13):
+            end_i = st_i + a_per._num_of_days_each_month[m - 1] * day_steps
+            month_vals = self._values[st_i:end_i]
+            for h in xrange(0, day_steps):
+                hr, mi = int(h / t_step), int((h % t_step) * (60 / t_step))
+                data_by_month_per_hour[(m, hr, mi)] = month_vals[h::day_steps]
+            st_i = end_i
+        return data_by_month_per_hour
+
     def to_immutable(self):
         """Get an immutable version of this collection."""
         if self._enumeration is None:
@@ -973,7 +1025,7 @@ class HourlyContinuousCollection(HourlyDiscontinuousCollection):
         """Convert Data Collection to a dictionary."""
         return {
             'header': self.header.to_dict(),
-            'values': self._values,
+            'values': self._values if not self.is_typed_array else list(self._values),
             'type': self._collection_type
         }
 
@@ -1039,14 +1091,14 @@ class HourlyContinuousCollection(HourlyDiscontinuousCollection):
         return self.__class__(self.header, new_vals)
 
     def __neg__(self):
-        new_vals = [-v_1 for v_1 in self._values]
+        new_vals = self._typed_values(-v_1 for v_1 in self._values)
         return self.__class__(self.header, new_vals)
 
     def __key(self):
         return (self.header, self.values)
 
     def __copy__(self):
-        return self.__class__(self.header.duplicate(), list(self._values))
+        return self.__class__(self.header.duplicate(), self._values[:])
 
     def __repr__(self):
         """Hourly Discontinuous Collection representation."""
@@ -3,6 +3,8 @@
 from __future__ import division
 
 from datetime import datetime, date, time
+from bisect import bisect_right
+import array as specializedarray
 
 MONTHNAMES = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep',
               'Oct', 'Nov', 'Dec')
@@ -575,3 +577,119 @@ class Time(time):
     def __repr__(self):
         """Return time as a string."""
         return self.__str__()
+
+
+class DateTimeIndex(object):
+    """An immutable index of the minutes of the year of a series of timesteps.
+
+    The index stores the minutes of the year as a compact array of integers and
+    only creates the DateTime objects of the timesteps when they are requested.
+    Indexes are usually obtained from the datetime_index property of an
+    AnalysisPeriod, which shares one index between all equivalent periods.
+
+    Args:
+        moys: A list of integers for the minutes of the year of each timestep.
+        leap_year: A boolean to indicate if the minutes of the year are for a
+            leap year. (Default: False).
+
+    Properties:
+        * moys
+        * leap_year
+        * datetimes
+        * doys
+        * months
+    """
+    __slots__ = ('_moys', '_leap_year', '_datetimes', '_moy_indices')
+    _MONTH_MINUTES = (0, 44640, 84960, 129600, 172800, 217440, 260640,
+                      305280, 349920, 393120, 437760, 480960)
+    _MONTH_MINUTES_LEAP = (0, 44640, 86400, 131040, 174240, 218880, 262080,
+                           306720, 351360, 394560, 439200, 482400)
+
+    def __init__(self, moys, leap_year=False):
+        """Initialize DateTimeIndex."""
+        self._moys = specializedarray.array('i', moys)
+        self._leap_year = bool(leap_year)
+        self._datetimes = None
+        self._moy_indices = None
+
+    @property
+    def moys(self):
+        """An array of integers for the minutes of the year. This must not be edited.
+        """
+        return self._moys
+
+    @property
+    def leap_year(self):
+        """A boolean to indicate if the minutes of the year are for a leap year."""
+        return self._leap_year
+
+    @property
+    def datetimes(self):
+        """A tuple of DateTimes for the timesteps, which are created upon first request.
+        """
+        if self._datetimes is None:
+            from_moy, leap_year = DateTime.from_moy, self._leap_year
+            self._datetimes = tuple(from_moy(moy, leap_year) for moy in self._moys)
+        return self._datetimes
+
+    @property
+    def doys(self):
+        """An array of integers for the day of the year of each timestep (1-366)."""
+        return specializedarray.array('H', (moy // 1440 + 1 for moy in self._moys))
+
+    @property
+    def months(self):
+        """An array of integers for the month of each timestep (1-12)."""
+        month_minutes = self._MONTH_MINUTES_LEAP if self._leap_year \
+            else self._MONTH_MINUTES
+        return specializedarray.array(
+            'B', (bisect_right(month_minutes, moy) for moy in self._moys))
+
+    def index(self, moy):
+        """Get the position of a minute of the year in this index.
+
+        Args:
+            moy: An integer for a minute of the year.
+        """
+        try:
+            return self._moy_map()[moy]
+        except KeyError:
+            raise ValueError('{} is not a minute of the year in the index.'.format(moy))
+
+    def indices(self, moys):
+        """Get the positions of several minutes of the year in this index.
+
+        Args:
+            moys: A list of integers for minutes of the year. Minutes of the
+                year that are not in this index are skipped.
+
+        Returns:
+            An array of integers for the positions of the moys in this index,
+            in the order of the input moys.
+        """
+        moy_map = self._moy_map()
+        return specializedarray.array(
+            'i', (moy_map[moy] for moy in moys if moy in moy_map))
+
+    def _moy_map(self):
+        """Get a dictionary from each minute of the year to its position."""
+        if self._moy_indices is None:
+            self._moy_indices = {m: i for i, m in enumerate(self._moys)}
+        return self._moy_indices
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __len__(self):
+        return len(self._moys)
+
+    def __iter__(self):
+        return iter(self._moys)
+
+    def __contains__(self, moy):
+        return moy in self._moy_map()
+
+    def __repr__(self):
+        return 'DateTime Index ({} timesteps)'.format(len(self._moys))
+
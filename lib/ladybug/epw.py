@@ -3,6 +3,7 @@ from __future__ import division
 
 import os
 import math
+import array as specializedarray
 
 from ladybug_geometry.geometry2d.pointvector import Vector2D
 
@@ -17,6 +18,7 @@ from .ddy import DDY
 from .futil import write_to_file
 from .header import Header
 from .location import Location
+from .epwcache import read_epw_cache, write_epw_cache, DEFAULT_CACHE_FOLDER
 from .climatezone import ashrae_climate_zone
 from .skymodel import calc_sky_temperature
 from .psychrometrics import rel_humid_from_db_dpt, wet_bulb_from_db_rh
@@ -57,6 +59,12 @@ class EPW(object):
     an EPW object. So the radiation with the 12:00 datetime in the hourly data
     collection represents the accumulated radiation in between 12:00 and 13:00.
 
+    When an .epw file is imported, its parsed data is written to a binary cache
+    in the EPW.CACHE_FOLDER (see ladybug.epwcache), which is a folder in the
+    temporary directory by default. Subsequent imports of the same unchanged
+    file will memory-map this cache and only load the fields that are requested.
+    Set EPW.CACHE_FOLDER to None to always parse the text file.
+
     Args:
         file_path: Local file address to an .epw file.
 
@@ -109,11 +117,12 @@ class EPW(object):
         * sky_temperature
     """
     __slots__ = ('_file_path', '_is_header_loaded', '_is_data_loaded', '_is_ip',
-                 '_data', '_metadata', '_location',
+                 '_data', '_columns', '_cache', '_metadata', '_location',
                  '_heating_dict', '_cooling_dict', '_extremes_dict',
                  '_extreme_hot_weeks', '_extreme_cold_weeks', '_typical_weeks',
                  '_monthly_ground_temps', '_is_leap_year', 'daylight_savings_start',
                  'daylight_savings_end', '_num_of_fields', 'comments_1', 'comments_2')
+    CACHE_FOLDER = DEFAULT_CACHE_FOLDER
 
     def __init__(self, file_path):
         """Initialize an EPW object from from a local .epw file.
@@ -125,6 +134,8 @@ class EPW(object):
 
         # placeholders for the EPW data that will be imported
         self._data = []
+        self._columns = []
+        self._cache = None
         self._metadata = {}
         self._heating_dict = {}
         self._cooling_dict = {}
@@ -364,51 +375,54 @@ class EPW(object):
         assert self._file_path.lower().endswith('epw'), '{} is not an .epw file. \n' \
             'It does not possess the .epw file extension.'.format(self._file_path)
 
+        if self.CACHE_FOLDER and self._import_cache(import_header_only):
+            return
+
         try:
-            with open(self._file_path, readmode) as epwin:
-                # import the header data to the object
-                line = epwin.readline()
-                original_header_load = bool(self._is_header_loaded)
-                if not self._is_header_loaded:
-                    self._import_location(line)
-                    header_lines = [line] + [epwin.readline() for i in xrange(7)]
-                    self._import_header(header_lines)
-                if import_header_only:
-                    return
-
-                # import the body of the data to the object
-                if original_header_load:
-                    for _ in xrange(7):
-                        epwin.readline()
-                body_lines = []
-                while line:
-                    line = epwin.readline()
-                    body_lines.append(line)
-                del body_lines[-1]  # last line is a blank space
-                self._import_body(body_lines)
+            self._import_file(readmode, import_header_only)
         except UnicodeDecodeError:  # let's hope it's just latin characters
             # TODO: do a better job of trying to sense the encoding
-            with open(self._file_path, readmode, errors='ignore') as epwin:
-                # import the header data to the object
-                line = epwin.readline()
-                original_header_load = bool(self._is_header_loaded)
-                if not self._is_header_loaded:
-                    self._import_location(line)
-                    header_lines = [line] + [epwin.readline() for i in xrange(7)]
-                    self._import_header(header_lines)
-                if import_header_only:
-                    return
-
-                # import the body of the data to the object
-                if original_header_load:
-                    for _ in xrange(7):
-                        epwin.readline()
-                body_lines = []
-                while line:
-                    line = epwin.readline()
-                    body_lines.append(line)
-                del body_lines[-1]  # last line is a blank space
-                self._import_body(body_lines)
+            self._import_file(readmode, import_header_only, errors='ignore')
+
+    def _import_file(self, mode, import_header_only=False, **kwargs):
+        """Import the header and, optionally, the body from the text of the epw file."""
+        with open(self._file_path, mode, **kwargs) as epwin:
+            # import the header data to the object
+            header_lines = [epwin.readline() for i in xrange(8)]
+            if not self._is_header_loaded:
+                self._import_location(header_lines[0])
+                self._import_header(header_lines)
+            if import_header_only:
+                return
+
+            # import the body of the data to the object
+            self._import_body(epwin.readlines())
+        if self.CACHE_FOLDER:
+            write_epw_cache(
+                self._file_path, header_lines, self._columns, self.CACHE_FOLDER)
+
+    def _import_cache(self, import_header_only=False):
+        """Import the header and data of the epw file from its binary cache.
+
+        Returns:
+            True if the file has an up-to-date cache that was imported. False
+            if it does not and the text of the file must be parsed.
+        """
+        cache = read_epw_cache(self._file_path, self.CACHE_FOLDER)
+        if cache is None:
+            return False
+        if not self._is_header_loaded:
+            self._import_location(cache.header_lines[0])
+            self._import_header(cache.header_lines)
+        if import_header_only:
+            cache.close()
+            return True
+        self._num_of_fields = cache.field_count
+        self._columns = [None] * self._num_of_fields
+        self._data = [None] * self._num_of_fields
+        self._cache = cache
+        self._is_data_loaded = True
+        return True
 
     def _import_location(self, line):
         """Set the EPW location from the first line of the EPW.
@@ -508,56 +522,89 @@ class EPW(object):
         self._is_header_loaded = True
 
     def _import_body(self, body_lines):
-        """Set all of the EPW data collections by parsing from the body lines."""
-        # get the number of fields and make an annual analysis period
-        self._num_of_fields = min(len(body_lines[0].strip().split(',')), 35)
-        analysis_period = AnalysisPeriod(is_leap_year=self.is_leap_year)
+        """Set all of the EPW data columns by parsing from the body lines.
 
-        # create headers and an empty list for each field in epw file
-        headers = []
-        for field_number in xrange(self._num_of_fields):
-            field = EPWFields.field_by_number(field_number)
-            header = Header(data_type=field.name, unit=field.unit,
-                            analysis_period=analysis_period,
-                            metadata=dict(self._metadata))
-            headers.append(header)
-            self._data.append([])
+        The body is parsed in bulk into one typed column for each field and the
+        data collections are only built from these columns once each of them
+        is requested (see _get_data_by_field).
+        """
+        rows = [line.split(',') for line in (ln.strip() for ln in body_lines) if line]
+        self._num_of_fields = min(len(rows[0]), 35)
+        if min(len(row) for row in rows) < self._num_of_fields:
+            for x, row in enumerate(rows):
+                if len(row) < self._num_of_fields:
+                    raise ValueError(
+                        'EPW data at index {} has {} fields but {} were expected.'
+                        '\n{}'.format(x, len(row), self._num_of_fields, ','.join(row)))
+
+        # parse the hourly data into columns; one for each field
+        self._columns = []
+        for field_number, column in zip(xrange(self._num_of_fields), zip(*rows)):
+            field = EPWFields._fields[field_number]
+            values = self._parse_column(column, field)
+            # if the first value is at 1 AM, move last item to start position
+            if field['name'].point_in_time:
+                values = values[-1:] + values[:-1]
+            self._columns.append(values)
+        self._data = [None] * self._num_of_fields
+        self._is_data_loaded = True
+
+    @staticmethod
+    def _parse_column(column, field):
+        """Cast a column of text values from the EPW body to the type of a field.
 
-        # parse the hourly data
+        Args:
+            column: A list of text values for a field with one value per hour.
+            field: The dictionary of the field from EPWFields.
+
+        Returns:
+            An array of doubles for float fields, an array of integers for int
+            fields and a list for all other fields.
+        """
+        value_type = field['type']
+        try:
+            if value_type is float:
+                return specializedarray.array('d', [float(v) for v in column])
+            elif value_type is int:
+                return specializedarray.array('i', [int(v) for v in column])
+            return list(column)
+        except (ValueError, OverflowError):
+            pass  # check the values one by one to handle floats in int fields
+
+        values = []
         msg_template = 'Failed to parse EPW data for field "{}" at index {}.\n{}'
-        for x, line in enumerate(body_lines):
-            l_strip = line.strip()
-            if not l_strip:  # blank line
-                continue
-            data = l_strip.split(',')
-            for field_number in xrange(self._num_of_fields):
-                value_type = EPWFields.field_by_number(field_number).value_type
+        for x, val in enumerate(column):
+            try:
+                value = value_type(val)
+            except ValueError as e:
+                # failed to cast the data to the correct type
+                if value_type != int:  # possibly an int to convert to float first
+                    raise ValueError(msg_template.format(field['name'], x, e))
                 try:
-                    value = value_type(data[field_number])
-                except ValueError as e:
-                    # failed to cast the data to the correct type
-                    if value_type != int:  # possibly an int to convert to float first
-                        msg = msg_template.format(headers[field_number].data_type, x, e)
-                        raise ValueError(msg)
-                    try:
-                        value = int(round(float(data[field_number])))
-                    except ValueError:
-                        msg = msg_template.format(headers[field_number].data_type, x, e)
-                        raise ValueError(msg)
-                self._data[field_number].append(value)
-
-        # if the first value is at 1 AM, move last item to start position
-        for field_number in xrange(self._num_of_fields):
-            point_in_time = headers[field_number].data_type.point_in_time
-            if point_in_time:
-                # move the last hour to first position
-                last_hour = self._data[field_number].pop()
-                self._data[field_number].insert(0, last_hour)
-
-        # finally, build the data collection objects from the headers and data
-        for i in xrange(self._num_of_fields):
-            self._data[i] = HourlyContinuousCollection(headers[i], self._data[i])
-        self._is_data_loaded = True
+                    value = int(round(float(val)))
+                except ValueError:
+                    raise ValueError(msg_template.format(field['name'], x, e))
+            values.append(value)
+        return values
+
+    def _build_collection(self, field_number):
+        """Build the data collection of a field from its parsed column of values."""
+        field = EPWFields.field_by_number(field_number)
+        header = Header(data_type=field.name, unit=field.unit,
+                        analysis_period=AnalysisPeriod(is_leap_year=self.is_leap_year),
+                        metadata=dict(self._metadata))
+        values = self._columns[field_number]
+        if values is None:  # load the values from the memory-mapped cache
+            values = self._cache.column(field_number)
+        collection = HourlyContinuousCollection(header, values)
+        if self._is_ip:
+            collection.convert_to_ip()
+        self._columns[field_number] = None  # the collection now owns the values
+        return collection
+
+    def _collections(self):
+        """Get a list of all data collections, building any that are not yet built."""
+        return [self._get_data_by_field(i) for i in xrange(self._num_of_fields)]
 
     @property
     def file_path(self):
@@ -608,7 +655,8 @@ class EPW(object):
             'must be a dictionary. Got {}.'.format(type(meta_d))
         self._metadata = meta_d
         for coll in self._data:
-            coll.header._metadata = meta_d
+            if coll is not None:
+                coll.header._metadata = meta_d
 
     @property
     def annual_heating_design_day_996(self):
@@ -876,7 +924,13 @@ class EPW(object):
         if not 0 <= field_number < self._num_of_fields:
             raise ValueError("Field number should be between 0-%d" % self._num_of_fields)
 
-        return self._data[field_number]
+        collection = self._data[field_number]
+        if collection is None:  # build the collection from the parsed column
+            collection = self._data[field_number] = self._build_collection(field_number)
+            if self._cache is not None and all(d is not None for d in self._data):
+                self._cache.close()  # all fields are loaded; the cache is not needed
+                self._cache = None
+        return collection
 
     def import_data_by_field(self, field_number):
         """Return an annual data collection for any field_number in epw file.
@@ -1462,7 +1516,8 @@ climate-calculations.html#energyplus-sky-temperature-calculation
             self._import_data()
         if not self.is_ip:
             for coll in self._data:
-                coll.convert_to_ip()
+                if coll is not None:  # unbuilt collections are converted when built
+                    coll.convert_to_ip()
         self._is_ip = True
 
     def convert_to_si(self):
@@ -1475,7 +1530,8 @@ climate-calculations.html#energyplus-sky-temperature-calculation
             self._import_data()
         if self.is_ip:
             for coll in self._data:
-                coll.convert_to_si()
+                if coll is not None:  # unbuilt collections are converted when built
+                    coll.convert_to_si()
         self._is_ip = False
 
     def to_ddy(self, file_path, percentile=0.4):
@@ -1638,7 +1694,7 @@ climate-calculations.html#energyplus-sky-temperature-calculation
 
         # append all of the data to the file contents
         time_sec = [float(h * 3660) for h in range(len(self.dry_bulb_temperature))]
-        for i, line in enumerate(zip(*self._data[6:])):
+        for i, line in enumerate(zip(*self._collections()[6:])):
             data_line = (time_sec[i],) + line
             data_str = '	'.join(str(v) for v in data_line) + '\n'
             file_contents.append(data_str)
@@ -1675,7 +1731,7 @@ climate-calculations.html#energyplus-sky-temperature-calculation
         grnd_temps = dictify_dict(self.monthly_ground_temperature)
         return {
             'location': self.location.to_dict(),
-            'data_collections': [dc.to_dict() for dc in self._data],
+            'data_collections': [dc.to_dict() for dc in self._collections()],
             'metadata': self.metadata,
             'heating_dict': self.heating_design_condition_dictionary,
             'cooling_dict': self.cooling_design_condition_dictionary,
@@ -1705,6 +1761,7 @@ climate-calculations.html#energyplus-sky-temperature-calculation
 
         # write the file
         lines = self.header
+        self._collections()  # make sure that all collections are built
         try:
             # if the first value is at 1AM, move first item to end position
             for field in xrange(0, self._num_of_fields):
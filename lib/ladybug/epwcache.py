@@ -0,0 +1,233 @@
+# coding=utf-8
+"""Binary cache for the parsed contents of .epw files.
+
+The cache of each .epw file is written to a cache folder (by default, a folder
+in the user's temporary directory) and contains the raw header lines of the
+EPW along with one binary column for each of the parsed data fields.
+The cache is only used when the path, modification time and size of the .epw
+file match those recorded in the cache. Cached columns are read from a
+memory-mapped file so that only the fields that are requested get loaded.
+"""
+from __future__ import division
+
+import os
+import json
+import mmap
+import struct
+import hashlib
+import tempfile
+import array as specializedarray
+
+CACHE_EXTENSION = '.lbcache'
+DEFAULT_CACHE_FOLDER = os.path.join(tempfile.gettempdir(), 'ladybug_epw_cache')
+_MAGIC = b'LBEPWC01'
+_ALIGN = 8  # byte alignment of each of the columns in the file
+
+
+def epw_cache_path(file_path, folder=DEFAULT_CACHE_FOLDER):
+    """Get the path to the cache file of an .epw file.
+
+    Args:
+        file_path: Path to an .epw file.
+        folder: Path to the folder where the cache files are written.
+            (Default: a ladybug_epw_cache folder in the temporary directory).
+    """
+    name = hashlib.md5(os.path.abspath(file_path).encode('utf-8')).hexdigest()
+    return os.path.join(folder, name + CACHE_EXTENSION)
+
+
+def _file_key(file_path):
+    """Get a dictionary that uniquely identifies the current state of a file."""
+    stat = os.stat(file_path)
+    return {'path': os.path.abspath(file_path), 'mtime': stat.st_mtime,
+            'size': stat.st_size}
+
+
+def write_epw_cache(file_path, header_lines, columns, folder=DEFAULT_CACHE_FOLDER,
+                    max_files=64):
+    """Write the header lines and parsed data columns of an .epw file to its cache.
+
+    Args:
+        file_path: Path to the .epw file from which the data was parsed.
+        header_lines: A list of the 8 text lines at the top of the .epw file.
+        columns: A list of parsed data columns with one value for each hour.
+            These can be arrays of doubles or integers or lists of text.
+        folder: Path to the folder where the cache files are written.
+            (Default: a ladybug_epw_cache folder in the temporary directory).
+        max_files: An integer for the maximum number of files to be kept in the
+            cache folder. When this is exceeded, the files that were least
+            recently written are deleted. (Default: 64).
+
+    Returns:
+        The path to the cache file or None if it could not be written (eg.
+        because the cache folder is read-only).
+    """
+    blobs, fields = [], []
+    for col in columns:
+        if isinstance(col, specializedarray.array) and col.typecode in ('d', 'i'):
+            code, arr = col.typecode, col
+        elif all(isinstance(v, str) for v in col):
+            code, arr = 's', None
+        else:
+            try:
+                code, arr = 'i', specializedarray.array('i', col)
+            except (TypeError, OverflowError):
+                code, arr = 'd', specializedarray.array('d', col)
+        if arr is None:
+            blob = '\n'.join(col).encode('utf-8')
+        else:
+            blob = arr.tobytes() if hasattr(arr, 'tobytes') else arr.tostring()
+        blobs.append(blob)
+        fields.append([code, len(blob)])
+
+    meta = _file_key(file_path)
+    meta['header'] = [line.rstrip('\r\n') for line in header_lines]
+    meta['fields'] = fields
+    meta_bytes = json.dumps(meta).encode('utf-8')
+
+    # compute the offset of each column in the file
+    offset = len(_MAGIC) + 4 + len(meta_bytes)
+    offsets = []
+    for blob in blobs:
+        offset += -offset % _ALIGN
+        offsets.append(offset)
+        offset += len(blob)
+
+    cache_path = epw_cache_path(file_path, folder)
+    temp_path = '{}.{}.tmp'.format(cache_path, os.getpid())
+    try:
+        if not os.path.isdir(folder):
+            os.makedirs(folder)
+        with open(temp_path, 'wb') as cache_file:
+            cache_file.write(_MAGIC)
+            cache_file.write(struct.pack('<I', len(meta_bytes)))
+            cache_file.write(meta_bytes)
+            for blob, col_offset in zip(blobs, offsets):
+                cache_file.write(b'\0' * (col_offset - cache_file.tell()))
+                cache_file.write(blob)
+        try:
+            os.replace(temp_path, cache_path)
+        except AttributeError:  # python 2; no atomic replace
+            if os.path.isfile(cache_path):
+                os.remove(cache_path)
+            os.rename(temp_path, cache_path)
+    except (IOError, OSError):
+        if os.path.isfile(temp_path):
+            os.remove(temp_path)
+        return None
+
+    # evict the files that were least recently written
+    cache_files = [os.path.join(folder, f) for f in os.listdir(folder)
+                   if f.endswith(CACHE_EXTENSION)]
+    if len(cache_files) > max_files:
+        cache_files.sort(key=os.path.getmtime)
+        for old_file in cache_files[:len(cache_files) - max_files]:
+            try:
+                os.remove(old_file)
+            except OSError:
+                pass
+    return cache_path
+
+
+def read_epw_cache(file_path, folder=DEFAULT_CACHE_FOLDER):
+    """Get an EPWCache for an .epw file if it has an up-to-date cache.
+
+    Args:
+        file_path: Path to an .epw file.
+        folder: Path to the folder where the cache files are written.
+            (Default: a ladybug_epw_cache folder in the temporary directory).
+
+    Returns:
+        An EPWCache object or None if no valid cache exists for the file.
+    """
+    cache_path = epw_cache_path(file_path, folder)
+    if not os.path.isfile(cache_path):
+        return None
+    try:
+        with open(cache_path, 'rb') as cache_file:
+            mm = mmap.mmap(cache_file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (IOError, OSError, ValueError):
+        return None
+    try:
+        if mm[:len(_MAGIC)] != _MAGIC:
+            raise ValueError('Not an EPW cache.')
+        meta_start = len(_MAGIC) + 4
+        meta_len = struct.unpack('<I', mm[len(_MAGIC):meta_start])[0]
+        meta = json.loads(mm[meta_start:meta_start + meta_len].decode('utf-8'))
+        key = _file_key(file_path)
+        if any(meta[k] != key[k] for k in ('path', 'mtime', 'size')):
+            raise ValueError('Outdated EPW cache.')
+    except (ValueError, KeyError, struct.error):
+        mm.close()
+        return None
+    return EPWCache(mm, meta['header'], meta['fields'], meta_start + meta_len)
+
+
+class EPWCache(object):
+    """A memory-mapped EPW cache from which data columns can be loaded one at a time.
+
+    Args:
+        mm: A read-only mmap of the cache file.
+        header_lines: A list of the 8 text lines at the top of the .epw file.
+        fields: A list with the type code and byte size of each column.
+        data_start: An integer for the byte at which the columns start.
+
+    Properties:
+        * header_lines
+        * field_count
+    """
+    __slots__ = ('_mm', '_header_lines', '_fields', '_offsets')
+
+    def __init__(self, mm, header_lines, fields, data_start):
+        """Initialize EPWCache."""
+        self._mm = mm
+        self._header_lines = header_lines
+        self._fields = fields
+        self._offsets = []
+        offset = data_start
+        for code, byte_size in fields:
+            offset += -offset % _ALIGN
+            self._offsets.append(offset)
+            offset += byte_size
+
+    @property
+    def header_lines(self):
+        """A list of the 8 text lines at the top of the .epw file."""
+        return self._header_lines
+
+    @property
+    def field_count(self):
+        """Integer for the number of data columns in the cache."""
+        return len(self._fields)
+
+    def column(self, field_number):
+        """Load the values of one data column from the cache.
+
+        Args:
+            field_number: An integer for the EPW field of the column.
+
+        Returns:
+            An array of doubles or integers or a list of text values.
+        """
+        code, byte_size = self._fields[field_number]
+        start = self._offsets[field_number]
+        end = start + byte_size
+        if code == 's':
+            return self._mm[start:end].decode('utf-8').split('\n')
+        arr = specializedarray.array(code)
+        if hasattr(arr, 'frombytes'):
+            arr.frombytes(self._mm[start:end])
+        else:  # python 2
+            arr.fromstring(self._mm[start:end])
+        return arr
+
+    def close(self):
+        """Close the memory-mapped cache file."""
+        self._mm.close()
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __repr__(self):
+        return 'EPW Cache ({} fields)'.format(self.field_count)
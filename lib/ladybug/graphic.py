@@ -39,6 +39,7 @@ class GraphicContainer(object):
         * unit
         * legend
         * value_colors
+        * value_color_array
         * lower_title_location
         * upper_title_location
     """
@@ -212,6 +213,11 @@ class GraphicContainer(object):
         """A List of colors associated with the assigned values."""
         return self._legend.value_colors
 
+    @property
+    def value_color_array(self):
+        """A ColorArray of packed RGBA colors associated with the assigned values."""
+        return self._legend.value_color_array
+
     @property
     def lower_title_location(self):
         """A Plane for the lower location of title text."""
@@ -31,6 +31,7 @@ class Legend(object):
         * legend_parameters
         * values
         * value_colors
+        * value_color_array
         * title
         * title_location
         * title_location_scene_2d
@@ -184,8 +185,16 @@ class Legend(object):
     @property
     def value_colors(self):
         """A List of colors associated with the assigned values."""
-        _color_range = self.color_range
-        return tuple(_color_range.color(val) for val in self.values)
+        return self.value_color_array.to_colors()
+
+    @property
+    def value_color_array(self):
+        """A ColorArray of packed RGBA colors associated with the assigned values.
+
+        This is a much more compact alternative to value_colors for large data sets
+        and it can be assigned directly to the colors of a Mesh3D.
+        """
+        return self.color_range.color_array(self.values)
 
     @property
     def title(self):
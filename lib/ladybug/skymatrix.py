@@ -0,0 +1,285 @@
+# coding=utf-8
+"""Cumulative sky matrix of radiation from each patch of a Tregenza or Reinhart sky.
+
+The matrix is computed in the same manner as Radiance's gendaymtx but without
+the need for any Radiance installation. For each timestep of a Wea, the diffuse
+horizontal irradiance is distributed over the sky patches using the Perez
+all-weather sky luminance model and the direct normal irradiance is shared
+between the 4 patches closest to the sun. The results of each unique Wea and
+sky density are kept in memory such that changing only the north or the
+ground reflectance does not require any recalculation.
+"""
+from __future__ import division
+
+import math
+import heapq
+import struct
+import hashlib
+import array as specializedarray
+from collections import OrderedDict
+
+from .wea import Wea
+from .sunpath import Sunpath
+from .viewsphere import view_sphere
+from .skymodel import perez_sky_parameters, perez_sky_coefficients
+
+try:  # python 2
+    from itertools import izip as zip
+except ImportError:  # python 3
+    xrange = range
+
+# patch values of the most recently computed sky matrices
+_PATCH_VALUES = OrderedDict()
+_PATCH_VALUES_MAX_SIZE = 16
+# number of patches closest to the sun among which the direct radiation is shared
+_SUN_PATCH_COUNT = 4
+
+
+class CumulativeSkyMatrix(object):
+    """Cumulative direct and diffuse radiation from each patch of a sky dome.
+
+    Args:
+        wea: A Ladybug Wea object for the irradiance and the location of the sky.
+        north: A number between -360 and 360 for the counterclockwise difference
+            between the North and the positive Y-axis in degrees. (Default: 0).
+        high_density: A Boolean to note whether the higher-density Reinhart sky
+            (with 577 patches) should be used instead of the Tregenza sky
+            (with 145 patches). (Default: False).
+        ground_reflectance: A number between 0 and 1 for the average ground
+            reflectance associated with the sky matrix. (Default: 0.2).
+
+    Properties:
+        * wea
+        * north
+        * high_density
+        * ground_reflectance
+        * patch_vectors
+        * direct_values
+        * diffuse_values
+        * wea_duration
+        * metadata
+        * data
+        * benefit_matrix
+    """
+    __slots__ = ('_wea', '_north', '_high_density', '_ground_reflectance',
+                 '_direct_values', '_diffuse_values')
+
+    def __init__(self, wea, north=0, high_density=False, ground_reflectance=0.2):
+        """Initialize CumulativeSkyMatrix."""
+        assert isinstance(wea, Wea), \
+            'Expected Wea for CumulativeSkyMatrix. Got {}.'.format(type(wea))
+        assert -360 <= north <= 360, 'CumulativeSkyMatrix north must be ' \
+            'between -360 and 360. Got {}.'.format(north)
+        assert 0 <= ground_reflectance <= 1, 'CumulativeSkyMatrix ground_reflectance ' \
+            'must be between 0 and 1. Got {}.'.format(ground_reflectance)
+        self._wea = wea
+        self._north = float(north)
+        self._high_density = bool(high_density)
+        self._ground_reflectance = float(ground_reflectance)
+        self._direct_values, self._diffuse_values = \
+            cumulative_patch_values(wea, self._high_density)
+
+    @classmethod
+    def from_components(
+            cls, location, direct_normal_irradiance, diffuse_horizontal_irradiance,
+            hoys=None, north=0, high_density=False, ground_reflectance=0.2):
+        """Create a CumulativeSkyMatrix from a location and irradiance data collections.
+
+        Args:
+            location: A Ladybug Location object.
+            direct_normal_irradiance: An hourly data collection of direct normal
+                irradiance, such as that which is output from an EPW.
+            diffuse_horizontal_irradiance: An hourly data collection of diffuse
+                horizontal irradiance aligned with the direct_normal_irradiance.
+            hoys: An optional list of hours of the year for which the sky matrix
+                will be computed. If None or empty, all of the hours of the
+                data collections will be used. (Default: None).
+            north: A number for the north angle of the sky in degrees. (Default: 0).
+            high_density: A Boolean to note whether the Reinhart sky should be
+                used. (Default: False).
+            ground_reflectance: A number between 0 and 1 for the ground
+                reflectance. (Default: 0.2).
+        """
+        wea = Wea(location, direct_normal_irradiance, diffuse_horizontal_irradiance)
+        if hoys:
+            wea = wea.filter_by_hoys(hoys)
+        return cls(wea, north, high_density, ground_reflectance)
+
+    @property
+    def wea(self):
+        """Get the Wea from which the sky matrix was computed."""
+        return self._wea
+
+    @property
+    def north(self):
+        """Get a number for the north angle of the sky in degrees."""
+        return self._north
+
+    @property
+    def high_density(self):
+        """Get a boolean for whether the sky matrix uses the Reinhart sky."""
+        return self._high_density
+
+    @property
+    def ground_reflectance(self):
+        """Get a number for the ground reflectance associated with the sky matrix."""
+        return self._ground_reflectance
+
+    @property
+    def patch_vectors(self):
+        """Get a tuple of Vector3D for the direction of each sky patch (without north)."""
+        return view_sphere.reinhart_dome_vectors if self._high_density \
+            else view_sphere.tregenza_dome_vectors
+
+    @property
+    def direct_values(self):
+        """Get a tuple with the cumulative direct radiation of each patch in kWh/m2."""
+        return self._direct_values
+
+    @property
+    def diffuse_values(self):
+        """Get a tuple with the cumulative diffuse radiation of each patch in kWh/m2."""
+        return self._diffuse_values
+
+    @property
+    def wea_duration(self):
+        """Get a number for the number of hours represented by the sky matrix."""
+        return len(self._wea) / self._wea.timestep
+
+    @property
+    def metadata(self):
+        """Get a tuple of the north, ground reflectance, start and end datetime."""
+        datetimes = self._wea.direct_normal_irradiance.datetimes
+        return (self._north, self._ground_reflectance, datetimes[0], datetimes[-1])
+
+    @property
+    def data(self):
+        """Get a tuple of the metadata, direct_values and diffuse_values.
+
+        This is the same structure as the data of the sky matrices computed
+        with Radiance, which is used by the nodes that accept a sky matrix.
+        """
+        return self.metadata, self._direct_values, self._diffuse_values
+
+    @property
+    def benefit_matrix(self):
+        """Always None since the sky matrix has no benefit/harm values."""
+        return None
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __len__(self):
+        return len(self._direct_values)
+
+    def __repr__(self):
+        return 'Cumulative Sky Matrix: {} [{} patches, {} hours]'.format(
+            self._wea.location.city, len(self._direct_values), self.wea_duration)
+
+
+def cumulative_patch_values(wea, high_density=False):
+    """Get the cumulative direct and diffuse radiation of each sky patch for a Wea.
+
+    The results are kept in memory for the most recently used Wea data, such
+    that the same sky patches are not computed twice.
+
+    Args:
+        wea: A Ladybug Wea object.
+        high_density: A Boolean to note whether the Reinhart sky should be
+            used instead of the Tregenza sky. (Default: False).
+
+    Returns:
+        A tuple with two elements
+
+        -   direct_values -- A tuple with the direct radiation of each patch in kWh/m2.
+
+        -   diffuse_values -- A tuple with the diffuse radiation of each patch in kWh/m2.
+    """
+    key = sky_matrix_key(wea, high_density)
+    try:
+        values = _PATCH_VALUES.pop(key)
+    except KeyError:
+        values = _compute_patch_values(wea, high_density)
+        while len(_PATCH_VALUES) >= _PATCH_VALUES_MAX_SIZE:
+            _PATCH_VALUES.popitem(last=False)
+    _PATCH_VALUES[key] = values
+    return values
+
+
+def sky_matrix_key(wea, high_density=False):
+    """Get text that identifies the patch values of a Wea and a sky density.
+
+    Args:
+        wea: A Ladybug Wea object.
+        high_density: A Boolean for whether the Reinhart sky is used.
+    """
+    loc = wea.location
+    hasher = hashlib.md5(repr(
+        (float(loc.latitude), float(loc.longitude), float(loc.time_zone),
+         bool(high_density), int(wea.timestep), bool(wea.is_leap_year))).encode('utf-8'))
+    hasher.update(specializedarray.array(
+        'i', [dt.moy for dt in wea.direct_normal_irradiance.datetimes]).tobytes())
+    for values in (wea.direct_normal_irradiance.values,
+                   wea.diffuse_horizontal_irradiance.values):
+        hasher.update(struct.pack('<{}d'.format(len(values)), *values))
+    return hasher.hexdigest()
+
+
+def _compute_patch_values(wea, high_density):
+    """Compute the cumulative direct and diffuse radiation of each patch for a Wea."""
+    # get the patch geometry and the constants used for all of the timesteps
+    if high_density:
+        vectors, solid_angles = \
+            view_sphere.reinhart_dome_vectors, view_sphere.reinhart_solid_angles
+    else:
+        vectors, solid_angles = \
+            view_sphere.tregenza_dome_vectors, view_sphere.tregenza_solid_angles
+    p_x = [v.x for v in vectors]
+    p_y = [v.y for v in vectors]
+    p_z = [v.z for v in vectors]
+    p_inv_z = [1 / z for z in p_z]
+    p_proj = [w * z for w, z in zip(solid_angles, p_z)]  # projected solid angle
+    patch_indices = range(len(vectors))
+    to_kwh = 1 / (1000 * wea.timestep)
+
+    # compute the sun positions for all of the timesteps of the Wea
+    sun_path = Sunpath.from_location(wea.location)
+    sun_path.is_leap_year = wea.is_leap_year
+    moys = [dt.moy for dt in wea.datetimes]
+    positions = sun_path.calculate_sun_positions_from_moys(moys)
+    s_x, s_y, s_z = positions.sun_vector_components
+
+    direct = [0.0] * len(vectors)
+    diffuse = [0.0] * len(vectors)
+    acos, exp = math.acos, math.exp
+    for moy, alt, sx, sy, sz, dnr, dhr in zip(
+            moys, positions.altitudes, s_x, s_y, s_z,
+            wea.direct_normal_irradiance.values,
+            wea.diffuse_horizontal_irradiance.values):
+        if alt <= 0 or (dnr <= 0 and dhr <= 0):
+            continue
+        # cosines of the angles between each patch and the sun
+        cos_gammas = [min(max(-sx * x - sy * y - sz * z, -1.0), 1.0)
+                      for x, y, z in zip(p_x, p_y, p_z)]
+
+        # distribute the diffuse radiation over the patches with the Perez sky
+        if dhr > 0:
+            clearness, brightness = perez_sky_parameters(dnr, dhr, alt, moy // 1440 + 1)
+            a, b, c, d, e = perez_sky_coefficients(clearness, brightness, alt)
+            lums = [(1 + a * exp(b * inv_z)) * (1 + c * exp(d * acos(cg)) + e * cg * cg)
+                    for inv_z, cg in zip(p_inv_z, cos_gammas)]
+            factor = dhr * to_kwh / sum(lm * pr for lm, pr in zip(lums, p_proj))
+            for i, lm, w in zip(patch_indices, lums, solid_angles):
+                diffuse[i] += lm * w * factor
+
+        # share the direct radiation between the patches closest to the sun
+        if dnr > 0:
+            nearest = heapq.nlargest(
+                _SUN_PATCH_COUNT, patch_indices, key=cos_gammas.__getitem__)
+            weights = [1 / (1.002 - cos_gammas[i]) for i in nearest]
+            factor = dnr * to_kwh / sum(weights)
+            for i, w in zip(nearest, weights):
+                direct[i] += w * factor
+
+    return tuple(direct), tuple(diffuse)
@@ -436,6 +436,122 @@ def calc_sky_temperature(horiz_ir, source_emissivity=1):
     return ((horiz_ir / (source_emissivity * sigma)) ** 0.25) - 273.15
 
 
+"""PEREZ ALL-WEATHER SKY LUMINANCE MODEL"""
+
+# upper limits of the sky clearness for each of the 8 categories of the Perez sky
+_PEREZ_CLEARNESS_BINS = (1.065, 1.230, 1.500, 1.950, 2.800, 4.500, 6.200)
+
+# coefficients a1..a4, b1..b4, c1..c4, d1..d4, e1..e4 for each sky clearness category
+_PEREZ_COEFFICIENTS = (
+    (1.3525, -0.2576, -0.2690, -1.4366, -0.7670, 0.0007, 1.2734, -0.1233,
+     2.8000, 0.6004, 1.2375, 1.0000, 1.8734, 0.6297, 0.9738, 0.2809,
+     0.0356, -0.1246, -0.5718, 0.9938),
+    (-1.2219, -0.7730, 1.4148, 1.1016, -0.2054, 0.0367, -3.9128, 0.9156,
+     6.9750, 0.1774, 6.4477, -0.1239, -1.5798, -0.5081, -1.7812, 0.1080,
+     0.2624, 0.0672, -0.2190, -0.4285),
+    (-1.1000, -0.2515, 0.8952, 0.0156, 0.2782, -0.1812, -4.5000, 1.1766,
+     24.7219, -13.0812, -37.7000, 34.8438, -5.0000, 1.5218, 3.9229, -2.6204,
+     -0.0156, 0.1597, 0.4199, -0.5562),
+    (-0.5484, -0.6654, -0.2672, 0.7117, 0.7234, -0.6219, -5.6812, 2.6297,
+     33.3389, -18.3000, -62.2500, 52.0781, -3.5000, 0.0016, 1.1477, 0.1062,
+     0.4659, -0.3296, -0.0876, -0.0329),
+    (-0.6000, -0.3566, -2.5000, 2.3250, 0.2937, 0.0496, -5.6812, 1.8415,
+     21.0000, -4.7656, -21.5906, 7.2492, -3.5000, -0.1554, 1.4062, 0.3988,
+     0.0032, 0.0766, -0.0656, -0.1294),
+    (-1.0156, -0.3670, 1.0078, 1.4051, 0.2875, -0.5328, -3.8500, 3.3750,
+     14.0000, -0.9999, -7.1406, 7.5469, -3.4000, -0.1078, -1.0750, 1.5702,
+     -0.0672, 0.4016, 0.3017, -0.4844),
+    (-1.0000, 0.0211, 0.5025, -0.5119, -0.3000, 0.1922, 0.7023, -1.6317,
+     19.0000, -5.0000, 1.2438, -1.9094, -4.0000, 0.0250, 0.3844, 0.2656,
+     1.0468, -0.3788, -2.4517, 1.4656),
+    (-1.0500, 0.0289, 0.4260, 0.3590, -0.3250, 0.1156, 0.7781, 0.0025,
+     31.0625, -14.5000, -46.1148, 55.3750, -7.2312, 0.4050, 13.3500, 0.6234,
+     1.5000, -0.6426, 1.8564, 0.5636)
+)
+
+
+def perez_sky_parameters(direct_normal, diffuse_horizontal, altitude, doy):
+    """Calculate the sky clearness and sky brightness of the Perez sky model.
+
+    Note:
+        [1] Perez, R., Seals, R., Michalsky, J. 1993. All-weather model for sky
+        luminance distribution - preliminary configuration and validation.
+        Solar Energy, 50(3), 235-245.
+
+    Args:
+        direct_normal: A number for the direct normal irradiance in W/m2.
+        diffuse_horizontal: A number greater than 0 for the diffuse horizontal
+            irradiance in W/m2.
+        altitude: A number greater than 0 for the solar altitude in degrees.
+        doy: An integer for the day of the year.
+
+    Returns:
+        A tuple with two values
+
+        -   clearness -- The sky clearness (epsilon) between 1 and 12.01.
+
+        -   brightness -- The sky brightness (delta) between 0.01 and 0.6.
+    """
+    zenith = math.radians(90 - altitude)
+    zenith_term = 1.041 * zenith ** 3
+    clearness = ((diffuse_horizontal + direct_normal) / diffuse_horizontal +
+                 zenith_term) / (1 + zenith_term)
+    air_mass = get_relative_airmass(altitude, 'kasten1966')
+    brightness = diffuse_horizontal * air_mass / get_extra_radiation(doy)
+    return min(max(clearness, 1.0), 12.01), min(max(brightness, 0.01), 0.6)
+
+
+def perez_sky_coefficients(clearness, brightness, altitude):
+    """Calculate the five coefficients of the Perez all-weather luminance model.
+
+    Args:
+        clearness: A number for the sky clearness (epsilon) of the Perez sky.
+        brightness: A number for the sky brightness (delta) of the Perez sky.
+        altitude: A number for the solar altitude in degrees.
+
+    Returns:
+        A tuple with the a, b, c, d and e coefficients of the relative luminance
+        distribution, which can be evaluated with perez_relative_luminance.
+    """
+    category = 0
+    while category < 7 and clearness >= _PEREZ_CLEARNESS_BINS[category]:
+        category += 1
+    cf = _PEREZ_COEFFICIENTS[category]
+    zen = math.radians(90 - altitude)
+    a = cf[0] + cf[1] * zen + brightness * (cf[2] + cf[3] * zen)
+    b = cf[4] + cf[5] * zen + brightness * (cf[6] + cf[7] * zen)
+    e = cf[16] + cf[17] * zen + brightness * (cf[18] + cf[19] * zen)
+    if category == 0:  # the clearest category uses a different form for c and d
+        c = math.exp((brightness * (cf[8] + cf[9] * zen)) ** cf[10]) - cf[11]
+        d = -math.exp(brightness * (cf[12] + cf[13] * zen)) + cf[14] + \
+            brightness * cf[15]
+    else:
+        c = cf[8] + cf[9] * zen + brightness * (cf[10] + cf[11] * zen)
+        d = cf[12] + cf[13] * zen + brightness * (cf[14] + cf[15] * zen)
+    return a, b, c, d, e
+
+
+def perez_relative_luminance(coefficients, cos_zenith, cos_gamma):
+    """Calculate the relative luminance of a point in the sky with the Perez model.
+
+    Args:
+        coefficients: A tuple with the a, b, c, d and e coefficients from the
+            perez_sky_coefficients function.
+        cos_zenith: A number greater than 0 for the cosine of the angle between
+            the point in the sky and the zenith.
+        cos_gamma: A number for the cosine of the angle between the point in
+            the sky and the sun.
+
+    Returns:
+        A number for the luminance of the point in the sky relative to an
+        arbitrary reference point.
+    """
+    a, b, c, d, e = coefficients
+    gamma = math.acos(min(max(cos_gamma, -1.0), 1.0))
+    return (1 + a * math.exp(b / cos_zenith)) * \
+        (1 + c * math.exp(d * gamma) + e * cos_gamma * cos_gamma)
+
+
 """DIRECT AND DIFFUSE SPLITTING FROM GLOBAL HORIZONTAL"""
 """The following code is a modified version of the PVLib python library.
 
@@ -0,0 +1,298 @@
+# coding=utf-8
+"""In-memory and on-disk cache for annual arrays of sun positions.
+
+Sun positions only depend on the location, north angle, daylight saving period,
+leap year, timestep and whether solar time is used. The cache stores the
+SunPositions of a whole year for each unique combination of these values so
+that repeated requests for the same sun path do not recompute any solar geometry.
+The most recently used results are kept in memory and, if a cache folder is
+specified, the results are also written to binary files that persist between
+Python sessions.
+"""
+from __future__ import division
+
+import os
+import json
+import struct
+import hashlib
+import tempfile
+import array as specializedarray
+from collections import OrderedDict
+
+from .sunpath import SunPositions
+
+_MAGIC = b'LBSUNC01'
+_CACHE_EXTENSION = '.lbsun'
+_FIELDS = ('i', 'd', 'd', 'd', 'd', 'd', 'B')  # moys, alts, azs, x, y, z, dst
+
+
+class SunPositionCache(object):
+    """A least-recently-used cache of annual SunPositions with an optional disk layer.
+
+    Args:
+        max_bytes: An integer for the maximum number of bytes of annual sun
+            positions to be kept in memory. When this is exceeded, the least
+            recently used positions are evicted. (Default: 64 MB).
+        folder: Optional path to a folder where the sun positions will be
+            written as binary files so that they persist between sessions.
+            If None, only the in-memory cache will be used. (Default: None).
+        max_disk_files: An integer for the maximum number of files to be kept
+            in the cache folder. When this is exceeded, the files that were
+            least recently written are deleted. (Default: 64).
+
+    Properties:
+        * max_bytes
+        * folder
+        * max_disk_files
+        * hits
+        * disk_hits
+        * misses
+        * size
+        * byte_size
+    """
+    __slots__ = ('_max_bytes', '_folder', '_max_disk_files', '_entries',
+                 '_byte_size', '_hits', '_disk_hits', '_misses')
+
+    def __init__(self, max_bytes=64 * 1024 * 1024, folder=None, max_disk_files=64):
+        """Initialize SunPositionCache."""
+        self._max_bytes = int(max_bytes)
+        self._folder = folder
+        self._max_disk_files = int(max_disk_files)
+        self._entries = OrderedDict()
+        self._byte_size = 0
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+
+    @property
+    def max_bytes(self):
+        """Integer for the maximum number of bytes of sun positions kept in memory."""
+        return self._max_bytes
+
+    @property
+    def folder(self):
+        """Path to the folder where the cache files are written or None."""
+        return self._folder
+
+    @property
+    def max_disk_files(self):
+        """Integer for the maximum number of files kept in the cache folder."""
+        return self._max_disk_files
+
+    @property
+    def hits(self):
+        """Integer for the number of requests served from memory."""
+        return self._hits
+
+    @property
+    def disk_hits(self):
+        """Integer for the number of requests served from the cache folder."""
+        return self._disk_hits
+
+    @property
+    def misses(self):
+        """Integer for the number of requests for which sun positions were computed."""
+        return self._misses
+
+    @property
+    def size(self):
+        """Integer for the number of entries currently kept in memory."""
+        return len(self._entries)
+
+    @property
+    def byte_size(self):
+        """Integer for the number of bytes of the sun positions kept in memory."""
+        return self._byte_size
+
+    def sun_positions(self, sunpath, timestep=1, is_solar_time=False):
+        """Get the SunPositions for every timestep of the year of a Sunpath.
+
+        Args:
+            sunpath: A ladybug Sunpath object.
+            timestep: An integer for the number of timesteps per hour. (Default: 1).
+            is_solar_time: A boolean to indicate if the moys of the year should
+                be treated as solar time. (Default: False)
+
+        Returns:
+            A SunPositions object with one position for each timestep of the year,
+            starting from the first minute of the year.
+        """
+        assert 60 % timestep == 0, \
+            'SunPositionCache timestep must be a divisor of 60. Got {}.'.format(timestep)
+        key = self.sunpath_key(sunpath, timestep, is_solar_time)
+        try:  # check if the sun positions are in memory
+            positions = self._entries.pop(key)
+        except KeyError:
+            positions = self._read(key)
+            if positions is not None:  # positions were found on disk
+                self._disk_hits += 1
+            else:  # compute the sun positions
+                self._misses += 1
+                year_minutes = 527040 if sunpath.is_leap_year else 525600
+                positions = sunpath.calculate_sun_positions_from_moys(
+                    range(0, year_minutes, 60 // timestep), is_solar_time)
+                self._write(key, positions)
+            self._add(key, positions)
+        else:
+            self._hits += 1
+            self._entries[key] = positions
+        return positions
+
+    def clear(self, disk=False):
+        """Clear all of the sun positions that are kept in memory.
+
+        Args:
+            disk: Boolean to note whether the files in the cache folder should
+                also be deleted. (Default: False).
+        """
+        self._entries.clear()
+        self._byte_size = 0
+        if disk:
+            for cache_file in self._cache_files():
+                try:
+                    os.remove(cache_file)
+                except OSError:
+                    pass
+
+    def reset_counters(self):
+        """Reset the hit and miss counters of the cache to zero."""
+        self._hits, self._disk_hits, self._misses = 0, 0, 0
+
+    @staticmethod
+    def sunpath_key(sunpath, timestep=1, is_solar_time=False):
+        """Get a tuple that identifies the annual sun positions of a Sunpath.
+
+        Args:
+            sunpath: A ladybug Sunpath object.
+            timestep: An integer for the number of timesteps per hour. (Default: 1).
+            is_solar_time: A boolean for whether solar time is used. (Default: False).
+        """
+        dsp = sunpath.daylight_saving_period
+        dst = None if dsp is None else \
+            (dsp.st_time.moy, dsp.end_time.moy, dsp.is_reversed)
+        return (float(sunpath.latitude), float(sunpath.longitude),
+                float(sunpath.time_zone), float(sunpath.north_angle), dst,
+                bool(sunpath.is_leap_year), int(timestep), bool(is_solar_time))
+
+    def _add(self, key, positions):
+        """Add sun positions to memory, evicting the least recently used positions."""
+        byte_size = _positions_byte_size(positions)
+        if byte_size > self._max_bytes:
+            return
+        self._entries[key] = positions
+        self._byte_size += byte_size
+        while self._byte_size > self._max_bytes:
+            _, old_positions = self._entries.popitem(last=False)
+            self._byte_size -= _positions_byte_size(old_positions)
+
+    def _file_path(self, key):
+        """Get the path to the cache file of a key."""
+        name = hashlib.md5(repr(key).encode('utf-8')).hexdigest()
+        return os.path.join(self._folder, name + _CACHE_EXTENSION)
+
+    def _cache_files(self):
+        """Get a list of all cache files in the folder."""
+        if not self._folder or not os.path.isdir(self._folder):
+            return []
+        return [os.path.join(self._folder, f) for f in os.listdir(self._folder)
+                if f.endswith(_CACHE_EXTENSION)]
+
+    def _read(self, key):
+        """Read the SunPositions of a key from the cache folder if they exist."""
+        if not self._folder:
+            return None
+        file_path = self._file_path(key)
+        try:
+            with open(file_path, 'rb') as cache_file:
+                content = cache_file.read()
+        except (IOError, OSError):
+            return None
+        try:
+            if content[:len(_MAGIC)] != _MAGIC:
+                raise ValueError('Not a sun position cache.')
+            meta_start = len(_MAGIC) + 4
+            meta_len = struct.unpack('<I', content[len(_MAGIC):meta_start])[0]
+            meta = json.loads(content[meta_start:meta_start + meta_len].decode('utf-8'))
+            if meta['key'] != repr(key):
+                raise ValueError('Sun position cache for a different key.')
+            arrays, offset = [], meta_start + meta_len
+            for code, byte_size in zip(_FIELDS, meta['sizes']):
+                arr = specializedarray.array(code)
+                blob = content[offset:offset + byte_size]
+                if hasattr(arr, 'frombytes'):
+                    arr.frombytes(blob)
+                else:  # python 2
+                    arr.fromstring(blob)
+                arrays.append(arr)
+                offset += byte_size
+        except (ValueError, KeyError, TypeError, struct.error):
+            return None
+        return SunPositions(arrays[0], arrays[1], arrays[2], tuple(arrays[3:6]),
+                            arrays[6], key[7], key[3], key[5])
+
+    def _write(self, key, positions):
+        """Write SunPositions to the cache folder, evicting the oldest files."""
+        if not self._folder:
+            return None
+        arrays = (positions.moys, positions.altitudes, positions.azimuths) + \
+            tuple(positions.sun_vector_components) + (positions.is_daylight_saving,)
+        blobs = [arr.tobytes() if hasattr(arr, 'tobytes') else arr.tostring()
+                 for arr in arrays]
+        meta = {'key': repr(key), 'sizes': [len(blob) for blob in blobs]}
+        meta_bytes = json.dumps(meta).encode('utf-8')
+        file_path = self._file_path(key)
+        temp_path = '{}.{}.tmp'.format(file_path, os.getpid())
+        try:
+            if not os.path.isdir(self._folder):
+                os.makedirs(self._folder)
+            with open(temp_path, 'wb') as cache_file:
+                cache_file.write(_MAGIC)
+                cache_file.write(struct.pack('<I', len(meta_bytes)))
+                cache_file.write(meta_bytes)
+                for blob in blobs:
+                    cache_file.write(blob)
+            try:
+                os.replace(temp_path, file_path)
+            except AttributeError:  # python 2; no atomic replace
+                if os.path.isfile(file_path):
+                    os.remove(file_path)
+                os.rename(temp_path, file_path)
+        except (IOError, OSError):
+            if os.path.isfile(temp_path):
+                os.remove(temp_path)
+            return None
+
+        # evict the files that were least recently written
+        cache_files = self._cache_files()
+        if len(cache_files) > self._max_disk_files:
+            cache_files.sort(key=os.path.getmtime)
+            for old_file in cache_files[:len(cache_files) - self._max_disk_files]:
+                try:
+                    os.remove(old_file)
+                except OSError:
+                    pass
+        return file_path
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return 'Sun Position Cache ({} entries, {} hits, {} disk hits, {} misses)'.format(
+            len(self._entries), self._hits, self._disk_hits, self._misses)
+
+
+def _positions_byte_size(positions):
+    """Get the number of bytes of the arrays of a SunPositions object."""
+    arrays = (positions.moys, positions.altitudes, positions.azimuths) + \
+        tuple(positions.sun_vector_components) + (positions.is_daylight_saving,)
+    return sum(arr.itemsize * len(arr) if isinstance(arr, specializedarray.array)
+               else 8 * len(arr) for arr in arrays)
+
+
+# a cache shared by all sun path calculations in the current Python session
+sun_position_cache = SunPositionCache(
+    folder=os.path.join(tempfile.gettempdir(), 'ladybug_sun_cache'))
@@ -18,6 +18,7 @@ from ladybug_geometry.geometry2d.polyline import Polyline2D
 import datetime as py_datetime
 import math
 import sys
+import array as specializedarray
 if (sys.version_info > (3, 0)):  # python 3
     xrange = range
 
@@ -261,47 +262,109 @@ class Sunpath(object):
             hour = datetime.hour + datetime.minute / 60.0
         is_daylight_saving = self.is_daylight_saving_hour(datetime)
         hour = hour - 1 if is_daylight_saving else hour  # spring forward!
-        sol_time = self._calculate_solar_time(hour, eq_of_time, is_solar_time) * 60
+        altitude, azimuth = self._calculate_altitude_azimuth(
+            sol_dec, eq_of_time, hour, is_solar_time)
 
-        # degrees for the angle between solar noon and the current time.
-        hour_angle = sol_time / 4 + 180 if sol_time < 0 else sol_time / 4 - 180
+        # create the sun for this hour
+        return Sun(datetime, altitude, azimuth, is_solar_time, is_daylight_saving,
+                   self.north_angle)
 
-        # radians for the zenith and degrees for altitude
-        zenith = math.acos(math.sin(self._latitude) * math.sin(sol_dec) +
-                           math.cos(self._latitude) * math.cos(sol_dec) *
-                           math.cos(math.radians(hour_angle)))
-        altitude = 90 - math.degrees(zenith)
+    def calculate_sun_positions_from_hoys(self, hoys, is_solar_time=False):
+        """Get the positions of the sun for many hours of the year at once.
 
-        # approx atmospheric refraction used to correct the altitude
-        if altitude > 85:
-            atmos_refraction = 0
-        elif altitude > 5:
-            atmos_refraction = 58.1 / math.tan(math.radians(altitude)) - \
-                0.07 / (math.tan(math.radians(altitude))) ** 3 + \
-                0.000086 / (math.tan(math.radians(altitude))) ** 5
-        elif altitude > -0.575:
-            atmos_refraction = 1735 + altitude * \
-                (-518.2 + altitude * (103.4 + altitude * (-12.79 + altitude * 0.711)))
-        else:
-            atmos_refraction = -20.772 / math.tan(math.radians(altitude))
+        Args:
+            hoys: A list of numbers for the hours of the year. These can be
+                decimal values to yield solar positions in between hours.
+            is_solar_time: A boolean to indicate if the input hoys are in solar
+                time. (Default: False)
 
-        atmos_refraction /= 3600
-        altitude += atmos_refraction
+        Returns:
+            A SunPositions object with the altitude, azimuth and sun vector
+            for each of the input hoys.
+        """
+        return self.calculate_sun_positions_from_moys(
+            [round(hoy * 60) for hoy in hoys], is_solar_time)
 
-        # azimuth in degrees
-        az_init = ((math.sin(self._latitude) * math.cos(zenith)) - math.sin(sol_dec)) / \
-            (math.cos(self._latitude) * math.sin(zenith))
-        try:
-            if hour_angle > 0:
-                azimuth = (math.degrees(math.acos(az_init)) + 180) % 360
-            else:
-                azimuth = (540 - math.degrees(math.acos(az_init))) % 360
-        except ValueError:  # perfect solar noon yields math domain error
-            azimuth = 180
+    def calculate_sun_positions_from_moys(self, moys, is_solar_time=False):
+        """Get the positions of the sun for many minutes of the year at once.
 
-        # create the sun for this hour
-        return Sun(datetime, altitude, azimuth, is_solar_time, is_daylight_saving,
-                   self.north_angle)
+        This yields the same altitudes, azimuths and sun vectors as calling
+        calculate_sun_from_moy for each minute but no DateTime or Sun objects
+        are created in the process and the solar geometry is only computed
+        once for all minutes that share the same julian day fraction.
+
+        Args:
+            moys: A list of integers for the minutes of the year.
+            is_solar_time: A boolean to indicate if the input moys are in solar
+                time. (Default: False)
+
+        Returns:
+            A SunPositions object with the altitude, azimuth and sun vector
+            for each of the input moys.
+        """
+        # set up the constants used for all of the minutes
+        leap_year = self.is_leap_year
+        year_minutes = 527040 if leap_year else 525600
+        preceding_days = 42368 if leap_year else 42734  # see _days_from_010119
+        tz_day = float(self.time_zone) / 24
+        dsp = self.daylight_saving_period
+        if dsp:
+            dst_st, dst_end = dsp.st_time.moy, dsp.end_time.moy
+        north = self.north_angle
+        if north != 0:
+            cos_n, sin_n = math.cos(math.radians(north)), math.sin(math.radians(north))
+
+        # compute the sun position for each minute of the year
+        moy_arr = specializedarray.array('i')
+        alts, azs = specializedarray.array('d'), specializedarray.array('d')
+        vec_x, vec_y, vec_z = specializedarray.array('d'), \
+            specializedarray.array('d'), specializedarray.array('d')
+        dst_arr = specializedarray.array('B')
+        geometry = {}
+        for moy in moys:
+            moy = int(moy)
+            if not 0 <= moy < year_minutes:
+                raise ValueError('moy must be positive and smaller than {}. '
+                                 'Invalid input {}'.format(year_minutes, moy))
+            doy, minute_of_day = divmod(moy, 1440)
+            julian_day = preceding_days + doy + 2 + 2415018.5 + \
+                round(minute_of_day / 1440.0, 2) - tz_day
+            try:
+                sol_dec, eq_of_time = geometry[julian_day]
+            except KeyError:
+                sol_dec, eq_of_time = geometry[julian_day] = \
+                    self._solar_geometry_from_julian_day(julian_day)
+
+            hour = minute_of_day // 60 + (minute_of_day % 60) / 60.0
+            if not dsp:
+                is_dst = False
+            elif dsp.is_reversed:
+                is_dst = dst_end <= moy or dst_st >= moy
+            else:
+                is_dst = dst_st <= moy < dst_end
+            if is_dst:
+                hour = hour - 1  # spring forward!
+            alt, az = self._calculate_altitude_azimuth(
+                sol_dec, eq_of_time, hour, is_solar_time)
+
+            # rotate the north vector in the same manner as Sun._calculate_sun_vector
+            alt_r = math.radians(alt)
+            cos_alt, sin_alt = math.cos(alt_r), math.sin(alt_r)
+            cos_a, sin_a = math.cos(-math.radians(az)), math.sin(-math.radians(az))
+            x, y = cos_a * 0. - sin_a * cos_alt, sin_a * 0. + cos_a * cos_alt
+            if north != 0:
+                x, y = cos_n * x - sin_n * y, sin_n * x + cos_n * y
+
+            moy_arr.append(moy)
+            alts.append(alt)
+            azs.append(az)
+            vec_x.append(-x)
+            vec_y.append(-y)
+            vec_z.append(-sin_alt)
+            dst_arr.append(is_dst)
+
+        return SunPositions(moy_arr, alts, azs, (vec_x, vec_y, vec_z), dst_arr,
+                            is_solar_time, north, leap_year)
 
     def calculate_sunrise_sunset(self, month, day, depression=0.5334,
                                  is_solar_time=False):
@@ -831,7 +894,20 @@ class Sunpath(object):
 
         julian_day = self._days_from_010119(year, month, day) + 2415018.5 + \
             round((minute + hour * 60) / 1440.0, 2) - (float(self.time_zone) / 24)
+        return self._solar_geometry_from_julian_day(julian_day)
+
+    @staticmethod
+    def _solar_geometry_from_julian_day(julian_day):
+        """Calculate the solar declination and equation of time for a julian day.
+
+        Args:
+            julian_day: A number for the julian day, including the fraction of
+                the day in UTC.
 
+        Returns:
+            A tuple with the solar declination in radians and the equation
+            of time in minutes.
+        """
         julian_century = (julian_day - 2451545) / 36525
 
         # degrees
@@ -894,6 +970,59 @@ class Sunpath(object):
 
         return sol_dec, eq_of_time
 
+    def _calculate_altitude_azimuth(self, sol_dec, eq_of_time, hour, is_solar_time):
+        """Calculate the solar altitude and azimuth in degrees for an hour of the day.
+
+        Args:
+            sol_dec: Solar declination in radians.
+            eq_of_time: Equation of time in minutes.
+            hour: A number for the hour of the day, already adjusted for
+                daylight saving time.
+            is_solar_time: A boolean to indicate if the hour is in solar time.
+
+        Returns:
+            A tuple with the solar altitude and azimuth in degrees.
+        """
+        sol_time = self._calculate_solar_time(hour, eq_of_time, is_solar_time) * 60
+
+        # degrees for the angle between solar noon and the current time.
+        hour_angle = sol_time / 4 + 180 if sol_time < 0 else sol_time / 4 - 180
+
+        # radians for the zenith and degrees for altitude
+        zenith = math.acos(math.sin(self._latitude) * math.sin(sol_dec) +
+                           math.cos(self._latitude) * math.cos(sol_dec) *
+                           math.cos(math.radians(hour_angle)))
+        altitude = 90 - math.degrees(zenith)
+
+        # approx atmospheric refraction used to correct the altitude
+        if altitude > 85:
+            atmos_refraction = 0
+        elif altitude > 5:
+            atmos_refraction = 58.1 / math.tan(math.radians(altitude)) - \
+                0.07 / (math.tan(math.radians(altitude))) ** 3 + \
+                0.000086 / (math.tan(math.radians(altitude))) ** 5
+        elif altitude > -0.575:
+            atmos_refraction = 1735 + altitude * \
+                (-518.2 + altitude * (103.4 + altitude * (-12.79 + altitude * 0.711)))
+        else:
+            atmos_refraction = -20.772 / math.tan(math.radians(altitude))
+
+        atmos_refraction /= 3600
+        altitude += atmos_refraction
+
+        # azimuth in degrees
+        az_init = ((math.sin(self._latitude) * math.cos(zenith)) - math.sin(sol_dec)) / \
+            (math.cos(self._latitude) * math.sin(zenith))
+        try:
+            if hour_angle > 0:
+                azimuth = (math.degrees(math.acos(az_init)) + 180) % 360
+            else:
+                azimuth = (540 - math.degrees(math.acos(az_init))) % 360
+        except ValueError:  # perfect solar noon yields math domain error
+            azimuth = 180
+
+        return altitude, azimuth
+
     def _calculate_sunrise_hour_angle(self, solar_dec, depression):
         """Calculate hour angle for sunrise time in degrees.
 
@@ -1252,3 +1381,144 @@ class Sun(object):
             self.sun_vector.y,
             self.sun_vector.z
         )
+
+
+class SunPositions(object):
+    """Compact arrays of sun positions computed for several minutes of the year.
+
+    Sun objects are only created when an individual position is requested
+    (eg. by indexing or iterating over this object).
+
+    Args:
+        moys: An array of integers for the minute of the year of each position.
+        altitudes: An array of solar altitudes in degrees.
+        azimuths: An array of solar azimuths in degrees.
+        sun_vector_components: A tuple of three arrays for the X, Y and Z
+            components of the sun vectors.
+        is_daylight_saving: An array of 0/1 values to note whether each
+            position is in the daylight saving period.
+        is_solar_time: Boolean indicating if the moys represent solar time.
+        north_angle: North angle of the sunpath in degrees.
+        is_leap_year: Boolean to note whether the moys are for a leap year.
+
+    Properties:
+        * moys
+        * hoys
+        * altitudes
+        * azimuths
+        * sun_vector_components
+        * sun_vectors
+        * sun_vectors_reversed
+        * is_daylight_saving
+        * is_during_day
+        * is_solar_time
+        * north_angle
+        * is_leap_year
+    """
+
+    __slots__ = ('_moys', '_altitudes', '_azimuths', '_sun_vector_components',
+                 '_is_daylight_saving', '_is_solar_time', '_north_angle',
+                 '_is_leap_year')
+
+    def __init__(self, moys, altitudes, azimuths, sun_vector_components,
+                 is_daylight_saving, is_solar_time, north_angle, is_leap_year):
+        """Init sun positions."""
+        self._moys = moys
+        self._altitudes = altitudes
+        self._azimuths = azimuths
+        self._sun_vector_components = sun_vector_components
+        self._is_daylight_saving = is_daylight_saving
+        self._is_solar_time = is_solar_time
+        self._north_angle = north_angle
+        self._is_leap_year = is_leap_year
+
+    @property
+    def moys(self):
+        """An array of integers for the minute of the year of each position."""
+        return self._moys
+
+    @property
+    def hoys(self):
+        """A list of numbers for the hour of the year of each position."""
+        return [moy / 60.0 for moy in self._moys]
+
+    @property
+    def altitudes(self):
+        """An array of solar altitudes in degrees."""
+        return self._altitudes
+
+    @property
+    def azimuths(self):
+        """An array of solar azimuths in degrees."""
+        return self._azimuths
+
+    @property
+    def sun_vector_components(self):
+        """A tuple of three arrays for the X, Y and Z components of the sun vectors.
+
+        Note that daytime sun vectors point downward (z will be negative).
+        """
+        return self._sun_vector_components
+
+    @property
+    def sun_vectors(self):
+        """A list of ladybug_geometry Vector3D for the sun vectors."""
+        return [Vector3D(x, y, z) for x, y, z in zip(*self._sun_vector_components)]
+
+    @property
+    def sun_vectors_reversed(self):
+        """A list of ladybug_geometry Vector3D for the reversed sun vectors."""
+        return [Vector3D(-x, -y, -z)
+                for x, y, z in zip(*self._sun_vector_components)]
+
+    @property
+    def is_daylight_saving(self):
+        """An array of 0/1 values for whether each position is in daylight saving."""
+        return self._is_daylight_saving
+
+    @property
+    def is_during_day(self):
+        """A list of booleans to note whether each sun position is during day."""
+        return [z <= 0 for z in self._sun_vector_components[2]]
+
+    @property
+    def is_solar_time(self):
+        """Boolean to note whether the moys represent solar time."""
+        return self._is_solar_time
+
+    @property
+    def north_angle(self):
+        """North angle of the sunpath in degrees."""
+        return self._north_angle
+
+    @property
+    def is_leap_year(self):
+        """Boolean to note whether the moys are for a leap year."""
+        return self._is_leap_year
+
+    def sun(self, index):
+        """Get a Sun object for one of the positions.
+
+        Args:
+            index: An integer for the index of the position.
+        """
+        return Sun(DateTime.from_moy(self._moys[index], self._is_leap_year),
+                   self._altitudes[index], self._azimuths[index], self._is_solar_time,
+                   bool(self._is_daylight_saving[index]), self._north_angle)
+
+    def ToString(self):
+        """Overwrite .NET ToString method."""
+        return self.__repr__()
+
+    def __len__(self):
+        return len(self._moys)
+
+    def __getitem__(self, key):
+        return self.sun(key)
+
+    def __iter__(self):
+        return (self.sun(i) for i in xrange(len(self._moys)))
+
+    def __repr__(self):
+        """Sun positions representation."""
+        return 'Sun Positions ({} positions)'.format(len(self._moys))
@@ -3,11 +3,15 @@
 from __future__ import division
 
 import math
+from collections import OrderedDict
 
 from ladybug_geometry.geometry2d.pointvector import Vector2D
 from ladybug_geometry.geometry3d.pointvector import Point3D, Vector3D
 from ladybug_geometry.geometry3d.mesh import Mesh3D
 
+# maximum number of requested patch geometries that are kept by each ViewSphere
+_PATCH_GEOMETRY_MAX_SIZE = 32
+
 
 class ViewSphere(object):
     """Class for subdividing the sphere and hemisphere for view-based studies.
@@ -47,7 +51,7 @@ class ViewSphere(object):
                  '_tregenza_sphere_mesh', '_tregenza_solid_angles',
                  '_reinhart_dome_vectors', '_reinhart_sphere_vectors',
                  '_reinhart_dome_mesh', '_reinhart_sphere_mesh',
-                 '_reinhart_solid_angles')
+                 '_reinhart_solid_angles', '_patch_geometry')
 
     def __init__(self):
         """Create the ViewSphere."""
@@ -63,6 +67,8 @@ class ViewSphere(object):
         self._reinhart_dome_mesh = None
         self._reinhart_sphere_mesh = None
         self._reinhart_solid_angles = None
+        # most recently requested patch geometry by (kind, arguments)
+        self._patch_geometry = OrderedDict()
 
     @property
     def tregenza_dome_vectors(self):
@@ -116,14 +122,14 @@ class ViewSphere(object):
     @property
     def tregenza_solid_angles(self):
         """Get a list of solid angles that align with the tregenza_dome_vectors."""
-        if self._reinhart_solid_angles is None:
+        if self._tregenza_solid_angles is None:
             angles = view_sphere.TREGENZA_COEFFICIENTS
             patch_rows = view_sphere.TREGENZA_PATCHES_PER_ROW + (1,)
             patch_angles = []
             for ang, p_count in zip(angles, patch_rows):
                 patch_angles.extend([ang] * p_count)
-            self._reinhart_solid_angles = tuple(patch_angles)
-        return self._reinhart_solid_angles
+            self._tregenza_solid_angles = tuple(patch_angles)
+        return self._tregenza_solid_angles
 
     @property
     def reinhart_dome_vectors(self):
@@ -219,6 +225,14 @@ class ViewSphere(object):
                 per patch. These will align with the faces of the patch_mesh.
                 All vectors are unit vectors.
         """
+        key = ('horizontal_radial', float(offset_angle), int(division_count),
+               bool(subdivide_in_place))
+        return self._stored(key, self._horizontal_radial_patches,
+                            offset_angle, division_count, subdivide_in_place)
+
+    def _horizontal_radial_patches(self, offset_angle, division_count,
+                                   subdivide_in_place):
+        """Compute the horizontal_radial_patches without using the store."""
         # figure out how many rows and patches should be in the output
         patch_row_count = self._patch_row_count_array(division_count)
         patch_count = self._patch_count_in_radial_offset(
@@ -248,6 +262,12 @@ class ViewSphere(object):
             A list of numbers with a value for each patch that corresponds to the
             area of that patch. The average value of all the patches is equal to 1.
         """
+        key = ('horizontal_radial_weights', float(offset_angle), int(division_count))
+        return list(self._stored(key, self._horizontal_radial_patch_weights,
+                                 offset_angle, division_count))
+
+    def _horizontal_radial_patch_weights(self, offset_angle, division_count):
+        """Compute the horizontal_radial_patch_weights as a tuple."""
         # get the areas of the patches and the number of patches to include in the offset
         patch_areas, patch_row_count = self._dome_patch_areas(division_count)
         patch_count = self._patch_count_in_radial_offset(
@@ -255,7 +275,7 @@ class ViewSphere(object):
         # normalize the patch areas so that they average to 1
         relevant_patches = patch_areas[:patch_count]
         avg_patch_area = sum(relevant_patches) / len(relevant_patches)
-        return [p_area / avg_patch_area for p_area in relevant_patches] * 2
+        return tuple(p_area / avg_patch_area for p_area in relevant_patches) * 2
 
     def dome_patches(self, division_count=1, subdivide_in_place=False):
         """Get Vector3Ds and a corresponding Mesh3D for a dome.
@@ -285,34 +305,27 @@ class ViewSphere(object):
                 until the last circular patch, which will have a single vector
                 for the several triangular faces. All vectors are unit vectors.
         """
+        key = ('dome', int(division_count), bool(subdivide_in_place))
+        return self._stored(key, self._dome_patches, division_count, subdivide_in_place)
+
+    def _dome_patches(self, division_count, subdivide_in_place):
+        """Compute the dome_patches without using the store."""
         # compute constants to be used in the generation of patch points
         patch_row_count = self._patch_row_count_array(division_count)
-        base_vec = Vector3D(0, 1, 0)
-        rotate_axis = Vector3D(1, 0, 0)
         vertical_angle = math.pi / (2 * len(patch_row_count) + division_count) if \
             subdivide_in_place else math.pi / (2 * len(patch_row_count) + 1)
 
-        # loop through the patch values and generate points for each vertex
+        # loop through the patch rows and generate points for each vertex
         vertices, faces = [], []
-        pt_i = -2  # track the number of vertices in the mesh
         for row_i, row_count in enumerate(patch_row_count):
-            pt_i += 2  # advance the number of vertices by two
             horiz_angle = -2 * math.pi / row_count  # horizontal angle of each patch
-            vec01 = base_vec.rotate(rotate_axis, vertical_angle * row_i)
-            vec02 = vec01.rotate(rotate_axis, vertical_angle)
             correction_angle = -horiz_angle / 2
-            if subdivide_in_place:
-                correction_angle * division_count
-            vec1 = vec01.rotate_xy(correction_angle)
-            vec2 = vec02.rotate_xy(correction_angle)
-            vertices.extend((Point3D(v.x, v.y, v.z) for v in (vec1, vec2)))
-            for _ in range(row_count):  # generate the row of patches
-                vec3 = vec1.rotate_xy(horiz_angle)
-                vec4 = vec2.rotate_xy(horiz_angle)
-                vertices.extend((Point3D(v.x, v.y, v.z) for v in (vec3, vec4)))
-                faces.append((pt_i, pt_i + 1, pt_i + 3, pt_i + 2))
-                pt_i += 2  # advance the number of vertices by two
-                vec1, vec2 = vec3, vec4  # reset vec1 and vec2 for the next patch
+            azimuths = [correction_angle + horiz_angle * i for i in range(row_count + 1)]
+            pt_i = len(vertices)
+            vertices.extend(self._row_vertices(
+                vertical_angle * row_i, vertical_angle * (row_i + 1), azimuths))
+            faces.extend((i, i + 1, i + 3, i + 2)
+                         for i in range(pt_i, pt_i + 2 * row_count, 2))
 
         # add triangular faces to represent the last circular patch
         end_vert_i = len(vertices)
@@ -338,11 +351,16 @@ class ViewSphere(object):
             A list of numbers with a value for each patch that corresponds to the
             area of that patch. The average value of all the patches is equal to 1.
         """
+        key = ('dome_weights', int(division_count))
+        return list(self._stored(key, self._dome_patch_weights, division_count))
+
+    def _dome_patch_weights(self, division_count):
+        """Compute the dome_patch_weights as a tuple."""
         # get the areas of the patches
         patch_areas, _ = self._dome_patch_areas(division_count)
         # normalize the patch areas so that they average to 1
         avg_patch_area = 2 * math.pi / len(patch_areas)
-        return [p_area / avg_patch_area for p_area in patch_areas]
+        return tuple(p_area / avg_patch_area for p_area in patch_areas)
 
     def sphere_patches(self, division_count=1, subdivide_in_place=False):
         """Get Vector3Ds and a corresponding Mesh3D for a sphere.
@@ -372,6 +390,11 @@ class ViewSphere(object):
                 for the two circular patches, which will have a single vector
                 for the several triangular faces. All vectors are unit vectors.
         """
+        key = ('sphere', int(division_count), bool(subdivide_in_place))
+        return self._stored(key, self._sphere_patches, division_count, subdivide_in_place)
+
+    def _sphere_patches(self, division_count, subdivide_in_place):
+        """Compute the sphere_patches without using the store."""
         # generate patches for the hemisphere
         m_top, v_top = self.dome_patches(division_count, subdivide_in_place)
         # reverse the vectors and negate all the z values of the sky patch mesh
@@ -388,11 +411,7 @@ class ViewSphere(object):
             A list of numbers with a value for each patch that corresponds to the
             area of that patch. The average value of all the patches is equal to 1.
         """
-        # get the areas of the patches
-        patch_areas, _ = self._dome_patch_areas(division_count)
-        # normalize the patch areas so that they average to 1
-        avg_patch_area = 2 * math.pi / len(patch_areas)
-        return [p_area / avg_patch_area for p_area in patch_areas] * 2
+        return self.dome_patch_weights(division_count) * 2
 
     def dome_radial_patches(self, azimuth_count=72, altitude_count=18):
         """Get Vector3Ds and a corresponding Mesh3D for a a radial dome.
@@ -415,26 +434,24 @@ class ViewSphere(object):
                 per mesh face. These will align with the faces of the patch_mesh.
                 All vectors are unit vectors.
         """
-        # set up starting vectors and points
-        base_vec, rotate_axis = Vector3D(0, 1, 0), Vector3D(1, 0, 0)
+        key = ('dome_radial', int(azimuth_count), int(altitude_count))
+        return self._stored(key, self._dome_radial_patches, azimuth_count, altitude_count)
+
+    def _dome_radial_patches(self, azimuth_count, altitude_count):
+        """Compute the dome_radial_patches without using the store."""
+        # set up the angles of the patches
         horiz_angle = -2 * math.pi / azimuth_count
         vertical_angle = math.pi / (2 * altitude_count)
+        azimuths = [horiz_angle * i for i in range(azimuth_count + 1)]
 
-        # loop through the patch values and generate points for each vertex
+        # loop through the patch rows and generate points for each vertex
         vertices, faces = [], []
-        pt_i = -2  # track the number of vertices in the mesh
         for row_i in range(altitude_count - 1):
-            pt_i += 2  # advance the number of vertices by two
-            vec1 = base_vec.rotate(rotate_axis, vertical_angle * row_i)
-            vec2 = vec1.rotate(rotate_axis, vertical_angle)
-            vertices.extend((Point3D(v.x, v.y, v.z) for v in (vec1, vec2)))
-            for _ in range(azimuth_count):  # generate the row of patches
-                vec3 = vec1.rotate_xy(horiz_angle)
-                vec4 = vec2.rotate_xy(horiz_angle)
-                vertices.extend((Point3D(v.x, v.y, v.z) for v in (vec3, vec4)))
-                faces.append((pt_i, pt_i + 1, pt_i + 3, pt_i + 2))
-                pt_i += 2  # advance the number of vertices by two
-                vec1, vec2 = vec3, vec4  # reset vec1 and vec2 for the next patch
+            pt_i = len(vertices)
+            vertices.extend(self._row_vertices(
+                vertical_angle * row_i, vertical_angle * (row_i + 1), azimuths))
+            faces.extend((i, i + 1, i + 3, i + 2)
+                         for i in range(pt_i, pt_i + 2 * azimuth_count, 2))
 
         # add triangular faces to represent the last circular patch
         end_vert_i = len(vertices)
@@ -463,11 +480,17 @@ class ViewSphere(object):
             A list of numbers with a value for each patch that corresponds to the
             area of that patch. The average value of all the patches is equal to 1.
         """
+        key = ('dome_radial_weights', int(azimuth_count), int(altitude_count))
+        return list(self._stored(key, self._dome_radial_patch_weights,
+                                 azimuth_count, altitude_count))
+
+    def _dome_radial_patch_weights(self, azimuth_count, altitude_count):
+        """Compute the dome_radial_patch_weights as a tuple."""
         # get the areas of the patches
         patch_areas = self._dome_radial_patch_areas(azimuth_count, altitude_count)
         # normalize the patch areas so that they average to 1
         total_patch_area = 2 * math.pi
-        return [p_area / total_patch_area for p_area in patch_areas]
+        return tuple(p_area / total_patch_area for p_area in patch_areas)
 
     def horizontal_circle_view_mesh(
             self, center_point=Point3D(0, 0, 0), radius=1, azimuth_count=72):
@@ -812,6 +835,41 @@ class ViewSphere(object):
             mask_pattern.append(not is_visible)
         return mask_pattern
 
+    def _stored(self, key, function, *args):
+        """Get patch geometry from the store of this object, computing it if needed.
+
+        Everything in the store is shared between all callers, which is why
+        meshes and vectors are immutable objects and weights are kept as tuples.
+        Only the most recently used geometries are kept in the store.
+        """
+        try:
+            result = self._patch_geometry.pop(key)
+        except KeyError:
+            result = function(*args)
+            while len(self._patch_geometry) >= _PATCH_GEOMETRY_MAX_SIZE:
+                self._patch_geometry.popitem(last=False)
+        self._patch_geometry[key] = result
+        return result
+
+    @staticmethod
+    def _row_vertices(altitude1, altitude2, azimuths):
+        """Get the vertices at the bottom and top of each patch edge in a row.
+
+        Args:
+            altitude1: The altitude of the bottom of the row in radians.
+            altitude2: The altitude of the top of the row in radians.
+            azimuths: A list of angles in radians for each edge between patches,
+                measured counterclockwise from the positive Y-axis.
+        """
+        cos1, sin1 = math.cos(altitude1), math.sin(altitude1)
+        cos2, sin2 = math.cos(altitude2), math.sin(altitude2)
+        vertices = []
+        for azimuth in azimuths:
+            cos_a, sin_a = math.cos(azimuth), math.sin(azimuth)
+            vertices.append(Point3D(-cos1 * sin_a, cos1 * cos_a, sin1))
+            vertices.append(Point3D(-cos2 * sin_a, cos2 * cos_a, sin2))
+        return vertices
+
     @staticmethod
     def _dome_radial_patch_areas(azimuth_count=72, altitude_count=18):
         """Get the area of each patch in a radial dome."""
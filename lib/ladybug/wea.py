@@ -5,8 +5,6 @@ import math
 import os
 from copy import deepcopy
 
-from ladybug_geometry.geometry3d.pointvector import Vector3D
-
 from .analysisperiod import AnalysisPeriod
 from .datacollection import HourlyContinuousCollection, HourlyDiscontinuousCollection
 from .datatype.energyflux import Irradiance, GlobalHorizontalIrradiance, \
@@ -669,12 +667,10 @@ class Wea(object):
                             analysis_period=self.analysis_period,
                             metadata=self.metadata)
         glob_horiz = []
-        sp = Sunpath.from_location(self.location)
-        sp.is_leap_year = self.is_leap_year
-        for dt, dnr, dhr in zip(self.datetimes, self.direct_normal_irradiance,
-                                self.diffuse_horizontal_irradiance):
-            sun = sp.calculate_sun_from_date_time(dt)
-            glob_horiz.append(dhr + dnr * math.sin(math.radians(sun.altitude)))
+        altitudes = self._sun_positions().altitudes
+        for alt, dnr, dhr in zip(altitudes, self.direct_normal_irradiance,
+                                 self.diffuse_horizontal_irradiance):
+            glob_horiz.append(dhr + dnr * math.sin(math.radians(alt)))
         return self._aligned_collection(header_ghr, glob_horiz)
 
     @property
@@ -689,11 +685,9 @@ class Wea(object):
                             analysis_period=self.analysis_period,
                             metadata=self.metadata)
         direct_horiz = []
-        sp = Sunpath.from_location(self.location)
-        sp.is_leap_year = self.is_leap_year
-        for dt, dnr in zip(self.datetimes, self.direct_normal_irradiance):
-            sun = sp.calculate_sun_from_date_time(dt)
-            direct_horiz.append(dnr * math.sin(math.radians(sun.altitude)))
+        altitudes = self._sun_positions().altitudes
+        for alt, dnr in zip(altitudes, self.direct_normal_irradiance):
+            direct_horiz.append(dnr * math.sin(math.radians(alt)))
         return self._aligned_collection(header_dhr, direct_horiz)
 
     def filter_by_pattern(self, pattern):
@@ -769,13 +763,8 @@ class Wea(object):
         Returns:
             A new Wea with filtered data.
         """
-        sp = Sunpath.from_location(self.location)
-        sp.is_leap_year = self.is_leap_year
-        pattern = []
-        for dt in self.datetimes:
-            sun = sp.calculate_sun_from_date_time(dt)
-            sun_up = True if sun.altitude > min_altitude else False
-            pattern.append(sun_up)
+        altitudes = self._sun_positions().altitudes
+        pattern = [alt > min_altitude for alt in altitudes]
         return self.filter_by_pattern(pattern)
 
     def get_irradiance_value(self, month, day, hour):
@@ -855,65 +844,96 @@ class Wea(object):
             -   reflected_irradiance: A data collection of ground reflected solar
                 irradiance.
         """
-        # function to convert polar coordinates to xyz.
-        def pol2cart(phi, theta):
-            mult = math.cos(theta)
-            x = math.sin(phi) * mult
-            y = math.cos(phi) * mult
-            z = math.sin(theta)
-            return Vector3D(x, y, z)
+        totals, directs, diffuses, reflecteds = self.directional_irradiances(
+            [(altitude, azimuth)], ground_reflectance, isotropic)
+        return totals[0], directs[0], diffuses[0], reflecteds[0]
 
-        # convert the altitude and azimuth to a normal vector
-        normal = pol2cart(math.radians(azimuth), math.radians(altitude))
+    def directional_irradiances(self, orientations, ground_reflectance=0.2,
+                                isotropic=True):
+        """Get the irradiance components for surfaces facing many directions at once.
 
-        # create sunpath and get altitude at every timestep of the year
-        dir_irr, diff_irr, ref_irr, total_irr = [], [], [], []
-        sp = Sunpath.from_location(self.location)
-        sp.is_leap_year = self.is_leap_year
-        for dt, dnr, dhr in zip(self.datetimes, self.direct_normal_irradiance,
-                                self.diffuse_horizontal_irradiance):
-            sun = sp.calculate_sun_from_date_time(dt)
-            sun_vec = pol2cart(math.radians(sun.azimuth),
-                               math.radians(sun.altitude))
-            vec_angle = sun_vec.angle(normal)
+        This yields the same results as calling directional_irradiance for
+        each orientation but the sun positions, the global horizontal irradiance
+        and the sky diffuse components are only computed once and shared
+        between all of the orientations.
+
+        Args:
+            orientations: A list of (altitude, azimuth) tuples with one tuple for
+                each surface orientation to be evaluated. Altitudes are numbers
+                between -90 and 90 and azimuths are numbers between 0 and 360,
+                both in degrees.
+            ground_reflectance: A number between 0 and 1 that represents the
+                reflectance of the ground. (Default: 0.2).
+            isotropic: A boolean value that sets whether an isotropic sky is
+                used (as opposed to an anisotropic sky). (Default: True).
+
+        Returns:
+            A tuple of four elements, each of which is a list with one data
+            collection for each of the input orientations.
+
+            -   total_irradiances: Data collections of total solar irradiance.
+
+            -   direct_irradiances: Data collections of direct solar irradiance.
+
+            -   diffuse_irradiances: Data collections of diffuse sky solar irradiance.
+
+            -   reflected_irradiances: Data collections of ground reflected solar
+                irradiance.
+        """
+        # compute the sun vector and global irradiance at every timestep once
+        sun_pos = self._sun_positions()
+        dnr_values = self.direct_normal_irradiance.values
+        dhr_values = self.diffuse_horizontal_irradiance.values
+        sun_x, sun_y, sun_z, sun_dnr, e_glob = [], [], [], [], []
+        for sun_alt, sun_az, dnr, dhr in zip(
+                sun_pos.altitudes, sun_pos.azimuths, dnr_values, dhr_values):
+            alt_r, az_r = math.radians(sun_alt), math.radians(sun_az)
+            sun_x.append(math.sin(az_r) * math.cos(alt_r))
+            sun_y.append(math.cos(az_r) * math.cos(alt_r))
+            sun_z.append(math.sin(alt_r))
+            sun_dnr.append(dnr if sun_alt > 0 else 0)
+            e_glob.append(dhr + dnr * math.cos(math.radians(90 - sun_alt)))
+
+        # compute the irradiance components of each orientation
+        dir_irrs, diff_irrs, ref_irrs, total_irrs = [], [], [], []
+        for altitude, azimuth in orientations:
+            alt_r, az_r = math.radians(altitude), math.radians(azimuth)
+            n_x = math.sin(az_r) * math.cos(alt_r)
+            n_y = math.cos(az_r) * math.cos(alt_r)
+            n_z = math.sin(alt_r)
+            cosines = [n_x * x + n_y * y + n_z * z
+                       for x, y, z in zip(sun_x, sun_y, sun_z)]
 
             # direct irradiance on surface
-            srf_dir = 0
-            if sun.altitude > 0 and vec_angle < math.pi / 2:
-                srf_dir = dnr * math.cos(vec_angle)
+            srf_dir = [dnr * cos_a if cos_a > 0 else 0
+                       for dnr, cos_a in zip(sun_dnr, cosines)]
 
             # diffuse irradiance on surface
             if isotropic:
-                srf_dif = dhr * ((math.sin(math.radians(altitude)) / 2) + 0.5)
+                factor = (math.sin(alt_r) / 2) + 0.5
+                srf_dif = [dhr * factor for dhr in dhr_values]
             else:
-                y = max(0.45, 0.55 + (0.437 * math.cos(vec_angle)) + 0.313 *
-                        math.cos(vec_angle) * 0.313 * math.cos(vec_angle))
-                srf_dif = dhr * (y * (
-                    math.sin(math.radians(abs(90 - altitude)))) +
-                    math.cos(math.radians(abs(90 - altitude))))
+                tilt = math.radians(abs(90 - altitude))
+                sin_t, cos_t = math.sin(tilt), math.cos(tilt)
+                srf_dif = [
+                    dhr * (max(0.45, 0.55 + (0.437 * cos_a) + 0.313 * cos_a * 0.313 *
+                               cos_a) * sin_t + cos_t)
+                    for dhr, cos_a in zip(dhr_values, cosines)]
 
             # reflected irradiance on surface.
-            e_glob = dhr + dnr * math.cos(math.radians(90 - sun.altitude))
-            srf_ref = e_glob * ground_reflectance * (0.5 - (math.sin(
-                math.radians(altitude)) / 2))
+            factor = ground_reflectance * (0.5 - (math.sin(alt_r) / 2))
+            srf_ref = [e_g * factor for e_g in e_glob]
 
-            # add it all together
-            dir_irr.append(srf_dir)
-            diff_irr.append(srf_dif)
-            ref_irr.append(srf_ref)
-            total_irr.append(srf_dir + srf_dif + srf_ref)
+            # create the data collections
+            data_head = Header(
+                Irradiance(), 'W/m2', self.analysis_period, dict(self.metadata))
+            dir_irrs.append(self._aligned_collection(data_head, srf_dir))
+            diff_irrs.append(self._aligned_collection(data_head, srf_dif))
+            ref_irrs.append(self._aligned_collection(data_head, srf_ref))
+            total_irrs.append(self._aligned_collection(
+                data_head, [d + f + r for d, f, r in zip(srf_dir, srf_dif, srf_ref)]))
 
-        # create the headers
-        data_head = Header(Irradiance(), 'W/m2', self.analysis_period, self.metadata)
-
-        # create the data collections
-        direct_irradiance = self._aligned_collection(data_head, dir_irr)
-        diffuse_irradiance = self._aligned_collection(data_head, diff_irr)
-        reflected_irradiance = self._aligned_collection(data_head, ref_irr)
-        total_irradiance = self._aligned_collection(data_head, total_irr)
-
-        return total_irradiance, direct_irradiance, \
-            diffuse_irradiance, reflected_irradiance
+        return total_irrs, dir_irrs, diff_irrs, ref_irrs
 
     def estimate_illuminance_components(self, dew_point):
         """Get estimated direct, diffuse, and global illuminance from this Wea.
@@ -950,13 +970,11 @@ class Wea(object):
             'Input dew_point data must be aligned with the irradiance on the Wea.'
 
         # calculate illuminance values
-        sp = Sunpath.from_location(self.location)
-        sp.is_leap_year = self.is_leap_year
+        altitudes = self._sun_positions().altitudes
         gh_ill_values, dn_ill_values, dh_ill_values, zen_lum_values = [], [], [], []
-        for dt, dp, ghi, dni, dhi in zip(
-                self.datetimes, dew_point, self.global_horizontal_irradiance,
+        for alt, dp, ghi, dni, dhi in zip(
+                altitudes, dew_point, self.global_horizontal_irradiance,
                 self.direct_normal_irradiance, self.diffuse_horizontal_irradiance):
-            alt = sp.calculate_sun_from_date_time(dt).altitude
             gh, dn, dh, z = estimate_illuminance_from_irradiance(alt, ghi, dni, dhi, dp)
             gh_ill_values.append(gh)
             dn_ill_values.append(dn)
@@ -1079,6 +1097,12 @@ class Wea(object):
             count = len(weaf.readlines()) - 6
         return count
 
+    def _sun_positions(self):
+        """Get SunPositions for each of the datetimes of the Wea."""
+        sp = Sunpath.from_location(self.location)
+        sp.is_leap_year = self.is_leap_year
+        return sp.calculate_sun_positions_from_moys([dt.moy for dt in self.datetimes])
+
     def _aligned_collection(self, header, values):
         """Process a header and values into a collection aligned with Wea data."""
         if self.is_continuous:
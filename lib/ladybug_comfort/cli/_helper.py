@@ -4,6 +4,7 @@ Most functions assist with the serialization of objects to/from JSON or CSV.
 """
 import os
 import json
+import multiprocessing
 
 from ladybug.analysisperiod import AnalysisPeriod
 from ladybug.header import Header
@@ -146,9 +147,51 @@ def csv_to_num_matrix(csv_file_path):
         )
 
 
-def _data_to_csv(data, csv_path):
+def process_matrix_rows(row_function, rows, args=(), workers=1):
+    """Run a function over the rows of a matrix using one or more processes.
+
+    When several workers are used, the rows are split into contiguous chunks
+    that are processed by a pool of processes and the results are reassembled
+    in the original row order. So the result is identical to a serial run.
+
+    Args:
+        row_function: A module-level function that accepts a list of rows followed
+            by the args and returns a tuple of lists with one item for each row.
+        rows: A list of the rows of the matrix.
+        args: A tuple of other arguments to be passed to the row_function.
+        workers: An integer for the number of processes to use. If 1 or less,
+            the rows are processed serially in the current process. (Default: 1).
+
+    Returns:
+        A tuple of lists with one item for each of the rows.
+    """
+    rows = list(rows)
+    if workers <= 1 or len(rows) <= 1:
+        return row_function(rows, *args)
+    workers = min(workers, len(rows))
+    chunk_count = min(workers * 4, len(rows))
+    chunk_size = -(-len(rows) // chunk_count)
+    jobs = [(row_function, rows[i:i + chunk_size], args)
+            for i in range(0, len(rows), chunk_size)]
+    pool = multiprocessing.Pool(workers)
+    try:
+        results = pool.map(_run_row_function, jobs, chunksize=1)
+    finally:
+        pool.close()
+        pool.join()
+    return tuple([item for result in results for item in result[i]]
+                 for i in range(len(results[0])))
+
+
+def _run_row_function(job):
+    """Run a row_function over a chunk of rows within a worker process."""
+    row_function, rows, args = job
+    return row_function(rows, *args)
+
+
+def _data_to_csv(data, csv_path, append=False):
     """Write a list of data collections into a CSV file."""
-    with open(csv_path, 'w') as csv_file:
+    with open(csv_path, 'a' if append else 'w') as csv_file:
         for dat in data:
             str_data = (str(v) for v in dat)
             csv_file.write(','.join(str_data) + '\n')
@@ -162,15 +205,21 @@ def _data_to_ill(data, ill_path):
             ill_file.write(' '.join(str_data) + '\n')
 
 
-def thermal_map_csv(folder, temperature, condition, condition_intensity):
-    """Write out the thermal mapping CSV files associated with every comfort map."""
+def thermal_map_csv(folder, temperature, condition, condition_intensity,
+                    append=False):
+    """Write out the thermal mapping CSV files associated with every comfort map.
+
+    If append is True, the rows are added to the end of any existing CSV files
+    in the folder, which allows maps to be written one chunk of sensors at a time.
+    """
     preparedir(folder, remove_content=False)
     result_file_dict = {
         'temperature': os.path.join(folder, 'temperature.csv'),
         'condition': os.path.join(folder, 'condition.csv'),
         'condition_intensity': os.path.join(folder, 'condition_intensity.csv')
     }
-    _data_to_csv(temperature, result_file_dict['temperature'])
-    _data_to_csv(condition, result_file_dict['condition'])
-    _data_to_csv(condition_intensity, result_file_dict['condition_intensity'])
+    _data_to_csv(temperature, result_file_dict['temperature'], append)
+    _data_to_csv(condition, result_file_dict['condition'], append)
+    _data_to_csv(
+        condition_intensity, result_file_dict['condition_intensity'], append)
     return result_file_dict
@@ -23,7 +23,8 @@ from ladybug.datatype.temperaturedelta import OperativeTemperatureDelta
 from ladybug.datatype.fraction import Fraction
 
 from ladybug_comfort.map.irr import irradiance_contrib_map
-from ladybug_comfort.map.mrt import shortwave_mrt_map, longwave_mrt_map
+from ladybug_comfort.map.mrt import shortwave_mrt_map, shortwave_mrt_map_chunks, \
+    longwave_mrt_map
 from ladybug_comfort.map.air import air_map
 from ladybug_comfort.map.tcp import tcp_model_schedules, tcp_total
 from ladybug_comfort.map._enclosure import _parse_enclosure_info, _values_to_data
@@ -97,6 +98,17 @@ def map():
               'the assumptions of the SolarCal model.', default=None, type=str)
 @click.option('--comfort-par', '-cp', help='A PMVParameter string to customize the '
               'assumptions of the PMV model.', default=None, type=str)
+@click.option('--chunk-size', '-cs', help='An integer for the number of sensors to '
+              'process at a time. The zone results of the result-sql are loaded once '
+              'and, when greater than zero, the irradiance of each chunk of sensors '
+              'is read, run through the comfort model with the zone results of its '
+              'sensors and appended to the result CSV files before the next chunk is '
+              'processed, which bounds the memory used by models with many sensors. '
+              'If 0, all sensors will be processed at once.', default=0, type=int,
+              show_default=True)
+@click.option('--progress/--no-progress', help='Flag to note whether the number '
+              'of processed sensors should be reported to stderr after each chunk.',
+              default=False, show_default=True)
 @click.option('--folder', '-f', help='Folder into which the result CSV files will be '
               'written. If None, files will be written to a "thermal_map" sub-folder in'
               'same directory as the result-sql.', default=None, show_default=True,
@@ -107,7 +119,7 @@ def map():
 def pmv(result_sql, enclosure_info, epw_file,
         total_irradiance, direct_irradiance, ref_irradiance, sun_up_hours,
         air_speed, met_rate, clo_value, write_op_map,
-        run_period, comfort_par, solarcal_par, folder, log_file):
+        run_period, comfort_par, solarcal_par, chunk_size, progress, folder, log_file):
     """Get CSV files with maps of PMV comfort from EnergyPlus and Radiance results.
 
     \b
@@ -135,15 +147,6 @@ def pmv(result_sql, enclosure_info, epw_file,
             enclosure_info, result_sql, epw_obj, run_period, air_speed,
             include_humidity=True)
 
-        # adjust the radiant temperature for shortwave solar
-        if total_irradiance is not None and os.path.isfile(total_irradiance):
-            assert sun_up_hours is not None and os.path.isfile(sun_up_hours), \
-                'Sun up hours must be specified when total irradiance is specified.'
-            pt_rad_temps = shortwave_mrt_map(
-                epw_obj.location, pt_rad_temps, sun_up_hours,
-                total_irradiance, direct_irradiance, ref_irradiance,
-                solarcal_par=solarcal_par, indirect_is_total=True)
-
         # convert any input lists of clothing or met to data collections
         met_rate = _values_to_data(met_rate, a_per, MetabolicRate, 'met')
         clo_value = _values_to_data(clo_value, a_per, ClothingInsulation, 'clo')
@@ -154,23 +157,27 @@ def pmv(result_sql, enclosure_info, epw_file,
                 if isinstance(clo_value, HourlyContinuousCollection) else clo_value
 
         # run the collections through the PMV model and output results
-        comf_class = _PMVnoSET if write_op_map else PMV
-        temperature, condition, condition_intensity = [], [], []
-        for t_a, rh, t_r, vel in zip(pt_air_temps, pt_humids, pt_rad_temps, pt_speeds):
-            pmv_obj = comf_class(
-                t_a, rh, t_r, vel, met_rate, clo_value, comfort_parameter=comfort_par)
-            condition.append(pmv_obj.thermal_condition)
-            condition_intensity.append(pmv_obj.predicted_mean_vote)
-            if write_op_map:
-                temperature.append(pmv_obj.operative_temperature)
-            else:
-                temperature.append(pmv_obj.standard_effective_temperature)
-
-        # write out the final results to CSV files
         if folder is None:
             folder = os.path.join(os.path.dirname(result_sql), 'thermal_map')
-        result_file_dict = thermal_map_csv(
-            folder, temperature, condition, condition_intensity)
+        result_file_dict = thermal_map_csv(folder, [], [], [])
+        comf_class = _PMVnoSET if write_op_map else PMV
+        for st, pt_mrts in _mrt_chunks(
+                epw_obj, pt_rad_temps, chunk_size, total_irradiance,
+                direct_irradiance, ref_irradiance, sun_up_hours, solarcal_par):
+            end = st + len(pt_mrts)
+            temperature, condition, condition_intensity = [], [], []
+            for t_a, rh, t_r, vel in zip(pt_air_temps[st:end], pt_humids[st:end],
+                                         pt_mrts, pt_speeds[st:end]):
+                pmv_obj = comf_class(t_a, rh, t_r, vel, met_rate, clo_value,
+                                     comfort_parameter=comfort_par)
+                condition.append(pmv_obj.thermal_condition)
+                condition_intensity.append(pmv_obj.predicted_mean_vote)
+                if write_op_map:
+                    temperature.append(pmv_obj.operative_temperature)
+                else:
+                    temperature.append(pmv_obj.standard_effective_temperature)
+            thermal_map_csv(folder, temperature, condition, condition_intensity, True)
+            _report_progress(progress, end, len(pt_air_temps))
         log_file.write(json.dumps(result_file_dict))
     except Exception as e:
         _logger.exception('Failed to run PMV model comfort map.\n{}'.format(e))
@@ -218,6 +225,17 @@ def pmv(result_sql, enclosure_info, epw_file,
               'the assumptions of the SolarCal model.', default=None, type=str)
 @click.option('--comfort-par', '-cp', help='An AdaptiveParameter string to customize '
               'the assumptions of the Adaptive comfort model.', default=None, type=str)
+@click.option('--chunk-size', '-cs', help='An integer for the number of sensors to '
+              'process at a time. The zone results of the result-sql are loaded once '
+              'and, when greater than zero, the irradiance of each chunk of sensors '
+              'is read, run through the comfort model with the zone results of its '
+              'sensors and appended to the result CSV files before the next chunk is '
+              'processed, which bounds the memory used by models with many sensors. '
+              'If 0, all sensors will be processed at once.', default=0, type=int,
+              show_default=True)
+@click.option('--progress/--no-progress', help='Flag to note whether the number '
+              'of processed sensors should be reported to stderr after each chunk.',
+              default=False, show_default=True)
 @click.option('--folder', '-f', help='Folder into which the result CSV files will be '
               'written. If None, files will be written to a "thermal_map" sub-folder in'
               'same directory as the result-sql.', default=None, show_default=True,
@@ -227,7 +245,8 @@ def pmv(result_sql, enclosure_info, epw_file,
               type=click.File('w'), default='-', show_default=True)
 def adaptive(result_sql, enclosure_info, epw_file,
              total_irradiance, direct_irradiance, ref_irradiance, sun_up_hours,
-             air_speed, run_period, comfort_par, solarcal_par, folder, log_file):
+             air_speed, run_period, comfort_par, solarcal_par, chunk_size, progress,
+             folder, log_file):
     """Get CSV files with maps of Adaptive comfort from EnergyPlus and Radiance results.
 
     \b
@@ -253,15 +272,6 @@ def adaptive(result_sql, enclosure_info, epw_file,
         pt_air_temps, pt_rad_temps, _, pt_speeds, _ = _parse_enclosure_info(
             enclosure_info, result_sql, epw_obj, run_period, air_speed)
 
-        # adjust the radiant temperature for shortwave solar
-        if total_irradiance is not None and os.path.isfile(total_irradiance):
-            assert sun_up_hours is not None and os.path.isfile(sun_up_hours), \
-                'Sun up hours must be specified when total irradiance is specified.'
-            pt_rad_temps = shortwave_mrt_map(
-                epw_obj.location, pt_rad_temps, sun_up_hours,
-                total_irradiance, direct_irradiance, ref_irradiance,
-                solarcal_par=solarcal_par, indirect_is_total=True)
-
         # compute previaling outdoor temperature so it's not recomputed for each sensor
         avg_month = comfort_par.avg_month_or_running_mean \
             if comfort_par is not None else True
@@ -269,19 +279,23 @@ def adaptive(result_sql, enclosure_info, epw_file,
         prevail_temp = prev_obj.get_aligned_prevailing(pt_air_temps[0])
 
         # run the collections through the Adaptive model and output results
-        temperature, condition, condition_intensity = [], [], []
-        for t_air, t_rad, vel in zip(pt_air_temps, pt_rad_temps, pt_speeds):
-            adaptive_obj = Adaptive.from_air_and_rad_temp(
-                prevail_temp, t_air, t_rad, vel, comfort_parameter=comfort_par)
-            temperature.append(adaptive_obj.operative_temperature)
-            condition.append(adaptive_obj.thermal_condition)
-            condition_intensity.append(adaptive_obj.degrees_from_neutral)
-
-        # write out the final results to CSV files
         if folder is None:
             folder = os.path.join(os.path.dirname(result_sql), 'thermal_map')
-        result_file_dict = thermal_map_csv(
-            folder, temperature, condition, condition_intensity)
+        result_file_dict = thermal_map_csv(folder, [], [], [])
+        for st, pt_mrts in _mrt_chunks(
+                epw_obj, pt_rad_temps, chunk_size, total_irradiance,
+                direct_irradiance, ref_irradiance, sun_up_hours, solarcal_par):
+            end = st + len(pt_mrts)
+            temperature, condition, condition_intensity = [], [], []
+            for t_air, t_rad, vel in zip(pt_air_temps[st:end], pt_mrts,
+                                         pt_speeds[st:end]):
+                adaptive_obj = Adaptive.from_air_and_rad_temp(
+                    prevail_temp, t_air, t_rad, vel, comfort_parameter=comfort_par)
+                temperature.append(adaptive_obj.operative_temperature)
+                condition.append(adaptive_obj.thermal_condition)
+                condition_intensity.append(adaptive_obj.degrees_from_neutral)
+            thermal_map_csv(folder, temperature, condition, condition_intensity, True)
+            _report_progress(progress, end, len(pt_air_temps))
         log_file.write(json.dumps(result_file_dict))
     except Exception as e:
         _logger.exception('Failed to run Adaptive model comfort map.\n{}'.format(e))
@@ -330,6 +344,17 @@ def adaptive(result_sql, enclosure_info, epw_file,
               'the assumptions of the SolarCal model.', default=None, type=str)
 @click.option('--comfort-par', '-cp', help='An UTCIParameter string to customize the '
               'assumptions of the Adaptrive comfort model.', default=None, type=str)
+@click.option('--chunk-size', '-cs', help='An integer for the number of sensors to '
+              'process at a time. The zone results of the result-sql are loaded once '
+              'and, when greater than zero, the irradiance of each chunk of sensors '
+              'is read, run through the comfort model with the zone results of its '
+              'sensors and appended to the result CSV files before the next chunk is '
+              'processed, which bounds the memory used by models with many sensors. '
+              'If 0, all sensors will be processed at once.', default=0, type=int,
+              show_default=True)
+@click.option('--progress/--no-progress', help='Flag to note whether the number '
+              'of processed sensors should be reported to stderr after each chunk.',
+              default=False, show_default=True)
 @click.option('--folder', '-f', help='Folder into which the result CSV files will be '
               'written. If None, files will be written to a "thermal_map" sub-folder in'
               'same directory as the result-sql.', default=None, show_default=True,
@@ -339,7 +364,8 @@ def adaptive(result_sql, enclosure_info, epw_file,
               type=click.File('w'), default='-', show_default=True)
 def utci(result_sql, enclosure_info, epw_file,
          total_irradiance, direct_irradiance, ref_irradiance, sun_up_hours,
-         wind_speed, run_period, comfort_par, solarcal_par, folder, log_file):
+         wind_speed, run_period, comfort_par, solarcal_par, chunk_size, progress,
+         folder, log_file):
     """Get CSV files with maps of UTCI comfort from EnergyPlus and Radiance results.
 
     \b
@@ -365,28 +391,23 @@ def utci(result_sql, enclosure_info, epw_file,
             enclosure_info, result_sql, epw_obj, run_period, wind_speed,
             include_humidity=True, use_10m_wind_speed=True)
 
-        # adjust the radiant temperature for shortwave solar
-        if total_irradiance is not None and os.path.isfile(total_irradiance):
-            assert sun_up_hours is not None and os.path.isfile(sun_up_hours), \
-                'Sun up hours must be specified when total irradiance is specified.'
-            pt_rad_temps = shortwave_mrt_map(
-                epw_obj.location, pt_rad_temps, sun_up_hours,
-                total_irradiance, direct_irradiance, ref_irradiance,
-                solarcal_par=solarcal_par, indirect_is_total=True)
-
         # run the collections through the UTCI model and output results
-        temperature, condition, condition_intensity = [], [], []
-        for t_a, rh, t_r, vel in zip(pt_air_temps, pt_humids, pt_rad_temps, pt_speeds):
-            utci_obj = UTCI(t_a, rh, t_r, vel, comfort_parameter=comfort_par)
-            temperature.append(utci_obj.universal_thermal_climate_index)
-            condition.append(utci_obj.thermal_condition)
-            condition_intensity.append(utci_obj.thermal_condition_eleven_point)
-
-        # write out the final results to CSV files
         if folder is None:
             folder = os.path.join(os.path.dirname(result_sql), 'thermal_map')
-        result_file_dict = thermal_map_csv(
-            folder, temperature, condition, condition_intensity)
+        result_file_dict = thermal_map_csv(folder, [], [], [])
+        for st, pt_mrts in _mrt_chunks(
+                epw_obj, pt_rad_temps, chunk_size, total_irradiance,
+                direct_irradiance, ref_irradiance, sun_up_hours, solarcal_par):
+            end = st + len(pt_mrts)
+            temperature, condition, condition_intensity = [], [], []
+            for t_a, rh, t_r, vel in zip(pt_air_temps[st:end], pt_humids[st:end],
+                                         pt_mrts, pt_speeds[st:end]):
+                utci_obj = UTCI(t_a, rh, t_r, vel, comfort_parameter=comfort_par)
+                temperature.append(utci_obj.universal_thermal_climate_index)
+                condition.append(utci_obj.thermal_condition)
+                condition_intensity.append(utci_obj.thermal_condition_eleven_point)
+            thermal_map_csv(folder, temperature, condition, condition_intensity, True)
+            _report_progress(progress, end, len(pt_air_temps))
         log_file.write(json.dumps(result_file_dict))
     except Exception as e:
         _logger.exception('Failed to run UTCI model comfort map.\n{}'.format(e))
@@ -928,3 +949,35 @@ def _tcp_config():
             }
         ]
     }
+
+
+def _mrt_chunks(epw_obj, pt_rad_temps, chunk_size, total_irradiance,
+                direct_irradiance, ref_irradiance, sun_up_hours, solarcal_par):
+    """Get the index of the first sensor and the MRT data for each chunk of sensors.
+
+    If total_irradiance is specified, the MRT will be adjusted for shortwave solar
+    and, if the chunk_size is 0, all sensors will be yielded as a single chunk.
+    """
+    sensor_count = len(pt_rad_temps)
+    chunk_size = chunk_size if chunk_size > 0 else max(sensor_count, 1)
+    if total_irradiance is not None and os.path.isfile(total_irradiance):
+        assert sun_up_hours is not None and os.path.isfile(sun_up_hours), \
+            'Sun up hours must be specified when total irradiance is specified.'
+        mrt_chunks = shortwave_mrt_map_chunks(
+            epw_obj.location, pt_rad_temps, sun_up_hours,
+            total_irradiance, direct_irradiance, ref_irradiance,
+            solarcal_par=solarcal_par, indirect_is_total=True, chunk_size=chunk_size)
+        start = 0
+        for pt_mrts in mrt_chunks:
+            yield start, pt_mrts
+            start += len(pt_mrts)
+    else:
+        for start in range(0, sensor_count, chunk_size):
+            yield start, pt_rad_temps[start:start + chunk_size]
+
+
+def _report_progress(progress, processed_count, sensor_count):
+    """Report the number of sensors processed so far to stderr if progress is True."""
+    if progress:
+        click.echo('Processed {} of {} sensors.'.format(
+            processed_count, sensor_count), err=True)
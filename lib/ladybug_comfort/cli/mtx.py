@@ -5,14 +5,14 @@ import logging
 import json
 import os
 
-from ladybug_comfort.pmv import predicted_mean_vote, predicted_mean_vote_no_set
+from ladybug_comfort.pmv import predicted_mean_vote_batch
 from ladybug_comfort.adaptive import adaptive_comfort_ashrae55, \
     adaptive_comfort_en15251, adaptive_comfort_conditioned_function, \
     cooling_effect_ashrae55, cooling_effect_en16798, cooling_effect_en15251
-from ladybug_comfort.utci import universal_thermal_climate_index
+from ladybug_comfort.utci import universal_thermal_climate_index_batch
 
 from ._helper import load_value_list, thermal_map_csv, csv_to_num_matrix, \
-    load_pmv_par_str, load_adaptive_par_str, load_utci_par_str
+    load_pmv_par_str, load_adaptive_par_str, load_utci_par_str, process_matrix_rows
 
 _logger = logging.getLogger(__name__)
 
@@ -76,6 +76,10 @@ def mtx():
               '"feels-like" temperature for the PMV model.', default=True)
 @click.option('--comfort-par', '-cp', help='A PMVParameter string to customize the '
               'assumptions of the PMV model.', default=None, type=str)
+@click.option('--workers', '-w', help='An integer for the number of processes '
+              'across which the rows of the matrix will be split. If 1 or less, the '
+              'rows will be processed serially in a single process.',
+              default=1, type=int, show_default=True)
 @click.option('--folder', '-f', help='Folder into which the result CSV files will be '
               'written. If None, files will be written to a "thermal_mtx" sub-folder in'
               'same directory as the temperature-mtx.', default=None, show_default=True,
@@ -86,7 +90,7 @@ def mtx():
 def pmv_mtx(
     temperature_mtx, rel_humidity_mtx, rad_temperature_mtx, rad_delta_mtx,
     air_speed_mtx, air_speed_json, air_speed,
-    met_rate, clo_value, write_op_map, comfort_par, folder, log_file
+    met_rate, clo_value, write_op_map, comfort_par, workers, folder, log_file
 ):
     """Get CSV files with matrices of PMV comfort from matrices of PMV inputs.
 
@@ -127,38 +131,11 @@ def pmv_mtx(
         met_rate = load_value_list(met_rate, mtx_len, 1.1)
         clo_value = load_value_list(clo_value, mtx_len, 0.7)
         comfort_par = load_pmv_par_str(comfort_par)
-        sa_thresh = comfort_par.still_air_threshold
 
         # run the collections through the PMV model and output results
-        temper, cond, cond_intensity = [], [], []
-        if write_op_map:
-            for sat, srt, sas, srh in zip(air_temp, rad_temp, a_speed, rel_h):
-                s_temper, s_cond, s_cond_intensity = [], [], []
-                for ta, tr, vel, rh, met, clo in \
-                        zip(sat, srt, sas, srh, met_rate, clo_value):
-                    result = predicted_mean_vote_no_set(
-                        ta, tr, vel, rh, met, clo, 0, sa_thresh)
-                    s_cond_intensity.append(result['pmv'])
-                    s_cond.append(
-                        comfort_par.thermal_condition(result['pmv'], result['ppd']))
-                    s_temper.append((ta + tr) / 2)
-                temper.append(s_temper)
-                cond.append(s_cond)
-                cond_intensity.append(s_cond_intensity)
-        else:
-            for sat, srt, sas, srh in zip(air_temp, rad_temp, a_speed, rel_h):
-                s_temper, s_cond, s_cond_intensity = [], [], []
-                for ta, tr, vel, rh, met, clo in \
-                        zip(sat, srt, sas, srh, met_rate, clo_value):
-                    result = predicted_mean_vote(
-                        ta, tr, vel, rh, met, clo, 0, sa_thresh)
-                    s_cond_intensity.append(result['pmv'])
-                    s_cond.append(
-                        comfort_par.thermal_condition(result['pmv'], result['ppd']))
-                    s_temper.append(result['set'])
-                temper.append(s_temper)
-                cond.append(s_cond)
-                cond_intensity.append(s_cond_intensity)
+        temper, cond, cond_intensity = process_matrix_rows(
+            _pmv_rows, zip(air_temp, rad_temp, a_speed, rel_h),
+            (met_rate, clo_value, comfort_par, write_op_map), workers)
 
         # write out the final results to CSV files
         if folder is None:
@@ -205,6 +182,10 @@ def pmv_mtx(
               'If unspecified or "None", 0.1 m/s will be used.', default='0.1', type=str)
 @click.option('--comfort-par', '-cp', help='A AdaptiveParameter string to customize the '
               'assumptions of the Adaptive model.', default=None, type=str)
+@click.option('--workers', '-w', help='An integer for the number of processes '
+              'across which the rows of the matrix will be split. If 1 or less, the '
+              'rows will be processed serially in a single process.',
+              default=1, type=int, show_default=True)
 @click.option('--folder', '-f', help='Folder into which the result CSV files will be '
               'written. If None, files will be written to a "thermal_mtx" sub-folder in'
               'same directory as the temperature-mtx.', default=None, show_default=True,
@@ -214,7 +195,7 @@ def pmv_mtx(
               type=click.File('w'), default='-', show_default=True)
 def adaptive_mtx(
     temperature_mtx, prevail_temp, rad_temperature_mtx, rad_delta_mtx,
-    air_speed_mtx, air_speed_json, air_speed, comfort_par, folder, log_file
+    air_speed_mtx, air_speed_json, air_speed, comfort_par, workers, folder, log_file
 ):
     """Get CSV files with matrices of Adaptive comfort from matrices of Adaptive inputs.
 
@@ -253,36 +234,11 @@ def adaptive_mtx(
 
         # load the comfort parameters
         comfort_par = load_adaptive_par_str(comfort_par)
-        # determine the comfort function to use
-        if comfort_par.conditioning != 0:
-            comf_funct = adaptive_comfort_conditioned_function(
-                comfort_par.conditioning, comfort_par.standard)
-        elif comfort_par.ashrae_or_en is True:
-            comf_funct = adaptive_comfort_ashrae55
-        else:
-            comf_funct = adaptive_comfort_en15251
-        # determine the cooling effect function to use
-        if not comfort_par.discrete_or_continuous_air_speed:
-            cooling_funct = cooling_effect_en15251
-        elif comfort_par.ashrae_or_en:
-            cooling_funct = cooling_effect_ashrae55
-        else:
-            cooling_funct = cooling_effect_en16798
 
-        # run the collections through the PMV model and output results
-        temper, cond, cond_intensity = [], [], []
-        for sat, srt, sas in zip(air_temp, rad_temp, a_speed):
-            s_temper, s_cond, s_cond_intensity = [], [], []
-            for tp, ta, tr, vel in zip(prevail_temp, sat, srt, sas):
-                to = (ta + tr) / 2
-                result = comf_funct(tp, to)
-                ce = cooling_funct(vel, to, tp)
-                s_cond_intensity.append(result['deg_comf'])
-                s_cond.append(comfort_par.thermal_condition(result, ce))
-                s_temper.append(to)
-            temper.append(s_temper)
-            cond.append(s_cond)
-            cond_intensity.append(s_cond_intensity)
+        # run the collections through the Adaptive model and output results
+        temper, cond, cond_intensity = process_matrix_rows(
+            _adaptive_rows, zip(air_temp, rad_temp, a_speed),
+            (prevail_temp, comfort_par), workers)
 
         # write out the final results to CSV files
         if folder is None:
@@ -332,6 +288,10 @@ def adaptive_mtx(
               default=None, type=str)
 @click.option('--comfort-par', '-cp', help='A UTCIParameter string to customize the '
               'assumptions of the UTCI model.', default=None, type=str)
+@click.option('--workers', '-w', help='An integer for the number of processes '
+              'across which the rows of the matrix will be split. If 1 or less, the '
+              'rows will be processed serially in a single process.',
+              default=1, type=int, show_default=True)
 @click.option('--folder', '-f', help='Folder into which the result CSV files will be '
               'written. If None, files will be written to a "thermal_mtx" sub-folder in'
               'same directory as the temperature-mtx.', default=None, show_default=True,
@@ -341,7 +301,7 @@ def adaptive_mtx(
               type=click.File('w'), default='-', show_default=True)
 def utci_mtx(
     temperature_mtx, rel_humidity_mtx, rad_temperature_mtx, rad_delta_mtx,
-    air_speed_mtx, wind_speed_json, wind_speed, comfort_par, folder, log_file
+    air_speed_mtx, wind_speed_json, wind_speed, comfort_par, workers, folder, log_file
 ):
     """Get CSV files with matrices of UTCI comfort from matrices of UTCI inputs.
 
@@ -383,18 +343,9 @@ def utci_mtx(
         comfort_par = load_utci_par_str(comfort_par)
 
         # run the collections through the UTCI model and output results
-        temper, cond, cond_intensity = [], [], []
-        for sat, srt, sws, srh in zip(air_temp, rad_temp, w_speed, rel_h):
-            s_temper, s_cond, s_cond_intensity = [], [], []
-            for ta, tr, vel, rh in zip(sat, srt, sws, srh):
-                result = universal_thermal_climate_index(ta, tr, vel, rh)
-                s_temper.append(result)
-                s_cond.append(comfort_par.thermal_condition(result))
-                s_cond_intensity.append(
-                    comfort_par.thermal_condition_eleven_point(result))
-            temper.append(s_temper)
-            cond.append(s_cond)
-            cond_intensity.append(s_cond_intensity)
+        temper, cond, cond_intensity = process_matrix_rows(
+            _utci_rows, zip(air_temp, rad_temp, w_speed, rel_h), (comfort_par,),
+            workers)
 
         # write out the final results to CSV files
         if folder is None:
@@ -406,3 +357,81 @@ def utci_mtx(
         sys.exit(1)
     else:
         sys.exit(0)
+
+
+def _pmv_rows(rows, met_rate, clo_value, comfort_par, write_op_map):
+    """Run rows of a PMV input matrix through the PMV model."""
+    sa_thresh = comfort_par.still_air_threshold
+    temper, cond, cond_intensity = [], [], []
+    for sat, srt, sas, srh in rows:
+        result = predicted_mean_vote_batch(
+            sat, srt, sas, srh, met_rate, clo_value, 0, sa_thresh,
+            include_set=not write_op_map)
+        cond.append([comfort_par.thermal_condition(pmv, ppd)
+                     for pmv, ppd in zip(result['pmv'], result['ppd'])])
+        cond_intensity.append(result['pmv'])
+        if write_op_map:
+            temper.append([(ta + tr) / 2 for ta, tr in zip(sat, srt)])
+        else:
+            temper.append(result['set'])
+    return temper, cond, cond_intensity
+
+
+def _adaptive_rows(rows, prevail_temp, comfort_par):
+    """Run rows of an Adaptive input matrix through the Adaptive model."""
+    # determine the comfort function to use
+    if comfort_par.conditioning != 0:
+        comf_funct = adaptive_comfort_conditioned_function(
+            comfort_par.conditioning, comfort_par.standard)
+    elif comfort_par.ashrae_or_en is True:
+        comf_funct = adaptive_comfort_ashrae55
+    else:
+        comf_funct = adaptive_comfort_en15251
+    # determine the cooling effect function to use
+    if not comfort_par.discrete_or_continuous_air_speed:
+        cooling_funct = cooling_effect_en15251
+    elif comfort_par.ashrae_or_en:
+        cooling_funct = cooling_effect_ashrae55
+    else:
+        cooling_funct = cooling_effect_en16798
+
+    # run each row through the comfort function
+    temper, cond, cond_intensity = [], [], []
+    for sat, srt, sas in rows:
+        s_temper, s_cond, s_cond_intensity = [], [], []
+        for tp, ta, tr, vel in zip(prevail_temp, sat, srt, sas):
+            to = (ta + tr) / 2
+            result = comf_funct(tp, to)
+            ce = cooling_funct(vel, to, tp)
+            s_cond_intensity.append(result['deg_comf'])
+            s_cond.append(comfort_par.thermal_condition(result, ce))
+            s_temper.append(to)
+        temper.append(s_temper)
+        cond.append(s_cond)
+        cond_intensity.append(s_cond_intensity)
+    return temper, cond, cond_intensity
+
+
+def _utci_rows(rows, comfort_par):
+    """Run rows of a UTCI input matrix through the UTCI model.
+
+    All rows are evaluated in a single batch such that the sensors sharing the
+    same weather conditions (eg. outdoor sensors) share the UTCI factors.
+    """
+    columns, counts = ([], [], [], []), []
+    for row in rows:
+        count = min(len(values) for values in row)
+        for column, values in zip(columns, row):
+            column.extend(values[:count])
+        counts.append(count)
+    all_temper = universal_thermal_climate_index_batch(*columns)
+    temper, cond, cond_intensity = [], [], []
+    start = 0
+    for count in counts:
+        s_temper = all_temper[start:start + count]
+        start += count
+        temper.append(s_temper)
+        cond.append(comfort_par.thermal_condition_batch(s_temper))
+        cond_intensity.append(
+            comfort_par.thermal_condition_eleven_point_batch(s_temper))
+    return temper, cond, cond_intensity
@@ -2,7 +2,7 @@
 """Object for calculating UTCI comfort from DataCollections."""
 from __future__ import division
 
-from ..utci import universal_thermal_climate_index
+from ..utci import universal_thermal_climate_index_batch
 from ..parameter.utci import UTCIParameter
 from .base import ComfortCollection
 from .solarcal import OutdoorSolarCal
@@ -179,15 +179,11 @@ class UTCI(ComfortCollection):
 
     def _calculate_utci(self):
         """Compute UTCI for each step of the Data Collection."""
-        self._utci = []
-        self._thermal_category = []
-        for ta, tr, vel, rh in \
-            zip(self._air_temperature, self._rad_temperature,
-                self._wind_speed, self._rel_humidity):
-            result = universal_thermal_climate_index(ta, tr, vel, rh)
-            self._utci.append(result)
-            self._thermal_category.append(
-                self._comfort_par.thermal_condition_eleven_point(result))
+        self._utci = universal_thermal_climate_index_batch(
+            self._air_temperature, self._rad_temperature,
+            self._wind_speed, self._rel_humidity)
+        self._thermal_category = \
+            self._comfort_par.thermal_condition_eleven_point_batch(self._utci)
 
     @property
     def air_temperature(self):
@@ -450,4 +446,4 @@ class UTCI(ComfortCollection):
         return [self._comfort_par.thermal_condition_nine_point(t) for t in self._utci]
 
     def _original_category_funct(self):
-        return [self._comfort_par.original_utci_category(t) for t in self._utci]
+        return self._comfort_par.original_utci_category_batch(self._utci)
@@ -35,7 +35,10 @@ def _parse_enclosure_info(enclosure_info, result_sql, epw, analysis_period=None,
             converted to ground-level speed (multiplying by 2/3).
 
     Returns:
-        A tuple of 5 values.
+        A tuple of 5 values. The data collections of each sensor are returned as
+        sequences that look up the collection of the enclosure of the sensor
+        when it is requested, such that no list with every sensor is built and
+        the sensors can be processed in chunks.
 
         * pt_air_temps -- Data collections of air temperatures.
 
@@ -107,17 +110,41 @@ def _parse_enclosure_info(enclosure_info, result_sql, epw, analysis_period=None,
             new_rel_speeds.append(new_a_spd)
         rel_speeds = new_rel_speeds
 
-    # loop through the sensors and select the relevant data collections
-    pt_air_temps, pt_rad_temps, pt_humids, pt_speeds = [], [], [], []
-    for pt_i in enclosure_dict['sensor_indices']:
-        pt_air_temps.append(rel_air_temps[pt_i])
-        pt_rad_temps.append(rel_rad_temps[pt_i])
-        if include_humidity:
-            pt_humids.append(rel_humids[pt_i])
-        pt_speeds.append(rel_speeds[pt_i])
+    # get the relevant data collections of the sensors
+    sensor_indices = enclosure_dict['sensor_indices']
+    pt_air_temps = _SensorData(rel_air_temps, sensor_indices)
+    pt_rad_temps = _SensorData(rel_rad_temps, sensor_indices)
+    pt_humids = _SensorData(rel_humids, sensor_indices) if include_humidity else []
+    pt_speeds = _SensorData(rel_speeds, sensor_indices)
     return pt_air_temps, pt_rad_temps, pt_humids, pt_speeds, base_a_per
 
 
+class _SensorData(object):
+    """A read-only sequence with the data collection of each sensor of a thermal map.
+
+    Args:
+        enclosure_data: A list with one data collection for each enclosure.
+        sensor_indices: A list with the index of the enclosure of each sensor.
+    """
+    __slots__ = ('_enclosure_data', '_sensor_indices')
+
+    def __init__(self, enclosure_data, sensor_indices):
+        self._enclosure_data = enclosure_data
+        self._sensor_indices = sensor_indices
+
+    def __len__(self):
+        return len(self._sensor_indices)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self._enclosure_data[i] for i in self._sensor_indices[key]]
+        return self._enclosure_data[self._sensor_indices[key]]
+
+    def __iter__(self):
+        for i in self._sensor_indices:
+            yield self._enclosure_data[i]
+
+
 def _values_to_data(values, base_period, data_type, data_units):
     """Load an array of values to a data collection.
 
@@ -4,6 +4,7 @@ from __future__ import division
 
 import os
 import json
+from itertools import islice
 
 from ladybug.epw import EPW
 from ladybug.sql import SQLiteResult
@@ -61,116 +62,171 @@ def shortwave_mrt_map(
             total irradiance, in which case the direct irradiance should be subtracted
             from it to get indirect irradiance. (Default: False).
     """
+    mrt_data = []
+    for mrt_chunk in shortwave_mrt_map_chunks(
+            location, longwave_data, sun_up_hours, indirect_ill, direct_ill, ref_ill,
+            contributions, transmittance_contribs, solarcal_par, indirect_is_total,
+            chunk_size=None):
+        mrt_data.extend(mrt_chunk)
+    return mrt_data
+
+
+def shortwave_mrt_map_chunks(
+    location, longwave_data, sun_up_hours, indirect_ill, direct_ill=None, ref_ill=None,
+    contributions=None, transmittance_contribs=None,
+    solarcal_par=None, indirect_is_total=False, chunk_size=1000
+):
+    """Get MRT data collections adjusted for shortwave in chunks of sensors.
+
+    This is the streaming equivalent of shortwave_mrt_map, which gets all of
+    the sensors as a single chunk. The .ill files (including those of any dynamic
+    contributions) are read incrementally such that only the irradiance of one
+    chunk of sensors is held in memory at a time.
+
+    Args:
+        location: A ladybug Location object to dictate the solar positions used
+            in the calculation.
+        longwave_data: An array of data collections for each point within a thermal
+            map. All collections must be aligned with one another. The analysis
+            period on the collections does not have to be annual. This can be
+            any sequence that can be sliced, such that the collections of each
+            chunk are only looked up as the chunk is processed.
+        sun_up_hours: File path to a sun-up-hours.txt file output by Radiance.
+        indirect_ill: Path to an .ill file output by Radiance containing indirect
+            irradiance for each longwave_data collection. Alternatively, if
+            indirect_is_total is set to True, this can be an .ill file with
+            the total irradiance, which will have the direct_ill subtracted
+            from it to yield the indirect illuminance.
+        direct_ill: Path to an .ill file output by Radiance containing direct
+            irradiance for each longwave_data collection. If None, all shortwave
+            will be assumed to be indirect. (Default: None).
+        ref_ill: Path to an .ill file output by Radiance containing total ground-
+            reflected irradiance for each longwave_data collection. If None, a
+            default ground reflectance of 0.25 will be assumed. (Default: None).
+        contributions: An optional folder containing sub-folders of irradiance
+            contributions from dynamic aperture groups. There should be one
+            sub-folder per window groups and each one should contain three .ill
+            files named direct.ill, indirect.ill and reflected.ill. If specified,
+            these will be added to the irradiance inputs before computing
+            shortwave MRT deltas. (Default: None).
+        transmittance_contribs: An optional folder containing a transmittance
+            schedule JSON and sub-folders of irradiance results that exclude the
+            shade from the calculation. There should be one sub-folder per window
+            groups and each one should contain three .ill files named direct.ill,
+            indirect.ill and reflected.ill. If specified, these will be added to
+            the irradiance inputs before computing shortwave MRT deltas.
+        solarcal_par: Optional SolarCalParameter object to account for
+            properties of the human geometry. (Default: None).
+        indirect_is_total: A boolean to note whether the indirect_ill is actually the
+            total irradiance, in which case the direct irradiance should be subtracted
+            from it to get indirect irradiance. (Default: False).
+        chunk_size: An integer for the number of sensors in each chunk. If None,
+            all of the sensors are processed as a single chunk. (Default: 1000).
+
+    Returns:
+        A generator of lists of MRT data collections. Each list contains the
+        data of the next chunk_size sensors.
+    """
     # determine the analysis period and open the sun_up_hours file
     a_per = longwave_data[0].header.analysis_period
     is_annual, t_step, lp_yr = a_per.is_annual, a_per.timestep, a_per.is_leap_year
     with open(sun_up_hours) as soh_f:
         sun_indices = [int(float(h) * t_step) for h in soh_f]
-
-    # parse each of the .ill files into annual irradiance data collections
-    indirect = _ill_file_to_data(indirect_ill, sun_indices, t_step, lp_yr)
-    direct = _ill_file_to_data(direct_ill, sun_indices, t_step, lp_yr) \
-        if direct_ill is not None and os.path.isfile(direct_ill) else \
-        [_blank_ill_data(t_step, lp_yr)] * len(indirect)
-    ref = _ill_file_to_data(ref_ill, sun_indices, t_step, lp_yr) \
-        if ref_ill is not None and os.path.isfile(ref_ill) else None
-
-    # if there are dynamic contributions, then add them to the data collections
-    if contributions is not None and os.path.isdir(contributions):
-        for dyn_group in os.listdir(contributions):
-            # get the file paths to the contributions
-            group_path = os.path.join(contributions, dyn_group)
-            indirect_con_f = os.path.join(group_path, 'indirect.ill')
-            direct_con_f = os.path.join(group_path, 'direct.ill')
-            ref_con_f = os.path.join(group_path, 'reflected.ill')
-            # add the contributions to the irradiance terms
-            indirect_con = _ill_file_to_data(indirect_con_f, sun_indices, t_step, lp_yr)
-            indirect = [rad + c_rad for rad, c_rad in zip(indirect, indirect_con)]
-            direct_con = _ill_file_to_data(direct_con_f, sun_indices, t_step, lp_yr)
-            direct = [rad + c_rad for rad, c_rad in zip(direct, direct_con)]
-            if ref is not None and os.path.isfile(ref_con_f):
-                ref_con = _ill_file_to_data(ref_con_f, sun_indices, t_step, lp_yr)
-                ref = [rad + c_rad for rad, c_rad in zip(ref, ref_con)]
-
-    # if the analysis is not annual, apply analysis periods
-    if not is_annual:
-        indirect = [data.filter_by_analysis_period(a_per) for data in indirect]
-        direct = [data.filter_by_analysis_period(a_per) for data in direct]
-        if ref is not None:
-            ref = [data.filter_by_analysis_period(a_per) for data in ref]
-
-    # if there are any transmittance contributions, then compute and add them
-    if transmittance_contribs is not None and os.path.isdir(transmittance_contribs):
-        # load the JSON file with the transmittance schedules
-        sch_json = os.path.join(transmittance_contribs, 'schedules.json')
-        with open(sch_json) as json_file:
-            sch_dict = json.load(json_file)
-        shd_grps = [grp for grp in os.listdir(transmittance_contribs)
-                    if grp != 'schedules.json']
-        for dyn_group in shd_grps:
-            t_sch_head = Header(Irradiance(), 'W/m2', a_per)
-            t_sch = HourlyContinuousCollection(t_sch_head, sch_dict[dyn_group])
-            # get the file paths to the transmittance_contribs
-            group_path = os.path.join(transmittance_contribs, dyn_group)
-            indirect_con_f = os.path.join(group_path, 'indirect.ill')
-            direct_con_f = os.path.join(group_path, 'direct.ill')
-            ref_con_f = os.path.join(group_path, 'reflected.ill')
-            # add the transmittance_contribs to the irradiance terms
-            indirect_con = _ill_file_to_data(indirect_con_f, sun_indices, t_step, lp_yr)
-            direct_con = _ill_file_to_data(direct_con_f, sun_indices, t_step, lp_yr)
-            if not is_annual:
-                indirect_con = \
-                    [data.filter_by_analysis_period(a_per) for data in indirect_con]
-                direct_con = \
-                    [data.filter_by_analysis_period(a_per) for data in direct_con]
-            indirect = [rad + ((c_rad - rad) * t_sch)
-                        for rad, c_rad in zip(indirect, indirect_con)]
-            direct = [rad + ((c_rad - rad) * t_sch)
-                      for rad, c_rad in zip(direct, direct_con)]
-            if ref is not None and os.path.isfile(ref_con_f):
-                ref_con = _ill_file_to_data(ref_con_f, sun_indices, t_step, lp_yr)
-                if not is_annual:
-                    ref_con = [data.filter_by_analysis_period(a_per) for data in ref_con]
-                ref = [rad + ((c_rad - rad) * t_sch) for rad, c_rad in zip(ref, ref_con)]
-
-    # if need be, convert total irradiance into indirect irradiance
-    if indirect_is_total:
-        indirect = [t_rad - d_rad for t_rad, d_rad in zip(indirect, direct)]
+    a_period = AnalysisPeriod(timestep=t_step, is_leap_year=lp_yr)
+    header = Header(Irradiance(), 'W/m2', a_period)
 
     # compute solar altitudes and sharps
     body_par = SolarCalParameter() if solarcal_par is None else solarcal_par
-    sp = Sunpath.from_location(location)
-    _altitudes = []
-    if body_par.body_azimuth is None:
-        _sharps = [body_par.sharp] * len(a_per)
-        for t_date in a_per.datetimes:
-            sun = sp.calculate_sun_from_date_time(t_date)
-            _altitudes.append(sun.altitude)
-    else:
-        _sharps = []
-        for t_date in a_per.datetimes:
-            sun = sp.calculate_sun_from_date_time(t_date)
-            sharp = sharp_from_solar_and_body_azimuth(sun.azimuth, body_par.body_azimuth)
-            _sharps.append(sharp)
-            _altitudes.append(sun.altitude)
-
-    # duplicate the longwave data if there is only one data collection
-    if len(longwave_data) == 1:
-        longwave_data = [longwave_data[0]] * len(direct)
-
-    # pass all data through the solarcal collections and return MRT data collections
-    mrt_data = []
-    if ref is not None:  # fully-detailed SolarCal with ground reflectance
-        for l_mrt, d_rad, i_rad, r_rad in zip(longwave_data, direct, indirect, ref):
-            scl_obj = _HorizontalRefSolarCalMap(
-                _altitudes, _sharps, d_rad, i_rad, r_rad, l_mrt, None, body_par)
-            mrt_data.append(scl_obj.mean_radiant_temperature)
-    else:  # simpler SolarCal assuming default ground reflectance
-        for l_mrt, d_rad, i_rad in zip(longwave_data, direct, indirect):
-            scl_obj = _HorizontalSolarCalMap(
-                _altitudes, _sharps, d_rad, i_rad, l_mrt, None, None, body_par)
-            mrt_data.append(scl_obj.mean_radiant_temperature)
-    return mrt_data
+    _altitudes, _sharps = _altitudes_and_sharps(location, a_per, body_par)
+
+    def _read_chunk(ill_file):
+        data = []
+        for pt_res in islice(ill_file, chunk_size):
+            ill_values = [float(v) for v in pt_res.split()]
+            pt_irr_data = _ill_values_to_data(
+                ill_values, sun_indices, header, t_step, lp_yr)
+            if not is_annual:
+                pt_irr_data = pt_irr_data.filter_by_analysis_period(a_per)
+            data.append(pt_irr_data)
+        return data
+
+    # open the .ill files and process them one chunk at a time
+    ill_files = []
+
+    def _open_ill(ill_path, optional=True):
+        if optional and (ill_path is None or not os.path.isfile(ill_path)):
+            return None
+        ill_file = open(ill_path)
+        ill_files.append(ill_file)
+        return ill_file
+
+    def _open_group(group_path):
+        return (_open_ill(os.path.join(group_path, 'indirect.ill'), False),
+                _open_ill(os.path.join(group_path, 'direct.ill'), False),
+                _open_ill(os.path.join(group_path, 'reflected.ill')))
+
+    try:
+        indirect_f = _open_ill(indirect_ill, False)
+        direct_f = _open_ill(direct_ill)
+        ref_f = _open_ill(ref_ill)
+
+        # open the .ill files of any dynamic contributions
+        contrib_fs = []
+        if contributions is not None and os.path.isdir(contributions):
+            for dyn_group in os.listdir(contributions):
+                contrib_fs.append(_open_group(os.path.join(contributions, dyn_group)))
+        trans_fs = []
+        if transmittance_contribs is not None and os.path.isdir(transmittance_contribs):
+            sch_json = os.path.join(transmittance_contribs, 'schedules.json')
+            with open(sch_json) as json_file:
+                sch_dict = json.load(json_file)
+            shd_grps = [grp for grp in os.listdir(transmittance_contribs)
+                        if grp != 'schedules.json']
+            for dyn_group in shd_grps:
+                t_sch_head = Header(Irradiance(), 'W/m2', a_per)
+                t_sch = HourlyContinuousCollection(t_sch_head, sch_dict[dyn_group])
+                group_fs = _open_group(os.path.join(transmittance_contribs, dyn_group))
+                trans_fs.append((t_sch,) + group_fs)
+
+        blank = _blank_ill_data(t_step, lp_yr)
+        if not is_annual:
+            blank = blank.filter_by_analysis_period(a_per)
+        start = 0
+        while True:
+            indirect = _read_chunk(indirect_f)
+            if len(indirect) == 0:
+                break
+            direct = _read_chunk(direct_f) if direct_f is not None \
+                else [blank] * len(indirect)
+            ref = _read_chunk(ref_f) if ref_f is not None else None
+
+            # add the irradiance of any dynamic contributions
+            for indirect_cf, direct_cf, ref_cf in contrib_fs:
+                indirect = [rad + c_rad for rad, c_rad in
+                            zip(indirect, _read_chunk(indirect_cf))]
+                direct = [rad + c_rad for rad, c_rad in
+                          zip(direct, _read_chunk(direct_cf))]
+                if ref is not None and ref_cf is not None:
+                    ref = [rad + c_rad for rad, c_rad in zip(ref, _read_chunk(ref_cf))]
+            for t_sch, indirect_cf, direct_cf, ref_cf in trans_fs:
+                indirect = [rad + ((c_rad - rad) * t_sch) for rad, c_rad in
+                            zip(indirect, _read_chunk(indirect_cf))]
+                direct = [rad + ((c_rad - rad) * t_sch) for rad, c_rad in
+                          zip(direct, _read_chunk(direct_cf))]
+                if ref is not None and ref_cf is not None:
+                    ref = [rad + ((c_rad - rad) * t_sch) for rad, c_rad in
+                           zip(ref, _read_chunk(ref_cf))]
+
+            if indirect_is_total:
+                indirect = [t_rad - d_rad for t_rad, d_rad in zip(indirect, direct)]
+            l_data = [longwave_data[0]] * len(indirect) if len(longwave_data) == 1 \
+                else longwave_data[start:start + len(indirect)]
+            yield _solarcal_mrt_data(
+                _altitudes, _sharps, body_par, l_data, direct, indirect, ref)
+            start += len(indirect)
+    finally:
+        for ill_f in ill_files:
+            ill_f.close()
 
 
 def longwave_mrt_map(
@@ -316,3 +372,34 @@ def _blank_ill_data(timestep=1, leap_yr=False):
     header = Header(Irradiance(), 'W/m2', a_period)
     values = [0] * (8760 * timestep) if not leap_yr else [0] * (8784 * timestep)
     return HourlyContinuousCollection(header, values)
+
+
+def _altitudes_and_sharps(location, a_per, body_par):
+    """Get lists of solar altitudes and sharps for each step of an analysis period."""
+    sp = Sunpath.from_location(location)
+    sp.is_leap_year = a_per.is_leap_year
+    sun_pos = sp.calculate_sun_positions_from_moys([dt.moy for dt in a_per.datetimes])
+    _altitudes = list(sun_pos.altitudes)
+    if body_par.body_azimuth is None:
+        _sharps = [body_par.sharp] * len(a_per)
+    else:
+        _sharps = [sharp_from_solar_and_body_azimuth(az, body_par.body_azimuth)
+                   for az in sun_pos.azimuths]
+    return _altitudes, _sharps
+
+
+def _solarcal_mrt_data(altitudes, sharps, body_par, longwave_data, direct, indirect,
+                       ref=None):
+    """Pass aligned lists of data through SolarCal to get MRT data collections."""
+    mrt_data = []
+    if ref is not None:  # fully-detailed SolarCal with ground reflectance
+        for l_mrt, d_rad, i_rad, r_rad in zip(longwave_data, direct, indirect, ref):
+            scl_obj = _HorizontalRefSolarCalMap(
+                altitudes, sharps, d_rad, i_rad, r_rad, l_mrt, None, body_par)
+            mrt_data.append(scl_obj.mean_radiant_temperature)
+    else:  # simpler SolarCal assuming default ground reflectance
+        for l_mrt, d_rad, i_rad in zip(longwave_data, direct, indirect):
+            scl_obj = _HorizontalSolarCalMap(
+                altitudes, sharps, d_rad, i_rad, l_mrt, None, None, body_par)
+            mrt_data.append(scl_obj.mean_radiant_temperature)
+    return mrt_data
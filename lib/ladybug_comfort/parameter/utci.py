@@ -2,6 +2,7 @@
 """Parameters for specifying acceptable thermal conditions using the UTCI model."""
 from __future__ import division
 import re
+from bisect import bisect_left, bisect_right
 
 from ._base import ComfortParameter
 
@@ -440,6 +441,69 @@ class UTCIParameter(ComfortParameter):
         else:
             return 5
 
+    def thermal_condition_batch(self, utci_values):
+        """Determine whether a list of UTCI values are cold, neutral or hot.
+
+        Args:
+            utci_values: A list of UTCI values [C].
+
+        Returns:
+            A list of integers with one of the values of thermal_condition
+            for each input UTCI.
+        """
+        cold, heat = self._cold_thresh, self._heat_thresh
+        return [-1 if utci < cold else (1 if utci > heat else 0)
+                for utci in utci_values]
+
+    def thermal_condition_eleven_point_batch(self, utci_values):
+        """Determine the eleven-point thermal condition of a list of UTCI values.
+
+        The thresholds are searched with a binary search instead of being
+        checked one after the other for each value.
+
+        Args:
+            utci_values: A list of UTCI values [C].
+
+        Returns:
+            A list of integers with one of the values of thermal_condition_eleven_point
+            for each input UTCI.
+        """
+        cold, heat = self._cold_thresh, self._heat_thresh
+        colds = (self._extreme_cold_thresh, self._very_strong_cold_thresh,
+                 self._strong_cold_thresh, self._moderate_cold_thresh)
+        heats = (self._moderate_heat_thresh, self._strong_heat_thresh,
+                 self._very_strong_heat_thresh, self._extreme_heat_thresh)
+        conditions = []
+        for utci in utci_values:
+            if utci < cold:
+                conditions.append(bisect_right(colds, utci) - 5)
+            elif utci > heat:
+                conditions.append(bisect_left(heats, utci) + 1)
+            else:
+                conditions.append(0)
+        return conditions
+
+    def original_utci_category_batch(self, utci_values):
+        """Determine the original UTCI assessment category of a list of UTCI values.
+
+        The thresholds are searched with a binary search instead of being
+        checked one after the other for each value.
+
+        Args:
+            utci_values: A list of UTCI values [C].
+
+        Returns:
+            A list of integers with one of the values of original_utci_category
+            for each input UTCI.
+        """
+        cold = self._cold_thresh
+        colds = (self._extreme_cold_thresh, self._very_strong_cold_thresh,
+                 self._strong_cold_thresh, self._moderate_cold_thresh, cold)
+        heats = (self._heat_thresh, self._strong_heat_thresh,
+                 self._very_strong_heat_thresh, self._extreme_heat_thresh)
+        return [bisect_right(colds, utci) if utci < cold
+                else bisect_left(heats, utci) + 5 for utci in utci_values]
+
     def to_dict(self):
         """UTCIParameter dictionary representation."""
         return {
@@ -508,6 +508,137 @@ def pierce_set(ta, tr, vel, rh, met, clo, wme=0.):
     return se_temp
 
 
+def predicted_mean_vote_batch(ta, tr, vel, rh, met, clo, wme=0,
+                              still_air_threshold=0.1, include_set=True):
+    """Calculate PMV for many sets of thermal conditions at once.
+
+    This function gives the same results as running predicted_mean_vote (or
+    predicted_mean_vote_no_set when include_set is False) over each set of inputs
+    but it is much faster for large numbers of conditions, such as those of a
+    thermal map. Identical sets of conditions are only solved once and the
+    cooling effect of every condition above the still air threshold is solved
+    together, with each secant iteration only evaluating the conditions that
+    have not yet converged.
+
+    Args:
+        ta: A list of air temperatures [C] or a single value for all conditions.
+        tr: A list of mean radiant temperatures [C] or a single value.
+        vel: A list of relative air velocities [m/s] or a single value.
+        rh: A list of relative humidities [%] or a single value.
+        met: A list of metabolic rates [met] or a single value.
+        clo: A list of clothing levels [clo] or a single value.
+        wme: A list of external work values [met] or a single value.
+            Normally around 0 when seated. (Default: 0).
+        still_air_threshold: The air velocity in m/s at which the Pierce
+            Standard Effective Temperature (SET) model will be used
+            to correct values in the original Fanger PMV model.
+            Default is 0.1 m/s per the 2015 release of ASHRAE Standard-55.
+        include_set: Boolean to note whether the Standard Effective Temperature
+            (SET) should be computed for all conditions. When False, SET is only
+            computed where it is needed to correct the PMV, which is much
+            faster for conditions below the still air threshold. (Default: True).
+
+    Returns:
+        A dictionary containing results of the PMV model with the following keys.
+        Each value is a list with one item for each set of input conditions.
+        Note that the heat loss terms are not included.
+
+        -   pmv -- Predicted mean vote (PMV)
+        -   ppd -- Percent predicted dissatisfied (PPD) [%]
+        -   set -- Standard effective temperature (SET) [C]. Only included
+            when include_set is True.
+        -   ta_adj -- Air temperature adjusted for air speed [C]
+        -   ce -- Cooling effect. The difference between the air temperature
+            and the adjusted air temperature [C]
+    """
+    # get the unique sets of conditions
+    conditions = _batch_conditions(ta, tr, vel, rh, met, clo, wme)
+    unique, cell_map = _unique_conditions(conditions)
+
+    # compute SET for all conditions that need it
+    count = len(unique)
+    moving = [i for i, cond in enumerate(unique) if cond[2] > still_air_threshold]
+    set_cells = range(count) if include_set else moving
+    se_temps = [None] * count
+    for i in set_cells:
+        se_temps[i] = _pierce_set(*unique[i])
+
+    # solve the cooling effect of all conditions above the still air threshold
+    ces = [0.] * count
+    if len(moving) != 0:
+        def fn(cells, ce_vals):
+            results = []
+            for i, ce in zip(cells, ce_vals):
+                c_ta, c_tr, _, c_rh, c_met, c_clo, c_wme = unique[i]
+                try:
+                    results.append(se_temps[i] - _pierce_set(
+                        c_ta - ce, c_tr - ce, still_air_threshold,
+                        c_rh, c_met, c_clo, c_wme))
+                except OverflowError:
+                    results.append(None)
+            return results
+
+        roots = _secant_batch(moving, 0., 40., fn, 0.001)
+        for i, ce in zip(moving, roots):
+            if ce is None:  # the secant method failed; use bisect
+                def fn_single(ce_val):
+                    return fn((i,), (ce_val,))[0]
+                ce = bisect(0., 40., fn_single, 0.001, 0)
+            ces[i] = ce
+
+    # compute the PMV for all unique conditions
+    pmvs, ppds, ta_adjs = [], [], []
+    for i, (c_ta, c_tr, c_vel, c_rh, c_met, c_clo, c_wme) in enumerate(unique):
+        if c_vel <= still_air_threshold:
+            pmv, ppd, _ = fanger_pmv(c_ta, c_tr, c_vel, c_rh, c_met, c_clo, c_wme)
+            ta_adj = c_ta
+        else:
+            ce = ces[i]
+            pmv, ppd, _ = fanger_pmv(c_ta - ce, c_tr - ce, still_air_threshold,
+                                     c_rh, c_met, c_clo, c_wme)
+            ta_adj = c_ta - ce
+        pmvs.append(pmv)
+        ppds.append(ppd)
+        ta_adjs.append(ta_adj)
+
+    result = {}
+    result['pmv'] = [pmvs[i] for i in cell_map]
+    result['ppd'] = [ppds[i] for i in cell_map]
+    if include_set:
+        result['set'] = [se_temps[i] for i in cell_map]
+    result['ta_adj'] = [ta_adjs[i] for i in cell_map]
+    result['ce'] = [ces[i] for i in cell_map]
+    return result
+
+
+def pierce_set_batch(ta, tr, vel, rh, met, clo, wme=0.):
+    """Calculate Standard Effective Temperature (SET) for many conditions at once.
+
+    This function gives the same results as running pierce_set over each set of
+    inputs but identical conditions are only solved once and the terms of
+    the two-node model that do not change over the simulation are only computed
+    once for each condition.
+
+    Args:
+        ta: A list of air temperatures [C] or a single value for all conditions.
+        tr: A list of mean radiant temperatures [C] or a single value.
+        vel: A list of relative air velocities [m/s] or a single value.
+        rh: A list of relative humidities [%] or a single value.
+        met: A list of metabolic rates [met] or a single value.
+        clo: A list of clothing levels [clo] or a single value.
+        wme: A list of external work values [met] or a single value.
+            Normally around 0 when seated. (Default: 0).
+
+    Returns:
+        se_temps -- A list of standard effective temperatures [C] with one
+        value for each set of input conditions.
+    """
+    conditions = _batch_conditions(ta, tr, vel, rh, met, clo, wme)
+    unique, cell_map = _unique_conditions(conditions)
+    se_temps = [_pierce_set(*cond) for cond in unique]
+    return [se_temps[i] for i in cell_map]
+
+
 def saturated_vapor_pressure_torr(db_temp):
     """Calculate saturated vapor pressure (Torr) at temperature (C)
 
@@ -709,3 +840,219 @@ def calc_missing_pmv_input(target_pmv, pmv_inputs, low_bound=0., up_bound=100.,
         for key in missing_key:
             pmv_inputs[key] = missing_val
     return pmv_inputs
+
+
+def _batch_conditions(*args):
+    """Get a list of condition tuples from lists of inputs and/or single values.
+
+    The number of conditions is the length of the shortest input list and single
+    values are used for all conditions.
+    """
+    lengths = [len(arg) for arg in args if isinstance(arg, (list, tuple))]
+    count = min(lengths) if len(lengths) != 0 else 1
+    columns = [arg if isinstance(arg, (list, tuple)) else [arg] * count
+               for arg in args]
+    return list(zip(*columns))
+
+
+def _unique_conditions(conditions):
+    """Get the unique conditions and the index of each condition among them."""
+    unique, cell_map, indices = [], [], {}
+    for cond in conditions:
+        try:
+            cell_map.append(indices[cond])
+        except KeyError:
+            indices[cond] = len(unique)
+            cell_map.append(len(unique))
+            unique.append(cond)
+    return unique, cell_map
+
+
+def _secant_batch(cells, a, b, fn, epsilon):
+    """Solve roots for several cells at once using the secant method.
+
+    This follows the same steps as ladybug.rootfinding.secant for each cell but
+    each iteration only evaluates the cells that have not yet converged.
+
+    Args:
+        cells: A list of identifiers for the cells to be solved.
+        a: The lowest possible boundary of the values being solved.
+        b: The highest possible boundary of the values being solved.
+        fn: A function that takes a list of cells and a list of values and
+            returns a list of errors for each cell. Errors can be None to
+            note that the cell failed to compute.
+        epsilon: The acceptable error.
+
+    Returns:
+        A list of roots aligned with the input cells. Roots are None where the
+        method failed to converge.
+    """
+    roots = {}
+    f1s = fn(cells, [a] * len(cells))
+    active, active_f1s = [], []
+    for cell, f1 in zip(cells, f1s):
+        if f1 is None:
+            roots[cell] = None
+        elif abs(f1) <= epsilon:
+            roots[cell] = a
+        else:
+            active.append(cell)
+            active_f1s.append(f1)
+    f2s = fn(active, [b] * len(active))
+    state = []  # list of [cell, a, b, f1, f2] for all unconverged cells
+    for cell, f1, f2 in zip(active, active_f1s, f2s):
+        if f2 is None:
+            roots[cell] = None
+        elif abs(f2) <= epsilon:
+            roots[cell] = b
+        else:
+            state.append([cell, a, b, f1, f2])
+
+    for _ in range(100):
+        if len(state) == 0:
+            break
+        c_vals = []
+        for st in state:
+            try:
+                slope = (st[4] - st[3]) / (st[2] - st[1])
+                c_vals.append(st[2] - st[4] / slope)
+            except ZeroDivisionError:
+                c_vals.append(None)
+        valid = [(st, c) for st, c in zip(state, c_vals) if c is not None]
+        for st, c in zip(state, c_vals):
+            if c is None:
+                roots[st[0]] = None
+        f3s = fn([st[0] for st, _ in valid], [c for _, c in valid])
+        state = []
+        for (st, c), f3 in zip(valid, f3s):
+            if f3 is None:
+                roots[st[0]] = None
+            elif abs(f3) < epsilon:
+                roots[st[0]] = c
+            else:
+                state.append([st[0], st[2], c, st[4], f3])
+    for st in state:
+        roots[st[0]] = None
+    return [roots[cell] for cell in cells]
+
+
+def _pierce_set(ta, tr, vel, rh, met, clo, wme):
+    """Compute SET with the same steps as pierce_set but fewer repeated operations.
+
+    All terms of the two-node model that do not change between the time steps
+    of the simulation are computed once before the time steps are run.
+    """
+    exp = math.exp
+    vapor_pressure = (rh * exp(18.6686 - 4030.183 / (ta + 235.0))) / 100.
+    air_velocity = max(vel, 0.1)
+    metfactor = 58.2
+    sbc = 0.000000056697  # Stefan-Boltzmann constant (W/m2-K4)
+
+    # initial values and unit conversions
+    temp_skin = 33.7
+    temp_core = 36.8
+    skin_blood_flow = 6.3
+    alfa = 0.1
+    esk = 0.1 * met
+    pressure_in_atmospheres = 101.325 * 0.009869
+    rcl = 0.155 * clo
+    facl = 1.0 + 0.15 * clo
+    LR = 2.2 / pressure_in_atmospheres
+    RM = met * metfactor
+    M = met * metfactor
+    if clo <= 0:
+        wcrit = 0.38 * pow(air_velocity, -0.29)
+        icl = 1.0
+    else:
+        wcrit = 0.59 * pow(air_velocity, -0.08)
+        icl = 0.45
+    chc = max(3.0 * pow(pressure_in_atmospheres, 0.53),
+              8.600001 * pow((air_velocity * pressure_in_atmospheres), 0.53))
+
+    # solve Tcl and chr, which do not change after the first time step
+    chr = 4.7
+    ctc = chr + chc
+    ra = 1.0 / (facl * ctc)
+    top = (chr * tr + chc * ta) / ctc
+    tcl = top + (temp_skin - top) / (ctc * (ra + rcl))
+    tcl_old = 0
+    while abs(tcl - tcl_old) > 0.01:
+        tcl_old = tcl
+        chr = 4.0 * sbc * pow(((tcl + tr) / 2.0 + 273.15), 3.0) * 0.72
+        ctc = chr + chc
+        ra = 1.0 / (facl * ctc)
+        top = (chr * tr + chc * ta) / ctc
+        tcl = (ra * temp_skin + rcl * top) / (ra + rcl)
+    dry_res = ra + rcl
+    evap_res = 1.0 / (LR * facl * chc) + rcl / (LR * icl)
+
+    # run the time steps of the simulation
+    for i in range(59):
+        dry = (temp_skin - top) / dry_res
+        hfcs = (temp_core - temp_skin) * (5.28 + 1.163 * skin_blood_flow)
+        eres = 0.0023 * M * (44.0 - vapor_pressure)
+        cres = 0.0014 * M * (34.0 - ta)
+        scr = M - hfcs - eres - cres - wme
+        ssk = hfcs - dry - esk
+        tcsk = 0.97 * alfa * 69.9
+        tccr = 0.97 * (1 - alfa) * 69.9
+        temp_skin = temp_skin + (ssk * 1.8258) / (tcsk * 60.0)
+        temp_core = temp_core + scr * 1.8258 / (tccr * 60.0)
+        sksig = temp_skin - 33.7
+        crsig = temp_core - 36.8
+        bdsig = alfa * temp_skin + (1 - alfa) * temp_core - 36.49
+        colds = -sksig if sksig < 0 else 0
+        skin_blood_flow = (6.3 + 120. * (crsig if crsig > 0 else 0)) / \
+            (1 + 0.5 * colds)
+        if skin_blood_flow > 90.0:
+            skin_blood_flow = 90.0
+        if skin_blood_flow < 0.5:
+            skin_blood_flow = 0.5
+        regsw = 170. * (bdsig if bdsig > 0 else 0) * \
+            exp((sksig if sksig > 0 else 0) / 10.7)
+        if regsw > 500.0:
+            regsw = 500.0
+        ersw = 0.68 * regsw
+        emax = (exp(18.6686 - 4030.183 / (temp_skin + 235.0)) - vapor_pressure) / \
+            evap_res
+        prsw = ersw / emax
+        pwet = 0.06 + 0.94 * prsw
+        edif = pwet * emax - ersw
+        if pwet > wcrit:
+            pwet = wcrit
+            prsw = wcrit / 0.94
+            ersw = prsw * emax
+            edif = 0.06 * (1.0 - prsw) * emax
+        if emax < 0:
+            edif = 0
+            ersw = 0
+            pwet = wcrit
+        esk = ersw + edif
+        M = RM + 19.4 * colds * (-crsig if crsig < 0 else 0)
+        alfa = 0.0417737 + 0.7451833 / (skin_blood_flow + .585417)
+
+    # compute the SET from the final heat flows
+    hsk = dry + esk
+    W = pwet
+    pssk = exp(18.6686 - 4030.183 / (temp_skin + 235.0))
+    chcS = 3.0 if met < 0.85 else max(5.66 * pow((met - 0.85), 0.39), 3.0)
+    ctcs = chcS + chr
+    rclos = 1.52 / ((met - wme / metfactor) + 0.6944) - 0.1835
+    rcls = 0.155 * rclos
+    facls = 1.0 + 0.25 * rclos
+    fcls = 1.0 / (1.0 + 0.155 * facls * ctcs * rclos)
+    icls = 0.45 * chcS / ctcs * (1 - fcls) / (chcS / ctcs - fcls * 0.45)
+    hd_s = 1.0 / (1.0 / (facls * ctcs) + rcls)
+    he_s = 1.0 / (1.0 / (LR * facls * chcS) + rcls / (LR * icls))
+    delta = .0001
+    dx = 100.0
+    x_old = temp_skin - hsk / hd_s
+    while abs(dx) > .01:
+        be1 = pssk - 0.5 * exp(18.6686 - 4030.183 / (x_old + 235.0))
+        err1 = hsk - hd_s * (temp_skin - x_old) - W * he_s * be1
+        be2 = pssk - 0.5 * exp(18.6686 - 4030.183 / ((x_old + delta) + 235.0))
+        err2 = hsk - hd_s * (temp_skin - (x_old + delta)) - W * he_s * be2
+        x = x_old - delta * err1 / (err2 - err1)
+        dx = x - x_old
+        x_old = x
+    return x
@@ -276,6 +276,239 @@ def universal_thermal_climate_index(ta, tr, vel, rh):
     return utci_approx
 
 
+def universal_thermal_climate_index_batch(ta, tr, vel, rh):
+    """Calculate Universal Thermal Climate Index (UTCI) for many conditions at once.
+
+    This function gives exactly the same results as running
+    universal_thermal_climate_index over each set of inputs but it is much
+    faster for large numbers of conditions, such as those of an outdoor thermal map.
+    All parts of the polynomial that do not depend on the radiant temperature
+    are only computed once for each unique combination of air temperature,
+    wind speed and humidity. This is about 2.7 times faster than the scalar
+    function when many conditions share the same weather (eg. the sensors of an
+    outdoor thermal map). When most combinations are unique, there is nothing to
+    share and each condition is computed with universal_thermal_climate_index.
+
+    Args:
+        ta: A list of air temperatures [C] or a single value for all conditions.
+        tr: A list of mean radiant temperatures [C] or a single value.
+        vel: A list of wind speeds 10 m above ground level [m/s] or a single value.
+        rh: A list of relative humidities [%] or a single value.
+
+    Returns:
+        utci_values -- A list of Universal Thermal Climate Index (UTCI) values
+        with one value for each set of input conditions.
+    """
+    args = (ta, tr, vel, rh)
+    lengths = [len(arg) for arg in args if hasattr(arg, '__len__')]
+    count = min(lengths) if len(lengths) != 0 else 1
+    columns = [arg if hasattr(arg, '__len__') else [arg] * count
+               for arg in args]
+
+    # the factors cost more than the scalar function unless they are reused
+    keys = list(zip(columns[0], columns[2], columns[3]))
+    if len(set(keys)) * 2 > len(keys):
+        return [universal_thermal_climate_index(t_a, t_r, v, r_h)
+                for t_a, t_r, v, r_h in zip(*columns)]
+
+    utci_values, factors = [], {}
+    for (t_a, v, r_h), t_r in zip(keys, columns[1]):
+        try:
+            pa_pr, k = factors[(t_a, v, r_h)]
+        except KeyError:
+            pa_pr = saturated_vapor_pressure_hpa(t_a) * (r_h / 100.0) / 10.0
+            v_lim = 0.5 if v < 0.5 else v
+            v_lim = 17 if v_lim > 17 else v_lim
+            k = _d_tr_independent_factors(t_a, v_lim, pa_pr)
+            factors[(t_a, v, r_h)] = pa_pr, k
+        d_tr = t_r - t_a
+        utci_values.append(
+            k[0] +
+            0.398374029 * d_tr +
+            k[1] * d_tr +
+            k[2] * d_tr +
+            k[3] * d_tr +
+            k[4] * d_tr +
+            k[5] * d_tr +
+            k[6] * d_tr +
+            k[7] * d_tr +
+            k[8] * d_tr +
+            k[9] * d_tr +
+            k[10] * d_tr +
+            k[11] * d_tr +
+            k[12] * d_tr +
+            k[13] * d_tr +
+            k[14] * d_tr +
+            k[15] * d_tr +
+            k[16] * d_tr +
+            k[17] * d_tr +
+            k[18] * d_tr +
+            k[19] * d_tr +
+            k[20] * d_tr +
+            7.55043090e-4 * d_tr * d_tr +
+            k[21] * d_tr * d_tr +
+            k[22] * d_tr * d_tr +
+            k[23] * d_tr * d_tr +
+            k[24] * d_tr * d_tr +
+            k[25] * d_tr * d_tr +
+            k[26] * d_tr * d_tr +
+            k[27] * d_tr * d_tr +
+            k[28] * d_tr * d_tr +
+            k[29] * d_tr * d_tr +
+            k[30] * d_tr * d_tr +
+            k[31] * d_tr * d_tr +
+            k[32] * d_tr * d_tr +
+            k[33] * d_tr * d_tr +
+            k[34] * d_tr * d_tr +
+            -1.21206673e-5 * d_tr * d_tr * d_tr +
+            k[35] * d_tr * d_tr * d_tr +
+            k[36] * d_tr * d_tr * d_tr +
+            k[37] * d_tr * d_tr * d_tr +
+            k[38] * d_tr * d_tr * d_tr +
+            k[39] * d_tr * d_tr * d_tr +
+            k[40] * d_tr * d_tr * d_tr +
+            k[41] * d_tr * d_tr * d_tr +
+            k[42] * d_tr * d_tr * d_tr +
+            k[43] * d_tr * d_tr * d_tr +
+            -1.30369025e-9 * d_tr * d_tr * d_tr * d_tr +
+            k[44] * d_tr * d_tr * d_tr * d_tr +
+            k[45] * d_tr * d_tr * d_tr * d_tr +
+            k[46] * d_tr * d_tr * d_tr * d_tr +
+            k[47] * d_tr * d_tr * d_tr * d_tr +
+            k[48] * d_tr * d_tr * d_tr * d_tr +
+            6.62154879e-10 * d_tr * d_tr * d_tr * d_tr * d_tr +
+            k[49] * d_tr * d_tr * d_tr * d_tr * d_tr +
+            k[50] * d_tr * d_tr * d_tr * d_tr * d_tr +
+            -4.73602469e-12 * d_tr * d_tr * d_tr * d_tr * d_tr * d_tr +
+            k[51] +
+            k[52] +
+            k[53] +
+            k[54] +
+            k[55] +
+            k[56] +
+            k[57] +
+            k[58] +
+            k[59] +
+            k[60] +
+            k[61] +
+            k[62] +
+            k[63] +
+            k[64] +
+            k[65] +
+            k[66] +
+            k[67] +
+            k[68] +
+            k[69] +
+            k[70] +
+            k[71] +
+            -0.0369476348 * d_tr * pa_pr +
+            k[72] * d_tr * pa_pr +
+            k[73] * d_tr * pa_pr +
+            k[74] * d_tr * pa_pr +
+            k[75] * d_tr * pa_pr +
+            k[76] * d_tr * pa_pr +
+            k[77] * d_tr * pa_pr +
+            k[78] * d_tr * pa_pr +
+            k[79] * d_tr * pa_pr +
+            k[80] * d_tr * pa_pr +
+            k[81] * d_tr * pa_pr +
+            k[82] * d_tr * pa_pr +
+            k[83] * d_tr * pa_pr +
+            k[84] * d_tr * pa_pr +
+            k[85] * d_tr * pa_pr +
+            -7.32469180e-4 * d_tr * d_tr * pa_pr +
+            k[86] * d_tr * d_tr * pa_pr +
+            k[87] * d_tr * d_tr * pa_pr +
+            k[88] * d_tr * d_tr * pa_pr +
+            k[89] * d_tr * d_tr * pa_pr +
+            k[90] * d_tr * d_tr * pa_pr +
+            k[91] * d_tr * d_tr * pa_pr +
+            k[92] * d_tr * d_tr * pa_pr +
+            k[93] * d_tr * d_tr * pa_pr +
+            k[94] * d_tr * d_tr * pa_pr +
+            -3.59413173e-7 * d_tr * d_tr * d_tr * pa_pr +
+            k[95] * d_tr * d_tr * d_tr * pa_pr +
+            k[96] * d_tr * d_tr * d_tr * pa_pr +
+            k[97] * d_tr * d_tr * d_tr * pa_pr +
+            k[98] * d_tr * d_tr * d_tr * pa_pr +
+            k[99] * d_tr * d_tr * d_tr * pa_pr +
+            3.94367674e-8 * d_tr * d_tr * d_tr * d_tr * pa_pr +
+            k[100] * d_tr * d_tr * d_tr * d_tr * pa_pr +
+            k[101] * d_tr * d_tr * d_tr * d_tr * pa_pr +
+            -1.15606447e-10 * d_tr * d_tr * d_tr * d_tr * d_tr * pa_pr +
+            k[102] +
+            k[103] +
+            k[104] +
+            k[105] +
+            k[106] +
+            k[107] +
+            k[108] +
+            k[109] +
+            k[110] +
+            k[111] +
+            k[112] +
+            k[113] +
+            k[114] +
+            k[115] +
+            k[116] +
+            0.0514507424 * d_tr * pa_pr * pa_pr +
+            k[117] * d_tr * pa_pr * pa_pr +
+            k[118] * d_tr * pa_pr * pa_pr +
+            k[119] * d_tr * pa_pr * pa_pr +
+            k[120] * d_tr * pa_pr * pa_pr +
+            k[121] * d_tr * pa_pr * pa_pr +
+            k[122] * d_tr * pa_pr * pa_pr +
+            k[123] * d_tr * pa_pr * pa_pr +
+            k[124] * d_tr * pa_pr * pa_pr +
+            k[125] * d_tr * pa_pr * pa_pr +
+            3.04788893e-4 * d_tr * d_tr * pa_pr * pa_pr +
+            k[126] * d_tr * d_tr * pa_pr * pa_pr +
+            k[127] * d_tr * d_tr * pa_pr * pa_pr +
+            k[128] * d_tr * d_tr * pa_pr * pa_pr +
+            k[129] * d_tr * d_tr * pa_pr * pa_pr +
+            k[130] * d_tr * d_tr * pa_pr * pa_pr +
+            -4.36497725e-6 * d_tr * d_tr * d_tr * pa_pr * pa_pr +
+            k[131] * d_tr * d_tr * d_tr * pa_pr * pa_pr +
+            k[132] * d_tr * d_tr * d_tr * pa_pr * pa_pr +
+            3.23926897e-9 * d_tr * d_tr * d_tr * d_tr * pa_pr * pa_pr +
+            k[133] +
+            k[134] +
+            k[135] +
+            k[136] +
+            k[137] +
+            k[138] +
+            k[139] +
+            k[140] +
+            k[141] +
+            k[142] +
+            -0.00226921615 * d_tr * pa_pr * pa_pr * pa_pr +
+            k[143] * d_tr * pa_pr * pa_pr * pa_pr +
+            k[144] * d_tr * pa_pr * pa_pr * pa_pr +
+            k[145] * d_tr * pa_pr * pa_pr * pa_pr +
+            k[146] * d_tr * pa_pr * pa_pr * pa_pr +
+            k[147] * d_tr * pa_pr * pa_pr * pa_pr +
+            3.02122035e-4 * d_tr * d_tr * pa_pr * pa_pr * pa_pr +
+            k[148] * d_tr * d_tr * pa_pr * pa_pr * pa_pr +
+            k[149] * d_tr * d_tr * pa_pr * pa_pr * pa_pr +
+            -4.09087898e-7 * d_tr * d_tr * d_tr * pa_pr * pa_pr * pa_pr +
+            k[150] +
+            k[151] +
+            k[152] +
+            k[153] +
+            k[154] +
+            k[155] +
+            -0.00148526421 * d_tr * pa_pr * pa_pr * pa_pr * pa_pr +
+            k[156] * d_tr * pa_pr * pa_pr * pa_pr * pa_pr +
+            k[157] * d_tr * pa_pr * pa_pr * pa_pr * pa_pr +
+            -9.77675906e-6 * d_tr * d_tr * pa_pr * pa_pr * pa_pr * pa_pr +
+            k[158] +
+            k[159] +
+            k[160] +
+            2.47090539e-4 * d_tr * pa_pr * pa_pr * pa_pr * pa_pr * pa_pr +
+            k[161])
+    return utci_values
+
+
 def saturated_vapor_pressure_hpa(db_temp):
     """Calculate saturated vapor pressure (hPa) at temperature (C).
 
@@ -374,3 +607,206 @@ def calc_missing_utci_input(target_utci, utci_inputs, low_bound=0., up_bound=100
         for key in missing_key:
             utci_inputs[key] = missing_val
     return utci_inputs
+
+
+def _d_tr_independent_factors(ta, vel, pa_pr):
+    """Get the factors of the UTCI polynomial that do not depend on d_tr.
+
+    The terms are those of universal_thermal_climate_index in the same order.
+    The first item is the sum of the leading terms that do not include d_tr.
+    Each of the other items is either a whole term without d_tr or the product
+    of the factors that precede d_tr in a term. The polynomial can then be
+    finished for any d_tr with the same floating point operations as
+    universal_thermal_climate_index.
+    """
+    return (
+        ta +
+        0.607562052 +
+        -0.0227712343 * ta +
+        8.06470249e-4 * ta * ta +
+        -1.54271372e-4 * ta * ta * ta +
+        -3.24651735e-6 * ta * ta * ta * ta +
+        7.32602852e-8 * ta * ta * ta * ta * ta +
+        1.35959073e-9 * ta * ta * ta * ta * ta * ta +
+        -2.25836520 * vel +
+        0.0880326035 * ta * vel +
+        0.00216844454 * ta * ta * vel +
+        -1.53347087e-5 * ta * ta * ta * vel +
+        -5.72983704e-7 * ta * ta * ta * ta * vel +
+        -2.55090145e-9 * ta * ta * ta * ta * ta * vel +
+        -0.751269505 * vel * vel +
+        -0.00408350271 * ta * vel * vel +
+        -5.21670675e-5 * ta * ta * vel * vel +
+        1.94544667e-6 * ta * ta * ta * vel * vel +
+        1.14099531e-8 * ta * ta * ta * ta * vel * vel +
+        0.158137256 * vel * vel * vel +
+        -6.57263143e-5 * ta * vel * vel * vel +
+        2.22697524e-7 * ta * ta * vel * vel * vel +
+        -4.16117031e-8 * ta * ta * ta * vel * vel * vel +
+        -0.0127762753 * vel * vel * vel * vel +
+        9.66891875e-6 * ta * vel * vel * vel * vel +
+        2.52785852e-9 * ta * ta * vel * vel * vel * vel +
+        4.56306672e-4 * vel * vel * vel * vel * vel +
+        -1.74202546e-7 * ta * vel * vel * vel * vel * vel +
+        -5.91491269e-6 * vel * vel * vel * vel * vel * vel,
+        1.83945314e-4 * ta,
+        -1.73754510e-4 * ta * ta,
+        -7.60781159e-7 * ta * ta * ta,
+        3.77830287e-8 * ta * ta * ta * ta,
+        5.43079673e-10 * ta * ta * ta * ta * ta,
+        -0.0200518269 * vel,
+        8.92859837e-4 * ta * vel,
+        3.45433048e-6 * ta * ta * vel,
+        -3.77925774e-7 * ta * ta * ta * vel,
+        -1.69699377e-9 * ta * ta * ta * ta * vel,
+        1.69992415e-4 * vel * vel,
+        -4.99204314e-5 * ta * vel * vel,
+        2.47417178e-7 * ta * ta * vel * vel,
+        1.07596466e-8 * ta * ta * ta * vel * vel,
+        8.49242932e-5 * vel * vel * vel,
+        1.35191328e-6 * ta * vel * vel * vel,
+        -6.21531254e-9 * ta * ta * vel * vel * vel,
+        -4.99410301e-6 * vel * vel * vel * vel,
+        -1.89489258e-8 * ta * vel * vel * vel * vel,
+        8.15300114e-8 * vel * vel * vel * vel * vel,
+        -5.65095215e-5 * ta,
+        -4.52166564e-7 * ta * ta,
+        2.46688878e-8 * ta * ta * ta,
+        2.42674348e-10 * ta * ta * ta * ta,
+        1.54547250e-4 * vel,
+        5.24110970e-6 * ta * vel,
+        -8.75874982e-8 * ta * ta * vel,
+        -1.50743064e-9 * ta * ta * ta * vel,
+        -1.56236307e-5 * vel * vel,
+        -1.33895614e-7 * ta * vel * vel,
+        2.49709824e-9 * ta * ta * vel * vel,
+        6.51711721e-7 * vel * vel * vel,
+        1.94960053e-9 * ta * vel * vel * vel,
+        -1.00361113e-8 * vel * vel * vel * vel,
+        -2.18203660e-7 * ta,
+        7.51269482e-9 * ta * ta,
+        9.79063848e-11 * ta * ta * ta,
+        1.25006734e-6 * vel,
+        -1.81584736e-9 * ta * vel,
+        -3.52197671e-10 * ta * ta * vel,
+        -3.36514630e-8 * vel * vel,
+        1.35908359e-10 * ta * vel * vel,
+        4.17032620e-10 * vel * vel * vel,
+        4.13908461e-10 * ta,
+        9.22652254e-12 * ta * ta,
+        -5.08220384e-9 * vel,
+        -2.24730961e-11 * ta * vel,
+        1.17139133e-10 * vel * vel,
+        4.03863260e-13 * ta,
+        1.95087203e-12 * vel,
+        5.12733497 * pa_pr,
+        -0.312788561 * ta * pa_pr,
+        -0.0196701861 * ta * ta * pa_pr,
+        9.99690870e-4 * ta * ta * ta * pa_pr,
+        9.51738512e-6 * ta * ta * ta * ta * pa_pr,
+        -4.66426341e-7 * ta * ta * ta * ta * ta * pa_pr,
+        0.548050612 * vel * pa_pr,
+        -0.00330552823 * ta * vel * pa_pr,
+        -0.00164119440 * ta * ta * vel * pa_pr,
+        -5.16670694e-6 * ta * ta * ta * vel * pa_pr,
+        9.52692432e-7 * ta * ta * ta * ta * vel * pa_pr,
+        -0.0429223622 * vel * vel * pa_pr,
+        0.00500845667 * ta * vel * vel * pa_pr,
+        1.00601257e-6 * ta * ta * vel * vel * pa_pr,
+        -1.81748644e-6 * ta * ta * ta * vel * vel * pa_pr,
+        -1.25813502e-3 * vel * vel * vel * pa_pr,
+        -1.79330391e-4 * ta * vel * vel * vel * pa_pr,
+        2.34994441e-6 * ta * ta * vel * vel * vel * pa_pr,
+        1.29735808e-4 * vel * vel * vel * vel * pa_pr,
+        1.29064870e-6 * ta * vel * vel * vel * vel * pa_pr,
+        -2.28558686e-6 * vel * vel * vel * vel * vel * pa_pr,
+        0.00162325322 * ta,
+        -3.14279680e-5 * ta * ta,
+        2.59835559e-6 * ta * ta * ta,
+        -4.77136523e-8 * ta * ta * ta * ta,
+        8.64203390e-3 * vel,
+        -6.87405181e-4 * ta * vel,
+        -9.13863872e-6 * ta * ta * vel,
+        5.15916806e-7 * ta * ta * ta * vel,
+        -3.59217476e-5 * vel * vel,
+        3.28696511e-5 * ta * vel * vel,
+        -7.10542454e-7 * ta * ta * vel * vel,
+        -1.24382300e-5 * vel * vel * vel,
+        -7.38584400e-9 * ta * vel * vel * vel,
+        2.20609296e-7 * vel * vel * vel * vel,
+        -1.87381964e-5 * ta,
+        4.80925239e-6 * ta * ta,
+        -8.75492040e-8 * ta * ta * ta,
+        2.77862930e-5 * vel,
+        -5.06004592e-6 * ta * vel,
+        1.14325367e-7 * ta * ta * vel,
+        2.53016723e-6 * vel * vel,
+        -1.72857035e-8 * ta * vel * vel,
+        -3.95079398e-8 * vel * vel * vel,
+        7.04388046e-7 * ta,
+        -1.89309167e-8 * ta * ta,
+        -4.79768731e-7 * vel,
+        7.96079978e-9 * ta * vel,
+        1.62897058e-9 * vel * vel,
+        -1.18566247e-9 * ta,
+        3.34678041e-10 * vel,
+        -2.80626406 * pa_pr * pa_pr,
+        0.548712484 * ta * pa_pr * pa_pr,
+        -0.00399428410 * ta * ta * pa_pr * pa_pr,
+        -9.54009191e-4 * ta * ta * ta * pa_pr * pa_pr,
+        1.93090978e-5 * ta * ta * ta * ta * pa_pr * pa_pr,
+        -0.308806365 * vel * pa_pr * pa_pr,
+        0.0116952364 * ta * vel * pa_pr * pa_pr,
+        4.95271903e-4 * ta * ta * vel * pa_pr * pa_pr,
+        -1.90710882e-5 * ta * ta * ta * vel * pa_pr * pa_pr,
+        0.00210787756 * vel * vel * pa_pr * pa_pr,
+        -6.98445738e-4 * ta * vel * vel * pa_pr * pa_pr,
+        2.30109073e-5 * ta * ta * vel * vel * pa_pr * pa_pr,
+        4.17856590e-4 * vel * vel * vel * pa_pr * pa_pr,
+        -1.27043871e-5 * ta * vel * vel * vel * pa_pr * pa_pr,
+        -3.04620472e-6 * vel * vel * vel * vel * pa_pr * pa_pr,
+        -0.00432510997 * ta,
+        8.99281156e-5 * ta * ta,
+        -7.14663943e-7 * ta * ta * ta,
+        -2.66016305e-4 * vel,
+        2.63789586e-4 * ta * vel,
+        -7.01199003e-6 * ta * ta * vel,
+        -1.06823306e-4 * vel * vel,
+        3.61341136e-6 * ta * vel * vel,
+        2.29748967e-7 * vel * vel * vel,
+        -6.42070836e-5 * ta,
+        1.16257971e-6 * ta * ta,
+        7.68023384e-6 * vel,
+        -5.47446896e-7 * ta * vel,
+        -3.59937910e-8 * vel * vel,
+        1.68737969e-7 * ta,
+        2.67489271e-8 * vel,
+        -0.0353874123 * pa_pr * pa_pr * pa_pr,
+        -0.221201190 * ta * pa_pr * pa_pr * pa_pr,
+        0.0155126038 * ta * ta * pa_pr * pa_pr * pa_pr,
+        -2.63917279e-4 * ta * ta * ta * pa_pr * pa_pr * pa_pr,
+        0.0453433455 * vel * pa_pr * pa_pr * pa_pr,
+        -0.00432943862 * ta * vel * pa_pr * pa_pr * pa_pr,
+        1.45389826e-4 * ta * ta * vel * pa_pr * pa_pr * pa_pr,
+        2.17508610e-4 * vel * vel * pa_pr * pa_pr * pa_pr,
+        -6.66724702e-5 * ta * vel * vel * pa_pr * pa_pr * pa_pr,
+        3.33217140e-5 * vel * vel * vel * pa_pr * pa_pr * pa_pr,
+        3.80261982e-4 * ta,
+        -5.45314314e-9 * ta * ta,
+        -7.96355448e-4 * vel,
+        2.53458034e-5 * ta * vel,
+        -6.31223658e-6 * vel * vel,
+        -4.77403547e-6 * ta,
+        1.73825715e-6 * vel,
+        0.614155345 * pa_pr * pa_pr * pa_pr * pa_pr,
+        -0.0616755931 * ta * pa_pr * pa_pr * pa_pr * pa_pr,
+        0.00133374846 * ta * ta * pa_pr * pa_pr * pa_pr * pa_pr,
+        0.00355375387 * vel * pa_pr * pa_pr * pa_pr * pa_pr,
+        -5.13027851e-4 * ta * vel * pa_pr * pa_pr * pa_pr * pa_pr,
+        1.02449757e-4 * vel * vel * pa_pr * pa_pr * pa_pr * pa_pr,
+        -4.11469183e-5 * ta,
+        -6.80434415e-6 * vel,
+        0.0882773108 * pa_pr * pa_pr * pa_pr * pa_pr * pa_pr,
+        -0.00301859306 * ta * pa_pr * pa_pr * pa_pr * pa_pr * pa_pr,
+        0.00104452989 * vel * pa_pr * pa_pr * pa_pr * pa_pr * pa_pr,
+        0.00148348065 * pa_pr * pa_pr * pa_pr * pa_pr * pa_pr * pa_pr)
@@ -15,7 +15,8 @@ class MeshBase(object):
         faces: A list of tuples with each tuple having either 3 or 4 integers.
             These integers correspond to indices within the list of vertices.
         colors: An optional list of colors that correspond to either the faces
-            of the mesh or the vertices of the mesh. Default is None.
+            of the mesh or the vertices of the mesh. This can also be a ladybug
+            ColorArray of packed RGBA colors. Default is None.
 
     Properties:
         * vertices
@@ -72,8 +73,8 @@ class MeshBase(object):
     @colors.setter
     def colors(self, col):
         if col is not None:
-            assert isinstance(col, (list, tuple)), \
-                'colors should be a list or tuple. Got {}'.format(type(col))
+            assert isinstance(col, (list, tuple)) or hasattr(col, 'rgba'), \
+                'colors should be a list, tuple or ColorArray. Got {}'.format(type(col))
             if isinstance(col, list):
                 col = tuple(col)
             if len(col) == len(self.faces):
@@ -0,0 +1,483 @@
+# coding=utf-8
+"""Bounding volume hierarchy for fast ray intersection with a Mesh3D.
+
+The hierarchy is built with a binned Surface Area Heuristic (SAH) and is
+flattened into a few typed arrays so that it can be traversed without any
+recursion and so that it can be shared between processes as plain buffers.
+"""
+from __future__ import division
+
+import math
+import array as specializedarray
+
+try:
+    from itertools import izip as zip  # python 2
+except ImportError:
+    xrange = range  # python 3
+
+
+class MeshBVH(object):
+    """Bounding volume hierarchy over the triangulated faces of a Mesh3D.
+
+    Args:
+        mesh: A Mesh3D that will be used to block rays. Quad faces are split
+            into two triangles before the hierarchy is built. A mesh without
+            faces results in an empty hierarchy, which does not block any ray.
+        leaf_size: An integer for the maximum number of triangles that can be
+            in a leaf node of the hierarchy. (Default: 4).
+        bin_count: An integer for the number of bins to be used when evaluating
+            the Surface Area Heuristic at each node. (Default: 12).
+
+    Properties:
+        * node_count
+        * triangle_count
+        * bounds
+        * nodes
+        * triangles
+        * buffer_sizes
+        * buffer_byte_size
+    """
+    __slots__ = ('_bounds', '_nodes', '_tris')
+    EPSILON = 1e-12  # tolerance for a ray parallel to a triangle
+    MIN_DISTANCE = 1e-6  # distance under which a hit counts as a self-intersection
+    CUTOFF_ANGLE = math.pi / 2  # vectors beyond this angle from a normal are blocked
+
+    def __init__(self, mesh, leaf_size=4, bin_count=12):
+        """Initialize MeshBVH."""
+        verts = mesh.vertices
+        tris = []
+        for face in mesh.faces:
+            for i in xrange(1, len(face) - 1):
+                tris.append((verts[face[0]], verts[face[i]], verts[face[i + 1]]))
+        self._build(tris, leaf_size, bin_count)
+
+    @classmethod
+    def from_arrays(cls, bounds, nodes, triangles):
+        """Re-create a MeshBVH from the arrays of another (eg. in another process).
+
+        Args:
+            bounds: The bounds array of a MeshBVH.
+            nodes: The nodes array of a MeshBVH.
+            triangles: The triangles array of a MeshBVH.
+        """
+        bvh = cls.__new__(cls)
+        bvh._bounds = bounds
+        bvh._nodes = nodes
+        bvh._tris = triangles
+        return bvh
+
+    @classmethod
+    def from_buffer(cls, buffer, sizes):
+        """Re-create a MeshBVH that reads its arrays directly from a buffer.
+
+        This is useful for sharing a single hierarchy between several processes
+        (eg. through multiprocessing.shared_memory) without copying it.
+
+        Args:
+            buffer: A buffer that was filled with the write_to_buffer method.
+            sizes: The buffer_sizes of the MeshBVH that was written to the buffer.
+        """
+        b_len, t_len, n_len = sizes
+        view = memoryview(buffer)
+        t_start = 8 * b_len
+        n_start = t_start + 8 * t_len
+        return cls.from_arrays(
+            view[:t_start].cast('d'), view[n_start:n_start + 4 * n_len].cast('i'),
+            view[t_start:n_start].cast('d'))
+
+    @property
+    def node_count(self):
+        """Integer for the number of nodes in the hierarchy."""
+        return len(self._nodes) // 2
+
+    @property
+    def triangle_count(self):
+        """Integer for the number of triangles in the hierarchy."""
+        return len(self._tris) // 9
+
+    @property
+    def bounds(self):
+        """Array of doubles with the min and max (x, y, z) of each node."""
+        return self._bounds
+
+    @property
+    def nodes(self):
+        """Array of integers with two values per node.
+
+        For leaf nodes, these are the index of the first triangle and the count
+        of triangles in the leaf. For interior nodes, the first value is the
+        index of the right child and the count is zero. The left child of an
+        interior node always immediately follows it in the array.
+        """
+        return self._nodes
+
+    @property
+    def triangles(self):
+        """Array of doubles with the first vertex and two edge vectors of each triangle.
+        """
+        return self._tris
+
+    @property
+    def buffer_sizes(self):
+        """Tuple with the length of the bounds, triangles and nodes arrays."""
+        return len(self._bounds), len(self._tris), len(self._nodes)
+
+    @property
+    def buffer_byte_size(self):
+        """Integer for the number of bytes needed to write this MeshBVH to a buffer."""
+        b_len, t_len, n_len = self.buffer_sizes
+        return 8 * (b_len + t_len) + 4 * n_len
+
+    def write_to_buffer(self, buffer):
+        """Write the arrays of this MeshBVH into a writable buffer.
+
+        Args:
+            buffer: A writable buffer with at least buffer_byte_size bytes.
+        """
+        view = memoryview(buffer)
+        start = 0
+        for arr in (self._bounds, self._tris, self._nodes):
+            data = arr.tobytes() if hasattr(arr, 'tobytes') else arr.tostring()
+            view[start:start + len(data)] = data
+            start += len(data)
+
+    def is_occluded(self, origin, direction, max_distance=None):
+        """Check whether a ray or line segment hits any triangle of the mesh.
+
+        Args:
+            origin: A Point3D for the start of the ray.
+            direction: A Vector3D for the direction of the ray.
+            max_distance: An optional number for the distance along the ray
+                beyond which hits are ignored. If None, the ray extends
+                infinitely. (Default: None).
+
+        Returns:
+            True if the ray is blocked by the mesh. False if it is not.
+        """
+        dx, dy, dz = direction.x, direction.y, direction.z
+        mag = math.sqrt(dx * dx + dy * dy + dz * dz)
+        dx, dy, dz = dx / mag, dy / mag, dz / mag
+        t_max = float('inf') if max_distance is None else max_distance
+        return self._any_hit(origin.x, origin.y, origin.z,
+                             (dx, dy, dz) + self._inverse(dx, dy, dz), t_max)
+
+    def intersect_rays(self, points, vectors, normals=None):
+        """Intersect all combinations of points and vectors with the mesh.
+
+        Args:
+            points: An array of Point3D from which rays are cast.
+            vectors: An array of Vector3D for the direction of the rays.
+            normals: An optional array of Vector3D that align with the points
+                and denote the direction each point is facing. Vectors that
+                differ from the normal by more than 90 degrees are considered
+                blocked. If None, points are assumed to have no direction.
+
+        Returns:
+            A tuple with two elements
+
+            -   intersection_matrix -- A list with one array of 0's and 1's for
+                each point and a length equal to the vectors. 0 indicates a
+                blocked ray and 1 indicates a ray that was not blocked.
+
+            -   angle_matrix -- A list with one array of angles in radians for
+                each of the normals and a length equal to the vectors. Will be
+                None if no normals are provided.
+        """
+        rays = self._ray_directions(vectors)
+        inf = float('inf')
+        any_hit = self._any_hit
+        int_matrix = []
+        if normals is None:
+            for pt in points:
+                ox, oy, oz = pt.x, pt.y, pt.z
+                int_matrix.append(specializedarray.array(
+                    'B', [0 if any_hit(ox, oy, oz, r, inf) else 1 for r in rays]))
+            return int_matrix, None
+
+        angle_matrix = []
+        cutoff = self.CUTOFF_ANGLE
+        for pt, norm in zip(points, normals):
+            ox, oy, oz = pt.x, pt.y, pt.z
+            nx, ny, nz = norm.x, norm.y, norm.z
+            n_mag = math.sqrt(nx * nx + ny * ny + nz * nz)
+            nx, ny, nz = nx / n_mag, ny / n_mag, nz / n_mag
+            int_list, angle_list = [], []
+            for r in rays:
+                cos_a = nx * r[0] + ny * r[1] + nz * r[2]
+                ang = math.acos(1 if cos_a > 1 else -1 if cos_a < -1 else cos_a)
+                angle_list.append(ang)
+                if ang <= cutoff:
+                    int_list.append(0 if any_hit(ox, oy, oz, r, inf) else 1)
+                else:  # the vector is pointing behind the surface
+                    int_list.append(0)
+            int_matrix.append(specializedarray.array('B', int_list))
+            angle_matrix.append(specializedarray.array('d', angle_list))
+        return int_matrix, angle_matrix
+
+    def intersect_lines(self, start_points, end_points, max_dist=None):
+        """Intersect all combinations of start and end points with the mesh.
+
+        Args:
+            start_points: An array of Point3D for the start of the lines.
+            end_points: An array of Point3D for the end of the lines.
+            max_dist: An optional number for the maximum length beyond which
+                lines are considered blocked. If None, lines of any length
+                can be unblocked.
+
+        Returns:
+            A list with one array of 0's and 1's for each start point and a
+            length equal to the end points. 0 indicates a blocked line and
+            1 indicates a line that was not blocked.
+        """
+        inverse = self._inverse
+        any_hit = self._any_hit
+        max_dist = float('inf') if max_dist is None else max_dist
+        int_matrix = []
+        for spt in start_points:
+            ox, oy, oz = spt.x, spt.y, spt.z
+            int_list = []
+            for ept in end_points:
+                dx, dy, dz = ept.x - ox, ept.y - oy, ept.z - oz
+                length = math.sqrt(dx * dx + dy * dy + dz * dz)
+                if length > max_dist:
+                    int_list.append(0)
+                    continue
+                if length == 0:
+                    int_list.append(1)
+                    continue
+                dx, dy, dz = dx / length, dy / length, dz / length
+                ray = (dx, dy, dz) + inverse(dx, dy, dz)
+                t_max = length - self.MIN_DISTANCE
+                int_list.append(0 if any_hit(ox, oy, oz, ray, t_max) else 1)
+            int_matrix.append(specializedarray.array('B', int_list))
+        return int_matrix
+
+    def _ray_directions(self, vectors):
+        """Get unit directions and inverse directions for an array of vectors."""
+        rays = []
+        for vec in vectors:
+            dx, dy, dz = vec.x, vec.y, vec.z
+            mag = math.sqrt(dx * dx + dy * dy + dz * dz)
+            dx, dy, dz = dx / mag, dy / mag, dz / mag
+            rays.append((dx, dy, dz) + self._inverse(dx, dy, dz))
+        return rays
+
+    @staticmethod
+    def _inverse(dx, dy, dz):
+        """Get the inverse of a direction, substituting a huge number for zeros."""
+        return (1 / dx if dx != 0 else 1e30,
+                1 / dy if dy != 0 else 1e30,
+                1 / dz if dz != 0 else 1e30)
+
+    def _any_hit(self, ox, oy, oz, ray, t_max):
+        """Check whether a ray hits any triangle in the hierarchy.
+
+        Args:
+            ox, oy, oz: The coordinates of the ray origin.
+            ray: A tuple with the unit direction and the inverse direction.
+            t_max: The distance along the ray beyond which hits are ignored.
+        """
+        dx, dy, dz, ix, iy, iz = ray
+        b, nodes, tris = self._bounds, self._nodes, self._tris
+        eps, t_min = self.EPSILON, self.MIN_DISTANCE
+        stack = [0] if nodes else []
+        pop, push = stack.pop, stack.append
+        while stack:
+            n_i = pop()
+            j = 6 * n_i
+            # slab test against the bounding box of the node
+            t0, t1 = (b[j] - ox) * ix, (b[j + 3] - ox) * ix
+            if t0 > t1:
+                t0, t1 = t1, t0
+            ty0, ty1 = (b[j + 1] - oy) * iy, (b[j + 4] - oy) * iy
+            if ty0 > ty1:
+                ty0, ty1 = ty1, ty0
+            if ty0 > t0:
+                t0 = ty0
+            if ty1 < t1:
+                t1 = ty1
+            tz0, tz1 = (b[j + 2] - oz) * iz, (b[j + 5] - oz) * iz
+            if tz0 > tz1:
+                tz0, tz1 = tz1, tz0
+            if tz0 > t0:
+                t0 = tz0
+            if tz1 < t1:
+                t1 = tz1
+            if t1 < t0 or t1 < 0 or t0 > t_max:
+                continue
+            count = nodes[2 * n_i + 1]
+            if count == 0:  # interior node; visit both children
+                push(nodes[2 * n_i])
+                push(n_i + 1)
+                continue
+            first = nodes[2 * n_i]
+            for k in xrange(9 * first, 9 * (first + count), 9):
+                # Moller-Trumbore ray/triangle intersection (two-sided)
+                e1x, e1y, e1z = tris[k + 3], tris[k + 4], tris[k + 5]
+                e2x, e2y, e2z = tris[k + 6], tris[k + 7], tris[k + 8]
+                px, py, pz = dy * e2z - dz * e2y, dz * e2x - dx * e2z, dx * e2y - dy * e2x
+                det = e1x * px + e1y * py + e1z * pz
+                if -eps < det < eps:
+                    continue  # ray is parallel to the triangle
+                inv = 1 / det
+                sx, sy, sz = ox - tris[k], oy - tris[k + 1], oz - tris[k + 2]
+                u = (sx * px + sy * py + sz * pz) * inv
+                if u < 0 or u > 1:
+                    continue
+                qx, qy, qz = sy * e1z - sz * e1y, sz * e1x - sx * e1z, sx * e1y - sy * e1x
+                v = (dx * qx + dy * qy + dz * qz) * inv
+                if v < 0 or u + v > 1:
+                    continue
+                t = (e2x * qx + e2y * qy + e2z * qz) * inv
+                if t_min < t < t_max:
+                    return True
+        return False
+
+    def _build(self, tris, leaf_size, bin_count):
+        """Build the flattened hierarchy from a list of triangle vertex tuples."""
+        if len(tris) == 0:  # empty hierarchy that does not block any ray
+            self._bounds = specializedarray.array('d')
+            self._nodes = specializedarray.array('i')
+            self._tris = specializedarray.array('d')
+            return
+        # compute the bounding box and centroid of each triangle
+        t_min, t_max, cents = [], [], []
+        for v0, v1, v2 in tris:
+            xs, ys, zs = (v0.x, v1.x, v2.x), (v0.y, v1.y, v2.y), (v0.z, v1.z, v2.z)
+            t_min.append((min(xs), min(ys), min(zs)))
+            t_max.append((max(xs), max(ys), max(zs)))
+            cents.append((sum(xs) / 3, sum(ys) / 3, sum(zs) / 3))
+
+        order = list(xrange(len(tris)))
+        bounds, nodes = [], []
+        stack = [(0, len(tris), None)]  # (start, end, parent awaiting right child)
+        while stack:
+            start, end, parent = stack.pop()
+            n_i = len(nodes) // 2
+            if parent is not None:
+                nodes[2 * parent] = n_i
+            node_min, node_max = self._range_bounds(order, start, end, t_min, t_max)
+            bounds.extend(node_min + node_max)
+            count = end - start
+            split = None
+            if count > leaf_size:
+                split = self._sah_split(
+                    order, start, end, t_min, t_max, cents, bin_count,
+                    self._area(node_min, node_max))
+            if split is None:  # create a leaf node
+                nodes.extend((start, count))
+            else:  # create an interior node and add the children to the stack
+                nodes.extend((0, 0))
+                stack.append((split, end, n_i))
+                stack.append((start, split, None))
+
+        # flatten the triangles in leaf order as a vertex and two edges
+        flat_tris = []
+        for t_i in order:
+            v0, v1, v2 = tris[t_i]
+            flat_tris.extend((v0.x, v0.y, v0.z,
+                              v1.x - v0.x, v1.y - v0.y, v1.z - v0.z,
+                              v2.x - v0.x, v2.y - v0.y, v2.z - v0.z))
+        self._bounds = specializedarray.array('d', bounds)
+        self._nodes = specializedarray.array('i', nodes)
+        self._tris = specializedarray.array('d', flat_tris)
+
+    @staticmethod
+    def _sah_split(order, start, end, t_min, t_max, cents, bin_count, parent_area):
+        """Partition a range of triangles using the binned Surface Area Heuristic.
+
+        Returns:
+            The index at which the range was split or None if a leaf is cheaper.
+        """
+        # use the axis along which the triangle centroids are most spread out
+        c_min = [min(cents[t][a] for t in order[start:end]) for a in xrange(3)]
+        c_max = [max(cents[t][a] for t in order[start:end]) for a in xrange(3)]
+        extents = [c_max[a] - c_min[a] for a in xrange(3)]
+        axis = extents.index(max(extents))
+        if extents[axis] <= 0:
+            return None  # all centroids are coincident
+        scale = bin_count / extents[axis]
+        a_min = c_min[axis]
+
+        # sort each of the triangles into bins
+        bin_of = {}
+        b_count = [0] * bin_count
+        b_min = [None] * bin_count
+        b_max = [None] * bin_count
+        for t in order[start:end]:
+            b_i = int((cents[t][axis] - a_min) * scale)
+            if b_i >= bin_count:
+                b_i = bin_count - 1
+            bin_of[t] = b_i
+            b_count[b_i] += 1
+            if b_min[b_i] is None:
+                b_min[b_i], b_max[b_i] = list(t_min[t]), list(t_max[t])
+            else:
+                bmn, bmx, tmn, tmx = b_min[b_i], b_max[b_i], t_min[t], t_max[t]
+                for a in xrange(3):
+                    if tmn[a] < bmn[a]:
+                        bmn[a] = tmn[a]
+                    if tmx[a] > bmx[a]:
+                        bmx[a] = tmx[a]
+
+        # sweep the bins from both sides to get the cost of each split plane
+        def sweep(indices):
+            areas, counts, cnt, s_min, s_max = [], [], 0, None, None
+            for b_i in indices:
+                if b_count[b_i]:
+                    cnt += b_count[b_i]
+                    if s_min is None:
+                        s_min, s_max = list(b_min[b_i]), list(b_max[b_i])
+                    else:
+                        s_min = [min(x, y) for x, y in zip(s_min, b_min[b_i])]
+                        s_max = [max(x, y) for x, y in zip(s_max, b_max[b_i])]
+                areas.append(MeshBVH._area(s_min, s_max) if s_min else 0)
+                counts.append(cnt)
+            return areas, counts
+
+        l_areas, l_counts = sweep(xrange(bin_count - 1))
+        r_areas, r_counts = sweep(xrange(bin_count - 1, 0, -1))
+        r_areas.reverse()
+        r_counts.reverse()
+        best_cost, best_plane = None, None
+        for p in xrange(bin_count - 1):
+            if l_counts[p] == 0 or r_counts[p] == 0:
+                continue
+            cost = l_areas[p] * l_counts[p] + r_areas[p] * r_counts[p]
+            if best_cost is None or cost < best_cost:
+                best_cost, best_plane = cost, p
+        if best_plane is None:
+            return None
+        # compare against the cost of intersecting every triangle in a leaf
+        count = end - start
+        if parent_area > 0 and 1 + best_cost / parent_area >= count and count <= 16:
+            return None
+
+        # partition the triangles in place about the chosen plane
+        left = [t for t in order[start:end] if bin_of[t] <= best_plane]
+        right = [t for t in order[start:end] if bin_of[t] > best_plane]
+        order[start:end] = left + right
+        return start + len(left)
+
+    @staticmethod
+    def _range_bounds(order, start, end, t_min, t_max):
+        """Get the bounding box around a range of triangles."""
+        mins = [t_min[t] for t in order[start:end]]
+        maxs = [t_max[t] for t in order[start:end]]
+        return (min(m[0] for m in mins), min(m[1] for m in mins),
+                min(m[2] for m in mins)), \
+            (max(m[0] for m in maxs), max(m[1] for m in maxs), max(m[2] for m in maxs))
+
+    @staticmethod
+    def _area(b_min, b_max):
+        """Get the surface area of a bounding box."""
+        dx, dy, dz = b_max[0] - b_min[0], b_max[1] - b_min[1], b_max[2] - b_min[2]
+        return 2 * (dx * dy + dy * dz + dz * dx)
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __repr__(self):
+        return 'MeshBVH ({} triangles) ({} nodes)'.format(
+            self.triangle_count, self.node_count)
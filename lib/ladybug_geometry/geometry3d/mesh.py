@@ -23,7 +23,8 @@ class Mesh3D(MeshBase):
         faces: A list of tuples with each tuple having either 3 or 4 integers.
             These integers correspond to indices within the list of vertices.
         colors: An optional list of colors that correspond to either the faces
-            of the mesh or the vertices of the mesh. Default is None.
+            of the mesh or the vertices of the mesh. This can also be a ladybug
+            ColorArray of packed RGBA colors. Default is None.
 
     Properties:
         * vertices
@@ -0,0 +1,179 @@
+"""Base class with the runtime shared by all generated Ladybug Sverchok nodes."""
+from sverchok.node_tree import SverchCustomTreeNode
+from sverchok.data_structure import zip_long_repeat
+
+from .nodecache import node_output_cache
+
+# cast functions of each node class, which only depend on the class attributes
+_INPUT_CASTS = {}
+
+
+def sv_cast(value, data_type, default):
+    """Cast a value coming from a Sverchok socket to the type of a Grasshopper input.
+
+    Args:
+        value: The value from the Sverchok socket.
+        data_type: Text for the Grasshopper type of the input (eg. bool, int, double).
+        default: The default value to be used when the value is an empty string.
+    """
+    result = default if isinstance(value, str) and value == '' else value
+    if result is None and data_type == 'bool':
+        return False
+    elif result is not None and data_type == 'bool':
+        if result == 'True' or result == '1':
+            return True
+        elif result == 'False' or result == '0':
+            return False
+        return bool(result)
+    elif result is not None and data_type == 'int':
+        return int(result)
+    elif result is not None and data_type == 'double':
+        return float(result)
+    return result
+
+
+def input_cast(data_type, default, access):
+    """Get a function that casts the values of one input of a node.
+
+    The type checks of sv_cast are resolved once here rather than for every value.
+
+    Args:
+        data_type: Text for the Grasshopper type of the input (eg. bool, int, double).
+        default: The default value to be used when the value is an empty string.
+        access: Text for the Grasshopper access of the input (item, list or tree).
+            Values of list inputs are always cast to a list.
+    """
+    if data_type == 'bool':
+        def cast(value):
+            if isinstance(value, str) and value == '':
+                value = default
+            if value is None:
+                return False
+            elif value == 'True' or value == '1':
+                return True
+            elif value == 'False' or value == '0':
+                return False
+            return bool(value)
+    elif data_type in ('int', 'double'):
+        number = int if data_type == 'int' else float
+
+        def cast(value):
+            if isinstance(value, str) and value == '':
+                value = default
+            return None if value is None else number(value)
+    elif default is None:
+        def cast(value):
+            return None if isinstance(value, str) and value == '' else value
+    else:
+        def cast(value):
+            return default if isinstance(value, str) and value == '' else value
+
+    if access != 'list':
+        return cast
+
+    def cast_list(value):
+        values = [cast(v) for v in value] if isinstance(value, (list, tuple)) \
+            else [cast(value)]
+        return [] if len(values) == 1 and values[0] is None else values
+    return cast_list
+
+
+class SvLadybugNode(SverchCustomTreeNode):
+    """Base class for the Sverchok nodes generated from the Ladybug Grasshopper components.
+
+    Nodes declare their inputs and outputs with the class attributes below and
+    implement process_ladybug, which accepts one cast value for each input and
+    returns a dictionary containing the outputs (typically the locals() of the
+    component code). Nodes that can process many combinations of inputs at once
+    set sv_vectorized to True and override process_ladybug_batch. Expensive nodes
+    set sv_memoize to True so that their outputs are cached for the content of
+    their inputs, in which case they can also have a sv_force_rerun property
+    to bypass the cache.
+
+    Class attributes:
+        * sv_output_names
+        * sv_input_names
+        * sv_input_types
+        * sv_input_defaults
+        * sv_input_access
+        * sv_vectorized
+        * sv_memoize
+    """
+    sv_output_names = []
+    sv_input_names = []
+    sv_input_types = []
+    sv_input_defaults = []
+    sv_input_access = []
+    sv_vectorized = False
+    sv_memoize = False
+
+    def process(self):
+        if not any(socket.is_linked for socket in self.outputs):
+            return
+
+        casts = self.sv_input_casts()
+        sv_inputs_nested = [self.inputs[name].sv_get() for name in self.sv_input_names]
+        sv_inputs = [
+            [cast(value) for cast, value in zip(casts, sv_input)]
+            for sv_input_nested in zip_long_repeat(*sv_inputs_nested)
+            for sv_input in zip_long_repeat(*sv_input_nested)
+        ]
+
+        key = None
+        if self.sv_memoize:
+            key = node_output_cache.inputs_key(self.sv_node_key(), sv_inputs)
+            if key is not None and not getattr(self, 'sv_force_rerun', False):
+                results = node_output_cache.get(key)
+                if results is not None:
+                    self.sv_set_outputs(results)
+                    return
+
+        if self.sv_vectorized:
+            results = self.process_ladybug_batch(*zip(*sv_inputs)) if sv_inputs else []
+        else:
+            results = [self.process_ladybug(*sv_input) for sv_input in sv_inputs]
+        if key is not None:
+            results = [{name: result[name] for name in self.sv_output_names if name in result}
+                       for result in results]
+            node_output_cache.set(key, results)
+        self.sv_set_outputs(results)
+
+    def sv_set_outputs(self, results):
+        """Set the output sockets from a list with a dictionary of outputs per combination."""
+        for name in self.sv_output_names:
+            self.outputs[name].sv_set(
+                [[result[name]] for result in results if name in result])
+
+    def sv_input_casts(self):
+        """Get a list with a function to cast the values of each input of the node."""
+        try:
+            return _INPUT_CASTS[self.bl_idname]
+        except KeyError:
+            casts = _INPUT_CASTS[self.bl_idname] = [
+                input_cast(data_type, default, access) for data_type, default, access
+                in zip(self.sv_input_types, self.sv_input_defaults, self.sv_input_access)]
+            return casts
+
+    def sv_node_key(self):
+        """Get a key that identifies this node in the output cache."""
+        return self.bl_idname, getattr(self, 'node_id', '') or self.name
+
+    def sv_cast(self, value, data_type, default):
+        return sv_cast(value, data_type, default)
+
+    def process_ladybug(self, *args):
+        """Process one combination of inputs, returning a dictionary of outputs."""
+        raise NotImplementedError(
+            'Node {} does not implement process_ladybug.'.format(self.bl_idname))
+
+    def process_ladybug_batch(self, *input_lists):
+        """Process all combinations of inputs at once.
+
+        Args:
+            input_lists: One list for each input of the node, which contains the
+                cast values of that input for every combination.
+
+        Returns:
+            A list with one dictionary of outputs for each combination.
+        """
+        return [self.process_ladybug(*sv_input) for sv_input in zip(*input_lists)]
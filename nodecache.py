@@ -0,0 +1,254 @@
+"""Memory-bounded cache of the outputs of Ladybug Sverchok nodes.
+
+Sverchok processes a node again whenever anything upstream of it is updated, even
+if the inputs of the node itself did not change. The cache stores the outputs of
+expensive nodes keyed by the node and a stable hash of its cast inputs so that
+they can be returned without running the calculation again. Outputs are stored
+pickled, which keeps the cached results isolated from any changes that
+downstream nodes make to the objects and gives an exact size for the memory budget.
+"""
+import io
+import os
+import pickle
+import hashlib
+import array as specializedarray
+from collections import OrderedDict
+
+
+class NodeOutputCache(object):
+    """A least-recently-used cache of node outputs with a memory budget.
+
+    Args:
+        max_bytes: An integer for the maximum number of bytes of pickled outputs
+            to be kept in the cache. When this is exceeded, the least recently
+            used outputs are evicted. (Default: 512 MB).
+
+    Properties:
+        * max_bytes
+        * hits
+        * misses
+        * size
+        * byte_size
+    """
+    __slots__ = ('_max_bytes', '_entries', '_byte_size', '_hits', '_misses')
+
+    def __init__(self, max_bytes=512 * 1024 * 1024):
+        """Initialize NodeOutputCache."""
+        self._entries = OrderedDict()
+        self._byte_size = 0
+        self._hits = 0
+        self._misses = 0
+        self.max_bytes = max_bytes
+
+    @property
+    def max_bytes(self):
+        """Get or set an integer for the memory budget of the cache in bytes."""
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value):
+        assert value >= 0, 'NodeOutputCache max_bytes must be positive.'
+        self._max_bytes = int(value)
+        self._evict()
+
+    @property
+    def hits(self):
+        """Integer for the number of requests served from the cache."""
+        return self._hits
+
+    @property
+    def misses(self):
+        """Integer for the number of requests that were not in the cache."""
+        return self._misses
+
+    @property
+    def size(self):
+        """Integer for the number of outputs currently kept in the cache."""
+        return len(self._entries)
+
+    @property
+    def byte_size(self):
+        """Integer for the number of bytes of pickled outputs in the cache."""
+        return self._byte_size
+
+    def get(self, key):
+        """Get the outputs stored for a key or None if they are not in the cache.
+
+        Args:
+            key: A key obtained from the inputs_key method.
+        """
+        try:
+            content = self._entries.pop(key)
+        except KeyError:
+            self._misses += 1
+            return None
+        self._entries[key] = content
+        self._hits += 1
+        return pickle.loads(content)
+
+    def set(self, key, outputs):
+        """Store the outputs of a node for a key.
+
+        Args:
+            key: A key obtained from the inputs_key method.
+            outputs: The outputs of the node. Outputs that cannot be pickled
+                are not stored.
+
+        Returns:
+            True if the outputs were stored. False if they could not be pickled
+            or they are larger than the memory budget of the cache.
+        """
+        try:
+            content = pickle.dumps(outputs, pickle.HIGHEST_PROTOCOL)
+        except Exception:  # not all objects from Blender can be pickled
+            return False
+        self.remove(key)
+        if len(content) > self._max_bytes:
+            return False
+        self._entries[key] = content
+        self._byte_size += len(content)
+        self._evict()
+        return True
+
+    def remove(self, key):
+        """Remove the outputs of a key from the cache if they exist."""
+        content = self._entries.pop(key, None)
+        if content is not None:
+            self._byte_size -= len(content)
+
+    def clear(self, node_key=None):
+        """Clear the outputs in the cache.
+
+        Args:
+            node_key: Optional key of a node to only clear its outputs. If None,
+                all outputs in the cache will be cleared. (Default: None).
+        """
+        if node_key is None:
+            self._entries.clear()
+            self._byte_size = 0
+            return
+        for key in [k for k in self._entries if k[0] == node_key]:
+            self.remove(key)
+
+    def reset_counters(self):
+        """Reset the hit and miss counters of the cache to zero."""
+        self._hits, self._misses = 0, 0
+
+    @staticmethod
+    def inputs_key(node_key, inputs):
+        """Get a key that identifies a node and the content of its inputs.
+
+        Text inputs that are paths to existing files also include the modification
+        time and size of the file so that edited files are not served from
+        the cache. Blender mesh objects, which cannot be pickled, are hashed
+        by the content of their geometry and their world matrix. Objects with
+        a to_array or a to_dict method (eg. Ladybug geometry and data collections)
+        are hashed by the result of that method such that the key does not
+        depend on the attributes that they compute lazily.
+
+        Args:
+            node_key: A hashable object that identifies the node.
+            inputs: A list of the cast inputs of the node.
+
+        Returns:
+            A tuple of the node_key and an md5 hash of the inputs. None if the
+            inputs cannot be pickled, in which case they cannot be cached.
+        """
+        content = io.BytesIO()
+        try:
+            _InputPickler(content, 2).dump(inputs)
+        except Exception:  # not all objects from Blender can be pickled
+            return None
+        hasher = hashlib.md5(content.getvalue())
+        for path in _file_paths(inputs):
+            stat = os.stat(path)
+            hasher.update('{}|{}|{}'.format(path, stat.st_mtime, stat.st_size).encode())
+        return node_key, hasher.hexdigest()
+
+    def _evict(self):
+        """Evict the least recently used outputs until the cache fits its budget."""
+        while self._byte_size > self._max_bytes and self._entries:
+            _, content = self._entries.popitem(last=False)
+            self._byte_size -= len(content)
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return 'Node Output Cache ({} entries, {} bytes, {} hits, {} misses)'.format(
+            len(self._entries), self._byte_size, self._hits, self._misses)
+
+
+class _InputPickler(pickle.Pickler):
+    """Pickler that writes a canonical form of the objects that it can.
+
+    Blender objects are replaced with a hash of their geometry and Ladybug objects
+    with their array of coordinates or their dictionary, which leave out the
+    lazily computed attributes (eg. the datetimes of a data collection) that would
+    otherwise change the pickle depending on whether some other node already
+    accessed them.
+    """
+    _object_kinds = {}  # whether each pickled type is a Blender or a Ladybug object
+
+    def persistent_id(self, obj):
+        obj_type = type(obj)
+        try:
+            kind = self._object_kinds[obj_type]
+        except KeyError:
+            if hasattr(obj, 'matrix_world') and hasattr(obj, 'data'):
+                kind = 'blender'
+            elif callable(getattr(obj_type, 'to_array', None)):
+                kind = 'to_array'
+            elif callable(getattr(obj_type, 'to_dict', None)):
+                kind = 'to_dict'
+            else:
+                kind = None
+            self._object_kinds[obj_type] = kind
+        if kind == 'blender':
+            return _object_geometry_hash(obj)
+        elif kind is not None:
+            try:
+                return obj_type.__name__, getattr(obj, kind)()
+            except Exception:  # pickle the object as it is
+                return None
+        return None
+
+
+def _object_geometry_hash(obj):
+    """Get text that identifies the geometry of a Blender mesh object in the world.
+
+    Raises:
+        TypeError if the object is not a mesh, the geometry of which cannot be hashed.
+    """
+    if obj.type != 'MESH':
+        raise TypeError('The geometry of a {} object cannot be hashed.'.format(obj.type))
+    hasher = hashlib.md5(specializedarray.array(
+        'd', [v for row in obj.matrix_world for v in row]).tobytes())
+    data = obj.data
+    for items, attr, code, size in (
+            (data.vertices, 'co', 'f', 3), (data.loops, 'vertex_index', 'i', 1),
+            (data.polygons, 'loop_start', 'i', 1), (data.polygons, 'loop_total', 'i', 1)):
+        values = specializedarray.array(code, [0]) * (len(items) * size)
+        items.foreach_get(attr, values)
+        hasher.update(values.tobytes())
+    return 'blender_object', hasher.hexdigest()
+
+
+def _file_paths(values):
+    """Get the text values in nested lists that are paths to existing files."""
+    for value in values:
+        if isinstance(value, (list, tuple)):
+            for path in _file_paths(value):
+                yield path
+        elif isinstance(value, str) and len(value) < 1024 and os.path.isfile(value):
+            yield value
+
+
+# a cache shared by all nodes in the current Blender session, the memory budget of
+# which can be set in megabytes with the LADYBUG_NODE_CACHE_MB environment variable
+node_output_cache = NodeOutputCache(
+    int(os.environ.get('LADYBUG_NODE_CACHE_MB', 512)) * 1024 * 1024)
@@ -1,15 +1,20 @@
 import bpy
 import ladybug_tools.helper
 from bpy.props import StringProperty
-from sverchok.node_tree import SverchCustomTreeNode
-from sverchok.data_structure import updateNode, zip_long_repeat
+from sverchok.data_structure import updateNode
+from ladybug_tools.node import SvLadybugNode
 
 ghenv = ladybug_tools.helper.ghenv
 
-class SvAdaptiveChart(bpy.types.Node, SverchCustomTreeNode):
+class SvAdaptiveChart(bpy.types.Node, SvLadybugNode):
     bl_idname = 'SvAdaptiveChart'
     bl_label = 'LB Adaptive Chart'
     sv_icon = 'LB_ADAPTIVECHART'
+    sv_output_names = ['total_comfort', 'comfort_data', 'condition_data', 'polygon', 'title', 'prevail_lines', 'operative_lines', 'mesh', 'legend', 'points', 'data', 'vis_set']
+    sv_input_names = ['_out_temp', '_air_temp', '_mrt_', '_air_speed_', 'adapt_par_', '_base_pt_', '_scale_', '_prevail_range_', '_operat_range_', 'legend_par_', 'data_', 'statement_', 'period_']
+    sv_input_types = ['System.Object', 'System.Object', 'System.Object', 'System.Object', 'System.Object', 'Point3d', 'double', 'Interval', 'Interval', 'System.Object', 'System.Object', 'string', 'System.Object']
+    sv_input_defaults = [None, None, None, None, None, None, None, None, None, None, None, None, None]
+    sv_input_access = ['list', 'list', 'list', 'item', 'item', 'item', 'item', 'item', 'item', 'list', 'list', 'item', 'item']
     sv__out_temp: StringProperty(
         name='_out_temp',
         update=updateNode,
@@ -132,59 +137,6 @@ class SvAdaptiveChart(bpy.types.Node, SverchCustomTreeNode):
     def draw_buttons(self, context, layout):
         op = layout.operator('node.sv_lb_socket_name', text='', icon='QUESTION', emboss=False).tooltip = 'Draw an adaptive comfort chart in the Rhino scene and plot a set of prevailing and indoor operative temperature values on it. _ Connected data can include outdoor temperatures from imported EPW weather data as well as indoor temperatures from an energy simulation. -'
 
-    def process(self):
-        if not any(socket.is_linked for socket in self.outputs):
-            return
-
-        self.sv_output_names = ['total_comfort', 'comfort_data', 'condition_data', 'polygon', 'title', 'prevail_lines', 'operative_lines', 'mesh', 'legend', 'points', 'data', 'vis_set']
-        for name in self.sv_output_names:
-            setattr(self, '{}_out'.format(name), [])
-        self.sv_input_names = ['_out_temp', '_air_temp', '_mrt_', '_air_speed_', 'adapt_par_', '_base_pt_', '_scale_', '_prevail_range_', '_operat_range_', 'legend_par_', 'data_', 'statement_', 'period_']
-        self.sv_input_types = ['System.Object', 'System.Object', 'System.Object', 'System.Object', 'System.Object', 'Point3d', 'double', 'Interval', 'Interval', 'System.Object', 'System.Object', 'string', 'System.Object']
-        self.sv_input_defaults = [None, None, None, None, None, None, None, None, None, None, None, None, None]
-        self.sv_input_access = ['list', 'list', 'list', 'item', 'item', 'item', 'item', 'item', 'item', 'list', 'list', 'item', 'item']
-        sv_inputs_nested = []
-        for name in self.sv_input_names:
-            sv_inputs_nested.append(self.inputs[name].sv_get())
-        for sv_input_nested in zip_long_repeat(*sv_inputs_nested):
-            for sv_input in zip_long_repeat(*sv_input_nested):
-                sv_input = list(sv_input)
-                for i, value in enumerate(sv_input):
-                    if self.sv_input_access[i] == 'list':
-                        if isinstance(value, (list, tuple)):
-                            values = value
-                        else:
-                            values = [value]
-                        value = [self.sv_cast(v, self.sv_input_types[i], self.sv_input_defaults[i]) for v in values]
-                        if value == [None]:
-                            value = []
-                        sv_input[i] = value
-                    else:
-                        sv_input[i] = self.sv_cast(value, self.sv_input_types[i], self.sv_input_defaults[i])
-                self.process_ladybug(*sv_input)
-        for name in self.sv_output_names:
-            value = getattr(self, '{}_out'.format(name))
-            # Not sure if this hack is correct, will find out when more nodes are generated
-            #if len(value) == 0 or not isinstance(value[0], (list, tuple)):
-            #    value = [value]
-            self.outputs[name].sv_set(value)
-
-    def sv_cast(self, value, data_type, default):
-        result = default if isinstance(value, str) and value == '' else value
-        if result is None and data_type == 'bool':
-            return False
-        elif result is not None and data_type == 'bool':
-            if result == 'True' or result == '1':
-                return True
-            elif result == 'False' or result == '0':
-                return False
-            return bool(result)
-        elif result is not None and data_type == 'int':
-            return int(result)
-        elif result is not None and data_type == 'double':
-            return float(result)
-        return result
-
     def process_ladybug(self, _out_temp, _air_temp, _mrt_, _air_speed_, adapt_par_, _base_pt_, _scale_, _prevail_range_, _operat_range_, legend_par_, data_, statement_, period_):
 
         try:
@@ -441,9 +393,7 @@ class SvAdaptiveChart(bpy.types.Node, SverchCustomTreeNode):
             vis_set = objectify_output('VisualizationSet Aruments [AdaptiveChart]', vis_set)
         
 
-        for name in self.sv_output_names:
-            if name in locals():
-                getattr(self, '{}_out'.format(name)).append([locals()[name]])
+        return locals()
 
 
 def register():
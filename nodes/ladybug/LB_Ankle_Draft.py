@@ -1,15 +1,20 @@
 import bpy
 import ladybug_tools.helper
 from bpy.props import StringProperty
-from sverchok.node_tree import SverchCustomTreeNode
-from sverchok.data_structure import updateNode, zip_long_repeat
+from sverchok.data_structure import updateNode
+from ladybug_tools.node import SvLadybugNode
 
 ghenv = ladybug_tools.helper.ghenv
 
-class SvAnkleDraft(bpy.types.Node, SverchCustomTreeNode):
+class SvAnkleDraft(bpy.types.Node, SvLadybugNode):
     bl_idname = 'SvAnkleDraft'
     bl_label = 'LB Ankle Draft'
     sv_icon = 'LB_ANKLEDRAFT'
+    sv_output_names = ['ppd']
+    sv_input_names = ['_full_body_pmv', '_draft_velocity']
+    sv_input_types = ['System.Object', 'System.Object']
+    sv_input_defaults = [None, None]
+    sv_input_access = ['item', 'item']
     sv__full_body_pmv: StringProperty(
         name='_full_body_pmv',
         update=updateNode,
@@ -33,59 +38,6 @@ class SvAnkleDraft(bpy.types.Node, SverchCustomTreeNode):
     def draw_buttons(self, context, layout):
         op = layout.operator('node.sv_lb_socket_name', text='', icon='QUESTION', emboss=False).tooltip = 'Calculate the percentage of people dissatisfied from cold drafts at ankle-level. _ The original tests used to create the model involved blowing cold air on subject\'s ankles at a height of 10 cm off of the ground. The formula was officially incorporated in the ASHRAE 55 standard in 2020 with a recommendation that PPD from ankle draft not exceed 20%. _ For more information on the methods used to create this model see the following: Liu, S., S. Schiavon, A. Kabanshi, W. Nazaroff. 2016. "Predicted percentage of dissatisfied with ankle draft." Accepted Author Manuscript. Indoor Environmental Quality. http://escholarship.org/uc/item/9076254n -'
 
-    def process(self):
-        if not any(socket.is_linked for socket in self.outputs):
-            return
-
-        self.sv_output_names = ['ppd']
-        for name in self.sv_output_names:
-            setattr(self, '{}_out'.format(name), [])
-        self.sv_input_names = ['_full_body_pmv', '_draft_velocity']
-        self.sv_input_types = ['System.Object', 'System.Object']
-        self.sv_input_defaults = [None, None]
-        self.sv_input_access = ['item', 'item']
-        sv_inputs_nested = []
-        for name in self.sv_input_names:
-            sv_inputs_nested.append(self.inputs[name].sv_get())
-        for sv_input_nested in zip_long_repeat(*sv_inputs_nested):
-            for sv_input in zip_long_repeat(*sv_input_nested):
-                sv_input = list(sv_input)
-                for i, value in enumerate(sv_input):
-                    if self.sv_input_access[i] == 'list':
-                        if isinstance(value, (list, tuple)):
-                            values = value
-                        else:
-                            values = [value]
-                        value = [self.sv_cast(v, self.sv_input_types[i], self.sv_input_defaults[i]) for v in values]
-                        if value == [None]:
-                            value = []
-                        sv_input[i] = value
-                    else:
-                        sv_input[i] = self.sv_cast(value, self.sv_input_types[i], self.sv_input_defaults[i])
-                self.process_ladybug(*sv_input)
-        for name in self.sv_output_names:
-            value = getattr(self, '{}_out'.format(name))
-            # Not sure if this hack is correct, will find out when more nodes are generated
-            #if len(value) == 0 or not isinstance(value[0], (list, tuple)):
-            #    value = [value]
-            self.outputs[name].sv_set(value)
-
-    def sv_cast(self, value, data_type, default):
-        result = default if isinstance(value, str) and value == '' else value
-        if result is None and data_type == 'bool':
-            return False
-        elif result is not None and data_type == 'bool':
-            if result == 'True' or result == '1':
-                return True
-            elif result == 'False' or result == '0':
-                return False
-            return bool(result)
-        elif result is not None and data_type == 'int':
-            return int(result)
-        elif result is not None and data_type == 'double':
-            return float(result)
-        return result
-
     def process_ladybug(self, _full_body_pmv, _draft_velocity):
 
         try:
@@ -107,9 +59,7 @@ class SvAnkleDraft(bpy.types.Node, SverchCustomTreeNode):
                 PercentagePeopleDissatisfied(), '%')
         
 
-        for name in self.sv_output_names:
-            if name in locals():
-                getattr(self, '{}_out'.format(name)).append([locals()[name]])
+        return locals()
 
 
 def register():
@@ -1,15 +1,21 @@
 import bpy
 import ladybug_tools.helper
 from bpy.props import StringProperty
-from sverchok.node_tree import SverchCustomTreeNode
-from sverchok.data_structure import updateNode, zip_long_repeat
+from sverchok.data_structure import updateNode
+from ladybug_tools.node import SvLadybugNode
 
 ghenv = ladybug_tools.helper.ghenv
 
-class SvArithOp(bpy.types.Node, SverchCustomTreeNode):
+class SvArithOp(bpy.types.Node, SvLadybugNode):
     bl_idname = 'SvArithOp'
     bl_label = 'LB Arithmetic Operation'
     sv_icon = 'LB_ARITHOP'
+    sv_output_names = ['data']
+    sv_input_names = ['_data_1', '_data_2', '_operator_', 'type_']
+    sv_input_types = ['System.Object', 'System.Object', 'string', 'string']
+    sv_input_defaults = [None, None, None, None]
+    sv_input_access = ['list', 'list', 'item', 'item']
+    sv_vectorized = True
     sv__data_1: StringProperty(
         name='_data_1',
         update=updateNode,
@@ -47,112 +53,93 @@ class SvArithOp(bpy.types.Node, SverchCustomTreeNode):
     def draw_buttons(self, context, layout):
         op = layout.operator('node.sv_lb_socket_name', text='', icon='QUESTION', emboss=False).tooltip = 'Perform simple arithmetic operations between Data Collections. For example, adding two Data Collections together, subtracting one collection from another, or multiplying/dividing a data in a collection by a factor. - Note that Data Collections must be aligned in order for this component to run successfully. - Using this component will often be much faster and more elegant compared to deconstructing the data collection, performing the operation with native Grasshopper components, and rebuilding the collection. -'
 
-    def process(self):
-        if not any(socket.is_linked for socket in self.outputs):
-            return
-
-        self.sv_output_names = ['data']
-        for name in self.sv_output_names:
-            setattr(self, '{}_out'.format(name), [])
-        self.sv_input_names = ['_data_1', '_data_2', '_operator_', 'type_']
-        self.sv_input_types = ['System.Object', 'System.Object', 'string', 'string']
-        self.sv_input_defaults = [None, None, None, None]
-        self.sv_input_access = ['list', 'list', 'item', 'item']
-        sv_inputs_nested = []
-        for name in self.sv_input_names:
-            sv_inputs_nested.append(self.inputs[name].sv_get())
-        for sv_input_nested in zip_long_repeat(*sv_inputs_nested):
-            for sv_input in zip_long_repeat(*sv_input_nested):
-                sv_input = list(sv_input)
-                for i, value in enumerate(sv_input):
-                    if self.sv_input_access[i] == 'list':
-                        if isinstance(value, (list, tuple)):
-                            values = value
-                        else:
-                            values = [value]
-                        value = [self.sv_cast(v, self.sv_input_types[i], self.sv_input_defaults[i]) for v in values]
-                        if value == [None]:
-                            value = []
-                        sv_input[i] = value
-                    else:
-                        sv_input[i] = self.sv_cast(value, self.sv_input_types[i], self.sv_input_defaults[i])
-                self.process_ladybug(*sv_input)
-        for name in self.sv_output_names:
-            value = getattr(self, '{}_out'.format(name))
-            # Not sure if this hack is correct, will find out when more nodes are generated
-            #if len(value) == 0 or not isinstance(value[0], (list, tuple)):
-            #    value = [value]
-            self.outputs[name].sv_set(value)
-
-    def sv_cast(self, value, data_type, default):
-        result = default if isinstance(value, str) and value == '' else value
-        if result is None and data_type == 'bool':
-            return False
-        elif result is not None and data_type == 'bool':
-            if result == 'True' or result == '1':
-                return True
-            elif result == 'False' or result == '0':
-                return False
-            return bool(result)
-        elif result is not None and data_type == 'int':
-            return int(result)
-        elif result is not None and data_type == 'double':
-            return float(result)
-        return result
-
     def process_ladybug(self, _data_1, _data_2, _operator_, type_):
 
         try:
-            import ladybug.datatype
-        except ImportError as e:
-            raise ImportError('\nFailed to import ladybug:\n\t{}'.format(e))
-        
-        try:
-            from ladybug_tools.sverchok import all_required_inputs, longest_list
+            from ladybug_tools.sverchok import all_required_inputs
         except ImportError as e:
             raise ImportError('\nFailed to import ladybug_tools:\n\t{}'.format(e))
         
-        try:
-            from itertools import izip as zip  # python 2
-        except ImportError:
-            pass  # some future time when Python upgrades to python 3
-        
         
         if all_required_inputs(ghenv.Component):
             # build the arithmetic statement
-            operator = '+' if _operator_ is None else _operator_
-            statement = 'data_1 {} data_2'.format(operator)
+            statement = arithmetic_statement(_operator_)
         
             # perform the arithmetic operation
-            data = []
-            for i, data_1 in enumerate(_data_1):
-                data_2 = longest_list(_data_2, i)
-                data_1 = float(data_1) if isinstance(data_1, str) else data_1
-                data_2 = float(data_2) if isinstance(data_2, str) else data_2
-                result = eval(statement, {'data_1': data_1, 'data_2': data_2})
-        
-                # try to replace the data collection type
-                try:
-                    result = result.duplicate()
-                    if type_:
-                        result.header.metadata['type'] = type_
-                    elif 'type' in result.header.metadata:  # infer data type from units
-                        d_unit = result.header.unit
-                        for key in ladybug.datatype.UNITS:
-                            if d_unit in ladybug.datatype.UNITS[key]:
-                                base_type = ladybug.datatype.TYPESDICT[key]()
-                                result.header.metadata['type'] = str(base_type)
-                                break
-                        else:
-                            result.header.metadata['type'] = 'Unknown Data Type'
-                except AttributeError:
-                    pass  # result was not a data collection; just return it anyway
-                data.append(result)
-
-        for name in self.sv_output_names:
-            if name in locals():
-                getattr(self, '{}_out'.format(name)).append([locals()[name]])
+            data = operate_on_data(_data_1, _data_2, statement, type_)
+
+        return locals()
+
+    def process_ladybug_batch(self, _data_1, _data_2, _operator_, type_):
+        """Perform the operations of all input combinations with one compiled statement per operator."""
+        try:
+            from ladybug_tools.sverchok import all_required_inputs
+        except ImportError as e:
+            raise ImportError('\nFailed to import ladybug_tools:\n\t{}'.format(e))
+
+        if not all_required_inputs(ghenv.Component):
+            return [{} for _ in _data_1]
+        statements, results = {}, []
+        for data_1s, data_2s, operator, d_type in zip(_data_1, _data_2, _operator_, type_):
+            try:
+                statement = statements[operator]
+            except KeyError:
+                statement = statements[operator] = arithmetic_statement(operator)
+            results.append({'data': operate_on_data(data_1s, data_2s, statement, d_type)})
+        return results
+
+
+# text for the base data type of each unit, filled as units are found
+UNIT_TYPES = {}
+
+
+def arithmetic_statement(_operator_):
+    """Get the compiled statement that applies an operator to data_1 and data_2."""
+    operator = '+' if _operator_ is None else _operator_
+    return compile('data_1 {} data_2'.format(operator), '<arithmetic>', 'eval')
+
 
+def operate_on_data(_data_1, _data_2, statement, type_):
+    """Evaluate an arithmetic statement for each item of _data_1 and the matching _data_2."""
+    try:
+        import ladybug.datatype
+    except ImportError as e:
+        raise ImportError('\nFailed to import ladybug:\n\t{}'.format(e))
+
+    try:
+        from ladybug_tools.sverchok import longest_list
+    except ImportError as e:
+        raise ImportError('\nFailed to import ladybug_tools:\n\t{}'.format(e))
+
+    data = []
+    for i, data_1 in enumerate(_data_1):
+        data_2 = longest_list(_data_2, i)
+        data_1 = float(data_1) if isinstance(data_1, str) else data_1
+        data_2 = float(data_2) if isinstance(data_2, str) else data_2
+        result = eval(statement, {'data_1': data_1, 'data_2': data_2})
+
+        # try to replace the data collection type
+        try:
+            result = result.duplicate()
+            if type_:
+                result.header.metadata['type'] = type_
+            elif 'type' in result.header.metadata:  # infer data type from units
+                d_unit = result.header.unit
+                try:
+                    result.header.metadata['type'] = UNIT_TYPES[d_unit]
+                except KeyError:
+                    for key in ladybug.datatype.UNITS:
+                        if d_unit in ladybug.datatype.UNITS[key]:
+                            base_type = ladybug.datatype.TYPESDICT[key]()
+                            d_type = str(base_type)
+                            break
+                    else:
+                        d_type = 'Unknown Data Type'
+                    result.header.metadata['type'] = UNIT_TYPES[d_unit] = d_type
+        except AttributeError:
+            pass  # result was not a data collection; just return it anyway
+        data.append(result)
+    return data
 
 def register():
     bpy.utils.register_class(SvArithOp)
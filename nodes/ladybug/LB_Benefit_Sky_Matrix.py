@@ -1,15 +1,26 @@
 import bpy
 import ladybug_tools.helper
-from bpy.props import StringProperty
-from sverchok.node_tree import SverchCustomTreeNode
-from sverchok.data_structure import updateNode, zip_long_repeat
+from bpy.props import BoolProperty, StringProperty
+from sverchok.data_structure import updateNode
+from ladybug_tools.node import SvLadybugNode
 
 ghenv = ladybug_tools.helper.ghenv
 
-class SvBenefitMatrix(bpy.types.Node, SverchCustomTreeNode):
+class SvBenefitMatrix(bpy.types.Node, SvLadybugNode):
     bl_idname = 'SvBenefitMatrix'
     bl_label = 'LB Benefit Sky Matrix'
     sv_icon = 'LB_BENEFITMATRIX'
+    sv_output_names = ['sky_mtx']
+    sv_input_names = ['north_', '_location', '_temperature', '_bal_temp_', '_bal_offset_', '_direct_rad', '_diffuse_rad', '_hoys_', 'high_density_', '_ground_ref_', '_folder_']
+    sv_input_types = ['System.Object', 'System.Object', 'System.Object', 'double', 'double', 'System.Object', 'System.Object', 'double', 'bool', 'double', 'string']
+    sv_input_defaults = [None, None, None, None, None, None, None, None, None, None, None]
+    sv_input_access = ['item', 'item', 'item', 'item', 'item', 'item', 'item', 'list', 'item', 'item', 'item']
+    sv_memoize = True
+    sv_force_rerun: BoolProperty(
+        name='Force Rerun',
+        default=False,
+        update=updateNode,
+        description='Run the calculation every time the node is processed instead of reusing the outputs that were cached for the same inputs.')
     sv_north_: StringProperty(
         name='north_',
         update=updateNode,
@@ -95,59 +106,7 @@ class SvBenefitMatrix(bpy.types.Node, SverchCustomTreeNode):
 
     def draw_buttons(self, context, layout):
         op = layout.operator('node.sv_lb_socket_name', text='', icon='QUESTION', emboss=False).tooltip = 'Get a matrix representing the benefit/harm of radiation based on temperature data. _ When this sky matrix is used in radiation studies or to produce radiation graphics, positive values represent helpful wintertime sun energy that can offset heating loads during cold temperatures while negative values represent harmful summertime sun energy that can increase cooling loads during hot temperatures. _ Radiation benefit skies are particularly helpful for evaluating building massing and facade designs in terms of passive solar heat gain vs. cooling energy increase. _ This component uses Radiance\'s gendaymtx function to calculate the radiation for each patch of the sky. Gendaymtx is written by Ian Ashdown and Greg Ward. Morere information can be found in Radiance manual at: http://www.radiance-online.org/learning/documentation/manual-pages/pdfs/gendaymtx.pdf -'
-
-    def process(self):
-        if not any(socket.is_linked for socket in self.outputs):
-            return
-
-        self.sv_output_names = ['sky_mtx']
-        for name in self.sv_output_names:
-            setattr(self, '{}_out'.format(name), [])
-        self.sv_input_names = ['north_', '_location', '_temperature', '_bal_temp_', '_bal_offset_', '_direct_rad', '_diffuse_rad', '_hoys_', 'high_density_', '_ground_ref_', '_folder_']
-        self.sv_input_types = ['System.Object', 'System.Object', 'System.Object', 'double', 'double', 'System.Object', 'System.Object', 'double', 'bool', 'double', 'string']
-        self.sv_input_defaults = [None, None, None, None, None, None, None, None, None, None, None]
-        self.sv_input_access = ['item', 'item', 'item', 'item', 'item', 'item', 'item', 'list', 'item', 'item', 'item']
-        sv_inputs_nested = []
-        for name in self.sv_input_names:
-            sv_inputs_nested.append(self.inputs[name].sv_get())
-        for sv_input_nested in zip_long_repeat(*sv_inputs_nested):
-            for sv_input in zip_long_repeat(*sv_input_nested):
-                sv_input = list(sv_input)
-                for i, value in enumerate(sv_input):
-                    if self.sv_input_access[i] == 'list':
-                        if isinstance(value, (list, tuple)):
-                            values = value
-                        else:
-                            values = [value]
-                        value = [self.sv_cast(v, self.sv_input_types[i], self.sv_input_defaults[i]) for v in values]
-                        if value == [None]:
-                            value = []
-                        sv_input[i] = value
-                    else:
-                        sv_input[i] = self.sv_cast(value, self.sv_input_types[i], self.sv_input_defaults[i])
-                self.process_ladybug(*sv_input)
-        for name in self.sv_output_names:
-            value = getattr(self, '{}_out'.format(name))
-            # Not sure if this hack is correct, will find out when more nodes are generated
-            #if len(value) == 0 or not isinstance(value[0], (list, tuple)):
-            #    value = [value]
-            self.outputs[name].sv_set(value)
-
-    def sv_cast(self, value, data_type, default):
-        result = default if isinstance(value, str) and value == '' else value
-        if result is None and data_type == 'bool':
-            return False
-        elif result is not None and data_type == 'bool':
-            if result == 'True' or result == '1':
-                return True
-            elif result == 'False' or result == '0':
-                return False
-            return bool(result)
-        elif result is not None and data_type == 'int':
-            return int(result)
-        elif result is not None and data_type == 'double':
-            return float(result)
-        return result
+        layout.prop(self, 'sv_force_rerun')
 
     def process_ladybug(self, north_, _location, _temperature, _bal_temp_, _bal_offset_, _direct_rad, _diffuse_rad, _hoys_, high_density_, _ground_ref_, _folder_):
 
@@ -200,9 +159,7 @@ class SvBenefitMatrix(bpy.types.Node, SverchCustomTreeNode):
                 sky_mtx.folder = _folder_
         
 
-        for name in self.sv_output_names:
-            if name in locals():
-                getattr(self, '{}_out'.format(name)).append([locals()[name]])
+        return locals()
 
 
 def register():
@@ -1,15 +1,26 @@
 import bpy
 import ladybug_tools.helper
-from bpy.props import StringProperty
-from sverchok.node_tree import SverchCustomTreeNode
-from sverchok.data_structure import updateNode, zip_long_repeat
+from bpy.props import BoolProperty, StringProperty
+from sverchok.data_structure import updateNode
+from ladybug_tools.node import SvLadybugNode
 
 ghenv = ladybug_tools.helper.ghenv
 
-class SvSkyMatrix(bpy.types.Node, SverchCustomTreeNode):
+class SvSkyMatrix(bpy.types.Node, SvLadybugNode):
     bl_idname = 'SvSkyMatrix'
     bl_label = 'LB Cumulative Sky Matrix'
     sv_icon = 'LB_SKYMATRIX'
+    sv_output_names = ['sky_mtx']
+    sv_input_names = ['north_', '_location', '_direct_rad', '_diffuse_rad', '_hoys_', 'high_density_', '_ground_ref_', '_folder_']
+    sv_input_types = ['System.Object', 'System.Object', 'System.Object', 'System.Object', 'double', 'bool', 'double', 'string']
+    sv_input_defaults = [None, None, None, None, None, None, None, None]
+    sv_input_access = ['item', 'item', 'item', 'item', 'list', 'item', 'item', 'item']
+    sv_memoize = True
+    sv_force_rerun: BoolProperty(
+        name='Force Rerun',
+        default=False,
+        update=updateNode,
+        description='Run the calculation every time the node is processed instead of reusing the outputs that were cached for the same inputs.')
     sv_north_: StringProperty(
         name='north_',
         update=updateNode,
@@ -41,7 +52,7 @@ class SvSkyMatrix(bpy.types.Node, SverchCustomTreeNode):
     sv__folder_: StringProperty(
         name='_folder_',
         update=updateNode,
-        description='The folder in which the Radiance commands are executed to produce the sky matrix. If None, it will be written to Ladybug\'s default EPW folder.')
+        description='An optional folder in which Radiance\'s gendaymtx will be executed to produce the sky matrix. If None, the sky matrix will be computed without Radiance using the Perez all-weather sky model of the ladybug library.')
 
     def sv_init(self, context):
         self.width *= 1.3
@@ -68,65 +79,13 @@ class SvSkyMatrix(bpy.types.Node, SverchCustomTreeNode):
         input_node.tooltip = 'A number between 0 and 1 to note the average ground reflectance that is associated with the sky matrix. (Default: 0.2).'
         input_node = self.inputs.new('SvLBSocket', '_folder_')
         input_node.prop_name = 'sv__folder_'
-        input_node.tooltip = 'The folder in which the Radiance commands are executed to produce the sky matrix. If None, it will be written to Ladybug\'s default EPW folder.'
+        input_node.tooltip = 'An optional folder in which Radiance\'s gendaymtx will be executed to produce the sky matrix. If None, the sky matrix will be computed without Radiance using the Perez all-weather sky model of the ladybug library.'
         output_node = self.outputs.new('SvLBSocket', 'sky_mtx')
         output_node.tooltip = 'A sky matrix object containing the radiation coming from each patch of the sky. This can be used for a radiation study, a radition rose, or a sky dome visualization. It can also be deconstructed into its individual values with the "LB Deconstruct Matrix" component.'
 
     def draw_buttons(self, context, layout):
-        op = layout.operator('node.sv_lb_socket_name', text='', icon='QUESTION', emboss=False).tooltip = 'Get a matrix containing radiation values from each patch of a sky dome. _ Creating this matrix is a necessary pre-step before doing incident radiation analysis with Rhino geometry or generating a radiation rose. _ This component uses Radiance\'s gendaymtx function to calculate the radiation for each patch of the sky. Gendaymtx is written by Ian Ashdown and Greg Ward. Morere information can be found in Radiance manual at: http://www.radiance-online.org/learning/documentation/manual-pages/pdfs/gendaymtx.pdf -'
-
-    def process(self):
-        if not any(socket.is_linked for socket in self.outputs):
-            return
-
-        self.sv_output_names = ['sky_mtx']
-        for name in self.sv_output_names:
-            setattr(self, '{}_out'.format(name), [])
-        self.sv_input_names = ['north_', '_location', '_direct_rad', '_diffuse_rad', '_hoys_', 'high_density_', '_ground_ref_', '_folder_']
-        self.sv_input_types = ['System.Object', 'System.Object', 'System.Object', 'System.Object', 'double', 'bool', 'double', 'string']
-        self.sv_input_defaults = [None, None, None, None, None, None, None, None]
-        self.sv_input_access = ['item', 'item', 'item', 'item', 'list', 'item', 'item', 'item']
-        sv_inputs_nested = []
-        for name in self.sv_input_names:
-            sv_inputs_nested.append(self.inputs[name].sv_get())
-        for sv_input_nested in zip_long_repeat(*sv_inputs_nested):
-            for sv_input in zip_long_repeat(*sv_input_nested):
-                sv_input = list(sv_input)
-                for i, value in enumerate(sv_input):
-                    if self.sv_input_access[i] == 'list':
-                        if isinstance(value, (list, tuple)):
-                            values = value
-                        else:
-                            values = [value]
-                        value = [self.sv_cast(v, self.sv_input_types[i], self.sv_input_defaults[i]) for v in values]
-                        if value == [None]:
-                            value = []
-                        sv_input[i] = value
-                    else:
-                        sv_input[i] = self.sv_cast(value, self.sv_input_types[i], self.sv_input_defaults[i])
-                self.process_ladybug(*sv_input)
-        for name in self.sv_output_names:
-            value = getattr(self, '{}_out'.format(name))
-            # Not sure if this hack is correct, will find out when more nodes are generated
-            #if len(value) == 0 or not isinstance(value[0], (list, tuple)):
-            #    value = [value]
-            self.outputs[name].sv_set(value)
-
-    def sv_cast(self, value, data_type, default):
-        result = default if isinstance(value, str) and value == '' else value
-        if result is None and data_type == 'bool':
-            return False
-        elif result is not None and data_type == 'bool':
-            if result == 'True' or result == '1':
-                return True
-            elif result == 'False' or result == '0':
-                return False
-            return bool(result)
-        elif result is not None and data_type == 'int':
-            return int(result)
-        elif result is not None and data_type == 'double':
-            return float(result)
-        return result
+        op = layout.operator('node.sv_lb_socket_name', text='', icon='QUESTION', emboss=False).tooltip = 'Get a matrix containing radiation values from each patch of a sky dome. _ Creating this matrix is a necessary pre-step before doing incident radiation analysis with Rhino geometry or generating a radiation rose. _ By default, this component distributes the radiation over the patches of the sky with the Perez all-weather sky model in the same manner as Radiance\'s gendaymtx function, without the need for Radiance. If a _folder_ is connected, Radiance\'s gendaymtx is used instead. Gendaymtx is written by Ian Ashdown and Greg Ward. Morere information can be found in Radiance manual at: http://www.radiance-online.org/learning/documentation/manual-pages/pdfs/gendaymtx.pdf -'
+        layout.prop(self, 'sv_force_rerun')
 
     def process_ladybug(self, north_, _location, _direct_rad, _diffuse_rad, _hoys_, high_density_, _ground_ref_, _folder_):
 
@@ -138,7 +97,7 @@ class SvSkyMatrix(bpy.types.Node, SverchCustomTreeNode):
             raise ImportError('\nFailed to import ladybug_geometry:\n\t{}'.format(e))
         
         try:
-            from ladybug_radiance.skymatrix import SkyMatrix
+            from ladybug.skymatrix import CumulativeSkyMatrix
         except ImportError as e:
             raise ImportError('\nFailed to import ladybug:\n\t{}'.format(e))
         
@@ -148,13 +107,19 @@ class SvSkyMatrix(bpy.types.Node, SverchCustomTreeNode):
         except ImportError as e:
             raise ImportError('\nFailed to import ladybug_tools:\n\t{}'.format(e))
         
-        try:
-            from lbt_recipes.version import check_radiance_date
-        except ImportError as e:
-            raise ImportError('\nFailed to import honeybee_radiance:\n\t{}'.format(e))
+        if _folder_:  # Radiance's gendaymtx was requested
+            try:
+                from ladybug_radiance.skymatrix import SkyMatrix
+            except ImportError as e:
+                raise ImportError('\nFailed to import ladybug_radiance:\n\t{}'.format(e))
         
-        # check the istalled Radiance date and get the path to the gemdaymtx executable
-        check_radiance_date()
+            try:
+                from lbt_recipes.version import check_radiance_date
+            except ImportError as e:
+                raise ImportError('\nFailed to import honeybee_radiance:\n\t{}'.format(e))
+        
+            # check the istalled Radiance date and get the path to the gemdaymtx executable
+            check_radiance_date()
         
         
         if all_required_inputs(ghenv.Component):
@@ -170,15 +135,16 @@ class SvSkyMatrix(bpy.types.Node, SverchCustomTreeNode):
             ground_r = 0.2 if _ground_ref_ is None else _ground_ref_
         
             # create the sky matrix object
-            sky_mtx = SkyMatrix.from_components(
-                _location, _direct_rad, _diffuse_rad, _hoys_, north_, high_density_, ground_r)
             if _folder_:
+                sky_mtx = SkyMatrix.from_components(
+                    _location, _direct_rad, _diffuse_rad, _hoys_, north_, high_density_, ground_r)
                 sky_mtx.folder = _folder_
+            else:
+                sky_mtx = CumulativeSkyMatrix.from_components(
+                    _location, _direct_rad, _diffuse_rad, _hoys_, north_, high_density_, ground_r)
         
 
-        for name in self.sv_output_names:
-            if name in locals():
-                getattr(self, '{}_out'.format(name)).append([locals()[name]])
+        return locals()
 
 
 def register():
@@ -1,15 +1,20 @@
 import bpy
 import ladybug_tools.helper
 from bpy.props import StringProperty
-from sverchok.node_tree import SverchCustomTreeNode
-from sverchok.data_structure import updateNode, zip_long_repeat
+from sverchok.data_structure import updateNode
+from ladybug_tools.node import SvLadybugNode
 
 ghenv = ladybug_tools.helper.ghenv
 
-class SvDayInfo(bpy.types.Node, SverchCustomTreeNode):
+class SvDayInfo(bpy.types.Node, SvLadybugNode):
     bl_idname = 'SvDayInfo'
     bl_label = 'LB Day Solar Information'
     sv_icon = 'LB_DAYINFO'
+    sv_output_names = ['sunrise', 'sunset', 'solar_noon', 'noon_alt', 'day_length']
+    sv_input_names = ['_location', '_doy', '_depression_', 'solar_time_', 'dl_saving_']
+    sv_input_types = ['System.Object', 'int', 'double', 'bool', 'System.Object']
+    sv_input_defaults = [None, None, None, None, None]
+    sv_input_access = ['item', 'list', 'item', 'item', 'item']
     sv__location: StringProperty(
         name='_location',
         update=updateNode,
@@ -62,59 +67,6 @@ class SvDayInfo(bpy.types.Node, SverchCustomTreeNode):
     def draw_buttons(self, context, layout):
         op = layout.operator('node.sv_lb_socket_name', text='', icon='QUESTION', emboss=False).tooltip = 'Compute solar infomation about a day of the year at a particular location. This includes the time of sunrise, sunset, solar noon, and the length of the day in hours. _ Note that these times are intended to represent a typical year and they will often vary by a few minutes depending on where in the leap year cycle a given year falls. -'
 
-    def process(self):
-        if not any(socket.is_linked for socket in self.outputs):
-            return
-
-        self.sv_output_names = ['sunrise', 'sunset', 'solar_noon', 'noon_alt', 'day_length']
-        for name in self.sv_output_names:
-            setattr(self, '{}_out'.format(name), [])
-        self.sv_input_names = ['_location', '_doy', '_depression_', 'solar_time_', 'dl_saving_']
-        self.sv_input_types = ['System.Object', 'int', 'double', 'bool', 'System.Object']
-        self.sv_input_defaults = [None, None, None, None, None]
-        self.sv_input_access = ['item', 'list', 'item', 'item', 'item']
-        sv_inputs_nested = []
-        for name in self.sv_input_names:
-            sv_inputs_nested.append(self.inputs[name].sv_get())
-        for sv_input_nested in zip_long_repeat(*sv_inputs_nested):
-            for sv_input in zip_long_repeat(*sv_input_nested):
-                sv_input = list(sv_input)
-                for i, value in enumerate(sv_input):
-                    if self.sv_input_access[i] == 'list':
-                        if isinstance(value, (list, tuple)):
-                            values = value
-                        else:
-                            values = [value]
-                        value = [self.sv_cast(v, self.sv_input_types[i], self.sv_input_defaults[i]) for v in values]
-                        if value == [None]:
-                            value = []
-                        sv_input[i] = value
-                    else:
-                        sv_input[i] = self.sv_cast(value, self.sv_input_types[i], self.sv_input_defaults[i])
-                self.process_ladybug(*sv_input)
-        for name in self.sv_output_names:
-            value = getattr(self, '{}_out'.format(name))
-            # Not sure if this hack is correct, will find out when more nodes are generated
-            #if len(value) == 0 or not isinstance(value[0], (list, tuple)):
-            #    value = [value]
-            self.outputs[name].sv_set(value)
-
-    def sv_cast(self, value, data_type, default):
-        result = default if isinstance(value, str) and value == '' else value
-        if result is None and data_type == 'bool':
-            return False
-        elif result is not None and data_type == 'bool':
-            if result == 'True' or result == '1':
-                return True
-            elif result == 'False' or result == '0':
-                return False
-            return bool(result)
-        elif result is not None and data_type == 'int':
-            return int(result)
-        elif result is not None and data_type == 'double':
-            return float(result)
-        return result
-
     def process_ladybug(self, _location, _doy, _depression_, solar_time_, dl_saving_):
 
         try:
@@ -159,9 +111,7 @@ class SvDayInfo(bpy.types.Node, SverchCustomTreeNode):
                     day_length.append(None)
         
 
-        for name in self.sv_output_names:
-            if name in locals():
-                getattr(self, '{}_out'.format(name)).append([locals()[name]])
+        return locals()
 
 
 def register():
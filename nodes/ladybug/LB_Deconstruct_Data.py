@@ -1,15 +1,21 @@
 import bpy
 import ladybug_tools.helper
 from bpy.props import StringProperty
-from sverchok.node_tree import SverchCustomTreeNode
-from sverchok.data_structure import updateNode, zip_long_repeat
+from sverchok.data_structure import updateNode
+from ladybug_tools.node import SvLadybugNode
 
 ghenv = ladybug_tools.helper.ghenv
 
-class SvXData(bpy.types.Node, SverchCustomTreeNode):
+class SvXData(bpy.types.Node, SvLadybugNode):
     bl_idname = 'SvXData'
     bl_label = 'LB Deconstruct Data'
     sv_icon = 'LB_XDATA'
+    sv_output_names = ['header', 'values']
+    sv_input_names = ['_data']
+    sv_input_types = ['System.Object']
+    sv_input_defaults = [None]
+    sv_input_access = ['item']
+    sv_vectorized = True
     sv__data: StringProperty(
         name='_data',
         update=updateNode,
@@ -28,66 +34,8 @@ class SvXData(bpy.types.Node, SverchCustomTreeNode):
     def draw_buttons(self, context, layout):
         op = layout.operator('node.sv_lb_socket_name', text='', icon='QUESTION', emboss=False).tooltip = 'Deconstruct a Ladybug DataCollection into a header and values. -'
 
-    def process(self):
-        if not any(socket.is_linked for socket in self.outputs):
-            return
-
-        self.sv_output_names = ['header', 'values']
-        for name in self.sv_output_names:
-            setattr(self, '{}_out'.format(name), [])
-        self.sv_input_names = ['_data']
-        self.sv_input_types = ['System.Object']
-        self.sv_input_defaults = [None]
-        self.sv_input_access = ['item']
-        sv_inputs_nested = []
-        for name in self.sv_input_names:
-            sv_inputs_nested.append(self.inputs[name].sv_get())
-        for sv_input_nested in zip_long_repeat(*sv_inputs_nested):
-            for sv_input in zip_long_repeat(*sv_input_nested):
-                sv_input = list(sv_input)
-                for i, value in enumerate(sv_input):
-                    if self.sv_input_access[i] == 'list':
-                        if isinstance(value, (list, tuple)):
-                            values = value
-                        else:
-                            values = [value]
-                        value = [self.sv_cast(v, self.sv_input_types[i], self.sv_input_defaults[i]) for v in values]
-                        if value == [None]:
-                            value = []
-                        sv_input[i] = value
-                    else:
-                        sv_input[i] = self.sv_cast(value, self.sv_input_types[i], self.sv_input_defaults[i])
-                self.process_ladybug(*sv_input)
-        for name in self.sv_output_names:
-            value = getattr(self, '{}_out'.format(name))
-            # Not sure if this hack is correct, will find out when more nodes are generated
-            #if len(value) == 0 or not isinstance(value[0], (list, tuple)):
-            #    value = [value]
-            self.outputs[name].sv_set(value)
-
-    def sv_cast(self, value, data_type, default):
-        result = default if isinstance(value, str) and value == '' else value
-        if result is None and data_type == 'bool':
-            return False
-        elif result is not None and data_type == 'bool':
-            if result == 'True' or result == '1':
-                return True
-            elif result == 'False' or result == '0':
-                return False
-            return bool(result)
-        elif result is not None and data_type == 'int':
-            return int(result)
-        elif result is not None and data_type == 'double':
-            return float(result)
-        return result
-
     def process_ladybug(self, _data):
 
-        try:
-            from ladybug.datacollection import BaseCollection
-        except ImportError as e:
-            raise ImportError('\nFailed to import ladybug:\n\t{}'.format(e))
-        
         try:
             from ladybug_tools.sverchok import all_required_inputs
         except ImportError as e:
@@ -95,14 +43,32 @@ class SvXData(bpy.types.Node, SverchCustomTreeNode):
         
         
         if all_required_inputs(ghenv.Component):
-            assert isinstance(_data, BaseCollection), \
-                '_data must be a Data Collection. Got {}.'.format(type(_data))
-            header = _data.header
-            values = _data.values
+            header, values = deconstruct_data(_data)
+
+        return locals()
+
+    def process_ladybug_batch(self, _data):
+        """Deconstruct all of the input Data Collections with a single required input check."""
+        try:
+            from ladybug_tools.sverchok import all_required_inputs
+        except ImportError as e:
+            raise ImportError('\nFailed to import ladybug_tools:\n\t{}'.format(e))
+
+        if not all_required_inputs(ghenv.Component):
+            return [{} for _ in _data]
+        return [dict(zip(('header', 'values'), deconstruct_data(data))) for data in _data]
+
+
+def deconstruct_data(_data):
+    """Get the header and the values of a Data Collection."""
+    try:
+        from ladybug.datacollection import BaseCollection
+    except ImportError as e:
+        raise ImportError('\nFailed to import ladybug:\n\t{}'.format(e))
 
-        for name in self.sv_output_names:
-            if name in locals():
-                getattr(self, '{}_out'.format(name)).append([locals()[name]])
+    assert isinstance(_data, BaseCollection), \
+        '_data must be a Data Collection. Got {}.'.format(type(_data))
+    return _data.header, _data.values
 
 
 def register():
@@ -1,15 +1,26 @@
 import bpy
 import ladybug_tools.helper
-from bpy.props import StringProperty
-from sverchok.node_tree import SverchCustomTreeNode
-from sverchok.data_structure import updateNode, zip_long_repeat
+from bpy.props import BoolProperty, StringProperty
+from sverchok.data_structure import updateNode
+from ladybug_tools.node import SvLadybugNode
 
 ghenv = ladybug_tools.helper.ghenv
 
-class SvDirectSunHours(bpy.types.Node, SverchCustomTreeNode):
+class SvDirectSunHours(bpy.types.Node, SvLadybugNode):
     bl_idname = 'SvDirectSunHours'
     bl_label = 'LB Direct Sun Hours'
     sv_icon = 'LB_DIRECTSUNHOURS'
+    sv_output_names = ['points', 'results', 'mesh', 'legend', 'title', 'int_mtx']
+    sv_input_names = ['_vectors', '_timestep_', '_geometry', 'context_', '_grid_size', '_offset_dist_', 'legend_par_', '_cpu_count_', '_run']
+    sv_input_types = ['Vector3d', 'int', 'GeometryBase', 'GeometryBase', 'double', 'double', 'System.Object', 'int', 'bool']
+    sv_input_defaults = [None, None, None, None, None, None, None, None, None]
+    sv_input_access = ['list', 'item', 'list', 'list', 'item', 'item', 'item', 'item', 'item']
+    sv_memoize = True
+    sv_force_rerun: BoolProperty(
+        name='Force Rerun',
+        default=False,
+        update=updateNode,
+        description='Run the calculation every time the node is processed instead of reusing the outputs that were cached for the same inputs.')
     sv__vectors: StringProperty(
         name='_vectors',
         update=updateNode,
@@ -91,59 +102,7 @@ class SvDirectSunHours(bpy.types.Node, SverchCustomTreeNode):
 
     def draw_buttons(self, context, layout):
         op = layout.operator('node.sv_lb_socket_name', text='', icon='QUESTION', emboss=False).tooltip = 'Calculate the number of hours of direct sunlight received by geometry using sun vectors obtained from the "LB SunPath" component. _ Such direct sun calculations can be used for shadow studies of outdoor enviroments or can be used to estimate glare potential from direct sun on the indoors. _ Note that this component uses the CAD environment\'s ray intersection methods, which can be fast for geometries with low complexity but does not scale well for complex geometries or many test points. For such complex studies, honeybee-radiance should be used. -'
-
-    def process(self):
-        if not any(socket.is_linked for socket in self.outputs):
-            return
-
-        self.sv_output_names = ['points', 'results', 'mesh', 'legend', 'title', 'int_mtx']
-        for name in self.sv_output_names:
-            setattr(self, '{}_out'.format(name), [])
-        self.sv_input_names = ['_vectors', '_timestep_', '_geometry', 'context_', '_grid_size', '_offset_dist_', 'legend_par_', '_cpu_count_', '_run']
-        self.sv_input_types = ['Vector3d', 'int', 'GeometryBase', 'GeometryBase', 'double', 'double', 'System.Object', 'int', 'bool']
-        self.sv_input_defaults = [None, None, None, None, None, None, None, None, None]
-        self.sv_input_access = ['list', 'item', 'list', 'list', 'item', 'item', 'item', 'item', 'item']
-        sv_inputs_nested = []
-        for name in self.sv_input_names:
-            sv_inputs_nested.append(self.inputs[name].sv_get())
-        for sv_input_nested in zip_long_repeat(*sv_inputs_nested):
-            for sv_input in zip_long_repeat(*sv_input_nested):
-                sv_input = list(sv_input)
-                for i, value in enumerate(sv_input):
-                    if self.sv_input_access[i] == 'list':
-                        if isinstance(value, (list, tuple)):
-                            values = value
-                        else:
-                            values = [value]
-                        value = [self.sv_cast(v, self.sv_input_types[i], self.sv_input_defaults[i]) for v in values]
-                        if value == [None]:
-                            value = []
-                        sv_input[i] = value
-                    else:
-                        sv_input[i] = self.sv_cast(value, self.sv_input_types[i], self.sv_input_defaults[i])
-                self.process_ladybug(*sv_input)
-        for name in self.sv_output_names:
-            value = getattr(self, '{}_out'.format(name))
-            # Not sure if this hack is correct, will find out when more nodes are generated
-            #if len(value) == 0 or not isinstance(value[0], (list, tuple)):
-            #    value = [value]
-            self.outputs[name].sv_set(value)
-
-    def sv_cast(self, value, data_type, default):
-        result = default if isinstance(value, str) and value == '' else value
-        if result is None and data_type == 'bool':
-            return False
-        elif result is not None and data_type == 'bool':
-            if result == 'True' or result == '1':
-                return True
-            elif result == 'False' or result == '0':
-                return False
-            return bool(result)
-        elif result is not None and data_type == 'int':
-            return int(result)
-        elif result is not None and data_type == 'double':
-            return float(result)
-        return result
+        layout.prop(self, 'sv_force_rerun')
 
     def process_ladybug(self, _vectors, _timestep_, _geometry, context_, _grid_size, _offset_dist_, legend_par_, _cpu_count_, _run):
 
@@ -159,7 +118,8 @@ class SvDirectSunHours(bpy.types.Node, SverchCustomTreeNode):
             from ladybug_tools.fromgeometry import from_mesh3d, from_point3d, from_vector3d
             from ladybug_tools.fromobjects import legend_objects
             from ladybug_tools.text import text_objects
-            from ladybug_tools.intersect import join_geometry_to_mesh, intersect_mesh_rays
+            from ladybug_tools.intersect import join_geometry_to_mesh, intersection_matrix
+            from ladybug_tools.visibility import visibility_matrix_store
             from ladybug_tools.sverchok import all_required_inputs, hide_output, \
                 show_output, objectify_output, recommended_processor_count
         except ImportError as e:
@@ -186,15 +146,16 @@ class SvDirectSunHours(bpy.types.Node, SverchCustomTreeNode):
             normals = [from_vector3d(vec) for vec in study_mesh.face_normals]
         
             # intersect the rays with the mesh
-            int_matrix, angles = intersect_mesh_rays(
-                shade_mesh, points, rev_vec, normals, cpu_count=workers)
+            int_matrix = intersection_matrix(
+                shade_mesh, points, rev_vec, normals, cpu_count=workers,
+                store=visibility_matrix_store, cosine_type=None)
         
             # compute the results
             int_mtx = objectify_output('Sun Intersection Matrix', int_matrix)
             if _timestep_ and _timestep_ != 1:  # divide by the timestep before output
-                results = [sum(int_list) / _timestep_ for int_list in int_matrix]
+                results = [count / _timestep_ for count in int_matrix.unblocked_counts()]
             else:  # no division required
-                results = [sum(int_list) for int_list in int_matrix]
+                results = int_matrix.unblocked_counts()
         
             # create the mesh and legend outputs
             graphic = GraphicContainer(results, study_mesh.min, study_mesh.max, legend_par_)
@@ -206,14 +167,12 @@ class SvDirectSunHours(bpy.types.Node, SverchCustomTreeNode):
                                  graphic.legend_parameters.font)
         
             # create all of the visual outputs
-            study_mesh.colors = graphic.value_colors
+            study_mesh.colors = graphic.value_color_array
             mesh = from_mesh3d(study_mesh)
             legend = legend_objects(graphic.legend)
         
 
-        for name in self.sv_output_names:
-            if name in locals():
-                getattr(self, '{}_out'.format(name)).append([locals()[name]])
+        return locals()
 
 
 def register():
@@ -1,15 +1,21 @@
 import bpy
 import ladybug_tools.helper
 from bpy.props import StringProperty
-from sverchok.node_tree import SverchCustomTreeNode
-from sverchok.data_structure import updateNode, zip_long_repeat
+from sverchok.data_structure import updateNode
+from ladybug_tools.node import SvLadybugNode
 
 ghenv = ladybug_tools.helper.ghenv
 
-class SvDirSolar(bpy.types.Node, SverchCustomTreeNode):
+class SvDirSolar(bpy.types.Node, SvLadybugNode):
     bl_idname = 'SvDirSolar'
     bl_label = 'LB Directional Solar Irradiance'
     sv_icon = 'LB_DIRSOLAR'
+    sv_output_names = ['total', 'direct', 'diff', 'reflect']
+    sv_input_names = ['_location', '_direct_norm', '_diffuse_horiz', '_srf_azimuth_', '_srf_altitude_', '_ground_ref_', 'anisotrophic_']
+    sv_input_types = ['System.Object', 'System.Object', 'System.Object', 'double', 'double', 'double', 'bool']
+    sv_input_defaults = [None, None, None, None, None, None, None]
+    sv_input_access = ['item', 'item', 'item', 'item', 'item', 'item', 'item']
+    sv_vectorized = True
     sv__location: StringProperty(
         name='_location',
         update=updateNode,
@@ -74,67 +80,11 @@ class SvDirSolar(bpy.types.Node, SverchCustomTreeNode):
     def draw_buttons(self, context, layout):
         op = layout.operator('node.sv_lb_socket_name', text='', icon='QUESTION', emboss=False).tooltip = 'Compute the hourly solar irradiance or illuminance falling on an unobstructed surface that faces any direction. _ The calculation method of this component is faster than running "LB Incident Radiation" studies on an hour-by-hour basis and it is slighty more realistic since it accounts for ground reflection. However, this comes at the cost of not being able to account for any obstructions that block the sun. -'
 
-    def process(self):
-        if not any(socket.is_linked for socket in self.outputs):
-            return
-
-        self.sv_output_names = ['total', 'direct', 'diff', 'reflect']
-        for name in self.sv_output_names:
-            setattr(self, '{}_out'.format(name), [])
-        self.sv_input_names = ['_location', '_direct_norm', '_diffuse_horiz', '_srf_azimuth_', '_srf_altitude_', '_ground_ref_', 'anisotrophic_']
-        self.sv_input_types = ['System.Object', 'System.Object', 'System.Object', 'double', 'double', 'double', 'bool']
-        self.sv_input_defaults = [None, None, None, None, None, None, None]
-        self.sv_input_access = ['item', 'item', 'item', 'item', 'item', 'item', 'item']
-        sv_inputs_nested = []
-        for name in self.sv_input_names:
-            sv_inputs_nested.append(self.inputs[name].sv_get())
-        for sv_input_nested in zip_long_repeat(*sv_inputs_nested):
-            for sv_input in zip_long_repeat(*sv_input_nested):
-                sv_input = list(sv_input)
-                for i, value in enumerate(sv_input):
-                    if self.sv_input_access[i] == 'list':
-                        if isinstance(value, (list, tuple)):
-                            values = value
-                        else:
-                            values = [value]
-                        value = [self.sv_cast(v, self.sv_input_types[i], self.sv_input_defaults[i]) for v in values]
-                        if value == [None]:
-                            value = []
-                        sv_input[i] = value
-                    else:
-                        sv_input[i] = self.sv_cast(value, self.sv_input_types[i], self.sv_input_defaults[i])
-                self.process_ladybug(*sv_input)
-        for name in self.sv_output_names:
-            value = getattr(self, '{}_out'.format(name))
-            # Not sure if this hack is correct, will find out when more nodes are generated
-            #if len(value) == 0 or not isinstance(value[0], (list, tuple)):
-            #    value = [value]
-            self.outputs[name].sv_set(value)
-
-    def sv_cast(self, value, data_type, default):
-        result = default if isinstance(value, str) and value == '' else value
-        if result is None and data_type == 'bool':
-            return False
-        elif result is not None and data_type == 'bool':
-            if result == 'True' or result == '1':
-                return True
-            elif result == 'False' or result == '0':
-                return False
-            return bool(result)
-        elif result is not None and data_type == 'int':
-            return int(result)
-        elif result is not None and data_type == 'double':
-            return float(result)
-        return result
-
     def process_ladybug(self, _location, _direct_norm, _diffuse_horiz, _srf_azimuth_, _srf_altitude_, _ground_ref_, anisotrophic_):
 
         
         try:
             from ladybug.wea import Wea
-            from ladybug.datacollection import HourlyContinuousCollection
-            from ladybug.header import Header
-            from ladybug.datatype.illuminance import Illuminance
         except ImportError as e:
             raise ImportError('\nFailed to import ladybug:\n\t{}'.format(e))
         
@@ -143,42 +93,94 @@ class SvDirSolar(bpy.types.Node, SverchCustomTreeNode):
         except ImportError as e:
             raise ImportError('\nFailed to import ladybug_tools:\n\t{}'.format(e))
         
-        def rad_to_ill(data):
-            """Change the data type of an input collection from irradiane to illuminance."""
-            head = data.header
-            new_header = Header(Illuminance(), 'lux', head.analysis_period, head.metadata)
-            return HourlyContinuousCollection(new_header, data.values) if \
-                isinstance(data, HourlyContinuousCollection) else \
-                data.__class__(new_header, data.values, data.datetimes)
-        
         
         if all_required_inputs(ghenv.Component):
             # set default values
-            az = _srf_azimuth_ if _srf_azimuth_ is not None else 180
-            alt = _srf_altitude_ if _srf_altitude_ is not None else 0
-            gref = _ground_ref_ if _ground_ref_ is not None else 0.2
-            isot = not anisotrophic_
+            az, alt, gref, isot = orientation_defaults(
+                _srf_azimuth_, _srf_altitude_, _ground_ref_, anisotrophic_)
         
             # create the Wea and output irradaince
             wea = Wea(_location, _direct_norm, _diffuse_horiz)
-            total, direct, diff, reflect = \
-                wea.directional_irradiance(alt, az, gref, isot)
-            for dat in (total, direct, diff, reflect):
-                dat.header.metadata['altitude'] = alt
-                dat.header.metadata['azimuth'] = az
-        
-            # convert to illuminace if input data was illuiminance
-            if isinstance(_direct_norm.header.data_type, Illuminance):
-                total = rad_to_ill(total)
-                direct = rad_to_ill(direct)
-                diff = rad_to_ill(diff)
-                reflect = rad_to_ill(reflect)
+            total, direct, diff, reflect = directional_outputs(
+                wea.directional_irradiance(alt, az, gref, isot), alt, az, _direct_norm)
         
 
-        for name in self.sv_output_names:
-            if name in locals():
-                getattr(self, '{}_out'.format(name)).append([locals()[name]])
+        return locals()
+
+    def process_ladybug_batch(self, _location, _direct_norm, _diffuse_horiz, _srf_azimuth_,
+                              _srf_altitude_, _ground_ref_, anisotrophic_):
+        """Compute the irradiance of all orientations that share the same Wea at once."""
+        try:
+            from ladybug.wea import Wea
+        except ImportError as e:
+            raise ImportError('\nFailed to import ladybug:\n\t{}'.format(e))
+
+        try:
+            from ladybug_tools.sverchok import all_required_inputs
+        except ImportError as e:
+            raise ImportError('\nFailed to import ladybug_tools:\n\t{}'.format(e))
+
+        results = [{} for _ in _location]
+        if not all_required_inputs(ghenv.Component):
+            return results
+
+        # group the combinations of inputs that share the same Wea and sky settings
+        groups = {}
+        for i, (loc, dir_norm, diff_horiz, az, alt, gref, aniso) in enumerate(zip(
+                _location, _direct_norm, _diffuse_horiz, _srf_azimuth_, _srf_altitude_,
+                _ground_ref_, anisotrophic_)):
+            az, alt, gref, isot = orientation_defaults(az, alt, gref, aniso)
+            key = (id(loc), id(dir_norm), id(diff_horiz), gref, isot)
+            groups.setdefault(key, (loc, dir_norm, diff_horiz, []))[3].append((i, alt, az))
+
+        # compute the irradiance for all orientations of each group
+        for (_, _, _, gref, isot), (loc, dir_norm, diff_horiz, items) in groups.items():
+            wea = Wea(loc, dir_norm, diff_horiz)
+            orientations = [(alt, az) for _, alt, az in items]
+            components = wea.directional_irradiances(orientations, gref, isot)
+            for j, (i, alt, az) in enumerate(items):
+                datas = directional_outputs(
+                    [comp[j] for comp in components], alt, az, dir_norm)
+                results[i] = dict(zip(('total', 'direct', 'diff', 'reflect'), datas))
+        return results
+
+
+def orientation_defaults(_srf_azimuth_, _srf_altitude_, _ground_ref_, anisotrophic_):
+    """Get the azimuth, altitude, ground reflectance and isotropic sky with defaults set."""
+    az = _srf_azimuth_ if _srf_azimuth_ is not None else 180
+    alt = _srf_altitude_ if _srf_altitude_ is not None else 0
+    gref = _ground_ref_ if _ground_ref_ is not None else 0.2
+    return az, alt, gref, not anisotrophic_
+
+
+def directional_outputs(datas, alt, az, _direct_norm):
+    """Note the orientation of the irradiance collections in their metadata.
+
+    The collections are converted to illuminance if the input data was illuminance.
+    """
+    try:
+        from ladybug.datacollection import HourlyContinuousCollection
+        from ladybug.header import Header
+        from ladybug.datatype.illuminance import Illuminance
+    except ImportError as e:
+        raise ImportError('\nFailed to import ladybug:\n\t{}'.format(e))
+
+    def rad_to_ill(data):
+        """Change the data type of an input collection from irradiane to illuminance."""
+        head = data.header
+        new_header = Header(Illuminance(), 'lux', head.analysis_period, head.metadata)
+        return HourlyContinuousCollection(new_header, data.values) if \
+            isinstance(data, HourlyContinuousCollection) else \
+            data.__class__(new_header, data.values, data.datetimes)
+
+    for dat in datas:
+        dat.header.metadata['altitude'] = alt
+        dat.header.metadata['azimuth'] = az
 
+    # convert to illuminace if input data was illuiminance
+    if isinstance(_direct_norm.header.data_type, Illuminance):
+        return tuple(rad_to_ill(dat) for dat in datas)
+    return tuple(datas)
 
 def register():
     bpy.utils.register_class(SvDirSolar)
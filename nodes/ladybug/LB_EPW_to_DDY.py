@@ -1,15 +1,20 @@
 import bpy
 import ladybug_tools.helper
 from bpy.props import StringProperty
-from sverchok.node_tree import SverchCustomTreeNode
-from sverchok.data_structure import updateNode, zip_long_repeat
+from sverchok.data_structure import updateNode
+from ladybug_tools.node import SvLadybugNode
 
 ghenv = ladybug_tools.helper.ghenv
 
-class SvEPWtoDDY(bpy.types.Node, SverchCustomTreeNode):
+class SvEPWtoDDY(bpy.types.Node, SvLadybugNode):
     bl_idname = 'SvEPWtoDDY'
     bl_label = 'LB EPW to DDY'
     sv_icon = 'LB_EPWTODDY'
+    sv_output_names = ['ddy_file']
+    sv_input_names = ['_weather_file', '_percentile_', 'monthly_cool_', '_folder_', '_write']
+    sv_input_types = ['string', 'double', 'bool', 'string', 'bool']
+    sv_input_defaults = [None, None, None, None, None]
+    sv_input_access = ['item', 'item', 'item', 'item', 'item']
     sv__weather_file: StringProperty(
         name='_weather_file',
         update=updateNode,
@@ -54,59 +59,6 @@ class SvEPWtoDDY(bpy.types.Node, SverchCustomTreeNode):
     def draw_buttons(self, context, layout):
         op = layout.operator('node.sv_lb_socket_name', text='', icon='QUESTION', emboss=False).tooltip = 'Produce a DDY file from the data contained within an EPW or STAT file. _ For EPW files, this method will first check if there is any heating or cooling design day information contained within the EPW itself. If None is found, the heating and cooling design days will be derived from analysis of the annual data within the EPW. This process of analyzing the annual TMY data is less representative of the climate since only one year of data is used to derive the DDY (instead of the usual multi-year analysis). However, if the EPW is the best available representation of the climate for a given site, it can often be preferable to using a DDY constructed with more years of data but from further away. Information on the uncertainty introduced by using only one year of data to create design days can be found in AHSRAE HOF 2013, Chapter 14.14. _ For STAT files, the DDY file will only be produced if the design day information is found within the file. If no information on the relevant design days are found, and error will be raised and the component will fail to run. -'
 
-    def process(self):
-        if not any(socket.is_linked for socket in self.outputs):
-            return
-
-        self.sv_output_names = ['ddy_file']
-        for name in self.sv_output_names:
-            setattr(self, '{}_out'.format(name), [])
-        self.sv_input_names = ['_weather_file', '_percentile_', 'monthly_cool_', '_folder_', '_write']
-        self.sv_input_types = ['string', 'double', 'bool', 'string', 'bool']
-        self.sv_input_defaults = [None, None, None, None, None]
-        self.sv_input_access = ['item', 'item', 'item', 'item', 'item']
-        sv_inputs_nested = []
-        for name in self.sv_input_names:
-            sv_inputs_nested.append(self.inputs[name].sv_get())
-        for sv_input_nested in zip_long_repeat(*sv_inputs_nested):
-            for sv_input in zip_long_repeat(*sv_input_nested):
-                sv_input = list(sv_input)
-                for i, value in enumerate(sv_input):
-                    if self.sv_input_access[i] == 'list':
-                        if isinstance(value, (list, tuple)):
-                            values = value
-                        else:
-                            values = [value]
-                        value = [self.sv_cast(v, self.sv_input_types[i], self.sv_input_defaults[i]) for v in values]
-                        if value == [None]:
-                            value = []
-                        sv_input[i] = value
-                    else:
-                        sv_input[i] = self.sv_cast(value, self.sv_input_types[i], self.sv_input_defaults[i])
-                self.process_ladybug(*sv_input)
-        for name in self.sv_output_names:
-            value = getattr(self, '{}_out'.format(name))
-            # Not sure if this hack is correct, will find out when more nodes are generated
-            #if len(value) == 0 or not isinstance(value[0], (list, tuple)):
-            #    value = [value]
-            self.outputs[name].sv_set(value)
-
-    def sv_cast(self, value, data_type, default):
-        result = default if isinstance(value, str) and value == '' else value
-        if result is None and data_type == 'bool':
-            return False
-        elif result is not None and data_type == 'bool':
-            if result == 'True' or result == '1':
-                return True
-            elif result == 'False' or result == '0':
-                return False
-            return bool(result)
-        elif result is not None and data_type == 'int':
-            return int(result)
-        elif result is not None and data_type == 'double':
-            return float(result)
-        return result
-
     def process_ladybug(self, _weather_file, _percentile_, monthly_cool_, _folder_, _write):
 
         import os
@@ -151,9 +103,7 @@ class SvEPWtoDDY(bpy.types.Node, SverchCustomTreeNode):
                     if monthly_cool_ else stat.to_ddy(f_path, _percentile_)
         
 
-        for name in self.sv_output_names:
-            if name in locals():
-                getattr(self, '{}_out'.format(name)).append([locals()[name]])
+        return locals()
 
 
 def register():
@@ -1,15 +1,26 @@
 import bpy
 import ladybug_tools.helper
-from bpy.props import StringProperty
-from sverchok.node_tree import SverchCustomTreeNode
-from sverchok.data_structure import updateNode, zip_long_repeat
+from bpy.props import BoolProperty, StringProperty
+from sverchok.data_structure import updateNode
+from ladybug_tools.node import SvLadybugNode
 
 ghenv = ladybug_tools.helper.ghenv
 
-class SvHumanToSky(bpy.types.Node, SverchCustomTreeNode):
+class SvHumanToSky(bpy.types.Node, SvLadybugNode):
     bl_idname = 'SvHumanToSky'
     bl_label = 'LB Human to Sky Relation'
     sv_icon = 'LB_HUMANTOSKY'
+    sv_output_names = ['human_points', 'human_line', 'fract_body_exp', 'sky_exposure']
+    sv_input_names = ['north_', '_location', '_position', '_context', '_pt_count_', '_height_', '_cpu_count_', '_run']
+    sv_input_types = ['System.Object', 'System.Object', 'Point3d', 'GeometryBase', 'int', 'double', 'int', 'bool']
+    sv_input_defaults = [None, None, None, None, None, None, None, None]
+    sv_input_access = ['item', 'item', 'list', 'list', 'item', 'item', 'item', 'item']
+    sv_memoize = True
+    sv_force_rerun: BoolProperty(
+        name='Force Rerun',
+        default=False,
+        update=updateNode,
+        description='Run the calculation every time the node is processed instead of reusing the outputs that were cached for the same inputs.')
     sv_north_: StringProperty(
         name='north_',
         update=updateNode,
@@ -80,59 +91,7 @@ class SvHumanToSky(bpy.types.Node, SverchCustomTreeNode):
 
     def draw_buttons(self, context, layout):
         op = layout.operator('node.sv_lb_socket_name', text='', icon='QUESTION', emboss=False).tooltip = 'Calculate parameters for the relationship between human geometry and the sky given the position of a human subject and context geometry surrounding this position. _ The outputs of this component can be plugged into either the "LB Outdoor Solar MRT" or the "LB Indoor Solar MRT" in order to account for context shading around a human subject in these MRT calculations. -'
-
-    def process(self):
-        if not any(socket.is_linked for socket in self.outputs):
-            return
-
-        self.sv_output_names = ['human_points', 'human_line', 'fract_body_exp', 'sky_exposure']
-        for name in self.sv_output_names:
-            setattr(self, '{}_out'.format(name), [])
-        self.sv_input_names = ['north_', '_location', '_position', '_context', '_pt_count_', '_height_', '_cpu_count_', '_run']
-        self.sv_input_types = ['System.Object', 'System.Object', 'Point3d', 'GeometryBase', 'int', 'double', 'int', 'bool']
-        self.sv_input_defaults = [None, None, None, None, None, None, None, None]
-        self.sv_input_access = ['item', 'item', 'list', 'list', 'item', 'item', 'item', 'item']
-        sv_inputs_nested = []
-        for name in self.sv_input_names:
-            sv_inputs_nested.append(self.inputs[name].sv_get())
-        for sv_input_nested in zip_long_repeat(*sv_inputs_nested):
-            for sv_input in zip_long_repeat(*sv_input_nested):
-                sv_input = list(sv_input)
-                for i, value in enumerate(sv_input):
-                    if self.sv_input_access[i] == 'list':
-                        if isinstance(value, (list, tuple)):
-                            values = value
-                        else:
-                            values = [value]
-                        value = [self.sv_cast(v, self.sv_input_types[i], self.sv_input_defaults[i]) for v in values]
-                        if value == [None]:
-                            value = []
-                        sv_input[i] = value
-                    else:
-                        sv_input[i] = self.sv_cast(value, self.sv_input_types[i], self.sv_input_defaults[i])
-                self.process_ladybug(*sv_input)
-        for name in self.sv_output_names:
-            value = getattr(self, '{}_out'.format(name))
-            # Not sure if this hack is correct, will find out when more nodes are generated
-            #if len(value) == 0 or not isinstance(value[0], (list, tuple)):
-            #    value = [value]
-            self.outputs[name].sv_set(value)
-
-    def sv_cast(self, value, data_type, default):
-        result = default if isinstance(value, str) and value == '' else value
-        if result is None and data_type == 'bool':
-            return False
-        elif result is not None and data_type == 'bool':
-            if result == 'True' or result == '1':
-                return True
-            elif result == 'False' or result == '0':
-                return False
-            return bool(result)
-        elif result is not None and data_type == 'int':
-            return int(result)
-        elif result is not None and data_type == 'double':
-            return float(result)
-        return result
+        layout.prop(self, 'sv_force_rerun')
 
     def process_ladybug(self, north_, _location, _position, _context, _pt_count_, _height_, _cpu_count_, _run):
 
@@ -147,6 +106,7 @@ class SvHumanToSky(bpy.types.Node, SverchCustomTreeNode):
         
         try:
             from ladybug.sunpath import Sunpath
+            from ladybug.suncache import sun_position_cache
             from ladybug.viewsphere import view_sphere
             from ladybug.datacollection import HourlyContinuousCollection
             from ladybug.header import Header
@@ -262,13 +222,10 @@ class SvHumanToSky(bpy.types.Node, SverchCustomTreeNode):
         
                 # generate the sun vectors for each sun-up hour of the year
                 sp = Sunpath.from_location(_location, north_)
-                sun_vecs = []
-                day_pattern = []
-                for hoy in range(8760):
-                    sun = sp.calculate_sun_from_hoy(hoy)
-                    day_pattern.append(sun.is_during_day)
-                    if sun.is_during_day:
-                        sun_vecs.append(from_vector3d(sun.sun_vector_reversed))
+                sun_pos = sun_position_cache.sun_positions(sp)
+                day_pattern = sun_pos.is_during_day
+                sun_vecs = [from_vector3d(vec) for vec, is_day in
+                            zip(sun_pos.sun_vectors_reversed, day_pattern) if is_day]
         
                 # intersect the sun vectors with the context and compute fraction exposed
                 sun_int_matrix, angles = intersect_mesh_rays(
@@ -291,9 +248,7 @@ class SvHumanToSky(bpy.types.Node, SverchCustomTreeNode):
                         sky_exposure_from_mtx(sky_int_matrix[i:i + _pt_count_], patch_wghts))
         
 
-        for name in self.sv_output_names:
-            if name in locals():
-                getattr(self, '{}_out'.format(name)).append([locals()[name]])
+        return locals()
 
 
 def register():
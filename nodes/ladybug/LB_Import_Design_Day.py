@@ -1,15 +1,20 @@
 import bpy
 import ladybug_tools.helper
 from bpy.props import StringProperty
-from sverchok.node_tree import SverchCustomTreeNode
-from sverchok.data_structure import updateNode, zip_long_repeat
+from sverchok.data_structure import updateNode
+from ladybug_tools.node import SvLadybugNode
 
 ghenv = ladybug_tools.helper.ghenv
 
-class SvImportDesignDay(bpy.types.Node, SverchCustomTreeNode):
+class SvImportDesignDay(bpy.types.Node, SvLadybugNode):
     bl_idname = 'SvImportDesignDay'
     bl_label = 'LB Import Design Day'
     sv_icon = 'LB_IMPORTDESIGNDAY'
+    sv_output_names = ['location', 'dry_bulb_temperature', 'dew_point_temperature', 'relative_humidity', 'wind_speed', 'wind_direction', 'direct_normal_rad', 'diffuse_horizontal_rad', 'global_horizontal_rad', 'horizontal_infrared_rad', 'total_sky_cover', 'barometric_pressure']
+    sv_input_names = ['_design_day']
+    sv_input_types = ['System.Object']
+    sv_input_defaults = [None]
+    sv_input_access = ['item']
     sv__design_day: StringProperty(
         name='_design_day',
         update=updateNode,
@@ -48,59 +53,6 @@ class SvImportDesignDay(bpy.types.Node, SverchCustomTreeNode):
     def draw_buttons(self, context, layout):
         op = layout.operator('node.sv_lb_socket_name', text='', icon='QUESTION', emboss=False).tooltip = 'Import hourly climate data from a Ladybug DesignDay object. -'
 
-    def process(self):
-        if not any(socket.is_linked for socket in self.outputs):
-            return
-
-        self.sv_output_names = ['location', 'dry_bulb_temperature', 'dew_point_temperature', 'relative_humidity', 'wind_speed', 'wind_direction', 'direct_normal_rad', 'diffuse_horizontal_rad', 'global_horizontal_rad', 'horizontal_infrared_rad', 'total_sky_cover', 'barometric_pressure']
-        for name in self.sv_output_names:
-            setattr(self, '{}_out'.format(name), [])
-        self.sv_input_names = ['_design_day']
-        self.sv_input_types = ['System.Object']
-        self.sv_input_defaults = [None]
-        self.sv_input_access = ['item']
-        sv_inputs_nested = []
-        for name in self.sv_input_names:
-            sv_inputs_nested.append(self.inputs[name].sv_get())
-        for sv_input_nested in zip_long_repeat(*sv_inputs_nested):
-            for sv_input in zip_long_repeat(*sv_input_nested):
-                sv_input = list(sv_input)
-                for i, value in enumerate(sv_input):
-                    if self.sv_input_access[i] == 'list':
-                        if isinstance(value, (list, tuple)):
-                            values = value
-                        else:
-                            values = [value]
-                        value = [self.sv_cast(v, self.sv_input_types[i], self.sv_input_defaults[i]) for v in values]
-                        if value == [None]:
-                            value = []
-                        sv_input[i] = value
-                    else:
-                        sv_input[i] = self.sv_cast(value, self.sv_input_types[i], self.sv_input_defaults[i])
-                self.process_ladybug(*sv_input)
-        for name in self.sv_output_names:
-            value = getattr(self, '{}_out'.format(name))
-            # Not sure if this hack is correct, will find out when more nodes are generated
-            #if len(value) == 0 or not isinstance(value[0], (list, tuple)):
-            #    value = [value]
-            self.outputs[name].sv_set(value)
-
-    def sv_cast(self, value, data_type, default):
-        result = default if isinstance(value, str) and value == '' else value
-        if result is None and data_type == 'bool':
-            return False
-        elif result is not None and data_type == 'bool':
-            if result == 'True' or result == '1':
-                return True
-            elif result == 'False' or result == '0':
-                return False
-            return bool(result)
-        elif result is not None and data_type == 'int':
-            return int(result)
-        elif result is not None and data_type == 'double':
-            return float(result)
-        return result
-
     def process_ladybug(self, _design_day):
 
         try:
@@ -122,9 +74,7 @@ class SvImportDesignDay(bpy.types.Node, SverchCustomTreeNode):
             barometric_pressure = _design_day.hourly_barometric_pressure
         
 
-        for name in self.sv_output_names:
-            if name in locals():
-                getattr(self, '{}_out'.format(name)).append([locals()[name]])
+        return locals()
 
 
 def register():
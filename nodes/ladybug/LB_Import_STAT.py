@@ -1,15 +1,26 @@
 import bpy
 import ladybug_tools.helper
-from bpy.props import StringProperty
-from sverchok.node_tree import SverchCustomTreeNode
-from sverchok.data_structure import updateNode, zip_long_repeat
+from bpy.props import BoolProperty, StringProperty
+from sverchok.data_structure import updateNode
+from ladybug_tools.node import SvLadybugNode
 
 ghenv = ladybug_tools.helper.ghenv
 
-class SvImportSTAT(bpy.types.Node, SverchCustomTreeNode):
+class SvImportSTAT(bpy.types.Node, SvLadybugNode):
     bl_idname = 'SvImportSTAT'
     bl_label = 'LB Import STAT'
     sv_icon = 'LB_IMPORTSTAT'
+    sv_output_names = ['location', 'ashrae_zone', 'koppen_zone', 'clear_dir_norm_rad', 'clear_diff_horiz_rad', 'ann_heat_dday_996', 'ann_heat_dday_990', 'ann_cool_dday_004', 'ann_cool_dday_010', 'monthly_ddays_050', 'monthly_ddays_100', 'extreme_cold_week', 'extreme_hot_week', 'typical_weeks']
+    sv_input_names = ['_stat_file']
+    sv_input_types = ['string']
+    sv_input_defaults = [None]
+    sv_input_access = ['item']
+    sv_memoize = True
+    sv_force_rerun: BoolProperty(
+        name='Force Rerun',
+        default=False,
+        update=updateNode,
+        description='Run the calculation every time the node is processed instead of reusing the outputs that were cached for the same inputs.')
     sv__stat_file: StringProperty(
         name='_stat_file',
         update=updateNode,
@@ -51,59 +62,7 @@ class SvImportSTAT(bpy.types.Node, SverchCustomTreeNode):
 
     def draw_buttons(self, context, layout):
         op = layout.operator('node.sv_lb_socket_name', text='', icon='QUESTION', emboss=False).tooltip = 'Import data from a standard .stat file. -'
-
-    def process(self):
-        if not any(socket.is_linked for socket in self.outputs):
-            return
-
-        self.sv_output_names = ['location', 'ashrae_zone', 'koppen_zone', 'clear_dir_norm_rad', 'clear_diff_horiz_rad', 'ann_heat_dday_996', 'ann_heat_dday_990', 'ann_cool_dday_004', 'ann_cool_dday_010', 'monthly_ddays_050', 'monthly_ddays_100', 'extreme_cold_week', 'extreme_hot_week', 'typical_weeks']
-        for name in self.sv_output_names:
-            setattr(self, '{}_out'.format(name), [])
-        self.sv_input_names = ['_stat_file']
-        self.sv_input_types = ['string']
-        self.sv_input_defaults = [None]
-        self.sv_input_access = ['item']
-        sv_inputs_nested = []
-        for name in self.sv_input_names:
-            sv_inputs_nested.append(self.inputs[name].sv_get())
-        for sv_input_nested in zip_long_repeat(*sv_inputs_nested):
-            for sv_input in zip_long_repeat(*sv_input_nested):
-                sv_input = list(sv_input)
-                for i, value in enumerate(sv_input):
-                    if self.sv_input_access[i] == 'list':
-                        if isinstance(value, (list, tuple)):
-                            values = value
-                        else:
-                            values = [value]
-                        value = [self.sv_cast(v, self.sv_input_types[i], self.sv_input_defaults[i]) for v in values]
-                        if value == [None]:
-                            value = []
-                        sv_input[i] = value
-                    else:
-                        sv_input[i] = self.sv_cast(value, self.sv_input_types[i], self.sv_input_defaults[i])
-                self.process_ladybug(*sv_input)
-        for name in self.sv_output_names:
-            value = getattr(self, '{}_out'.format(name))
-            # Not sure if this hack is correct, will find out when more nodes are generated
-            #if len(value) == 0 or not isinstance(value[0], (list, tuple)):
-            #    value = [value]
-            self.outputs[name].sv_set(value)
-
-    def sv_cast(self, value, data_type, default):
-        result = default if isinstance(value, str) and value == '' else value
-        if result is None and data_type == 'bool':
-            return False
-        elif result is not None and data_type == 'bool':
-            if result == 'True' or result == '1':
-                return True
-            elif result == 'False' or result == '0':
-                return False
-            return bool(result)
-        elif result is not None and data_type == 'int':
-            return int(result)
-        elif result is not None and data_type == 'double':
-            return float(result)
-        return result
+        layout.prop(self, 'sv_force_rerun')
 
     def process_ladybug(self, _stat_file):
 
@@ -155,9 +114,7 @@ class SvImportSTAT(bpy.types.Node, SverchCustomTreeNode):
                     typical_weeks.append(wk)
             typical_weeks.extend(stat_obj.other_typical_weeks)
 
-        for name in self.sv_output_names:
-            if name in locals():
-                getattr(self, '{}_out'.format(name)).append([locals()[name]])
+        return locals()
 
 
 def register():
@@ -1,15 +1,31 @@
 import bpy
 import ladybug_tools.helper
-from bpy.props import StringProperty
-from sverchok.node_tree import SverchCustomTreeNode
-from sverchok.data_structure import updateNode, zip_long_repeat
+from bpy.props import BoolProperty, StringProperty
+from sverchok.data_structure import updateNode
+from ladybug_tools.node import SvLadybugNode
 
 ghenv = ladybug_tools.helper.ghenv
 
-class SvIncidentRadiation(bpy.types.Node, SverchCustomTreeNode):
+class SvIncidentRadiation(bpy.types.Node, SvLadybugNode):
     bl_idname = 'SvIncidentRadiation'
     bl_label = 'LB Incident Radiation'
     sv_icon = 'LB_INCIDENTRADIATION'
+    sv_output_names = ['points', 'results', 'total', 'mesh', 'legend', 'title', 'int_mtx']
+    sv_input_names = ['_sky_mtx', '_geometry', 'context_', '_grid_size', '_offset_dist_', 'irradiance_', 'legend_par_', '_cpu_count_', '_run']
+    sv_input_types = ['System.Object', 'GeometryBase', 'GeometryBase', 'double', 'double', 'bool', 'System.Object', 'int', 'bool']
+    sv_input_defaults = [None, None, None, None, None, None, None, None, None]
+    sv_input_access = ['item', 'list', 'list', 'item', 'item', 'item', 'item', 'item', 'item']
+    sv_memoize = True
+    sv_force_rerun: BoolProperty(
+        name='Force Rerun',
+        default=False,
+        update=updateNode,
+        description='Run the calculation every time the node is processed instead of reusing the outputs that were cached for the same inputs.')
+    sv_half_precision: BoolProperty(
+        name='Half Precision',
+        default=False,
+        update=updateNode,
+        description='Store the cosines of the rays in the intersection matrix as half precision (float16) numbers instead of double precision ones. This takes about a quarter of the memory for studies with many points at the cost of about 3 significant digits in the results.')
     sv__sky_mtx: StringProperty(
         name='_sky_mtx',
         update=updateNode,
@@ -93,59 +109,12 @@ class SvIncidentRadiation(bpy.types.Node, SverchCustomTreeNode):
 
     def draw_buttons(self, context, layout):
         op = layout.operator('node.sv_lb_socket_name', text='', icon='QUESTION', emboss=False).tooltip = 'Calculate the incident radiation on geometry using a sky matrix from the "Cumulative Sky Matrix" component. _ Such studies of incident radiation can be used to apprxomiate the energy that can be collected from photovoltaic or solar thermal systems. They are also useful for evaluating the impact of a building\'s orientation on both energy use and the size/cost of cooling systems. For studies of photovoltaic potential or building energy use impact, a sky matrix from EPW radiation should be used. For studies of cooling system size/cost, a sky matrix derived from the STAT file\'s clear sky radiation should be used. _ NOTE THAT NO REFLECTIONS OF SOLAR ENERGY ARE INCLUDED IN THE ANALYSIS PERFORMED BY THIS COMPONENT. _ Ground reflected irradiance is crudely acounted for by means of an emissive "ground hemisphere," which is like the sky dome hemisphere and is derived from the ground reflectance that is associated with the connected _sky_mtx. This means that including geometry that represents the ground surface will effectively block such crude ground reflection. _ Also note that this component uses the CAD environment\'s ray intersection methods, which can be fast for geometries with low complexity but does not scale well for complex geometries or many test points. For such complex cases and situations where relfection of solar energy are important, honeybee-radiance should be used. -'
+        layout.prop(self, 'sv_force_rerun')
+        layout.prop(self, 'sv_half_precision')
 
-    def process(self):
-        if not any(socket.is_linked for socket in self.outputs):
-            return
-
-        self.sv_output_names = ['points', 'results', 'total', 'mesh', 'legend', 'title', 'int_mtx']
-        for name in self.sv_output_names:
-            setattr(self, '{}_out'.format(name), [])
-        self.sv_input_names = ['_sky_mtx', '_geometry', 'context_', '_grid_size', '_offset_dist_', 'irradiance_', 'legend_par_', '_cpu_count_', '_run']
-        self.sv_input_types = ['System.Object', 'GeometryBase', 'GeometryBase', 'double', 'double', 'bool', 'System.Object', 'int', 'bool']
-        self.sv_input_defaults = [None, None, None, None, None, None, None, None, None]
-        self.sv_input_access = ['item', 'list', 'list', 'item', 'item', 'item', 'item', 'item', 'item']
-        sv_inputs_nested = []
-        for name in self.sv_input_names:
-            sv_inputs_nested.append(self.inputs[name].sv_get())
-        for sv_input_nested in zip_long_repeat(*sv_inputs_nested):
-            for sv_input in zip_long_repeat(*sv_input_nested):
-                sv_input = list(sv_input)
-                for i, value in enumerate(sv_input):
-                    if self.sv_input_access[i] == 'list':
-                        if isinstance(value, (list, tuple)):
-                            values = value
-                        else:
-                            values = [value]
-                        value = [self.sv_cast(v, self.sv_input_types[i], self.sv_input_defaults[i]) for v in values]
-                        if value == [None]:
-                            value = []
-                        sv_input[i] = value
-                    else:
-                        sv_input[i] = self.sv_cast(value, self.sv_input_types[i], self.sv_input_defaults[i])
-                self.process_ladybug(*sv_input)
-        for name in self.sv_output_names:
-            value = getattr(self, '{}_out'.format(name))
-            # Not sure if this hack is correct, will find out when more nodes are generated
-            #if len(value) == 0 or not isinstance(value[0], (list, tuple)):
-            #    value = [value]
-            self.outputs[name].sv_set(value)
-
-    def sv_cast(self, value, data_type, default):
-        result = default if isinstance(value, str) and value == '' else value
-        if result is None and data_type == 'bool':
-            return False
-        elif result is not None and data_type == 'bool':
-            if result == 'True' or result == '1':
-                return True
-            elif result == 'False' or result == '0':
-                return False
-            return bool(result)
-        elif result is not None and data_type == 'int':
-            return int(result)
-        elif result is not None and data_type == 'double':
-            return float(result)
-        return result
+    def sv_node_key(self):
+        # the precision of the cosines changes the results
+        return SvLadybugNode.sv_node_key(self) + (self.sv_half_precision,)
 
     def process_ladybug(self, _sky_mtx, _geometry, context_, _grid_size, _offset_dist_, irradiance_, legend_par_, _cpu_count_, _run):
 
@@ -169,7 +138,8 @@ class SvIncidentRadiation(bpy.types.Node, SverchCustomTreeNode):
             from ladybug_tools.fromgeometry import from_mesh3d, from_point3d, from_vector3d
             from ladybug_tools.fromobjects import legend_objects
             from ladybug_tools.text import text_objects
-            from ladybug_tools.intersect import join_geometry_to_mesh, intersect_mesh_rays
+            from ladybug_tools.intersect import join_geometry_to_mesh, intersection_matrix
+            from ladybug_tools.visibility import visibility_matrix_store
             from ladybug_tools.sverchok import all_required_inputs, hide_output, \
                 show_output, objectify_output, de_objectify_output, recommended_processor_count
         except ImportError as e:
@@ -206,17 +176,13 @@ class SvIncidentRadiation(bpy.types.Node, SverchCustomTreeNode):
         
             # intersect the rays with the mesh
             normals = [from_vector3d(vec) for vec in study_mesh.face_normals]
-            int_matrix_init, angles = intersect_mesh_rays(
-                shade_mesh, points, all_vecs, normals, cpu_count=workers)
+            int_matrix = intersection_matrix(
+                shade_mesh, points, all_vecs, normals, cpu_count=workers,
+                store=visibility_matrix_store,
+                cosine_type='e' if self.sv_half_precision else 'd')
         
             # compute the results
-            results = []
-            int_matrix = []
-            for int_vals, angs in zip(int_matrix_init, angles):
-                pt_rel = [ival * math.cos(ang) for ival, ang in zip(int_vals, angs)]
-                int_matrix.append(pt_rel)
-                rad_result = sum(r * w for r, w in zip(pt_rel, all_rad))
-                results.append(rad_result)
+            results = int_matrix.cosine_weighted_sums(all_rad)
         
             # convert to irradiance if requested
             study_name = 'Incident Radiation'
@@ -251,14 +217,12 @@ class SvIncidentRadiation(bpy.types.Node, SverchCustomTreeNode):
                 graphic.legend_parameters.font)
         
             # create all of the visual outputs
-            study_mesh.colors = graphic.value_colors
+            study_mesh.colors = graphic.value_color_array
             mesh = from_mesh3d(study_mesh)
             legend = legend_objects(graphic.legend)
         
 
-        for name in self.sv_output_names:
-            if name in locals():
-                getattr(self, '{}_out'.format(name)).append([locals()[name]])
+        return locals()
 
 
 def register():
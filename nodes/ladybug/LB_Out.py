@@ -4,21 +4,38 @@ from bpy.types import Operator
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import multi_socket, updateNode, zip_long_repeat
 
-from ladybug_tools.text import LadybugText
-from ladybug_tools.colorize import ColoredPoint
-from ladybug_geometry.geometry2d.line import LineSegment2D
-from ladybug_geometry.geometry2d.arc import Arc2D
-from ladybug_geometry.geometry3d.arc import Arc3D
-from ladybug_geometry.geometry2d.mesh import Mesh2D
-from ladybug_geometry.geometry3d.mesh import Mesh3D
-from ladybug_geometry.geometry2d.pointvector import Point2D
-from ladybug_geometry.geometry3d.pointvector import Point3D
-from ladybug_geometry.geometry2d.polyline import Polyline2D
-from ladybug_geometry.geometry3d.polyline import Polyline3D
-
+from array import array
+from hashlib import md5
 from math import pi, sin, cos
 from mathutils import Vector, Matrix
 
+BYTE_TO_FLOAT = tuple(i / 255 for i in range(256))
+# sRGB color bytes converted to the scene linear values expected by color attributes
+SRGB_BYTE_TO_LINEAR = tuple(
+    c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4 for c in BYTE_TO_FLOAT)
+# Custom properties used to find and update the objects baked by a node
+BAKE_KEY = 'lb_bake_key'
+BAKE_TOPOLOGY = 'lb_bake_topology'
+BAKE_COLORS = 'lb_bake_colors'
+
+
+def import_ladybug_geometry():
+    """Import the ladybug geometry classes on first use rather than on add-on startup."""
+    global LadybugText, ColoredPoint, LineSegment2D, Arc2D, Arc3D, Mesh2D, Mesh3D, \
+        Point2D, Point3D, Polyline2D, Polyline3D
+    from ladybug_tools.text import LadybugText
+    from ladybug_tools.colorize import ColoredPoint
+    from ladybug_geometry.geometry2d.line import LineSegment2D
+    from ladybug_geometry.geometry2d.arc import Arc2D
+    from ladybug_geometry.geometry3d.arc import Arc3D
+    from ladybug_geometry.geometry2d.mesh import Mesh2D
+    from ladybug_geometry.geometry3d.mesh import Mesh3D
+    from ladybug_geometry.geometry2d.pointvector import Point2D
+    from ladybug_geometry.geometry3d.pointvector import Point3D
+    from ladybug_geometry.geometry2d.polyline import Polyline2D
+    from ladybug_geometry.geometry3d.polyline import Polyline3D
+
+
 class SvLBOut(bpy.types.Node, SverchCustomTreeNode):
     bl_idname = 'SvLBOut'
     bl_label = 'LB Out'
@@ -42,6 +59,7 @@ class SvLBOut(bpy.types.Node, SverchCustomTreeNode):
         r0.prop(self, "should_bake")
 
     def process(self):
+        import_ladybug_geometry()
         self.v = []
         self.e = []
         self.f = []
@@ -49,6 +67,8 @@ class SvLBOut(bpy.types.Node, SverchCustomTreeNode):
         self.text_s = []
         self.blender_v = []
         self.blender_colored_v = []
+        self.baked_objects = self.get_baked_objects() if self.should_bake else {}
+        self.bake_slots = {}
 
         for socket in self.inputs:
             if not (socket.is_linked and socket.links):
@@ -59,7 +79,9 @@ class SvLBOut(bpy.types.Node, SverchCustomTreeNode):
         
         if self.should_bake:
             self.create_blender_colored_v()
-            self.create_wireframe([Vector(xyz) for xyz in self.blender_v], [])
+            if self.blender_v:
+                self.create_wireframe(self.blender_v, [])
+            self.remove_baked_objects(self.baked_objects.values())
         self.outputs['verts'].sv_set(self.v)
         self.outputs['edges'].sv_set(self.e)
         self.outputs['faces'].sv_set(self.f)
@@ -186,49 +208,129 @@ class SvLBOut(bpy.types.Node, SverchCustomTreeNode):
         self.create_wireframe(*self.from_arc3d(arc))
 
     def blender_from_mesh(self, mesh, z=0):
-        """Rhino Mesh from ladybug Mesh2D."""
-        data = bpy.data.meshes.new('Ladybug Mesh')
-        data.from_pydata([Vector((v.x, v.y, v.z if hasattr(v, 'z') else 0)) for v in mesh.vertices], [], mesh.faces)
-        def get_material_name(color):
-            return 'ladybug-{}-{}-{}-{}'.format(color.r, color.g, color.b, color.a)
+        """Blender Mesh from ladybug Mesh2D or Mesh3D."""
+        buffers = self.mesh_buffers(mesh, z)
+        obj = self.get_baked_object('mesh', lambda: bpy.data.meshes.new('Ladybug Mesh'))
+        data = obj.data
+        topology = self.buffers_hash(*buffers)
+        if obj.get(BAKE_TOPOLOGY) != topology:
+            data.clear_geometry()
+            self.set_mesh_geometry(data, *buffers)
+            obj[BAKE_TOPOLOGY] = topology
+            obj[BAKE_COLORS] = ''
+
+        # Only the colors need to be updated when the topology is unchanged
+        if mesh.colors is None:
+            if data.materials:
+                self.remove_mesh_colors(data)
+                data.materials.clear()
+                obj[BAKE_COLORS] = ''
+            return
+        colors = self.buffers_hash(self.mesh_rgba(mesh), bytes((mesh.is_color_by_face,)))
+        if obj.get(BAKE_COLORS) != colors:
+            if not data.materials:
+                data.materials.append(self.get_vertex_color_material())
+            self.set_mesh_colors(data, mesh)
+            obj[BAKE_COLORS] = colors
+
+    def mesh_buffers(self, mesh, z=0):
+        """Get flat arrays of vertex coordinates and polygon loops of a ladybug mesh."""
+        vertices = mesh.vertices
+        if vertices and hasattr(vertices[0], 'z'):
+            co = array('f', [c for v in vertices for c in (v.x, v.y, v.z)])
+        else:
+            co = array('f', [c for v in vertices for c in (v.x, v.y, z)])
+        loop_starts, loop_totals, loop_vertices = array('i'), array('i'), array('i')
+        for face in mesh.faces:
+            loop_starts.append(len(loop_vertices))
+            loop_totals.append(len(face))
+            loop_vertices.extend(face)
+        return co, loop_starts, loop_totals, loop_vertices
+
+    def buffers_hash(self, *buffers):
+        """Get a hash of flat buffers that is stable between Blender sessions."""
+        hasher = md5()
+        for buffer in buffers:
+            hasher.update(bytes(buffer))
+        return hasher.hexdigest()
+
+    def set_mesh_geometry(self, data, co, loop_starts, loop_totals, loop_vertices):
+        """Fill empty Blender mesh data with flat vertex and loop buffers."""
+        data.vertices.add(len(co) // 3)
+        data.vertices.foreach_set('co', co)
+        data.loops.add(len(loop_vertices))
+        data.loops.foreach_set('vertex_index', loop_vertices)
+        data.polygons.add(len(loop_starts))
+        data.polygons.foreach_set('loop_start', loop_starts)
+        if not data.polygons.bl_rna.properties['loop_total'].is_readonly:
+            data.polygons.foreach_set('loop_total', loop_totals)  # Blender < 4.0
+        data.update(calc_edges=True)
+
+    def mesh_rgba(self, mesh):
+        """Get the packed RGBA bytes of the colors of a ladybug mesh."""
+        colors = mesh.colors
+        if hasattr(colors, 'rgba'):
+            return colors.rgba
+        return bytes(bytearray(c for col in colors for c in (col.r, col.g, col.b, col.a)))
+
+    def set_mesh_colors(self, data, mesh):
+        """Write the colors of a ladybug mesh to the LB_Col color attribute of Blender mesh data."""
+        rgba_bytes = bytearray(self.mesh_rgba(mesh))
+        if hasattr(data, 'color_attributes'):
+            # color attributes take scene linear RGB while the alpha stays as is
+            rgba = array('f', map(SRGB_BYTE_TO_LINEAR.__getitem__, rgba_bytes))
+            rgba[3::4] = array('f', map(BYTE_TO_FLOAT.__getitem__, rgba_bytes[3::4]))
+        else:
+            # legacy vertex colors take the sRGB values directly
+            rgba = array('f', map(BYTE_TO_FLOAT.__getitem__, rgba_bytes))
 
         if mesh.is_color_by_face:
-            colors = list(set(mesh.colors))
-            material_to_slot = {}
-            for i, color in enumerate(colors):
-                name = get_material_name(color)
-                material_to_slot[name] = i
-                material = bpy.data.materials.get(name)
-                if not material:
-                    material = bpy.data.materials.new(name)
-                    material.diffuse_color = (color.r / 255, color.g / 255, color.b / 255, color.a / 255)
-                    material.specular_intensity = 0
-                data.materials.append(material)
-            material_index = [material_to_slot[get_material_name(c)] for c in mesh.colors]
-            data.polygons.foreach_set('material_index', material_index)
+            # A single color per polygon written to each of its face corners
+            loop_colors = array('f')
+            for i, face in enumerate(mesh.faces):
+                loop_colors.extend(rgba[4 * i:4 * i + 4] * len(face))
+            domain = 'CORNER'
+        elif hasattr(data, 'color_attributes'):
+            loop_colors = rgba
+            domain = 'POINT'
         else:
-            material = bpy.data.materials.get('LB_VCol')
-            if not material:
-                material = bpy.data.materials.new('LB_VCol')
-                material.use_nodes = True
-                for node in material.node_tree.nodes:
-                    if node.type == 'OUTPUT_MATERIAL':
-                        output_node = node
-                        break
-                emission = material.node_tree.nodes.new(type='ShaderNodeEmission')
-                attribute = material.node_tree.nodes.new(type='ShaderNodeAttribute')
-                attribute.attribute_name = 'LB_Col'
-                material.node_tree.links.new(attribute.outputs[0], emission.inputs[0])
-                material.node_tree.links.new(emission.outputs[0], output_node.inputs[0])
-            data.materials.append(material)
-            data.vertex_colors.new(name='LB_Col')
-            for polygon in data.polygons:
-                for i, vi in enumerate(polygon.vertices):
-                    loop_index = polygon.loop_indices[i]
-                    color = mesh.colors[vi]
-                    data.vertex_colors['LB_Col'].data[loop_index].color = (color.r / 255, color.g / 255, color.b / 255, color.a / 255)
-        obj = bpy.data.objects.new('Ladybug Mesh', data)
-        bpy.context.scene.collection.objects.link(obj)
+            # Legacy vertex colors are always stored per face corner
+            loop_colors = array('f')
+            for face in mesh.faces:
+                for vi in face:
+                    loop_colors.extend(rgba[4 * vi:4 * vi + 4])
+            domain = 'CORNER'
+
+        self.remove_mesh_colors(data)
+        if hasattr(data, 'color_attributes'):
+            attribute = data.color_attributes.new('LB_Col', 'BYTE_COLOR', domain)
+        else:
+            attribute = data.vertex_colors.new(name='LB_Col')
+        attribute.data.foreach_set('color', loop_colors)
+
+    def remove_mesh_colors(self, data):
+        """Remove the LB_Col color attribute from Blender mesh data if it exists."""
+        attributes = data.color_attributes if hasattr(data, 'color_attributes') \
+            else data.vertex_colors
+        attribute = attributes.get('LB_Col')
+        if attribute is not None:
+            attributes.remove(attribute)
+
+    def get_vertex_color_material(self):
+        material = bpy.data.materials.get('LB_VCol')
+        if not material:
+            material = bpy.data.materials.new('LB_VCol')
+            material.use_nodes = True
+            for node in material.node_tree.nodes:
+                if node.type == 'OUTPUT_MATERIAL':
+                    output_node = node
+                    break
+            emission = material.node_tree.nodes.new(type='ShaderNodeEmission')
+            attribute = material.node_tree.nodes.new(type='ShaderNodeAttribute')
+            attribute.attribute_name = 'LB_Col'
+            material.node_tree.links.new(attribute.outputs[0], emission.inputs[0])
+            material.node_tree.links.new(emission.outputs[0], output_node.inputs[0])
+        return material
 
     def from_point(self, point):
         """Rhino Point3d from ladybug Point3D."""
@@ -265,7 +367,8 @@ class SvLBOut(bpy.types.Node, SverchCustomTreeNode):
         self.create_wireframe(*self.from_polyline(polyline, z))
 
     def blender_from_text(self, text):
-        data = bpy.data.curves.new('Ladybug Text', 'FONT')
+        obj = self.get_baked_object('text', lambda: bpy.data.curves.new('Ladybug Text', 'FONT'))
+        data = obj.data
         data.body = text.text
         data.size = text.height
 
@@ -283,34 +386,83 @@ class SvLBOut(bpy.types.Node, SverchCustomTreeNode):
         elif text.vertical_alignment <= 6:
             data.align_y = 'BOTTOM'
 
-        name = 'ladybug-0-0-0-255'
-        material = bpy.data.materials.get(name)
-        if not material:
-            material = bpy.data.materials.new(name)
-            material.diffuse_color = (0, 0, 0, 255)
-            material.specular_intensity = 0
-        data.materials.append(material)
+        if not data.materials:
+            name = 'ladybug-0-0-0-255'
+            material = bpy.data.materials.get(name)
+            if not material:
+                material = bpy.data.materials.new(name)
+                material.diffuse_color = (0, 0, 0, 255)
+                material.specular_intensity = 0
+            data.materials.append(material)
 
-        obj = bpy.data.objects.new('Ladybug Text', data)
         obj.location = (text.plane.o.x, text.plane.o.y, text.plane.o.z)
-        bpy.context.scene.collection.objects.link(obj)
 
     def create_blender_colored_v(self):
         if not self.blender_colored_v:
             return
         import numpy as np
         from space_view3d_point_cloud_visualizer import PCVControl
-        obj = bpy.data.objects.new('Ladybug Colored Points', None)
+        obj = self.get_baked_object('points', lambda: None, 'Ladybug Colored Points')
         vs = [(cv.point.x, cv.point.y, cv.point.z if hasattr(cv.point, 'z') else 0) for cv in self.blender_colored_v]
         cs = [(cv.color.r/255, cv.color.g/255, cv.color.b/255) for cv in self.blender_colored_v]
         PCVControl(obj).draw(vs, [], cs)
-        bpy.context.scene.collection.objects.link(obj)
 
     def create_wireframe(self, v, e):
-        data = bpy.data.meshes.new('Ladybug Wireframe')
-        data.from_pydata([Vector(xyz) for xyz in v], e, [])
-        obj = bpy.data.objects.new('Ladybug Wireframe', data)
+        obj = self.get_baked_object('wireframe', lambda: bpy.data.meshes.new('Ladybug Wireframe'))
+        co = array('f', [c for xyz in v for c in xyz])
+        edges = array('i', [i for edge in e for i in edge])
+        topology = self.buffers_hash(co, edges)
+        if obj.get(BAKE_TOPOLOGY) != topology:
+            obj.data.clear_geometry()
+            self.set_wireframe_geometry(obj.data, co, edges)
+            obj[BAKE_TOPOLOGY] = topology
+
+    def set_wireframe_geometry(self, data, co, edges):
+        """Fill empty Blender mesh data with flat vertex and edge buffers."""
+        data.vertices.add(len(co) // 3)
+        data.vertices.foreach_set('co', co)
+        data.edges.add(len(edges) // 2)
+        data.edges.foreach_set('vertices', edges)
+        data.update()
+
+    def get_baked_objects(self):
+        """Get a dictionary of all objects previously baked by this node keyed by slot."""
+        prefix = self.bake_id() + ':'
+        return {obj[BAKE_KEY]: obj for obj in bpy.data.objects
+                if str(obj.get(BAKE_KEY, '')).startswith(prefix)}
+
+    def bake_id(self):
+        return getattr(self, 'node_id', '') or self.name
+
+    def get_baked_object(self, kind, new_data, name=None):
+        """Get the object baked in the next output slot of a kind, creating it if needed.
+
+        Objects are keyed by node and output slot so that baking the same node again
+        updates the existing datablocks in place rather than adding new ones.
+        """
+        slot = self.bake_slots.get(kind, 0)
+        self.bake_slots[kind] = slot + 1
+        key = '{}:{}:{}'.format(self.bake_id(), kind, slot)
+        obj = self.baked_objects.pop(key, None)
+        if obj is not None:
+            return obj
+        data = new_data()
+        obj = bpy.data.objects.new(name or data.name, data)
+        obj[BAKE_KEY] = key
         bpy.context.scene.collection.objects.link(obj)
+        return obj
+
+    def remove_baked_objects(self, objects):
+        """Remove baked objects along with their data if nothing else uses it."""
+        for obj in list(objects):
+            data, obj_type = obj.data, obj.type
+            bpy.data.objects.remove(obj, do_unlink=True)
+            if data is None or data.users != 0:
+                continue
+            if obj_type == 'MESH':
+                bpy.data.meshes.remove(data)
+            elif obj_type == 'FONT':
+                bpy.data.curves.remove(data)
 
 
 def register():
@@ -1,15 +1,20 @@
 import bpy
 import ladybug_tools.helper
 from bpy.props import StringProperty
-from sverchok.node_tree import SverchCustomTreeNode
-from sverchok.data_structure import updateNode, zip_long_repeat
+from sverchok.data_structure import updateNode
+from ladybug_tools.node import SvLadybugNode
 
 ghenv = ladybug_tools.helper.ghenv
 
-class SvPMV_Polygon(bpy.types.Node, SverchCustomTreeNode):
+class SvPMV_Polygon(bpy.types.Node, SvLadybugNode):
     bl_idname = 'SvPMV_Polygon'
     bl_label = 'LB PMV Polygon'
     sv_icon = 'LB_PMV_POLYGON'
+    sv_output_names = ['total_comfort', 'total_comf_data', 'polygon_names', 'polygon_comfort', 'polygon_data', 'comfort_poly', 'strategy_poly']
+    sv_input_names = ['_psych_chart', '_mrt_', '_air_speed_', '_met_rate_', '_clothing_', 'pmv_par_', 'merge_poly_', 'strategies_', 'strategy_par_', 'solar_data_']
+    sv_input_types = ['System.Object', 'double', 'double', 'double', 'double', 'System.Object', 'bool', 'string', 'System.Object', 'System.Object']
+    sv_input_defaults = [None, None, None, None, None, None, None, None, None, None]
+    sv_input_access = ['item', 'list', 'list', 'list', 'list', 'item', 'item', 'list', 'item', 'item']
     sv__psych_chart: StringProperty(
         name='_psych_chart',
         update=updateNode,
@@ -101,59 +106,6 @@ class SvPMV_Polygon(bpy.types.Node, SverchCustomTreeNode):
     def draw_buttons(self, context, layout):
         op = layout.operator('node.sv_lb_socket_name', text='', icon='QUESTION', emboss=False).tooltip = 'Draw thermal comfort polygons on a Psychrometric Chart using the PMV model for indoor thermal comfort. _ This component can also plot passive strategy polygons on the psychrometric chart and can compute the number of hours that lie inside each of the comfort / strategy polygons. -'
 
-    def process(self):
-        if not any(socket.is_linked for socket in self.outputs):
-            return
-
-        self.sv_output_names = ['total_comfort', 'total_comf_data', 'polygon_names', 'polygon_comfort', 'polygon_data', 'comfort_poly', 'strategy_poly']
-        for name in self.sv_output_names:
-            setattr(self, '{}_out'.format(name), [])
-        self.sv_input_names = ['_psych_chart', '_mrt_', '_air_speed_', '_met_rate_', '_clothing_', 'pmv_par_', 'merge_poly_', 'strategies_', 'strategy_par_', 'solar_data_']
-        self.sv_input_types = ['System.Object', 'double', 'double', 'double', 'double', 'System.Object', 'bool', 'string', 'System.Object', 'System.Object']
-        self.sv_input_defaults = [None, None, None, None, None, None, None, None, None, None]
-        self.sv_input_access = ['item', 'list', 'list', 'list', 'list', 'item', 'item', 'list', 'item', 'item']
-        sv_inputs_nested = []
-        for name in self.sv_input_names:
-            sv_inputs_nested.append(self.inputs[name].sv_get())
-        for sv_input_nested in zip_long_repeat(*sv_inputs_nested):
-            for sv_input in zip_long_repeat(*sv_input_nested):
-                sv_input = list(sv_input)
-                for i, value in enumerate(sv_input):
-                    if self.sv_input_access[i] == 'list':
-                        if isinstance(value, (list, tuple)):
-                            values = value
-                        else:
-                            values = [value]
-                        value = [self.sv_cast(v, self.sv_input_types[i], self.sv_input_defaults[i]) for v in values]
-                        if value == [None]:
-                            value = []
-                        sv_input[i] = value
-                    else:
-                        sv_input[i] = self.sv_cast(value, self.sv_input_types[i], self.sv_input_defaults[i])
-                self.process_ladybug(*sv_input)
-        for name in self.sv_output_names:
-            value = getattr(self, '{}_out'.format(name))
-            # Not sure if this hack is correct, will find out when more nodes are generated
-            #if len(value) == 0 or not isinstance(value[0], (list, tuple)):
-            #    value = [value]
-            self.outputs[name].sv_set(value)
-
-    def sv_cast(self, value, data_type, default):
-        result = default if isinstance(value, str) and value == '' else value
-        if result is None and data_type == 'bool':
-            return False
-        elif result is not None and data_type == 'bool':
-            if result == 'True' or result == '1':
-                return True
-            elif result == 'False' or result == '0':
-                return False
-            return bool(result)
-        elif result is not None and data_type == 'int':
-            return int(result)
-        elif result is not None and data_type == 'double':
-            return float(result)
-        return result
-
     def process_ladybug(self, _psych_chart, _mrt_, _air_speed_, _met_rate_, _clothing_, pmv_par_, merge_poly_, strategies_, strategy_par_, solar_data_):
 
         try:
@@ -304,9 +256,7 @@ class SvPMV_Polygon(bpy.types.Node, SverchCustomTreeNode):
                 total_comfort = total_comf_data * 100
         
 
-        for name in self.sv_output_names:
-            if name in locals():
-                getattr(self, '{}_out'.format(name)).append([locals()[name]])
+        return locals()
 
 
 def register():
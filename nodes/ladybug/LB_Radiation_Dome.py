@@ -1,15 +1,26 @@
 import bpy
 import ladybug_tools.helper
-from bpy.props import StringProperty
-from sverchok.node_tree import SverchCustomTreeNode
-from sverchok.data_structure import updateNode, zip_long_repeat
+from bpy.props import BoolProperty, StringProperty
+from sverchok.data_structure import updateNode
+from ladybug_tools.node import SvLadybugNode
 
 ghenv = ladybug_tools.helper.ghenv
 
-class SvRadiationDome(bpy.types.Node, SverchCustomTreeNode):
+class SvRadiationDome(bpy.types.Node, SvLadybugNode):
     bl_idname = 'SvRadiationDome'
     bl_label = 'LB Radiation Dome'
     sv_icon = 'LB_RADIATIONDOME'
+    sv_output_names = ['mesh', 'compass', 'legend', 'title', 'dir_vecs', 'dir_values', 'max_pt', 'max_info', 'vis_set']
+    sv_input_names = ['_sky_mtx', 'context_', '_az_count_', '_alt_count_', '_center_pt_', '_scale_', 'projection_', 'irradiance_', 'show_comp_', 'legend_par_']
+    sv_input_types = ['System.Object', 'GeometryBase', 'int', 'int', 'Point3d', 'double', 'string', 'bool', 'System.Object', 'System.Object']
+    sv_input_defaults = [None, None, None, None, None, 1, None, None, None, None]
+    sv_input_access = ['item', 'list', 'item', 'item', 'item', 'item', 'item', 'item', 'item', 'item']
+    sv_memoize = True
+    sv_force_rerun: BoolProperty(
+        name='Force Rerun',
+        default=False,
+        update=updateNode,
+        description='Run the calculation every time the node is processed instead of reusing the outputs that were cached for the same inputs.')
     sv__sky_mtx: StringProperty(
         name='_sky_mtx',
         update=updateNode,
@@ -104,59 +115,7 @@ class SvRadiationDome(bpy.types.Node, SverchCustomTreeNode):
 
     def draw_buttons(self, context, layout):
         op = layout.operator('node.sv_lb_socket_name', text='', icon='QUESTION', emboss=False).tooltip = 'Visualize the radiation falling on an object from different directions over a dome. _ The Radiation Dome depicts the amount of solar energy received by all directions over a dome. This is useful for understanding the optimal orientation of solar panels and how the performance of the panel might change if it\'s orientation is off from the optimal position. It can also be used to identify the optimal wall orientation for passive solar heating when used with skies of radiation harm/benefit. When used with clear sky matrices, it can identify the orientations that result in the highest and lowest peak cooling load. _ The Radiation Dome can be understood in different ways: 1) It\'s a 3D representation of the "LB Radiation Rose," depicting all tilt angles     for that rose at once. 2) It\'s the reciprocal of the "LB Sky Dome," since it shows how the radiation from     that sky falls onto a hemispherical object. 3) It\'s an radiation study of a hemisphere. The results here are effectively the     same as running a hemisphere through the "LB Incident Radiation" component. -'
-
-    def process(self):
-        if not any(socket.is_linked for socket in self.outputs):
-            return
-
-        self.sv_output_names = ['mesh', 'compass', 'legend', 'title', 'dir_vecs', 'dir_values', 'max_pt', 'max_info', 'vis_set']
-        for name in self.sv_output_names:
-            setattr(self, '{}_out'.format(name), [])
-        self.sv_input_names = ['_sky_mtx', 'context_', '_az_count_', '_alt_count_', '_center_pt_', '_scale_', 'projection_', 'irradiance_', 'show_comp_', 'legend_par_']
-        self.sv_input_types = ['System.Object', 'GeometryBase', 'int', 'int', 'Point3d', 'double', 'string', 'bool', 'System.Object', 'System.Object']
-        self.sv_input_defaults = [None, None, None, None, None, 1, None, None, None, None]
-        self.sv_input_access = ['item', 'list', 'item', 'item', 'item', 'item', 'item', 'item', 'item', 'item']
-        sv_inputs_nested = []
-        for name in self.sv_input_names:
-            sv_inputs_nested.append(self.inputs[name].sv_get())
-        for sv_input_nested in zip_long_repeat(*sv_inputs_nested):
-            for sv_input in zip_long_repeat(*sv_input_nested):
-                sv_input = list(sv_input)
-                for i, value in enumerate(sv_input):
-                    if self.sv_input_access[i] == 'list':
-                        if isinstance(value, (list, tuple)):
-                            values = value
-                        else:
-                            values = [value]
-                        value = [self.sv_cast(v, self.sv_input_types[i], self.sv_input_defaults[i]) for v in values]
-                        if value == [None]:
-                            value = []
-                        sv_input[i] = value
-                    else:
-                        sv_input[i] = self.sv_cast(value, self.sv_input_types[i], self.sv_input_defaults[i])
-                self.process_ladybug(*sv_input)
-        for name in self.sv_output_names:
-            value = getattr(self, '{}_out'.format(name))
-            # Not sure if this hack is correct, will find out when more nodes are generated
-            #if len(value) == 0 or not isinstance(value[0], (list, tuple)):
-            #    value = [value]
-            self.outputs[name].sv_set(value)
-
-    def sv_cast(self, value, data_type, default):
-        result = default if isinstance(value, str) and value == '' else value
-        if result is None and data_type == 'bool':
-            return False
-        elif result is not None and data_type == 'bool':
-            if result == 'True' or result == '1':
-                return True
-            elif result == 'False' or result == '0':
-                return False
-            return bool(result)
-        elif result is not None and data_type == 'int':
-            return int(result)
-        elif result is not None and data_type == 'double':
-            return float(result)
-        return result
+        layout.prop(self, 'sv_force_rerun')
 
     def process_ladybug(self, _sky_mtx, context_, _az_count_, _alt_count_, _center_pt_, _scale_, projection_, irradiance_, show_comp_, legend_par_):
 
@@ -285,9 +244,7 @@ class SvRadiationDome(bpy.types.Node, SverchCustomTreeNode):
             vis_set = objectify_output('VisualizationSet Aruments [RadiationDome]', vis_set)
         
 
-        for name in self.sv_output_names:
-            if name in locals():
-                getattr(self, '{}_out'.format(name)).append([locals()[name]])
+        return locals()
 
 
 def register():
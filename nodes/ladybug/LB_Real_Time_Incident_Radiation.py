@@ -1,15 +1,20 @@
 import bpy
 import ladybug_tools.helper
 from bpy.props import StringProperty
-from sverchok.node_tree import SverchCustomTreeNode
-from sverchok.data_structure import updateNode, zip_long_repeat
+from sverchok.data_structure import updateNode
+from ladybug_tools.node import SvLadybugNode
 
 ghenv = ladybug_tools.helper.ghenv
 
-class SvRTrad(bpy.types.Node, SverchCustomTreeNode):
+class SvRTrad(bpy.types.Node, SvLadybugNode):
     bl_idname = 'SvRTrad'
     bl_label = 'LB Real Time Incident Radiation'
     sv_icon = 'LB_RTRAD'
+    sv_output_names = ['results']
+    sv_input_names = ['_int_mtx', '_sky_mtx']
+    sv_input_types = ['System.Object', 'System.Object']
+    sv_input_defaults = [None, None]
+    sv_input_access = ['item', 'item']
     sv__int_mtx: StringProperty(
         name='_int_mtx',
         update=updateNode,
@@ -33,59 +38,6 @@ class SvRTrad(bpy.types.Node, SverchCustomTreeNode):
     def draw_buttons(self, context, layout):
         op = layout.operator('node.sv_lb_socket_name', text='', icon='QUESTION', emboss=False).tooltip = 'Compute Incident Radiation values for any sky matrix in real time using the Geometry/Sky intersection matrix produced by the "LB Incident Radiation" component. _ Using this component enables one to scroll through radiation on an hour-by-hour or month-by-month basis in a manner that is an order of magnitude faster than running each sky matrix through the "LB Incident Radiation" component. _ The speed of this component is thanks to the fact that the Geometry/Sky intersection matrix contains the relationship between the geometry and each patch of the sky. So computing new radiation values is as simple as multiplying the sky matrix by the intersection matrix. -'
 
-    def process(self):
-        if not any(socket.is_linked for socket in self.outputs):
-            return
-
-        self.sv_output_names = ['results']
-        for name in self.sv_output_names:
-            setattr(self, '{}_out'.format(name), [])
-        self.sv_input_names = ['_int_mtx', '_sky_mtx']
-        self.sv_input_types = ['System.Object', 'System.Object']
-        self.sv_input_defaults = [None, None]
-        self.sv_input_access = ['item', 'item']
-        sv_inputs_nested = []
-        for name in self.sv_input_names:
-            sv_inputs_nested.append(self.inputs[name].sv_get())
-        for sv_input_nested in zip_long_repeat(*sv_inputs_nested):
-            for sv_input in zip_long_repeat(*sv_input_nested):
-                sv_input = list(sv_input)
-                for i, value in enumerate(sv_input):
-                    if self.sv_input_access[i] == 'list':
-                        if isinstance(value, (list, tuple)):
-                            values = value
-                        else:
-                            values = [value]
-                        value = [self.sv_cast(v, self.sv_input_types[i], self.sv_input_defaults[i]) for v in values]
-                        if value == [None]:
-                            value = []
-                        sv_input[i] = value
-                    else:
-                        sv_input[i] = self.sv_cast(value, self.sv_input_types[i], self.sv_input_defaults[i])
-                self.process_ladybug(*sv_input)
-        for name in self.sv_output_names:
-            value = getattr(self, '{}_out'.format(name))
-            # Not sure if this hack is correct, will find out when more nodes are generated
-            #if len(value) == 0 or not isinstance(value[0], (list, tuple)):
-            #    value = [value]
-            self.outputs[name].sv_set(value)
-
-    def sv_cast(self, value, data_type, default):
-        result = default if isinstance(value, str) and value == '' else value
-        if result is None and data_type == 'bool':
-            return False
-        elif result is not None and data_type == 'bool':
-            if result == 'True' or result == '1':
-                return True
-            elif result == 'False' or result == '0':
-                return False
-            return bool(result)
-        elif result is not None and data_type == 'int':
-            return int(result)
-        elif result is not None and data_type == 'double':
-            return float(result)
-        return result
-
     def process_ladybug(self, _int_mtx, _sky_mtx):
 
         
@@ -109,14 +61,15 @@ class SvRTrad(bpy.types.Node, SverchCustomTreeNode):
             all_rad = total_sky_rad + ground_rad 
         
             # compute the results
-            results = []
-            for pt_rel in int_mtx:
-                results.append(sum(r * w for r, w in zip(pt_rel, all_rad)))
+            if hasattr(int_mtx, 'cosine_weighted_sums'):  # compact intersection matrix
+                results = int_mtx.cosine_weighted_sums(all_rad)
+            else:
+                results = []
+                for pt_rel in int_mtx:
+                    results.append(sum(r * w for r, w in zip(pt_rel, all_rad)))
         
 
-        for name in self.sv_output_names:
-            if name in locals():
-                getattr(self, '{}_out'.format(name)).append([locals()[name]])
+        return locals()
 
 
 def register():
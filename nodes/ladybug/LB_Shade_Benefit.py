@@ -1,15 +1,26 @@
 import bpy
 import ladybug_tools.helper
-from bpy.props import StringProperty
-from sverchok.node_tree import SverchCustomTreeNode
-from sverchok.data_structure import updateNode, zip_long_repeat
+from bpy.props import BoolProperty, StringProperty
+from sverchok.data_structure import updateNode
+from ladybug_tools.node import SvLadybugNode
 
 ghenv = ladybug_tools.helper.ghenv
 
-class SvShadeBenefit(bpy.types.Node, SverchCustomTreeNode):
+class SvShadeBenefit(bpy.types.Node, SvLadybugNode):
     bl_idname = 'SvShadeBenefit'
     bl_label = 'LB Shade Benefit'
     sv_icon = 'LB_SHADEBENEFIT'
+    sv_output_names = ['mesh', 'legend', 'title', 'shade_help']
+    sv_input_names = ['_vectors', '_study_points', 'study_directs_', '_shade_geo', 'context_', '_grid_size', '_timestep_', 'legend_par_', '_cpu_count_', '_run']
+    sv_input_types = ['System.Object', 'Point3d', 'Vector3d', 'GeometryBase', 'GeometryBase', 'double', 'int', 'System.Object', 'int', 'bool']
+    sv_input_defaults = [None, None, None, None, None, None, None, None, None, None]
+    sv_input_access = ['list', 'list', 'list', 'list', 'list', 'item', 'item', 'item', 'item', 'item']
+    sv_memoize = True
+    sv_force_rerun: BoolProperty(
+        name='Force Rerun',
+        default=False,
+        update=updateNode,
+        description='Run the calculation every time the node is processed instead of reusing the outputs that were cached for the same inputs.')
     sv__vectors: StringProperty(
         name='_vectors',
         update=updateNode,
@@ -94,59 +105,7 @@ class SvShadeBenefit(bpy.types.Node, SverchCustomTreeNode):
 
     def draw_buttons(self, context, layout):
         op = layout.operator('node.sv_lb_socket_name', text='', icon='QUESTION', emboss=False).tooltip = 'Visualize the desirability of shade in terms of the time period of blocked sun vectors for each part of a shade geometry. _ The calculation assumes that all input _vectors represent sun to be blocked, which is often the case when evaluating shade in terms of its benefit for glare reduction and occupant visual comfort. It can also be the case when sun vectors have been filtered to account for times of peak cooling demand or for the heat stress of human subjects. _ The component outputs a colored mesh of the shade illustrating the helpfulness of shading each part of the _shade_geo. A higher saturation of blue indicates that shading the cell blocks more hours of sun and is therefore more desirable. _ The units for shade desirability are hrs/square Rhino unit, which note the amount of time that sun is blocked by a given cell. So, if a given square meter of input _shade_geo has a shade desirability of 10 hrs/m2, this means that a shade in this location blocks an average of 10 hours to each of the _study_points. -'
-
-    def process(self):
-        if not any(socket.is_linked for socket in self.outputs):
-            return
-
-        self.sv_output_names = ['mesh', 'legend', 'title', 'shade_help']
-        for name in self.sv_output_names:
-            setattr(self, '{}_out'.format(name), [])
-        self.sv_input_names = ['_vectors', '_study_points', 'study_directs_', '_shade_geo', 'context_', '_grid_size', '_timestep_', 'legend_par_', '_cpu_count_', '_run']
-        self.sv_input_types = ['System.Object', 'Point3d', 'Vector3d', 'GeometryBase', 'GeometryBase', 'double', 'int', 'System.Object', 'int', 'bool']
-        self.sv_input_defaults = [None, None, None, None, None, None, None, None, None, None]
-        self.sv_input_access = ['list', 'list', 'list', 'list', 'list', 'item', 'item', 'item', 'item', 'item']
-        sv_inputs_nested = []
-        for name in self.sv_input_names:
-            sv_inputs_nested.append(self.inputs[name].sv_get())
-        for sv_input_nested in zip_long_repeat(*sv_inputs_nested):
-            for sv_input in zip_long_repeat(*sv_input_nested):
-                sv_input = list(sv_input)
-                for i, value in enumerate(sv_input):
-                    if self.sv_input_access[i] == 'list':
-                        if isinstance(value, (list, tuple)):
-                            values = value
-                        else:
-                            values = [value]
-                        value = [self.sv_cast(v, self.sv_input_types[i], self.sv_input_defaults[i]) for v in values]
-                        if value == [None]:
-                            value = []
-                        sv_input[i] = value
-                    else:
-                        sv_input[i] = self.sv_cast(value, self.sv_input_types[i], self.sv_input_defaults[i])
-                self.process_ladybug(*sv_input)
-        for name in self.sv_output_names:
-            value = getattr(self, '{}_out'.format(name))
-            # Not sure if this hack is correct, will find out when more nodes are generated
-            #if len(value) == 0 or not isinstance(value[0], (list, tuple)):
-            #    value = [value]
-            self.outputs[name].sv_set(value)
-
-    def sv_cast(self, value, data_type, default):
-        result = default if isinstance(value, str) and value == '' else value
-        if result is None and data_type == 'bool':
-            return False
-        elif result is not None and data_type == 'bool':
-            if result == 'True' or result == '1':
-                return True
-            elif result == 'False' or result == '0':
-                return False
-            return bool(result)
-        elif result is not None and data_type == 'int':
-            return int(result)
-        elif result is not None and data_type == 'double':
-            return float(result)
-        return result
+        layout.prop(self, 'sv_force_rerun')
 
     def process_ladybug(self, _vectors, _study_points, study_directs_, _shade_geo, context_, _grid_size, _timestep_, legend_par_, _cpu_count_, _run):
 
@@ -215,14 +174,12 @@ class SvShadeBenefit(bpy.types.Node, SverchCustomTreeNode):
                                  graphic.legend_parameters.font)
         
             # create all of the visual outputs
-            analysis_mesh.colors = graphic.value_colors
+            analysis_mesh.colors = graphic.value_color_array
             mesh = from_mesh3d(analysis_mesh)
             legend = legend_objects(graphic.legend)
         
 
-        for name in self.sv_output_names:
-            if name in locals():
-                getattr(self, '{}_out'.format(name)).append([locals()[name]])
+        return locals()
 
 
 def register():
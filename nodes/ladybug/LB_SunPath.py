@@ -1,15 +1,26 @@
 import bpy
 import ladybug_tools.helper
-from bpy.props import StringProperty
-from sverchok.node_tree import SverchCustomTreeNode
-from sverchok.data_structure import updateNode, zip_long_repeat
+from bpy.props import BoolProperty, StringProperty
+from sverchok.data_structure import updateNode
+from ladybug_tools.node import SvLadybugNode
 
 ghenv = ladybug_tools.helper.ghenv
 
-class SvSunpath(bpy.types.Node, SverchCustomTreeNode):
+class SvSunpath(bpy.types.Node, SvLadybugNode):
     bl_idname = 'SvSunpath'
     bl_label = 'LB SunPath'
     sv_icon = 'LB_SUNPATH'
+    sv_output_names = ['vectors', 'altitudes', 'azimuths', 'hoys', 'sun_pts', 'analemma', 'daily', 'compass', 'legend', 'title', 'color_pts', 'vis_set']
+    sv_input_names = ['north_', '_location', 'hoys_', 'dl_saving_', 'solar_time_', '_center_pt_', '_scale_', 'projection_', 'daily_', 'data_', 'statement_', 'legend_par_']
+    sv_input_types = ['System.Object', 'System.Object', 'double', 'System.Object', 'bool', 'Point3d', 'double', 'string', 'bool', 'System.Object', 'string', 'System.Object']
+    sv_input_defaults = [None, None, None, None, None, None, 1, None, None, None, None, None]
+    sv_input_access = ['item', 'item', 'list', 'item', 'item', 'item', 'item', 'item', 'item', 'list', 'item', 'list']
+    sv_memoize = True
+    sv_force_rerun: BoolProperty(
+        name='Force Rerun',
+        default=False,
+        update=updateNode,
+        description='Run the calculation every time the node is processed instead of reusing the outputs that were cached for the same inputs.')
     sv_north_: StringProperty(
         name='north_',
         update=updateNode,
@@ -124,59 +135,7 @@ class SvSunpath(bpy.types.Node, SverchCustomTreeNode):
 
     def draw_buttons(self, context, layout):
         op = layout.operator('node.sv_lb_socket_name', text='', icon='QUESTION', emboss=False).tooltip = 'Output a Sunpath (aka. sun plot) graphic into the Rhino scene. - The component also outputs sun vectors that can be used for solar access analysis and shading design. -'
-
-    def process(self):
-        if not any(socket.is_linked for socket in self.outputs):
-            return
-
-        self.sv_output_names = ['vectors', 'altitudes', 'azimuths', 'hoys', 'sun_pts', 'analemma', 'daily', 'compass', 'legend', 'title', 'color_pts', 'vis_set']
-        for name in self.sv_output_names:
-            setattr(self, '{}_out'.format(name), [])
-        self.sv_input_names = ['north_', '_location', 'hoys_', 'dl_saving_', 'solar_time_', '_center_pt_', '_scale_', 'projection_', 'daily_', 'data_', 'statement_', 'legend_par_']
-        self.sv_input_types = ['System.Object', 'System.Object', 'double', 'System.Object', 'bool', 'Point3d', 'double', 'string', 'bool', 'System.Object', 'string', 'System.Object']
-        self.sv_input_defaults = [None, None, None, None, None, None, 1, None, None, None, None, None]
-        self.sv_input_access = ['item', 'item', 'list', 'item', 'item', 'item', 'item', 'item', 'item', 'list', 'item', 'list']
-        sv_inputs_nested = []
-        for name in self.sv_input_names:
-            sv_inputs_nested.append(self.inputs[name].sv_get())
-        for sv_input_nested in zip_long_repeat(*sv_inputs_nested):
-            for sv_input in zip_long_repeat(*sv_input_nested):
-                sv_input = list(sv_input)
-                for i, value in enumerate(sv_input):
-                    if self.sv_input_access[i] == 'list':
-                        if isinstance(value, (list, tuple)):
-                            values = value
-                        else:
-                            values = [value]
-                        value = [self.sv_cast(v, self.sv_input_types[i], self.sv_input_defaults[i]) for v in values]
-                        if value == [None]:
-                            value = []
-                        sv_input[i] = value
-                    else:
-                        sv_input[i] = self.sv_cast(value, self.sv_input_types[i], self.sv_input_defaults[i])
-                self.process_ladybug(*sv_input)
-        for name in self.sv_output_names:
-            value = getattr(self, '{}_out'.format(name))
-            # Not sure if this hack is correct, will find out when more nodes are generated
-            #if len(value) == 0 or not isinstance(value[0], (list, tuple)):
-            #    value = [value]
-            self.outputs[name].sv_set(value)
-
-    def sv_cast(self, value, data_type, default):
-        result = default if isinstance(value, str) and value == '' else value
-        if result is None and data_type == 'bool':
-            return False
-        elif result is not None and data_type == 'bool':
-            if result == 'True' or result == '1':
-                return True
-            elif result == 'False' or result == '0':
-                return False
-            return bool(result)
-        elif result is not None and data_type == 'int':
-            return int(result)
-        elif result is not None and data_type == 'double':
-            return float(result)
-        return result
+        layout.prop(self, 'sv_force_rerun')
 
     def process_ladybug(self, north_, _location, hoys_, dl_saving_, solar_time_, _center_pt_, _scale_, projection_, daily_, data_, statement_, legend_par_):
 
@@ -189,6 +148,7 @@ class SvSunpath(bpy.types.Node, SverchCustomTreeNode):
         
         try:
             from ladybug.sunpath import Sunpath
+            from ladybug.suncache import sun_position_cache
             from ladybug.compass import Compass
             from ladybug.graphic import GraphicContainer
             from ladybug.datacollection import HourlyContinuousCollection
@@ -211,6 +171,10 @@ class SvSunpath(bpy.types.Node, SverchCustomTreeNode):
             raise ImportError('\nFailed to import ladybug_tools:\n\t{}'.format(e))
         
         import math
+        try:  # python 3.5+
+            from math import gcd
+        except ImportError:  # python 2
+            from fractions import gcd
         
         
         def draw_analemma_and_arcs(sp, datetimes, radius, center_pt3d):
@@ -322,16 +286,30 @@ class SvSunpath(bpy.types.Node, SverchCustomTreeNode):
         
             # process all of the input hoys into altitudes, azimuths and vectors
             altitudes, azimuths, datetimes, moys, hoys, vectors, suns = [], [], [], [], [], [], []
-            for hoy in hoys_:
-                sun = sp.calculate_sun_from_hoy(hoy, solar_time_)
-                if sun.is_during_day:
-                    altitudes.append(sun.altitude)
-                    azimuths.append(sun.azimuth)
-                    datetimes.append(sun.datetime)
-                    moys.append(sun.datetime.moy)
-                    hoys.append(sun.datetime.hoy)
-                    vectors.append(from_vector3d(sun.sun_vector))
-                    suns.append(sun)
+            in_moys = [int(round(hoy * 60)) for hoy in hoys_]
+            step = 60
+            for moy in in_moys:
+                step = gcd(step, moy)
+            year_moys = 527040 if sp.is_leap_year else 525600
+            if len(in_moys) != 0 and step >= 5 and \
+                    all(0 <= moy < year_moys for moy in in_moys):
+                # the hoys lie on a regular timestep of the year; get the annual
+                # sun positions at that timestep from the cache
+                sun_pos = sun_position_cache.sun_positions(sp, 60 // step, solar_time_)
+                sun_alts = sun_pos.altitudes
+                all_suns = [sun_pos[moy // step] for moy in in_moys
+                            if sun_alts[moy // step] > 0]
+            else:  # compute the position of the sun for each of the hoys
+                all_suns = [sp.calculate_sun_from_hoy(hoy, solar_time_) for hoy in hoys_]
+                all_suns = [sun for sun in all_suns if sun.is_during_day]
+            for sun in all_suns:
+                altitudes.append(sun.altitude)
+                azimuths.append(sun.azimuth)
+                datetimes.append(sun.datetime)
+                moys.append(sun.datetime.moy)
+                hoys.append(sun.datetime.hoy)
+                vectors.append(from_vector3d(sun.sun_vector))
+                suns.append(sun)
         
             if len(data_) > 0 and data_[0] is not None and len(hoys_) > 0:  # build a sunpath for each data collection
                 title, all_sun_pts, all_analemma, all_daily, all_compass, all_col_pts, all_legends = \
@@ -413,9 +391,7 @@ class SvSunpath(bpy.types.Node, SverchCustomTreeNode):
             vis_set = objectify_output('VisualizationSet Aruments [Sunpath]', vis_set)
         
 
-        for name in self.sv_output_names:
-            if name in locals():
-                getattr(self, '{}_out'.format(name)).append([locals()[name]])
+        return locals()
 
 
 def register():
@@ -1,15 +1,26 @@
 import bpy
 import ladybug_tools.helper
-from bpy.props import StringProperty
-from sverchok.node_tree import SverchCustomTreeNode
-from sverchok.data_structure import updateNode, zip_long_repeat
+from bpy.props import BoolProperty, StringProperty
+from sverchok.data_structure import updateNode
+from ladybug_tools.node import SvLadybugNode
 
 ghenv = ladybug_tools.helper.ghenv
 
-class SvThermalShadeBenefit(bpy.types.Node, SverchCustomTreeNode):
+class SvThermalShadeBenefit(bpy.types.Node, SvLadybugNode):
     bl_idname = 'SvThermalShadeBenefit'
     bl_label = 'LB Thermal Shade Benefit'
     sv_icon = 'LB_THERMALSHADEBENEFIT'
+    sv_output_names = ['vectors', 'points', 'mesh', 'legend', 'title', 'shade_help', 'shade_harm', 'shade_net']
+    sv_input_names = ['north_', '_location', '_temperature', '_study_region', '_shade_geo', 'context_', '_grid_size', '_up_threshold_', '_low_threshold_', '_timestep_', 'legend_par_', '_cpu_count_', '_run']
+    sv_input_types = ['System.Object', 'System.Object', 'System.Object', 'GeometryBase', 'GeometryBase', 'GeometryBase', 'double', 'double', 'double', 'int', 'System.Object', 'int', 'bool']
+    sv_input_defaults = [None, None, None, None, None, None, None, None, None, None, None, None, None]
+    sv_input_access = ['item', 'item', 'item', 'list', 'list', 'list', 'item', 'item', 'item', 'item', 'item', 'item', 'item']
+    sv_memoize = True
+    sv_force_rerun: BoolProperty(
+        name='Force Rerun',
+        default=False,
+        update=updateNode,
+        description='Run the calculation every time the node is processed instead of reusing the outputs that were cached for the same inputs.')
     sv_north_: StringProperty(
         name='north_',
         update=updateNode,
@@ -123,59 +134,7 @@ class SvThermalShadeBenefit(bpy.types.Node, SverchCustomTreeNode):
 
     def draw_buttons(self, context, layout):
         op = layout.operator('node.sv_lb_socket_name', text='', icon='QUESTION', emboss=False).tooltip = 'Visualize the desirability of shade in terms of proximity of conditions to a favorable temerature range. _ The calculation runs by generating solar vectors for a data collection of input temperature values. Solar vectors for hours when the temperature is above the upper temperature threshold contribute positively to shade desirability (shade_help) while solar vectors for hours when the temperature is below the lower temperature threshold contribute negatively (shade_harm). _ The component outputs a colored mesh of the shade illustrating the net effect of shading each part of the _shade_geo. A higher saturation of blue indicates that shading the cell is desirable to avoid excessively hot temperatures. A higher saturation of red indicates that shading the cell is harmful, blocking helpful sun in cold conditions that could bring conditions closer to the desired temperature range. Desaturated cells indicate that shading the cell will have relatively little effect on keeping the _study_region in the desired thermal range. _ The units for shade desirability are degree-days per unit area of shade, which are essentially the amount of time in days that sun is blocked by a given cell multiplied by the degrees above (or below) the temperature thresholds during that time. So, if a given square meter of input _shade_geo has a shade desirability of 10 degree-days per square meter, this means that a shade in this location provides roughly 1 day of sun protection from conditions 10 degrees Celsius warmer than the _up_threshold_ to the _study_region. _ More information on the methods used by this component can be found in the following publication: Mackey, Christopher; Sadeghipour Roudsari, Mostapha; Samaras, Panagiotis. “ComfortCover: A Novel Method for the Design of Outdoor Shades.” In Proceedings of Symposium on Simulation for Architecture and Urban Design. Washington, DC, United States, Apr 12-15 2015. https://drive.google.com/file/d/0Bz2PwDvkjovJQVRTRHhMSXZWZjQ/view?usp=sharing -'
-
-    def process(self):
-        if not any(socket.is_linked for socket in self.outputs):
-            return
-
-        self.sv_output_names = ['vectors', 'points', 'mesh', 'legend', 'title', 'shade_help', 'shade_harm', 'shade_net']
-        for name in self.sv_output_names:
-            setattr(self, '{}_out'.format(name), [])
-        self.sv_input_names = ['north_', '_location', '_temperature', '_study_region', '_shade_geo', 'context_', '_grid_size', '_up_threshold_', '_low_threshold_', '_timestep_', 'legend_par_', '_cpu_count_', '_run']
-        self.sv_input_types = ['System.Object', 'System.Object', 'System.Object', 'GeometryBase', 'GeometryBase', 'GeometryBase', 'double', 'double', 'double', 'int', 'System.Object', 'int', 'bool']
-        self.sv_input_defaults = [None, None, None, None, None, None, None, None, None, None, None, None, None]
-        self.sv_input_access = ['item', 'item', 'item', 'list', 'list', 'list', 'item', 'item', 'item', 'item', 'item', 'item', 'item']
-        sv_inputs_nested = []
-        for name in self.sv_input_names:
-            sv_inputs_nested.append(self.inputs[name].sv_get())
-        for sv_input_nested in zip_long_repeat(*sv_inputs_nested):
-            for sv_input in zip_long_repeat(*sv_input_nested):
-                sv_input = list(sv_input)
-                for i, value in enumerate(sv_input):
-                    if self.sv_input_access[i] == 'list':
-                        if isinstance(value, (list, tuple)):
-                            values = value
-                        else:
-                            values = [value]
-                        value = [self.sv_cast(v, self.sv_input_types[i], self.sv_input_defaults[i]) for v in values]
-                        if value == [None]:
-                            value = []
-                        sv_input[i] = value
-                    else:
-                        sv_input[i] = self.sv_cast(value, self.sv_input_types[i], self.sv_input_defaults[i])
-                self.process_ladybug(*sv_input)
-        for name in self.sv_output_names:
-            value = getattr(self, '{}_out'.format(name))
-            # Not sure if this hack is correct, will find out when more nodes are generated
-            #if len(value) == 0 or not isinstance(value[0], (list, tuple)):
-            #    value = [value]
-            self.outputs[name].sv_set(value)
-
-    def sv_cast(self, value, data_type, default):
-        result = default if isinstance(value, str) and value == '' else value
-        if result is None and data_type == 'bool':
-            return False
-        elif result is not None and data_type == 'bool':
-            if result == 'True' or result == '1':
-                return True
-            elif result == 'False' or result == '0':
-                return False
-            return bool(result)
-        elif result is not None and data_type == 'int':
-            return int(result)
-        elif result is not None and data_type == 'double':
-            return float(result)
-        return result
+        layout.prop(self, 'sv_force_rerun')
 
     def process_ladybug(self, north_, _location, _temperature, _study_region, _shade_geo, context_, _grid_size, _up_threshold_, _low_threshold_, _timestep_, legend_par_, _cpu_count_, _run):
 
@@ -299,14 +258,12 @@ class SvThermalShadeBenefit(bpy.types.Node, SverchCustomTreeNode):
                                  graphic.legend_parameters.font)
         
             # create all of the visual outputs
-            analysis_mesh.colors = graphic.value_colors
+            analysis_mesh.colors = graphic.value_color_array
             mesh = from_mesh3d(analysis_mesh)
             legend = legend_objects(graphic.legend)
         
 
-        for name in self.sv_output_names:
-            if name in locals():
-                getattr(self, '{}_out'.format(name)).append([locals()[name]])
+        return locals()
 
 
 def register():
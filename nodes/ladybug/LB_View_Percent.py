@@ -1,15 +1,26 @@
 import bpy
 import ladybug_tools.helper
-from bpy.props import StringProperty
-from sverchok.node_tree import SverchCustomTreeNode
-from sverchok.data_structure import updateNode, zip_long_repeat
+from bpy.props import BoolProperty, StringProperty
+from sverchok.data_structure import updateNode
+from ladybug_tools.node import SvLadybugNode
 
 ghenv = ladybug_tools.helper.ghenv
 
-class SvViewPercent(bpy.types.Node, SverchCustomTreeNode):
+class SvViewPercent(bpy.types.Node, SvLadybugNode):
     bl_idname = 'SvViewPercent'
     bl_label = 'LB View Percent'
     sv_icon = 'LB_VIEWPERCENT'
+    sv_output_names = ['points', 'view_vecs', 'results', 'mesh', 'legend', 'title', 'int_mtx']
+    sv_input_names = ['_view_type', '_resolution_', '_geometry', 'context_', '_grid_size', '_offset_dist_', '_geo_block_', 'legend_par_', '_cpu_count_', '_run']
+    sv_input_types = ['string', 'int', 'GeometryBase', 'GeometryBase', 'double', 'double', 'bool', 'System.Object', 'int', 'bool']
+    sv_input_defaults = [None, None, None, None, None, None, None, None, None, None]
+    sv_input_access = ['item', 'item', 'list', 'list', 'item', 'item', 'item', 'item', 'item', 'item']
+    sv_memoize = True
+    sv_force_rerun: BoolProperty(
+        name='Force Rerun',
+        default=False,
+        update=updateNode,
+        description='Run the calculation every time the node is processed instead of reusing the outputs that were cached for the same inputs.')
     sv__view_type: StringProperty(
         name='_view_type',
         update=updateNode,
@@ -100,59 +111,7 @@ class SvViewPercent(bpy.types.Node, SverchCustomTreeNode):
 
     def draw_buttons(self, context, layout):
         op = layout.operator('node.sv_lb_socket_name', text='', icon='QUESTION', emboss=False).tooltip = 'Evaluate the percent view to the outdoors or sky from input geometry through context. _ Such view calculations can be used to estimate the quality of a view to the outdoors from a given location on the indoors. They can also be used on the outdoors to evaluate the openness of street canyons to the sky, which has implications for the pedestrian expereince as well as the rate of radiant heat loss from urban surfaces and the sky at night. _ Note that this component uses the CAD environment\'s ray intersection methods, which can be fast for geometries with low complexity but does not scale well for complex geometries or many test points. For such complex studies, honeybee-radiance should be used. -'
-
-    def process(self):
-        if not any(socket.is_linked for socket in self.outputs):
-            return
-
-        self.sv_output_names = ['points', 'view_vecs', 'results', 'mesh', 'legend', 'title', 'int_mtx']
-        for name in self.sv_output_names:
-            setattr(self, '{}_out'.format(name), [])
-        self.sv_input_names = ['_view_type', '_resolution_', '_geometry', 'context_', '_grid_size', '_offset_dist_', '_geo_block_', 'legend_par_', '_cpu_count_', '_run']
-        self.sv_input_types = ['string', 'int', 'GeometryBase', 'GeometryBase', 'double', 'double', 'bool', 'System.Object', 'int', 'bool']
-        self.sv_input_defaults = [None, None, None, None, None, None, None, None, None, None]
-        self.sv_input_access = ['item', 'item', 'list', 'list', 'item', 'item', 'item', 'item', 'item', 'item']
-        sv_inputs_nested = []
-        for name in self.sv_input_names:
-            sv_inputs_nested.append(self.inputs[name].sv_get())
-        for sv_input_nested in zip_long_repeat(*sv_inputs_nested):
-            for sv_input in zip_long_repeat(*sv_input_nested):
-                sv_input = list(sv_input)
-                for i, value in enumerate(sv_input):
-                    if self.sv_input_access[i] == 'list':
-                        if isinstance(value, (list, tuple)):
-                            values = value
-                        else:
-                            values = [value]
-                        value = [self.sv_cast(v, self.sv_input_types[i], self.sv_input_defaults[i]) for v in values]
-                        if value == [None]:
-                            value = []
-                        sv_input[i] = value
-                    else:
-                        sv_input[i] = self.sv_cast(value, self.sv_input_types[i], self.sv_input_defaults[i])
-                self.process_ladybug(*sv_input)
-        for name in self.sv_output_names:
-            value = getattr(self, '{}_out'.format(name))
-            # Not sure if this hack is correct, will find out when more nodes are generated
-            #if len(value) == 0 or not isinstance(value[0], (list, tuple)):
-            #    value = [value]
-            self.outputs[name].sv_set(value)
-
-    def sv_cast(self, value, data_type, default):
-        result = default if isinstance(value, str) and value == '' else value
-        if result is None and data_type == 'bool':
-            return False
-        elif result is not None and data_type == 'bool':
-            if result == 'True' or result == '1':
-                return True
-            elif result == 'False' or result == '0':
-                return False
-            return bool(result)
-        elif result is not None and data_type == 'int':
-            return int(result)
-        elif result is not None and data_type == 'double':
-            return float(result)
-        return result
+        layout.prop(self, 'sv_force_rerun')
 
     def process_ladybug(self, _view_type, _resolution_, _geometry, context_, _grid_size, _offset_dist_, _geo_block_, legend_par_, _cpu_count_, _run):
 
@@ -175,7 +134,8 @@ class SvViewPercent(bpy.types.Node, SverchCustomTreeNode):
             from ladybug_tools.fromgeometry import from_mesh3d, from_point3d, from_vector3d
             from ladybug_tools.fromobjects import legend_objects
             from ladybug_tools.text import text_objects
-            from ladybug_tools.intersect import join_geometry_to_mesh, intersect_mesh_rays
+            from ladybug_tools.intersect import join_geometry_to_mesh, intersection_matrix
+            from ladybug_tools.visibility import visibility_matrix_store
             from ladybug_tools.sverchok import all_required_inputs, hide_output, \
                 show_output, objectify_output, recommended_processor_count
         except ImportError as e:
@@ -235,28 +195,24 @@ class SvViewPercent(bpy.types.Node, SverchCustomTreeNode):
             # intersect the rays with the mesh
             if vt_str == 'Sky View':  # account for the normals of the surface
                 normals = [from_vector3d(vec) for vec in study_mesh.face_normals]
-                int_matrix, angles = intersect_mesh_rays(
-                    shade_mesh, points, view_vecs, normals, cpu_count=workers)
+                int_matrix = intersection_matrix(
+                    shade_mesh, points, view_vecs, normals, cpu_count=workers,
+                    store=visibility_matrix_store)
             else:
-                int_matrix, angles = intersect_mesh_rays(
-                    shade_mesh, points, view_vecs, cpu_count=workers)
+                int_matrix = intersection_matrix(
+                    shade_mesh, points, view_vecs, cpu_count=workers,
+                    store=visibility_matrix_store)
         
             # compute the results
-            int_mtx = objectify_output('View Intersection Matrix', int_matrix)
+            int_mtx = objectify_output('View Intersection Matrix', int_matrix.bits_matrix())
             vec_count = len(view_vecs)
-            results = []
             if vt_str == 'Sky View':  # weight intersections by angle before output
-                for int_vals, angles in zip(int_matrix, angles):
-                    w_res = (ival * 2 * math.cos(ang) for ival, ang in zip(int_vals, angles))
-                    weight_result = sum(r * w for r, w in zip(w_res, patch_wghts))
-                    results.append(weight_result * 100 / vec_count)
+                results = [r * 200 / vec_count
+                           for r in int_matrix.cosine_weighted_sums(patch_wghts)]
+            elif patch_wghts:
+                results = [r * 100 / vec_count for r in int_matrix.weighted_sums(patch_wghts)]
             else:
-                if patch_wghts:
-                    for int_list in int_matrix:
-                        weight_result = sum(r * w for r, w in zip(int_list, patch_wghts))
-                        results.append(weight_result * 100 / vec_count)
-                else:
-                    results = [sum(int_list) * 100 / vec_count for int_list in int_matrix]
+                results = [r * 100 / vec_count for r in int_matrix.unblocked_counts()]
         
             # create the mesh and legend outputs
             graphic = GraphicContainer(results, study_mesh.min, study_mesh.max, legend_par_)
@@ -271,14 +227,12 @@ class SvViewPercent(bpy.types.Node, SverchCustomTreeNode):
                 graphic.legend_parameters.font)
         
             # create all of the visual outputs
-            study_mesh.colors = graphic.value_colors
+            study_mesh.colors = graphic.value_color_array
             mesh = from_mesh3d(study_mesh)
             legend = legend_objects(graphic.legend)
         
 
-        for name in self.sv_output_names:
-            if name in locals():
-                getattr(self, '{}_out'.format(name)).append([locals()[name]])
+        return locals()
 
 
 def register():
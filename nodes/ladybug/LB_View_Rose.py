@@ -1,15 +1,20 @@
 import bpy
 import ladybug_tools.helper
 from bpy.props import StringProperty
-from sverchok.node_tree import SverchCustomTreeNode
-from sverchok.data_structure import updateNode, zip_long_repeat
+from sverchok.data_structure import updateNode
+from ladybug_tools.node import SvLadybugNode
 
 ghenv = ladybug_tools.helper.ghenv
 
-class SvViewRose(bpy.types.Node, SverchCustomTreeNode):
+class SvViewRose(bpy.types.Node, SvLadybugNode):
     bl_idname = 'SvViewRose'
     bl_label = 'LB View Rose'
     sv_icon = 'LB_VIEWROSE'
+    sv_output_names = ['view_vecs', 'results', 'mesh', 'legend']
+    sv_input_names = ['_context', '_center_pt', '_radius_', '_view_type_', '_resolution_', 'legend_par_']
+    sv_input_types = ['GeometryBase', 'Point3d', 'double', 'string', 'int', 'System.Object']
+    sv_input_defaults = [None, None, None, None, None, None]
+    sv_input_access = ['list', 'item', 'item', 'item', 'item', 'item']
     sv__context: StringProperty(
         name='_context',
         update=updateNode,
@@ -67,59 +72,6 @@ class SvViewRose(bpy.types.Node, SverchCustomTreeNode):
     def draw_buttons(self, context, layout):
         op = layout.operator('node.sv_lb_socket_name', text='', icon='QUESTION', emboss=False).tooltip = 'Visualize the view openness around a given point as a colored mesh that fills a circle, sphere, or hemisphere (depending on the specified view type). _ The input context will block the view, resulting in a decresed view rose size and a change in the view rose color. -'
 
-    def process(self):
-        if not any(socket.is_linked for socket in self.outputs):
-            return
-
-        self.sv_output_names = ['view_vecs', 'results', 'mesh', 'legend']
-        for name in self.sv_output_names:
-            setattr(self, '{}_out'.format(name), [])
-        self.sv_input_names = ['_context', '_center_pt', '_radius_', '_view_type_', '_resolution_', 'legend_par_']
-        self.sv_input_types = ['GeometryBase', 'Point3d', 'double', 'string', 'int', 'System.Object']
-        self.sv_input_defaults = [None, None, None, None, None, None]
-        self.sv_input_access = ['list', 'item', 'item', 'item', 'item', 'item']
-        sv_inputs_nested = []
-        for name in self.sv_input_names:
-            sv_inputs_nested.append(self.inputs[name].sv_get())
-        for sv_input_nested in zip_long_repeat(*sv_inputs_nested):
-            for sv_input in zip_long_repeat(*sv_input_nested):
-                sv_input = list(sv_input)
-                for i, value in enumerate(sv_input):
-                    if self.sv_input_access[i] == 'list':
-                        if isinstance(value, (list, tuple)):
-                            values = value
-                        else:
-                            values = [value]
-                        value = [self.sv_cast(v, self.sv_input_types[i], self.sv_input_defaults[i]) for v in values]
-                        if value == [None]:
-                            value = []
-                        sv_input[i] = value
-                    else:
-                        sv_input[i] = self.sv_cast(value, self.sv_input_types[i], self.sv_input_defaults[i])
-                self.process_ladybug(*sv_input)
-        for name in self.sv_output_names:
-            value = getattr(self, '{}_out'.format(name))
-            # Not sure if this hack is correct, will find out when more nodes are generated
-            #if len(value) == 0 or not isinstance(value[0], (list, tuple)):
-            #    value = [value]
-            self.outputs[name].sv_set(value)
-
-    def sv_cast(self, value, data_type, default):
-        result = default if isinstance(value, str) and value == '' else value
-        if result is None and data_type == 'bool':
-            return False
-        elif result is not None and data_type == 'bool':
-            if result == 'True' or result == '1':
-                return True
-            elif result == 'False' or result == '0':
-                return False
-            return bool(result)
-        elif result is not None and data_type == 'int':
-            return int(result)
-        elif result is not None and data_type == 'double':
-            return float(result)
-        return result
-
     def process_ladybug(self, _context, _center_pt, _radius_, _view_type_, _resolution_, legend_par_):
 
         try:
@@ -205,14 +157,12 @@ class SvViewRose(bpy.types.Node, SverchCustomTreeNode):
                 graphic.legend_parameters.colors = Colorset.view_study()
         
             # create all of the visual outputs
-            study_mesh.colors = graphic.value_colors
+            study_mesh.colors = graphic.value_color_array
             mesh = from_mesh3d(study_mesh)
             legend = legend_objects(graphic.legend)
         
 
-        for name in self.sv_output_names:
-            if name in locals():
-                getattr(self, '{}_out'.format(name)).append([locals()[name]])
+        return locals()
 
 
 def register():
@@ -1,15 +1,20 @@
 import bpy
 import ladybug_tools.helper
 from bpy.props import StringProperty
-from sverchok.node_tree import SverchCustomTreeNode
-from sverchok.data_structure import updateNode, zip_long_repeat
+from sverchok.data_structure import updateNode
+from ladybug_tools.node import SvLadybugNode
 
 ghenv = ladybug_tools.helper.ghenv
 
-class SvWindProfile(bpy.types.Node, SverchCustomTreeNode):
+class SvWindProfile(bpy.types.Node, SvLadybugNode):
     bl_idname = 'SvWindProfile'
     bl_label = 'LB Wind Profile'
     sv_icon = 'LB_WINDPROFILE'
+    sv_output_names = ['wind_speeds', 'wind_vectors', 'anchor_pts', 'mesh_arrows', 'profile_curve', 'speed_axis', 'height_axis', 'legend', 'title', 'vis_set']
+    sv_input_names = ['north_', '_met_wind_vel', 'met_wind_dir_', 'profile_dir_', '_terrain_', '_met_height_', '_met_terrain_', 'log_law_', '_base_pt_', '_max_speed_', '_profile_height_', '_vec_spacing_', '_vec_scale_', 'legend_par_']
+    sv_input_types = ['System.Object', 'System.Object', 'System.Object', 'string', 'string', 'double', 'string', 'bool', 'Point3d', 'double', 'double', 'double', 'double', 'System.Object']
+    sv_input_defaults = [None, None, None, None, None, None, None, None, None, None, None, None, None, None]
+    sv_input_access = ['item', 'item', 'item', 'item', 'item', 'item', 'item', 'item', 'item', 'item', 'item', 'item', 'item', 'item']
     sv_north_: StringProperty(
         name='north_',
         update=updateNode,
@@ -135,59 +140,6 @@ class SvWindProfile(bpy.types.Node, SverchCustomTreeNode):
     def draw_buttons(self, context, layout):
         op = layout.operator('node.sv_lb_socket_name', text='', icon='QUESTION', emboss=False).tooltip = 'Visualize a wind profile curve for a given terrain type. _ Wind profiles assist with understanding how wind speed decreases as one approaches the ground or increases as one leaves the ground.  _ By default, the wind profile output by this component will be an average over the _met_wind_vel data collection (or it can be for a single meteorological wind velocity for point-in-time studies). _ If a met_wind_dir_ data collection is connected, the wind profile will point in the direction of prevailing wind direction by default. A profile_dir_ can then be connected to understand the average wind profile from a specific cardinal direction (eg. NE). -'
 
-    def process(self):
-        if not any(socket.is_linked for socket in self.outputs):
-            return
-
-        self.sv_output_names = ['wind_speeds', 'wind_vectors', 'anchor_pts', 'mesh_arrows', 'profile_curve', 'speed_axis', 'height_axis', 'legend', 'title', 'vis_set']
-        for name in self.sv_output_names:
-            setattr(self, '{}_out'.format(name), [])
-        self.sv_input_names = ['north_', '_met_wind_vel', 'met_wind_dir_', 'profile_dir_', '_terrain_', '_met_height_', '_met_terrain_', 'log_law_', '_base_pt_', '_max_speed_', '_profile_height_', '_vec_spacing_', '_vec_scale_', 'legend_par_']
-        self.sv_input_types = ['System.Object', 'System.Object', 'System.Object', 'string', 'string', 'double', 'string', 'bool', 'Point3d', 'double', 'double', 'double', 'double', 'System.Object']
-        self.sv_input_defaults = [None, None, None, None, None, None, None, None, None, None, None, None, None, None]
-        self.sv_input_access = ['item', 'item', 'item', 'item', 'item', 'item', 'item', 'item', 'item', 'item', 'item', 'item', 'item', 'item']
-        sv_inputs_nested = []
-        for name in self.sv_input_names:
-            sv_inputs_nested.append(self.inputs[name].sv_get())
-        for sv_input_nested in zip_long_repeat(*sv_inputs_nested):
-            for sv_input in zip_long_repeat(*sv_input_nested):
-                sv_input = list(sv_input)
-                for i, value in enumerate(sv_input):
-                    if self.sv_input_access[i] == 'list':
-                        if isinstance(value, (list, tuple)):
-                            values = value
-                        else:
-                            values = [value]
-                        value = [self.sv_cast(v, self.sv_input_types[i], self.sv_input_defaults[i]) for v in values]
-                        if value == [None]:
-                            value = []
-                        sv_input[i] = value
-                    else:
-                        sv_input[i] = self.sv_cast(value, self.sv_input_types[i], self.sv_input_defaults[i])
-                self.process_ladybug(*sv_input)
-        for name in self.sv_output_names:
-            value = getattr(self, '{}_out'.format(name))
-            # Not sure if this hack is correct, will find out when more nodes are generated
-            #if len(value) == 0 or not isinstance(value[0], (list, tuple)):
-            #    value = [value]
-            self.outputs[name].sv_set(value)
-
-    def sv_cast(self, value, data_type, default):
-        result = default if isinstance(value, str) and value == '' else value
-        if result is None and data_type == 'bool':
-            return False
-        elif result is not None and data_type == 'bool':
-            if result == 'True' or result == '1':
-                return True
-            elif result == 'False' or result == '0':
-                return False
-            return bool(result)
-        elif result is not None and data_type == 'int':
-            return int(result)
-        elif result is not None and data_type == 'double':
-            return float(result)
-        return result
-
     def process_ladybug(self, north_, _met_wind_vel, met_wind_dir_, profile_dir_, _terrain_, _met_height_, _met_terrain_, log_law_, _base_pt_, _max_speed_, _profile_height_, _vec_spacing_, _vec_scale_, legend_par_):
 
         import math
@@ -374,9 +326,7 @@ class SvWindProfile(bpy.types.Node, SverchCustomTreeNode):
             vis_set = objectify_output('VisualizationSet Aruments [WindProfile]', vis_set)
         
 
-        for name in self.sv_output_names:
-            if name in locals():
-                getattr(self, '{}_out'.format(name)).append([locals()[name]])
+        return locals()
 
 
 def register():
@@ -1,15 +1,20 @@
 import bpy
 import ladybug_tools.helper
 from bpy.props import StringProperty
-from sverchok.node_tree import SverchCustomTreeNode
-from sverchok.data_structure import updateNode, zip_long_repeat
+from sverchok.data_structure import updateNode
+from ladybug_tools.node import SvLadybugNode
 
 ghenv = ladybug_tools.helper.ghenv
 
-class SvWindRose(bpy.types.Node, SverchCustomTreeNode):
+class SvWindRose(bpy.types.Node, SvLadybugNode):
     bl_idname = 'SvWindRose'
     bl_label = 'LB Wind Rose'
     sv_icon = 'LB_WINDROSE'
+    sv_output_names = ['mesh', 'compass', 'orient_line', 'freq_line', 'windrose_line', 'legend', 'title', 'prevailing', 'angles', 'calm_hours', 'histogram', 'vis_set']
+    sv_input_names = ['north_', '_data', '_wind_direction', '_dir_count_', '_center_pt_', 'show_calm_', 'show_avg_', '_freq_dist_', '_freq_hours_', '_max_freq_lines_', 'legend_par_', 'statement_', 'period_']
+    sv_input_types = ['System.Object', 'System.Object', 'System.Object', 'int', 'Point3d', 'bool', 'bool', 'double', 'int', 'int', 'System.Object', 'string', 'System.Object']
+    sv_input_defaults = [None, None, None, None, None, None, None, None, None, None, None, None, None]
+    sv_input_access = ['item', 'list', 'item', 'item', 'item', 'item', 'item', 'item', 'item', 'item', 'list', 'item', 'item']
     sv_north_: StringProperty(
         name='north_',
         update=updateNode,
@@ -132,59 +137,6 @@ class SvWindRose(bpy.types.Node, SverchCustomTreeNode):
     def draw_buttons(self, context, layout):
         op = layout.operator('node.sv_lb_socket_name', text='', icon='QUESTION', emboss=False).tooltip = 'Create a plot of any hourly data by wind directions. -'
 
-    def process(self):
-        if not any(socket.is_linked for socket in self.outputs):
-            return
-
-        self.sv_output_names = ['mesh', 'compass', 'orient_line', 'freq_line', 'windrose_line', 'legend', 'title', 'prevailing', 'angles', 'calm_hours', 'histogram', 'vis_set']
-        for name in self.sv_output_names:
-            setattr(self, '{}_out'.format(name), [])
-        self.sv_input_names = ['north_', '_data', '_wind_direction', '_dir_count_', '_center_pt_', 'show_calm_', 'show_avg_', '_freq_dist_', '_freq_hours_', '_max_freq_lines_', 'legend_par_', 'statement_', 'period_']
-        self.sv_input_types = ['System.Object', 'System.Object', 'System.Object', 'int', 'Point3d', 'bool', 'bool', 'double', 'int', 'int', 'System.Object', 'string', 'System.Object']
-        self.sv_input_defaults = [None, None, None, None, None, None, None, None, None, None, None, None, None]
-        self.sv_input_access = ['item', 'list', 'item', 'item', 'item', 'item', 'item', 'item', 'item', 'item', 'list', 'item', 'item']
-        sv_inputs_nested = []
-        for name in self.sv_input_names:
-            sv_inputs_nested.append(self.inputs[name].sv_get())
-        for sv_input_nested in zip_long_repeat(*sv_inputs_nested):
-            for sv_input in zip_long_repeat(*sv_input_nested):
-                sv_input = list(sv_input)
-                for i, value in enumerate(sv_input):
-                    if self.sv_input_access[i] == 'list':
-                        if isinstance(value, (list, tuple)):
-                            values = value
-                        else:
-                            values = [value]
-                        value = [self.sv_cast(v, self.sv_input_types[i], self.sv_input_defaults[i]) for v in values]
-                        if value == [None]:
-                            value = []
-                        sv_input[i] = value
-                    else:
-                        sv_input[i] = self.sv_cast(value, self.sv_input_types[i], self.sv_input_defaults[i])
-                self.process_ladybug(*sv_input)
-        for name in self.sv_output_names:
-            value = getattr(self, '{}_out'.format(name))
-            # Not sure if this hack is correct, will find out when more nodes are generated
-            #if len(value) == 0 or not isinstance(value[0], (list, tuple)):
-            #    value = [value]
-            self.outputs[name].sv_set(value)
-
-    def sv_cast(self, value, data_type, default):
-        result = default if isinstance(value, str) and value == '' else value
-        if result is None and data_type == 'bool':
-            return False
-        elif result is not None and data_type == 'bool':
-            if result == 'True' or result == '1':
-                return True
-            elif result == 'False' or result == '0':
-                return False
-            return bool(result)
-        elif result is not None and data_type == 'int':
-            return int(result)
-        elif result is not None and data_type == 'double':
-            return float(result)
-        return result
-
     def process_ladybug(self, north_, _data, _wind_direction, _dir_count_, _center_pt_, show_calm_, show_avg_, _freq_dist_, _freq_hours_, _max_freq_lines_, legend_par_, statement_, period_):
 
         import math
@@ -394,9 +346,7 @@ class SvWindRose(bpy.types.Node, SverchCustomTreeNode):
                 vis_set.append(objectify_output('VisualizationSet Aruments [WindRose]', [wr, _center_pt_.z]))
         
 
-        for name in self.sv_output_names:
-            if name in locals():
-                getattr(self, '{}_out'.format(name)).append([locals()[name]])
+        return locals()
 
 
 def register():
@@ -1,19 +1,31 @@
 """Functions for dealing with inputs and outputs from Grasshopper components."""
 import collections
+import math
 import multiprocessing
+import multiprocessing.pool
 import types
 
-# Stub for .net tasks.
 
 def for_each(iterable, fn):
-    for i in iterable:
-        fn(i)
-    return # Does this work in Sverchok?
+    """Call a function on every item of an iterable using a pool of threads.
 
-    pool = multiprocessing.Pool()
-    pool.map(fn, iterable)
-    pool.close()
-    pool.join()
+    This replaces the .NET Tasks.Parallel.ForEach used by the Grasshopper
+    components. The functions passed to it are typically closures that write
+    their results into pre-created lists, which only works when all workers
+    share the memory of the calling process. So threads are used here and
+    CPU-bound work that must scale across cores should use parallel_map.
+    """
+    items = list(iterable)
+    if len(items) <= 1:
+        for i in items:
+            fn(i)
+        return
+    pool = multiprocessing.pool.ThreadPool(min(len(items), local_processor_count()))
+    try:
+        pool.map(fn, items)
+    finally:
+        pool.close()
+        pool.join()
 
 tasks = types.SimpleNamespace()
 Parallel = types.SimpleNamespace()
@@ -21,6 +33,72 @@ Parallel.ForEach = for_each
 tasks.Parallel = Parallel
 
 
+def process_context():
+    """Get a multiprocessing context that can run worker processes from Blender.
+
+    Worker processes are forked so that they inherit the imported add-on modules,
+    which cannot be imported by a freshly spawned Python interpreter outside
+    of Blender. None will be returned on platforms that do not support fork,
+    in which case calculations should be run in the current process.
+    """
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        return None
+    return multiprocessing.get_context('fork')
+
+
+def parallel_map(function, chunks, cpu_count=None, initializer=None, initargs=()):
+    """Map a function over chunks of work using a pool of worker processes.
+
+    Args:
+        function: A module-level function that accepts one chunk and returns
+            its result. It must be picklable, so closures cannot be used.
+        chunks: A list of arguments for the function (eg. ranges of points).
+        cpu_count: An integer for the number of processes to be used. If None,
+            all available processors will be used. (Default: None).
+        initializer: An optional module-level function that is run once in each
+            worker before any chunk is processed. This is the place to attach
+            to large shared data like an occluder mesh.
+        initargs: A tuple of arguments for the initializer.
+
+    Returns:
+        A list with the result of each chunk in the order of the input chunks.
+    """
+    cpu_count = local_processor_count() if cpu_count is None else cpu_count
+    worker_count = min(cpu_count, len(chunks))
+    context = process_context()
+    if worker_count <= 1 or context is None:  # run everything in this process
+        if initializer is not None:
+            initializer(*initargs)
+        return [function(chunk) for chunk in chunks]
+    pool = context.Pool(worker_count, initializer, initargs)
+    try:
+        return pool.map(function, chunks, chunksize=1)
+    finally:
+        pool.close()
+        pool.join()
+
+
+def chunk_ranges(object_count, cpu_count=None, chunks_per_worker=4):
+    """Get a list of (start, stop) index ranges that split objects into chunks.
+
+    Several chunks are made for each worker so that workers that finish early
+    can pick up the remaining work.
+
+    Args:
+        object_count: An integer for the number of objects to be split.
+        cpu_count: An integer for the number of workers. If None, the number
+            of processors on this machine will be used. (Default: None).
+        chunks_per_worker: An integer for the number of chunks per worker.
+    """
+    if object_count == 0:
+        return []
+    cpu_count = local_processor_count() if cpu_count is None else cpu_count
+    chunk_count = min(object_count, max(1, cpu_count) * chunks_per_worker)
+    i_per_chunk = int(math.ceil(object_count / chunk_count))
+    return [(x, min(x + i_per_chunk, object_count))
+            for x in range(0, object_count, i_per_chunk)]
+
+
 def give_warning(component, message):
     """Give a warning message (turning the component orange).
 
@@ -241,6 +319,21 @@ def wrap_output(output):
         raise ValueError('Failed to wrap {}:\n{}.'.format(output, e))
 
 
+class Objectifier(object):
+    """Generic class for objectifying data.
+
+    The class is defined at the module level so that objectified outputs can be
+    pickled (eg. by the output cache of the nodes).
+    """
+
+    def __init__(self, name, data):
+        self.name = name
+        self.data = data
+
+    def ToString(self):
+        return '{} ({} items)'.format(self.name, len(self.data))
+
+
 def objectify_output(object_name, output_data):
     """Wrap data into a single custom Python object that can later be de-serialized.
 
@@ -257,16 +350,6 @@ def objectify_output(object_name, output_data):
         output_data: A list of data to be stored under the data property of
             the output object.
     """
-    class Objectifier(object):
-        """Generic class for objectifying data."""
-
-        def __init__(self, name, data):
-            self.name = name
-            self.data = data
-
-        def ToString(self):
-            return '{} ({} items)'.format(self.name, len(self.data))
-
     return Objectifier(object_name, output_data)
 
 
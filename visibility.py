@@ -0,0 +1,532 @@
+"""Compact ray intersection matrices and a store that persists them between runs.
+
+Whether the rays from a set of points are blocked only depends on the context
+geometry, the points and normals of the study and the ray directions. This is why
+the results of an intersection can be reused whenever only the climate inputs of
+a study change (eg. the sky matrix, analysis period or legend), leaving just the
+weighted sum of the results to be recomputed. Matrices are kept in memory up to a
+byte budget and, if a folder is specified, they are also written to binary files.
+"""
+import os
+import json
+import struct
+import hashlib
+import tempfile
+import array as specializedarray
+from operator import getitem, mul
+from collections import OrderedDict
+
+_MAGIC = b'LBVISM02'
+_STORE_EXTENSION = '.lbvis'
+_TO_BIT_CHARS = bytes.maketrans(b'\x00\x01', b'01')
+_FROM_BIT_CHARS = bytes.maketrans(b'01', b'\x00\x01')
+
+
+class IntersectionMatrix(object):
+    """A ray intersection matrix with one bit per ray and optional ray cosines.
+
+    Each row of the matrix represents one point and each column represents one
+    ray direction. The bits note whether each ray is unblocked (1) or blocked (0).
+    The optional cosines are those of the angle between each ray and the normal
+    of the point, multiplied by the bit of the ray (so they are 0 for blocked
+    rays). They are stored as double (float64) precision numbers by default,
+    such that the weighted sums match those of the unpacked angles. Half (float16)
+    precision takes a quarter of the memory when it is enough for a study.
+
+    Args:
+        row_count: An integer for the number of points in the matrix.
+        column_count: An integer for the number of rays of each point.
+        bits: Bytes with the bits of each row, starting at the least significant
+            bit of the first byte. Each row is padded to a whole number of bytes.
+        cosines: Optional bytes for the cosines of each ray of each row, packed
+            with the cosine_type. If None, the matrix has no cosines. (Default: None).
+        cosine_type: Text for the struct format character of the cosines. Choose
+            from e (float16), f (float32) or d (float64). (Default: d).
+
+    Properties:
+        * row_count
+        * column_count
+        * bits
+        * cosines
+        * cosine_type
+        * has_cosines
+        * byte_size
+    """
+    __slots__ = ('_row_count', '_column_count', '_bits', '_cosines', '_cosine_type',
+                 '_row_bytes', '_cosine_struct')
+
+    def __init__(self, row_count, column_count, bits, cosines=None, cosine_type='d'):
+        """Initialize IntersectionMatrix."""
+        assert cosine_type in ('e', 'f', 'd'), 'cosine_type must be e, f or d. ' \
+            'Got {}.'.format(cosine_type)
+        self._row_count = int(row_count)
+        self._column_count = int(column_count)
+        self._row_bytes = (self._column_count + 7) // 8
+        assert len(bits) == self._row_count * self._row_bytes, 'Length of bits ' \
+            '({}) does not match the size of the matrix.'.format(len(bits))
+        self._bits = bytes(bits)
+        self._cosine_type = cosine_type
+        self._cosine_struct = struct.Struct('<{}{}'.format(self._column_count, cosine_type))
+        self._cosines = None
+        if cosines is not None:
+            assert len(cosines) == self._row_count * self._cosine_struct.size, \
+                'Length of cosines ({}) does not match the size of the matrix.'.format(
+                    len(cosines))
+            self._cosines = bytes(cosines)
+
+    @classmethod
+    def from_matrices(cls, intersection_matrix, angle_matrix=None, cosine_type='d'):
+        """Create an IntersectionMatrix from the outputs of intersect_mesh_rays.
+
+        Args:
+            intersection_matrix: A list with one array of 0's and 1's for each point.
+            angle_matrix: An optional list with one array of angles in radians
+                for each point. If None, the matrix has no cosines.
+            cosine_type: Text for the struct format character of the cosines.
+                (Default: d).
+        """
+        rows = len(intersection_matrix)
+        columns = len(intersection_matrix[0]) if rows else 0
+        row_bytes = (columns + 7) // 8
+        bits = bytearray()
+        if columns:
+            for row in intersection_matrix:
+                # the last column becomes the most significant bit of the integer
+                chars = bytes(row)[::-1].translate(_TO_BIT_CHARS)
+                bits.extend(int(chars, 2).to_bytes(row_bytes, 'little'))
+        cosines = None
+        if angle_matrix is not None:
+            from math import cos
+            pack = struct.Struct('<{}{}'.format(columns, cosine_type)).pack
+            cosines = bytearray()
+            for row, angles in zip(intersection_matrix, angle_matrix):
+                cosines.extend(pack(*[i * cos(a) for i, a in zip(row, angles)]))
+        return cls(rows, columns, bits, cosines, cosine_type)
+
+    @property
+    def row_count(self):
+        """Integer for the number of points (rows) of the matrix."""
+        return self._row_count
+
+    @property
+    def column_count(self):
+        """Integer for the number of rays (columns) of each row."""
+        return self._column_count
+
+    @property
+    def bits(self):
+        """Bytes with the bits of each row, each padded to a whole number of bytes."""
+        return self._bits
+
+    @property
+    def cosines(self):
+        """Bytes of the packed ray cosines of each row or None."""
+        return self._cosines
+
+    @property
+    def cosine_type(self):
+        """Text for the struct format character of the cosines."""
+        return self._cosine_type
+
+    @property
+    def has_cosines(self):
+        """Boolean noting whether the matrix has ray cosines."""
+        return self._cosines is not None
+
+    @property
+    def byte_size(self):
+        """Integer for the number of bytes used by the bits and cosines of the matrix."""
+        return len(self._bits) + (len(self._cosines) if self._cosines is not None else 0)
+
+    def bits_matrix(self):
+        """Get a copy of this matrix without the cosines, which shares the same bits."""
+        return IntersectionMatrix(self._row_count, self._column_count, self._bits)
+
+    def row_bits(self, index):
+        """Get a list of 0's and 1's for whether each ray of a row is unblocked."""
+        if not self._column_count:
+            return []
+        row_int = int.from_bytes(self._row(index), 'little')
+        chars = format(row_int, '0{}b'.format(self._column_count))[::-1]
+        return list(chars.encode('ascii').translate(_FROM_BIT_CHARS))
+
+    def row_cosines(self, index):
+        """Get a tuple of the cosines of each ray of a row (0 for blocked rays)."""
+        assert self._cosines is not None, 'IntersectionMatrix has no cosines.'
+        index = self._check_index(index)
+        return self._cosine_struct.unpack_from(
+            self._cosines, index * self._cosine_struct.size)
+
+    def unblocked_counts(self):
+        """Get a list with the number of unblocked rays of each row.
+
+        This is the direct sun hours of each point when the rays are sun vectors.
+        """
+        bits, step = self._bits, self._row_bytes
+        if not step:  # matrix without any rays
+            return [0] * self._row_count
+        return [bin(int.from_bytes(bits[i:i + step], 'little')).count('1')
+                for i in range(0, len(bits), step)]
+
+    def weighted_sums(self, weights):
+        """Get a list with the sum of the weights of the unblocked rays of each row.
+
+        The sums use one lookup per byte of each row in a table of the sums of the
+        weights for each of the 256 possible bytes, rather than one multiplication
+        per ray.
+
+        Args:
+            weights: A list of numbers with one weight for each column (eg. the
+                solid angle of each sky patch).
+        """
+        assert len(weights) == self._column_count, 'Number of weights ({}) does not ' \
+            'match the number of columns ({}).'.format(len(weights), self._column_count)
+        tables = []
+        for start in range(0, self._column_count, 8):
+            byte_weights = list(weights[start:start + 8])
+            table = [0] * 256
+            for byte in range(1, 256):
+                low_bit = byte & -byte
+                bit_index = low_bit.bit_length() - 1
+                table[byte] = table[byte ^ low_bit] + (
+                    byte_weights[bit_index] if bit_index < len(byte_weights) else 0)
+            tables.append(table)
+        bits, step = self._bits, self._row_bytes
+        if not step:  # matrix without any rays
+            return [0] * self._row_count
+        return [sum(map(getitem, tables, bits[i:i + step]))
+                for i in range(0, len(bits), step)]
+
+    def cosine_weighted_sums(self, weights):
+        """Get a list with the sum of the weights multiplied by the ray cosines of each row.
+
+        This is the incident radiation of each point when the weights are the
+        radiation of each sky patch.
+
+        Args:
+            weights: A list of numbers with one weight for each column.
+        """
+        assert self._cosines is not None, 'IntersectionMatrix has no cosines.'
+        assert len(weights) == self._column_count, 'Number of weights ({}) does not ' \
+            'match the number of columns ({}).'.format(len(weights), self._column_count)
+        unpack_from, size = self._cosine_struct.unpack_from, self._cosine_struct.size
+        cosines = self._cosines
+        if not size:  # matrix without any rays
+            return [0] * self._row_count
+        return [sum(map(mul, unpack_from(cosines, i), weights))
+                for i in range(0, len(cosines), size)]
+
+    def _check_index(self, index):
+        """Get a positive row index, raising an IndexError if it is out of range."""
+        if index < 0:
+            index += self._row_count
+        if not 0 <= index < self._row_count:
+            raise IndexError('IntersectionMatrix row index out of range.')
+        return index
+
+    def _row(self, index):
+        """Get the bytes of the bits of a row."""
+        start = self._check_index(index) * self._row_bytes
+        return self._bits[start:start + self._row_bytes]
+
+    def __reduce__(self):
+        return IntersectionMatrix, (self._row_count, self._column_count, self._bits,
+                                    self._cosines, self._cosine_type)
+
+    def __len__(self):
+        return self._row_count
+
+    def __getitem__(self, index):
+        """Get the cosines of a row if the matrix has them or else the bits of the row."""
+        if self._cosines is not None:
+            return self.row_cosines(index)
+        return self.row_bits(index)
+
+    def __iter__(self):
+        return (self[i] for i in range(self._row_count))
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __repr__(self):
+        return 'Intersection Matrix ({} points x {} rays)'.format(
+            self._row_count, self._column_count)
+
+
+class VisibilityMatrixStore(object):
+    """A least-recently-used store of ray intersection matrices with a disk layer.
+
+    Args:
+        max_bytes: An integer for the maximum number of bytes of matrices to be
+            kept in memory. When this is exceeded, the least recently used
+            matrices are evicted. (Default: 256 MB).
+        folder: Optional path to a folder where the matrices will be written as
+            binary files so that they persist between sessions. If None, only
+            the in-memory store will be used. (Default: None).
+        max_disk_files: An integer for the maximum number of files to be kept
+            in the folder. When this is exceeded, the files that were least
+            recently written are deleted. (Default: 32).
+
+    Properties:
+        * max_bytes
+        * folder
+        * max_disk_files
+        * hits
+        * disk_hits
+        * misses
+        * size
+        * byte_size
+    """
+    __slots__ = ('_max_bytes', '_folder', '_max_disk_files', '_entries',
+                 '_byte_size', '_hits', '_disk_hits', '_misses')
+
+    def __init__(self, max_bytes=256 * 1024 * 1024, folder=None, max_disk_files=32):
+        """Initialize VisibilityMatrixStore."""
+        self._max_bytes = int(max_bytes)
+        self._folder = folder
+        self._max_disk_files = int(max_disk_files)
+        self._entries = OrderedDict()
+        self._byte_size = 0
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+
+    @property
+    def max_bytes(self):
+        """Integer for the maximum number of bytes of matrices kept in memory."""
+        return self._max_bytes
+
+    @property
+    def folder(self):
+        """Path to the folder where the matrices are written or None."""
+        return self._folder
+
+    @property
+    def max_disk_files(self):
+        """Integer for the maximum number of files kept in the folder."""
+        return self._max_disk_files
+
+    @property
+    def hits(self):
+        """Integer for the number of requests served from memory."""
+        return self._hits
+
+    @property
+    def disk_hits(self):
+        """Integer for the number of requests served from the folder."""
+        return self._disk_hits
+
+    @property
+    def misses(self):
+        """Integer for the number of requests for which no matrix was stored."""
+        return self._misses
+
+    @property
+    def size(self):
+        """Integer for the number of matrices currently kept in memory."""
+        return len(self._entries)
+
+    @property
+    def byte_size(self):
+        """Integer for the number of bytes of the matrices kept in memory."""
+        return self._byte_size
+
+    def get(self, key):
+        """Get the IntersectionMatrix of a key.
+
+        Args:
+            key: Text for the key of the matrix, obtained from the rays_key method.
+
+        Returns:
+            An IntersectionMatrix or None if no matrix is stored for the key.
+        """
+        try:
+            matrix = self._entries.pop(key)
+            self._hits += 1
+        except KeyError:
+            matrix = self._read(key)
+            if matrix is None:
+                self._misses += 1
+                return None
+            self._disk_hits += 1
+            self._add(key, matrix)
+            return matrix
+        self._entries[key] = matrix
+        return matrix
+
+    def set(self, key, matrix):
+        """Store the IntersectionMatrix of a key.
+
+        Args:
+            key: Text for the key of the matrix, obtained from the rays_key method.
+            matrix: An IntersectionMatrix.
+        """
+        self._write(key, matrix)
+        self._add(key, matrix)
+
+    def clear(self, disk=False):
+        """Clear all of the matrices that are kept in memory.
+
+        Args:
+            disk: Boolean to note whether the files in the folder should also
+                be deleted. (Default: False).
+        """
+        self._entries.clear()
+        self._byte_size = 0
+        if disk:
+            for store_file in self._store_files():
+                try:
+                    os.remove(store_file)
+                except OSError:
+                    pass
+
+    def reset_counters(self):
+        """Reset the hit and miss counters of the store to zero."""
+        self._hits, self._disk_hits, self._misses = 0, 0, 0
+
+    @staticmethod
+    def rays_key(mesh, points, vectors, normals=None, cosine_type='d'):
+        """Get text that identifies the intersection of a mesh with a set of rays.
+
+        Args:
+            mesh: A Ladybug Mesh3D or a ladybug_geometry MeshBVH that blocks the rays.
+            points: An array of Ladybug Point3D from which the rays are cast.
+            vectors: An array of Ladybug Vector3D for the direction of the rays.
+            normals: An optional array of Ladybug Vector3D that align with the points.
+            cosine_type: Text for the struct format character of the cosines.
+                None if the matrix has no cosines.
+        """
+        hasher = hashlib.md5((cosine_type or '').encode('ascii'))
+        if hasattr(mesh, 'triangles'):  # a MeshBVH
+            hasher.update(b'bvh')
+            hasher.update(_array_bytes(mesh.triangles))
+        else:
+            hasher.update(b'mesh')
+            hasher.update(_coordinate_bytes(mesh.vertices))
+            hasher.update(_array_bytes(specializedarray.array(
+                'i', [i for face in mesh.faces for i in (len(face),) + tuple(face)])))
+        for geos in (points, vectors, normals or ()):
+            hasher.update(struct.pack('<I', len(geos)))
+            hasher.update(_coordinate_bytes(geos))
+        hasher.update(b'normals' if normals is not None else b'')
+        return hasher.hexdigest()
+
+    def _add(self, key, matrix):
+        """Add a matrix to memory, evicting the least recently used matrices."""
+        old_matrix = self._entries.pop(key, None)
+        if old_matrix is not None:
+            self._byte_size -= old_matrix.byte_size
+        if matrix.byte_size > self._max_bytes:
+            return
+        self._entries[key] = matrix
+        self._byte_size += matrix.byte_size
+        while self._byte_size > self._max_bytes:
+            _, old_matrix = self._entries.popitem(last=False)
+            self._byte_size -= old_matrix.byte_size
+
+    def _file_path(self, key):
+        """Get the path to the file of a key."""
+        return os.path.join(self._folder, key + _STORE_EXTENSION)
+
+    def _store_files(self):
+        """Get a list of all store files in the folder."""
+        if not self._folder or not os.path.isdir(self._folder):
+            return []
+        return [os.path.join(self._folder, f) for f in os.listdir(self._folder)
+                if f.endswith(_STORE_EXTENSION)]
+
+    def _read(self, key):
+        """Read the matrix of a key from the folder if it exists."""
+        if not self._folder:
+            return None
+        try:
+            with open(self._file_path(key), 'rb') as store_file:
+                content = store_file.read()
+        except (IOError, OSError):
+            return None
+        try:
+            if content[:len(_MAGIC)] != _MAGIC:
+                raise ValueError('Not a visibility matrix file.')
+            meta_start = len(_MAGIC) + 4
+            meta_len = struct.unpack('<I', content[len(_MAGIC):meta_start])[0]
+            meta = json.loads(content[meta_start:meta_start + meta_len].decode('utf-8'))
+            if meta['key'] != key:
+                raise ValueError('Visibility matrix file for a different key.')
+            bits_start = meta_start + meta_len
+            cosines_start = bits_start + meta['sizes'][0]
+            cosines = None if meta['sizes'][1] is None else \
+                content[cosines_start:cosines_start + meta['sizes'][1]]
+            return IntersectionMatrix(
+                meta['rows'], meta['columns'], content[bits_start:cosines_start],
+                cosines, meta['cosine_type'])
+        except (ValueError, KeyError, TypeError, AssertionError, struct.error):
+            return None
+
+    def _write(self, key, matrix):
+        """Write a matrix to the folder, evicting the oldest files."""
+        if not self._folder:
+            return None
+        cosines = matrix.cosines
+        meta = {'key': key, 'rows': matrix.row_count, 'columns': matrix.column_count,
+                'cosine_type': matrix.cosine_type,
+                'sizes': [len(matrix.bits), len(cosines) if cosines is not None else None]}
+        meta_bytes = json.dumps(meta).encode('utf-8')
+        file_path = self._file_path(key)
+        temp_path = '{}.{}.tmp'.format(file_path, os.getpid())
+        try:
+            if not os.path.isdir(self._folder):
+                os.makedirs(self._folder)
+            with open(temp_path, 'wb') as store_file:
+                store_file.write(_MAGIC)
+                store_file.write(struct.pack('<I', len(meta_bytes)))
+                store_file.write(meta_bytes)
+                store_file.write(matrix.bits)
+                if cosines is not None:
+                    store_file.write(cosines)
+            os.replace(temp_path, file_path)
+        except (IOError, OSError):
+            if os.path.isfile(temp_path):
+                os.remove(temp_path)
+            return None
+
+        # evict the files that were least recently written
+        store_files = self._store_files()
+        if len(store_files) > self._max_disk_files:
+            store_files.sort(key=os.path.getmtime)
+            for old_file in store_files[:len(store_files) - self._max_disk_files]:
+                try:
+                    os.remove(old_file)
+                except OSError:
+                    pass
+        return file_path
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return 'Visibility Matrix Store ({} entries, {} bytes, {} hits, {} disk hits, ' \
+            '{} misses)'.format(len(self._entries), self._byte_size, self._hits,
+                                self._disk_hits, self._misses)
+
+
+def _coordinate_bytes(geometries):
+    """Get the bytes of the x, y, z coordinates of a list of points or vectors."""
+    return specializedarray.array(
+        'd', [c for geo in geometries for c in (geo.x, geo.y, geo.z)]).tobytes()
+
+
+def _array_bytes(values):
+    """Get the bytes of an array or a list of numbers."""
+    if not isinstance(values, specializedarray.array):
+        values = specializedarray.array('d', values)
+    return values.tobytes()
+
+
+# a store shared by all studies in the current Python session
+visibility_matrix_store = VisibilityMatrixStore(
+    folder=os.path.join(tempfile.gettempdir(), 'ladybug_visibility_matrices'))